@@ -5,6 +5,14 @@ from fastapi import HTTPException, status
 from api_service.db.models import User
 from moonmind.config.settings import settings
 
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header matches ``etag``."""
+
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
 def ensure_preset_catalog_enabled() -> None:
     """Raise a 404 when the preset catalog is disabled."""
 
@@ -48,7 +48,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from temporalio.api.enums.v1 import IndexedValueType
 from temporalio.api.operatorservice.v1 import ListSearchAttributesRequest
 from temporalio.client import Client
-from temporalio.service import RPCError
+from temporalio.service import RPCError, RPCStatusCode
 
 from api_service.api.dependencies import resolve_template_scope_for_user
 from api_service.api.execution_fanout import (
@@ -59,6 +59,11 @@ from api_service.api.execution_fanout import (
 )
 from api_service.auth_providers import get_current_user, get_current_user_optional
 from api_service.core import sync as execution_sync
+from api_service.core.execution_metrics import (
+    duration_seconds_from_payload as _duration_seconds_from_payload,
+    extract_cost_estimate_usd as _extract_cost_estimate_usd,
+    load_execution_metrics_rollup,
+)
 from api_service.db import models as db_models
 from api_service.db.base import async_session_maker, get_async_session
 from api_service.db.models import (
@@ -224,7 +229,11 @@ from moonmind.workflows.temporal.artifacts import (
 )
 from moonmind.workflows.temporal.report_artifacts import build_report_projection_summary
 from moonmind.workflows.temporal.runtime.store import ManagedRunStore
-from moonmind.workflows.temporal.client import TemporalClientAdapter, query_workflow
+from moonmind.workflows.temporal.client import (
+    TemporalClientAdapter,
+    TemporalVisibilityGroupBySupport,
+    query_workflow,
+)
 from moonmind.workflows.temporal.hard_switch_cutover import (
     resolve_user_workflow_start_contract,
 )
@@ -319,6 +328,7 @@ from moonmind.workflows import get_temporal_artifact_service
 
 router = APIRouter(prefix="/api/executions", tags=["executions"])
 _TEMPORAL_SOURCE = "temporal"
+_PROJECTION_SOURCE = "projection"
 _ALLOWED_OWNER_TYPES = {"user", "system", "service"}
 _SUPPORTED_TASK_RUNTIMES = frozenset({
     "codex_cli",
@@ -366,20 +376,6 @@ _EXECUTION_FILTER_VALUE_MAX_LENGTH = 200
 _EXECUTION_TEXT_FILTER_MAX_LENGTH = 200
 _EXECUTION_FACET_PAGE_SIZE_LIMIT = 200
 _EXECUTION_METRICS_SAMPLE_SIZE_LIMIT = 500
-_EXECUTION_COST_KEYS = frozenset(
-    {
-        "costEstimateUsd",
-        "cost_estimate_usd",
-        "estimatedCostUsd",
-        "estimated_cost_usd",
-        "costUsd",
-        "cost_usd",
-        "totalCostUsd",
-        "total_cost_usd",
-        "mm_cost_estimate_usd",
-        "moonmind.cost_estimate_usd",
-    }
-)
 _EXECUTION_SORT_FIELDS = {
     "workflowId": "WorkflowId",
     "targetRuntime": "mm_target_runtime",
@@ -2062,6 +2058,11 @@ async def get_temporal_client(
 ) -> Client:
     return await adapter.get_client()
 
+def get_temporal_visibility_group_by_support(
+    adapter: TemporalClientAdapter = Depends(get_temporal_client_adapter),
+) -> TemporalVisibilityGroupBySupport:
+    return adapter.visibility_group_by
+
 def _is_execution_admin(user: User | None) -> bool:
     return bool(user and getattr(user, "is_superuser", False))
 
@@ -6634,6 +6635,24 @@ async def _load_execution_progress(
         return None, None
 
 
+def _published_progress_version(memo: Any) -> int | None:
+    """Return the version stamp of workflow-published ``memo.progress``.
+
+    Only snapshots carrying a version are kept current by the workflow on every
+    step change; unversioned memo progress may be a stale legacy summary.
+    """
+
+    if not isinstance(memo, Mapping):
+        return None
+    progress = memo.get("progress")
+    if not isinstance(progress, Mapping):
+        return None
+    version = progress.get("version")
+    if isinstance(version, bool) or not isinstance(version, int):
+        return None
+    return version
+
+
 def _execution_uses_live_workflow_queries(execution: ExecutionModel) -> bool:
     if execution.workflow_type != "MoonMind.UserWorkflow":
         return False
@@ -13720,25 +13739,31 @@ async def list_executions(
                 page_size=page_size,
                 next_page_token=token_bytes,
             )
-            await iterator.fetch_next_page()
 
-            count_value: int | None = None
-            count_mode = "exact"
-            degraded_count = False
+            async def _count_listed_workflows() -> int | None:
+                try:
+                    count_info = await asyncio.wait_for(
+                        client.count_workflows(query=count_query),
+                        timeout=settings.temporal_dashboard.list_count_timeout_seconds,
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        "Temporal execution list count degraded for query_present=%s: %s",
+                        bool(count_query),
+                        exc,
+                    )
+                    return None
+                return count_info.count
+
+            count_task = asyncio.create_task(_count_listed_workflows())
             try:
-                count_info = await asyncio.wait_for(
-                    client.count_workflows(query=count_query),
-                    timeout=settings.temporal_dashboard.list_count_timeout_seconds,
-                )
-                count_value = count_info.count
-            except Exception as exc:
-                count_mode = "estimated_or_unknown"
-                degraded_count = True
-                logger.warning(
-                    "Temporal execution list count degraded for query_present=%s: %s",
-                    bool(count_query),
-                    exc,
-                )
+                await iterator.fetch_next_page()
+            except BaseException:
+                count_task.cancel()
+                raise
+            count_value = await count_task
+            degraded_count = count_value is None
+            count_mode = "estimated_or_unknown" if degraded_count else "exact"
 
             page = iterator.current_page or []
             canonical_map: dict[str, TemporalExecutionCanonicalRecord] = {}
@@ -13783,7 +13808,12 @@ async def list_executions(
                             getattr(record_obj, "started_at", None) or datetime.now(UTC)
                         )
                     execution = _serialize_execution_list_item(record_obj)
-                    if _execution_uses_live_workflow_queries(execution):
+                    # Workflows publish versioned progress into the memo on every
+                    # step change; only runs that predate that still need a live
+                    # query to show progress on the list page.
+                    if _execution_uses_live_workflow_queries(
+                        execution
+                    ) and _published_progress_version(payload.get("memo")) is None:
                         live_progress_queries.append((len(items), wf.id))
                     items.append(execution)
 
@@ -13922,56 +13952,64 @@ async def list_executions(
         ),
     )
 
-def _coerce_metric_float(value: Any) -> float | None:
-    if isinstance(value, bool) or value is None:
+_EXECUTION_COUNT_CONCURRENCY = 8
+
+
+async def _count_workflows_grouped(
+    client: Any,
+    query: str | None,
+    attr: str,
+    group_by_support: TemporalVisibilityGroupBySupport,
+) -> dict[Any, int] | None:
+    """Count matching workflows per ``attr`` value in one Visibility round trip.
+
+    Returns ``None`` when the Visibility store cannot group by ``attr`` (Temporal
+    only supports ``GROUP BY ExecutionStatus`` on most stores). That outcome is
+    remembered on ``group_by_support`` so later requests go straight to
+    per-value counts. Groups with no value are reported under the ``None`` key.
+    """
+
+    if group_by_support.is_unsupported(attr):
         return None
-    if isinstance(value, int | float):
-        candidate = float(value)
-    elif isinstance(value, str):
-        text = value.strip().replace("$", "").replace(",", "")
-        if not text:
-            return None
-        try:
-            candidate = float(text)
-        except ValueError:
-            return None
-    else:
+    grouped_query = f"{query} GROUP BY {attr}" if query else f"GROUP BY {attr}"
+    try:
+        result = await client.count_workflows(query=grouped_query)
+    except RPCError as exc:
+        if exc.status != RPCStatusCode.INVALID_ARGUMENT:
+            raise
+        logger.info("Temporal Visibility cannot group counts by %s: %s", attr, exc)
+        group_by_support.mark_unsupported(attr)
         return None
-    if candidate < 0:
+    groups = getattr(result, "groups", None)
+    if groups is None or (not groups and int(result.count or 0) > 0):
+        group_by_support.mark_unsupported(attr)
         return None
-    return candidate
+    counts: dict[Any, int] = {}
+    for group in groups:
+        group_values = list(getattr(group, "group_values", None) or [])
+        value = group_values[0] if group_values else None
+        if isinstance(value, list):
+            value = value[0] if value else None
+        counts[value] = counts.get(value, 0) + int(group.count)
+    return counts
 
 
-def _extract_cost_estimate_usd(*payloads: Any) -> float | None:
-    stack = [(payload, False) for payload in payloads]
-    while stack:
-        value, cost_context = stack.pop()
-        if cost_context:
-            candidate = _coerce_metric_float(value)
-            if candidate is not None:
-                return candidate
-        if isinstance(value, dict):
-            for key, nested in value.items():
-                if str(key) in _EXECUTION_COST_KEYS:
-                    candidate = _coerce_metric_float(nested)
-                    if candidate is not None:
-                        return candidate
-                    if isinstance(nested, dict | list | tuple):
-                        stack.append((nested, True))
-                elif isinstance(nested, dict | list | tuple):
-                    stack.append((nested, False))
-        elif isinstance(value, (list, tuple)):
-            stack.extend((nested, cost_context) for nested in value)
-    return None
+async def _count_workflows_concurrently(
+    client: Any,
+    queries: Sequence[str | None],
+) -> list[int]:
+    """Run independent Visibility counts concurrently, preserving query order."""
 
+    semaphore = asyncio.Semaphore(_EXECUTION_COUNT_CONCURRENCY)
 
-def _duration_seconds_from_payload(payload: Mapping[str, Any]) -> float | None:
-    closed_at = payload.get("closed_at")
-    started_at = payload.get("started_at") or payload.get("created_at")
-    if not isinstance(closed_at, datetime) or not isinstance(started_at, datetime):
-        return None
-    duration = (closed_at - started_at).total_seconds()
-    return duration if duration >= 0 else None
+    async def _count(query: str | None) -> int:
+        if query is None:
+            return 0
+        async with semaphore:
+            count_result = await client.count_workflows(query=query)
+        return int(count_result.count)
+
+    return list(await asyncio.gather(*(_count(query) for query in queries)))
 
 
 def _duration_metrics(values: list[float]) -> ExecutionMetricsDurationModel:
@@ -14003,6 +14041,67 @@ def _cost_metrics(values: list[float]) -> ExecutionMetricsCostModel:
     )
 
 
+_EXECUTION_METRICS_ROLLUP_PARAMS = frozenset(
+    {"source", "ownerType", "ownerId", "workflowType", "sampleSize"}
+)
+
+
+async def _execution_metrics_from_rollup(
+    session: AsyncSession,
+    *,
+    owner_type: str | None,
+    owner_id: str | None,
+    workflow_type: str | None,
+) -> ExecutionMetricsResponse:
+    """Build metrics from the materialized rollup with a single grouped query.
+
+    The rollup keeps sums rather than samples, so duration medians and extremes
+    are not available from this source.
+    """
+
+    totals = await load_execution_metrics_rollup(
+        session,
+        owner_type=owner_type,
+        owner_id=owner_id,
+        workflow_type=workflow_type,
+    )
+    completed = totals.runs_by_state.get("completed", 0)
+    failed = totals.runs_by_state.get("failed", 0)
+    canceled = totals.runs_by_state.get("canceled", 0)
+    terminal = completed + failed + canceled
+    duration = ExecutionMetricsDurationModel()
+    if totals.terminal_duration_count:
+        duration = ExecutionMetricsDurationModel(
+            averageSeconds=max(
+                totals.terminal_duration_total_seconds
+                / totals.terminal_duration_count,
+                0.0,
+            ),
+            observedCount=totals.terminal_duration_count,
+        )
+    cost = ExecutionMetricsCostModel()
+    if totals.cost_count:
+        cost_total = max(totals.cost_total_usd, 0.0)
+        cost = ExecutionMetricsCostModel(
+            totalEstimateUsd=cost_total,
+            averageEstimateUsd=cost_total / totals.cost_count,
+            observedCount=totals.cost_count,
+        )
+    return ExecutionMetricsResponse(
+        totalRuns=totals.total_runs,
+        completedRuns=completed,
+        failedRuns=failed,
+        canceledRuns=canceled,
+        terminalRuns=terminal,
+        successRate=completed / terminal if terminal else None,
+        duration=duration,
+        cost=cost,
+        sampleSize=terminal,
+        countMode="exact",
+        refreshedAt=datetime.now(UTC),
+    )
+
+
 @router.get("/metrics", response_model=ExecutionMetricsResponse)
 async def get_execution_metrics(
     *,
@@ -14045,13 +14144,16 @@ async def get_execution_metrics(
     user: User = Depends(get_current_user()),
     session: AsyncSession = Depends(get_async_session),
     temporal_client: Client = Depends(get_temporal_client),
+    group_by_support: TemporalVisibilityGroupBySupport = Depends(
+        get_temporal_visibility_group_by_support
+    ),
 ) -> ExecutionMetricsResponse:
-    if source not in {None, _TEMPORAL_SOURCE}:
+    if source not in {None, _TEMPORAL_SOURCE, _PROJECTION_SOURCE}:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail={
                 "code": "invalid_execution_query",
-                "message": "metrics currently support source=temporal only.",
+                "message": "metrics support source=temporal or source=projection.",
             },
         )
 
@@ -14060,6 +14162,34 @@ async def get_execution_metrics(
         owner_type=owner_type,
         owner_id=owner_id,
     )
+    unsupported_filters = sorted(
+        key
+        for key in request.query_params
+        if key not in _EXECUTION_METRICS_ROLLUP_PARAMS
+    )
+    # The rollup answers in one grouped query, so it is the default whenever
+    # it covers the requested filters; Temporal serves the rest and any
+    # explicit source=temporal request.
+    if source == _PROJECTION_SOURCE or (source is None and not unsupported_filters):
+        if unsupported_filters:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail={
+                    "code": "invalid_execution_query",
+                    "message": (
+                        "source=projection metrics only support ownerType, ownerId, "
+                        "and workflowType filters; unsupported: "
+                        + ", ".join(unsupported_filters)
+                        + "."
+                    ),
+                },
+            )
+        return await _execution_metrics_from_rollup(
+            session,
+            owner_type=effective_owner_type,
+            owner_id=effective_owner,
+            workflow_type=workflow_type,
+        )
     usable_search_attributes: frozenset[str] = frozenset()
 
     def build_query(
@@ -14150,18 +14280,46 @@ async def get_execution_metrics(
                 refreshedAt=datetime.now(UTC),
             )
 
-        async def count_matching_workflows(query: str | None) -> int:
-            if query is None:
-                return 0
-            count_result = await client.count_workflows(query=query)
-            return int(count_result.count)
-
-        total, completed, failed, canceled = await asyncio.gather(
-            count_matching_workflows(build_query()),
-            count_matching_workflows(build_query(metric_state_in="completed")),
-            count_matching_workflows(build_query(metric_state_in="failed")),
-            count_matching_workflows(build_query(metric_state_in="canceled")),
+        # Terminal metric buckets are ExecutionStatus slices of the base query,
+        # so one grouped count answers all of them when Visibility supports it.
+        # MoonMind state filters are intersected with each metric state rather
+        # than applied to the base query, so they keep the per-status counts.
+        state_filtered = bool(
+            str(state or "").strip()
+            or _raw_query_values(request, "stateIn", state_in)
+            or _raw_query_values(request, "stateNotIn", state_not_in)
+        )
+        status_counts = (
+            None
+            if state_filtered
+            else await _count_workflows_grouped(
+                client,
+                build_query(),
+                "ExecutionStatus",
+                group_by_support,
+            )
         )
+        if status_counts is not None:
+            total = sum(status_counts.values())
+            completed, failed, canceled = (
+                sum(
+                    status_counts.get(status_value, 0)
+                    for status_value in _TERMINAL_EXECUTION_STATUSES_BY_MM_STATE[
+                        metric_state
+                    ]
+                )
+                for metric_state in ("completed", "failed", "canceled")
+            )
+        else:
+            total, completed, failed, canceled = await _count_workflows_concurrently(
+                client,
+                [
+                    build_query(),
+                    build_query(metric_state_in="completed"),
+                    build_query(metric_state_in="failed"),
+                    build_query(metric_state_in="canceled"),
+                ],
+            )
 
         terminal_query = build_query(
             metric_state_in="completed,failed,canceled",
@@ -14239,6 +14397,42 @@ async def get_execution_metrics(
             },
         ) from exc
 
+async def _facet_value_counts(
+    client: Any,
+    base_query: str | None,
+    facet_attr: str,
+    values: Sequence[str],
+    group_by_support: TemporalVisibilityGroupBySupport,
+    *,
+    include_blank: bool = False,
+) -> list[int]:
+    """Return counts for ``values`` (plus the blank count) in facet order.
+
+    Uses one grouped Visibility count when the store supports grouping by the
+    facet attribute; otherwise the per-value counts run concurrently.
+    """
+
+    if facet_attr not in _OPTIONAL_TEMPORAL_SEARCH_ATTRIBUTES:
+        grouped = await _count_workflows_grouped(
+            client, base_query, facet_attr, group_by_support
+        )
+        if grouped is not None:
+            counts = [grouped.get(value, 0) for value in values]
+            if include_blank:
+                counts.append(grouped.get(None, 0) + grouped.get("", 0))
+            return counts
+    queries: list[str | None] = [
+        _and_temporal_query(
+            base_query,
+            f'{facet_attr}="{_escape_temporal_value(value)}"',
+        )
+        for value in values
+    ]
+    if include_blank:
+        queries.append(_and_temporal_query(base_query, f"{facet_attr} IS NULL"))
+    return await _count_workflows_concurrently(client, queries)
+
+
 @router.get("/facets", response_model=ExecutionFacetResponse)
 async def list_execution_facets(
     *,
@@ -14284,6 +14478,9 @@ async def list_execution_facets(
     source: Optional[str] = Query(None),
     user: User = Depends(get_current_user()),
     temporal_client: Client = Depends(get_temporal_client),
+    group_by_support: TemporalVisibilityGroupBySupport = Depends(
+        get_temporal_visibility_group_by_support
+    ),
 ) -> ExecutionFacetResponse:
     if source not in {None, _TEMPORAL_SOURCE}:
         raise HTTPException(
@@ -14403,21 +14600,21 @@ async def list_execution_facets(
                 if next_status_offset < len(matching_values)
                 else None
             )
-            items = []
-            for value in values:
-                count_info = await client.count_workflows(
-                    query=_and_temporal_query(
-                        base_query,
-                        f'{facet_attr}="{_escape_temporal_value(value)}"',
-                    )
-                )
-                items.append(
-                    ExecutionFacetItemModel(
-                        value=value,
-                        label=_facet_label(facet, value),
-                        count=count_info.count,
-                    )
+            counts = await _facet_value_counts(
+                client,
+                base_query,
+                facet_attr,
+                values,
+                group_by_support,
+            )
+            items = [
+                ExecutionFacetItemModel(
+                    value=value,
+                    label=_facet_label(facet, value),
+                    count=count,
                 )
+                for value, count in zip(values, counts, strict=True)
+            ]
             return ExecutionFacetResponse(
                 facet=facet,
                 items=items,
@@ -14447,24 +14644,23 @@ async def list_execution_facets(
             seen.add(value)
             values.append(value)
 
-        items = []
-        for value in values[:page_size]:
-            count_info = await client.count_workflows(
-                query=_and_temporal_query(
-                    base_query,
-                    f'{facet_attr}="{_escape_temporal_value(value)}"',
-                )
-            )
-            items.append(
-                ExecutionFacetItemModel(
-                    value=value,
-                    label=_facet_label(facet, value),
-                    count=count_info.count,
-                )
+        page_values = values[:page_size]
+        *counts, blank_count = await _facet_value_counts(
+            client,
+            base_query,
+            facet_attr,
+            page_values,
+            group_by_support,
+            include_blank=True,
+        )
+        items = [
+            ExecutionFacetItemModel(
+                value=value,
+                label=_facet_label(facet, value),
+                count=count,
             )
-        blank_info = await client.count_workflows(
-            query=_and_temporal_query(base_query, f"{facet_attr} IS NULL")
-        )
+            for value, count in zip(page_values, counts, strict=True)
+        ]
         next_token = (
             base64.b64encode(iterator.next_page_token).decode("utf-8")
             if iterator.next_page_token
@@ -14473,7 +14669,7 @@ async def list_execution_facets(
         return ExecutionFacetResponse(
             facet=facet,
             items=items,
-            blankCount=blank_info.count,
+            blankCount=blank_count,
             truncated=bool(iterator.next_page_token),
             nextPageToken=next_token,
             countMode="exact",
@@ -21,6 +21,7 @@ from moonmind.integrations.jira.browser import (
     JiraListResponse,
     JiraProject,
 )
+from moonmind.integrations.jira.cache import get_jira_browser_cache
 from moonmind.integrations.jira.errors import JiraToolError
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,7 @@ def _get_service() -> JiraBrowserService:
     return JiraBrowserService(
         atlassian_settings=settings.atlassian,
         feature_flags=settings.feature_flags,
+        cache=get_jira_browser_cache(),
     )
 
 def _to_http_exception(exc: JiraToolError) -> HTTPException:
@@ -178,6 +180,21 @@ async def get_issue(
     except Exception:
         raise _unexpected_http_exception() from None
 
+@router.post("/cache/invalidate", status_code=204, response_class=Response)
+async def invalidate_cache(
+    project_key: str | None = Query(None, alias="projectKey"),
+    board_id: str | None = Query(None, alias="boardId"),
+    _user: User = Depends(get_current_user()),
+    service: JiraBrowserService = Depends(_get_service),
+) -> Response:
+    try:
+        service.invalidate_cache(project_key=project_key, board_id=board_id)
+    except JiraToolError as exc:
+        raise _to_http_exception(exc) from None
+    except Exception:
+        raise _unexpected_http_exception() from None
+    return Response(status_code=204)
+
 @router.get(
     "/issues/{issue_key}/attachments/{attachment_id}/content",
     response_class=Response,
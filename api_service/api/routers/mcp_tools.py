@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api_service.api.dependencies import etag_matches
 from api_service.api.routers.container_jobs import container_jobs_ready
 from api_service.auth_providers import get_current_user
 from api_service.db.base import async_session_maker, get_async_session
@@ -74,6 +79,8 @@ router = APIRouter(prefix="/mcp", tags=["mcp-tools"])
 MCP_PROTOCOL_VERSION = "2025-03-26"
 SUPPORTED_MCP_PROTOCOL_VERSIONS = {MCP_PROTOCOL_VERSION, "2025-06-18"}
 MCP_SERVER_INFO = {"name": "moonmind", "version": "0.1.0"}
+# Messages of one JSON-RPC batch handled at the same time.
+_JSON_RPC_BATCH_CONCURRENCY = 8
 
 _execution_tool_registry = ExecutableToolDiscoveryRegistry()
 _container_job_registry = ContainerJobToolRegistry()
@@ -161,37 +168,58 @@ def _to_http_exception(exc: Exception) -> HTTPException:
     )
 
 
-def _list_container_job_tools() -> list[Any]:
-    if not container_jobs_ready():
-        return []
-    return _container_job_registry.list_tools()
+@dataclass(frozen=True, slots=True)
+class _ToolCatalog:
+    """Serialized tool listing and its validator for one registry set."""
 
+    tools: list[dict[str, Any]]
+    etag: str
 
-def _list_registered_tools() -> list[Any]:
-    tools = (
-        _execution_tool_registry.list_tools()
-        + _skills_on_demand_registry.list_tools()
-        + _remediation_registry.list_tools()
-        + _list_container_job_tools()
-    )
+
+# Keyed by the registries that make up a listing; registries compute their
+# metadata once, so a listing only changes when the registry set does.
+_tool_catalogs: dict[tuple[Any, ...], _ToolCatalog] = {}
+
+
+def _catalog_registries(*, streamable: bool) -> tuple[Any, ...]:
+    registries: list[Any] = [] if streamable else [_execution_tool_registry]
+    registries += [_skills_on_demand_registry, _remediation_registry]
+    if container_jobs_ready():
+        registries.append(_container_job_registry)
     if _jira_registry is not None:
-        tools = tools + _jira_registry.list_tools()
+        registries.append(_jira_registry)
     if _jules_registry is not None:
-        tools = tools + _jules_registry.list_tools()
-    return tools
+        registries.append(_jules_registry)
+    return tuple(registries)
+
+
+def _tool_catalog(*, streamable: bool) -> _ToolCatalog:
+    registries = _catalog_registries(streamable=streamable)
+    catalog = _tool_catalogs.get(registries)
+    if catalog is None:
+        tools = [
+            tool.model_dump(by_alias=True)
+            for registry in registries
+            for tool in registry.list_tools()
+        ]
+        digest = hashlib.sha256(
+            json.dumps(
+                tools, sort_keys=True, separators=(",", ":"), default=str
+            ).encode("utf-8")
+        ).hexdigest()
+        catalog = _ToolCatalog(tools=tools, etag=f'"{digest[:32]}"')
+        _tool_catalogs[registries] = catalog
+    return catalog
+
 
+def _tool_uses_request_session(tool: str) -> bool:
+    """Return whether dispatching ``tool`` uses the request's DB session."""
 
-def _list_streamable_callable_tools() -> list[Any]:
-    tools = (
-        _skills_on_demand_registry.list_tools()
-        + _remediation_registry.list_tools()
-        + _list_container_job_tools()
+    return (
+        _container_job_registry.has_tool(tool)
+        or tool.startswith("moonmind.skills.")
+        or tool.startswith("remediation.")
     )
-    if _jira_registry is not None:
-        tools = tools + _jira_registry.list_tools()
-    if _jules_registry is not None:
-        tools = tools + _jules_registry.list_tools()
-    return tools
 
 
 async def _dispatch_container_job_tool(
@@ -431,6 +459,8 @@ async def _handle_json_rpc_request(
     message: Any,
     user: User,
     session: AsyncSession | None = None,
+    *,
+    session_lock: asyncio.Lock | None = None,
 ) -> dict[str, Any] | None:
     if _is_json_rpc_notification(message) or _is_json_rpc_response(message):
         return None
@@ -483,11 +513,9 @@ async def _handle_json_rpc_request(
         if method == "ping":
             return _json_rpc_result(request_id, {})
         if method == "tools/list":
-            tools = [
-                tool.model_dump(by_alias=True)
-                for tool in _list_streamable_callable_tools()
-            ]
-            return _json_rpc_result(request_id, {"tools": tools})
+            return _json_rpc_result(
+                request_id, {"tools": _tool_catalog(streamable=True).tools}
+            )
         if method == "tools/call":
             tool_name = params.get("name")
             if not isinstance(tool_name, str) or not tool_name:
@@ -503,11 +531,19 @@ async def _handle_json_rpc_request(
                     code=-32602,
                     message="tools/call params.arguments must be an object.",
                 )
-            result = await _dispatch_tool_call(
-                ToolCallRequest(tool=tool_name, arguments=arguments),
-                user,
-                session,
+            # Batched calls run concurrently, but an AsyncSession supports one
+            # operation at a time: calls that use it take turns.
+            session_guard = (
+                session_lock
+                if session_lock is not None and _tool_uses_request_session(tool_name)
+                else contextlib.nullcontext()
             )
+            async with session_guard:
+                result = await _dispatch_tool_call(
+                    ToolCallRequest(tool=tool_name, arguments=arguments),
+                    user,
+                    session,
+                )
             return _json_rpc_result(request_id, _tool_result_payload(result))
     except HTTPException as exc:
         if method == "tools/call":
@@ -582,12 +618,21 @@ async def handle_streamable_http_post(
                 ),
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
+        batch_slots = asyncio.Semaphore(_JSON_RPC_BATCH_CONCURRENCY)
+        session_lock = asyncio.Lock()
+
+        async def _handle_batched(message: Any) -> dict[str, Any] | None:
+            async with batch_slots:
+                return await _handle_json_rpc_request(
+                    message, user, session, session_lock=session_lock
+                )
+
+        # gather keeps responses in request order.
         responses = [
             response
-            for response in [
-                await _handle_json_rpc_request(message, user, session)
-                for message in payload
-            ]
+            for response in await asyncio.gather(
+                *(_handle_batched(message) for message in payload)
+            )
             if response is not None
         ]
         if not responses:
@@ -626,10 +671,18 @@ async def list_resources(
 
 @router.get("/tools", response_model=ToolListResponse)
 async def list_tools(
+    request: Request,
     _user: User = Depends(get_current_user()),
-) -> ToolListResponse:
-    """Return all registered MCP tool definitions."""
-    return ToolListResponse(tools=_list_registered_tools())
+) -> Response:
+    """Return all registered MCP tool definitions.
+
+    The listing carries an ETag; a matching ``If-None-Match`` gets a 304.
+    """
+    catalog = _tool_catalog(streamable=False)
+    headers = {"ETag": catalog.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), catalog.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse({"tools": catalog.tools}, headers=headers)
 
 @router.post("/tools/call", response_model=ToolCallResponse)
 async def call_tool(
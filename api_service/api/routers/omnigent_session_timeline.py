@@ -17,10 +17,11 @@ internal token, raw host path, or unbounded payload is ever surfaced.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api_service.api.dependencies import etag_matches
 from api_service.auth_providers import get_current_user
 from api_service.db.base import get_async_session
 from api_service.db.models import User
@@ -46,16 +47,28 @@ def _require_diagnostic_read(user: User) -> None:
 @router.get("/{session_id}/timeline")
 async def get_session_timeline(
     session_id: str,
+    request: Request,
     user: User = Depends(get_current_user()),
     db: AsyncSession = Depends(get_async_session),
-) -> dict:
-    """Return the machine-readable operator timeline for one canonical session."""
+) -> Response:
+    """Return the machine-readable operator timeline for one canonical session.
+
+    The timeline carries an ETag derived from one aggregate query over the
+    session and its evidence tables; a matching ``If-None-Match`` gets a 304
+    without loading the evidence rows.
+    """
 
     _require_diagnostic_read(user)
+    service = OmnigentSessionTimelineService(db)
     try:
-        return await OmnigentSessionTimelineService(db).timeline(session_id)
+        etag = await service.timeline_etag(session_id)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        timeline = await service.timeline(session_id)
     except OmnigentSessionProjectionNotFound:
         raise HTTPException(404, "Session not found")
+    return JSONResponse(timeline, headers=headers)
 
 
 async def _diagnostic_redirect(
@@ -30,12 +30,13 @@ from fastapi import (
     Request,
     UploadFile,
 )
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api_service.api.dependencies import etag_matches
 from api_service.db.base import get_async_session
 from api_service.api.routers.workflow_console_view_model import (
     build_repository_branch_options,
@@ -44,7 +45,10 @@ from api_service.api.routers.workflow_console_view_model import (
 )
 from api_service.auth_providers import get_current_user
 from api_service.db.models import AgentSkillDefinition, TemporalArtifact, User
-from api_service.dashboard_static import DASHBOARD_HTML_CACHE_CONTROL
+from api_service.dashboard_static import (
+    DASHBOARD_HTML_CACHE_CONTROL,
+    DASHBOARD_SHELL_CACHE_CONTROL,
+)
 from api_service.services.settings_catalog import settings_permissions_for_user
 from moonmind.config.settings import settings
 from moonmind.capabilities.input_contracts import (
@@ -66,7 +70,11 @@ from moonmind.workflows.skills.resolver import (
 )
 
 from api_service.ui_boot import generate_boot_payload
-from api_service.ui_assets import DashboardUIAssetsError, ui_assets
+from api_service.ui_assets import (
+    DashboardUIAssetsError,
+    ui_assets,
+    ui_assets_build_key,
+)
 
 from moonmind.workflows.temporal import TemporalExecutionService
 
@@ -851,11 +859,40 @@ def _dashboard_ui_error_response(page: str, detail: str) -> HTMLResponse:
     return response
 
 
-def _vite_assets_or_error(page: str) -> HTMLResponse | str:
-    try:
-        return ui_assets("dashboard")
-    except DashboardUIAssetsError:
-        return _dashboard_ui_error_response(page, _DASHBOARD_UI_ERROR_DETAIL)
+@dataclass(frozen=True, slots=True)
+class _DashboardShell:
+    """Rendered dashboard HTML and its validator for one UI build."""
+
+    body: bytes
+    etag: str
+
+
+# Keyed by ``ui_assets_build_key``; only the current build is retained.
+_dashboard_shells: dict[tuple[Any, ...], _DashboardShell] = {}
+
+
+def _dashboard_shell() -> _DashboardShell:
+    """Return the dashboard shell for the current UI build, rendering it once.
+
+    The shell does not depend on the requested page or path (the React router
+    reads ``location`` client side), so every console route shares one body.
+    Raises ``DashboardUIAssetsError`` when the bundle cannot be resolved;
+    failures are not cached so a repaired bundle is picked up immediately.
+    """
+    build_key = ui_assets_build_key("dashboard")
+    shell = _dashboard_shells.get(build_key)
+    if shell is None:
+        html = templates.get_template("react_dashboard.html").render(
+            boot_payload=generate_boot_payload("dashboard"),
+            assets_html=ui_assets("dashboard"),
+            build_id=None,
+        )
+        body = html.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        shell = _DashboardShell(body=body, etag=f'"{digest[:32]}"')
+        _dashboard_shells.clear()
+        _dashboard_shells[build_key] = shell
+    return shell
 
 
 async def _render_react_page(
@@ -867,26 +904,17 @@ async def _render_react_page(
     data_wide_panel: bool = False,
     session: AsyncSession | None = None,
     user: User | None = None,
-) -> HTMLResponse:
+) -> Response:
     _ = (current_path, initial_data, data_wide_panel, session, user)
-    boot_payload = generate_boot_payload("dashboard")
-    assets_html = _vite_assets_or_error(page)
-    if isinstance(assets_html, HTMLResponse):
-        return assets_html
+    try:
+        shell = _dashboard_shell()
+    except DashboardUIAssetsError:
+        return _dashboard_ui_error_response(page, _DASHBOARD_UI_ERROR_DETAIL)
 
-    response = templates.TemplateResponse(
-        request,
-        "react_dashboard.html",
-        {
-            "request": request,
-            "boot_payload": boot_payload,
-            "assets_html": assets_html,
-            "current_path": current_path,
-            "build_id": None,
-        },
-    )
-    response.headers["Cache-Control"] = DASHBOARD_HTML_CACHE_CONTROL
-    return response
+    headers = {"ETag": shell.etag, "Cache-Control": DASHBOARD_SHELL_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), shell.etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=shell.body, headers=headers)
 
 
 def _is_zip_symlink(info: zipfile.ZipInfo) -> bool:
@@ -0,0 +1,397 @@
+"""Execution metric extraction and the materialized metrics rollup."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api_service.db.models import (
+    TemporalExecutionMetricsRollup,
+    TemporalExecutionRecord,
+)
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_COST_KEYS = frozenset(
+    {
+        "costEstimateUsd",
+        "cost_estimate_usd",
+        "estimatedCostUsd",
+        "estimated_cost_usd",
+        "costUsd",
+        "cost_usd",
+        "totalCostUsd",
+        "total_cost_usd",
+        "mm_cost_estimate_usd",
+        "moonmind.cost_estimate_usd",
+    }
+)
+
+_ROLLUP_KEY_COLUMNS = ("owner_type", "owner_key", "workflow_type", "state")
+
+def coerce_metric_float(value: Any) -> float | None:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, int | float):
+        candidate = float(value)
+    elif isinstance(value, str):
+        text = value.strip().replace("$", "").replace(",", "")
+        if not text:
+            return None
+        try:
+            candidate = float(text)
+        except ValueError:
+            return None
+    else:
+        return None
+    if candidate < 0:
+        return None
+    return candidate
+
+def extract_cost_estimate_usd(*payloads: Any) -> float | None:
+    stack = [(payload, False) for payload in payloads]
+    while stack:
+        value, cost_context = stack.pop()
+        if cost_context:
+            candidate = coerce_metric_float(value)
+            if candidate is not None:
+                return candidate
+        if isinstance(value, dict):
+            for key, nested in value.items():
+                if str(key) in EXECUTION_COST_KEYS:
+                    candidate = coerce_metric_float(nested)
+                    if candidate is not None:
+                        return candidate
+                    if isinstance(nested, dict | list | tuple):
+                        stack.append((nested, True))
+                elif isinstance(nested, dict | list | tuple):
+                    stack.append((nested, False))
+        elif isinstance(value, (list, tuple)):
+            stack.extend((nested, cost_context) for nested in value)
+    return None
+
+def duration_seconds_from_payload(payload: Mapping[str, Any]) -> float | None:
+    closed_at = payload.get("closed_at")
+    started_at = payload.get("started_at") or payload.get("created_at")
+    if not isinstance(closed_at, datetime) or not isinstance(started_at, datetime):
+        return None
+    if (closed_at.tzinfo is None) != (started_at.tzinfo is None):
+        # SQLite drops tzinfo on reload; projection timestamps are stored as UTC.
+        closed_at = closed_at.replace(tzinfo=closed_at.tzinfo or UTC)
+        started_at = started_at.replace(tzinfo=started_at.tzinfo or UTC)
+    duration = (closed_at - started_at).total_seconds()
+    return duration if duration >= 0 else None
+
+def _enum_text(value: Any) -> str:
+    return str(getattr(value, "value", value) or "")
+
+@dataclass(frozen=True, slots=True)
+class ExecutionMetricsContribution:
+    """What one execution projection row adds to the metrics rollup."""
+
+    owner_type: str
+    owner_key: str
+    workflow_type: str
+    state: str
+    duration_seconds: float | None = None
+    cost_usd: float | None = None
+
+    @classmethod
+    def from_record(
+        cls,
+        record: TemporalExecutionRecord | None,
+    ) -> ExecutionMetricsContribution | None:
+        if record is None:
+            return None
+        state = _enum_text(record.state)
+        workflow_type = _enum_text(record.workflow_type)
+        if not state or not workflow_type:
+            return None
+        return cls(
+            owner_type=_enum_text(record.owner_type) or "user",
+            owner_key=str(record.owner_id or ""),
+            workflow_type=workflow_type,
+            state=state,
+            duration_seconds=duration_seconds_from_payload(
+                {
+                    "closed_at": record.closed_at,
+                    "started_at": record.started_at,
+                    "created_at": record.created_at,
+                }
+            ),
+            cost_usd=extract_cost_estimate_usd(
+                record.search_attributes,
+                record.memo,
+                record.parameters,
+            ),
+        )
+
+async def apply_execution_metrics_delta(
+    session: AsyncSession,
+    previous: ExecutionMetricsContribution | None,
+    current: ExecutionMetricsContribution | None,
+) -> None:
+    """Move one execution's contribution from ``previous`` to ``current``.
+
+    Each adjustment is an atomic ``INSERT ... ON CONFLICT DO UPDATE`` so
+    concurrent projection syncs touching the same bucket never lose updates.
+    """
+
+    if previous == current:
+        return
+    if previous is not None:
+        await _adjust_rollup(session, previous, sign=-1)
+    if current is not None:
+        await _adjust_rollup(session, current, sign=1)
+
+async def _adjust_rollup(
+    session: AsyncSession,
+    contribution: ExecutionMetricsContribution,
+    *,
+    sign: int,
+) -> None:
+    has_duration = contribution.duration_seconds is not None
+    has_cost = contribution.cost_usd is not None
+    values = {
+        "owner_type": contribution.owner_type,
+        "owner_key": contribution.owner_key,
+        "workflow_type": contribution.workflow_type,
+        "state": contribution.state,
+        "run_count": sign,
+        "duration_count": sign if has_duration else 0,
+        "duration_total_seconds": (
+            sign * contribution.duration_seconds if has_duration else 0.0
+        ),
+        "cost_count": sign if has_cost else 0,
+        "cost_total_usd": sign * contribution.cost_usd if has_cost else 0.0,
+    }
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        await _adjust_rollup_orm(session, values)
+        return
+
+    table = TemporalExecutionMetricsRollup
+    stmt = insert(table).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(_ROLLUP_KEY_COLUMNS),
+        set_={
+            "run_count": table.run_count + stmt.excluded.run_count,
+            "duration_count": table.duration_count + stmt.excluded.duration_count,
+            "duration_total_seconds": table.duration_total_seconds
+            + stmt.excluded.duration_total_seconds,
+            "cost_count": table.cost_count + stmt.excluded.cost_count,
+            "cost_total_usd": table.cost_total_usd + stmt.excluded.cost_total_usd,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+async def _adjust_rollup_orm(session: AsyncSession, values: dict[str, Any]) -> None:
+    key = tuple(values[column] for column in _ROLLUP_KEY_COLUMNS)
+    row = await session.get(TemporalExecutionMetricsRollup, key)
+    if row is None:
+        session.add(TemporalExecutionMetricsRollup(**values))
+        return
+    row.run_count += values["run_count"]
+    row.duration_count += values["duration_count"]
+    row.duration_total_seconds += values["duration_total_seconds"]
+    row.cost_count += values["cost_count"]
+    row.cost_total_usd += values["cost_total_usd"]
+
+async def rebuild_execution_metrics_rollup(
+    session: AsyncSession,
+    *,
+    batch_size: int = 500,
+) -> int:
+    """Recompute the rollup from the execution projection; returns rows scanned."""
+
+    totals: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+    scanned = 0
+    result = await session.stream_scalars(
+        select(TemporalExecutionRecord).execution_options(yield_per=batch_size)
+    )
+    async for record in result:
+        scanned += 1
+        contribution = ExecutionMetricsContribution.from_record(record)
+        if contribution is None:
+            continue
+        key = (
+            contribution.owner_type,
+            contribution.owner_key,
+            contribution.workflow_type,
+            contribution.state,
+        )
+        bucket = totals.setdefault(
+            key,
+            {
+                "run_count": 0,
+                "duration_count": 0,
+                "duration_total_seconds": 0.0,
+                "cost_count": 0,
+                "cost_total_usd": 0.0,
+            },
+        )
+        bucket["run_count"] += 1
+        if contribution.duration_seconds is not None:
+            bucket["duration_count"] += 1
+            bucket["duration_total_seconds"] += contribution.duration_seconds
+        if contribution.cost_usd is not None:
+            bucket["cost_count"] += 1
+            bucket["cost_total_usd"] += contribution.cost_usd
+
+    await session.execute(delete(TemporalExecutionMetricsRollup))
+    session.add_all(
+        TemporalExecutionMetricsRollup(
+            **dict(zip(_ROLLUP_KEY_COLUMNS, key, strict=True)),
+            **bucket,
+        )
+        for key, bucket in totals.items()
+    )
+    logger.info(
+        "Rebuilt execution metrics rollup from %s projection rows into %s buckets",
+        scanned,
+        len(totals),
+    )
+    return scanned
+
+async def reconcile_execution_metrics_rollup(
+    session: AsyncSession,
+    *,
+    batch_size: int = 500,
+) -> int | None:
+    """Rebuild the rollup when any bucket's run count disagrees with the projection.
+
+    Compares per-(owner, workflow type, state) counts, so drift between state
+    buckets that leaves the overall total unchanged is repaired as well. Covers
+    the first start after the rollup table is created and drift left behind by
+    interrupted projection syncs. Returns the number of rows scanned by the
+    rebuild, or ``None`` when the rollup already matched.
+    """
+
+    record = TemporalExecutionRecord
+    projected: dict[tuple[str, str, str, str], int] = {}
+    projected_rows = await session.execute(
+        select(
+            record.owner_type,
+            record.owner_id,
+            record.workflow_type,
+            record.state,
+            func.count(),
+        ).group_by(
+            record.owner_type, record.owner_id, record.workflow_type, record.state
+        )
+    )
+    for owner_type, owner_id, workflow_type, state, count in projected_rows:
+        state_text = _enum_text(state)
+        workflow_type_text = _enum_text(workflow_type)
+        if not state_text or not workflow_type_text:
+            continue
+        key = (
+            _enum_text(owner_type) or "user",
+            str(owner_id or ""),
+            workflow_type_text,
+            state_text,
+        )
+        projected[key] = projected.get(key, 0) + int(count)
+
+    table = TemporalExecutionMetricsRollup
+    rollup_rows = await session.execute(
+        select(
+            table.owner_type,
+            table.owner_key,
+            table.workflow_type,
+            table.state,
+            table.run_count,
+        ).where(table.run_count != 0)
+    )
+    rolled_up = {tuple(row[:4]): int(row[4]) for row in rollup_rows}
+    if projected == rolled_up:
+        return None
+    drifted = sum(
+        1
+        for key in projected.keys() | rolled_up.keys()
+        if projected.get(key) != rolled_up.get(key)
+    )
+    logger.info(
+        "Execution metrics rollup disagrees with the projection in %s buckets; "
+        "rebuilding",
+        drifted,
+    )
+    return await rebuild_execution_metrics_rollup(session, batch_size=batch_size)
+
+@dataclass(slots=True)
+class ExecutionMetricsRollupTotals:
+    """Aggregated rollup values for one metrics request."""
+
+    runs_by_state: dict[str, int] = field(default_factory=dict)
+    terminal_duration_count: int = 0
+    terminal_duration_total_seconds: float = 0.0
+    cost_count: int = 0
+    cost_total_usd: float = 0.0
+
+    @property
+    def total_runs(self) -> int:
+        return sum(self.runs_by_state.values())
+
+async def load_execution_metrics_rollup(
+    session: AsyncSession,
+    *,
+    owner_type: str | None = None,
+    owner_id: str | None = None,
+    workflow_type: str | None = None,
+    terminal_states: frozenset[str] = frozenset({"completed", "failed", "canceled"}),
+) -> ExecutionMetricsRollupTotals:
+    """Read rollup totals grouped by state in a single query."""
+
+    table = TemporalExecutionMetricsRollup
+    stmt = select(
+        table.state,
+        func.sum(table.run_count),
+        func.sum(table.duration_count),
+        func.sum(table.duration_total_seconds),
+        func.sum(table.cost_count),
+        func.sum(table.cost_total_usd),
+    ).group_by(table.state)
+    if owner_type is not None:
+        stmt = stmt.where(table.owner_type == owner_type)
+    if owner_id is not None:
+        stmt = stmt.where(table.owner_key == owner_id)
+    if workflow_type is not None:
+        stmt = stmt.where(table.workflow_type == workflow_type)
+
+    totals = ExecutionMetricsRollupTotals()
+    for state, runs, durations, duration_total, costs, cost_total in (
+        await session.execute(stmt)
+    ).all():
+        # Buckets can only go negative if a row was decremented before the
+        # rollup was backfilled; never surface that as a negative count.
+        totals.runs_by_state[str(state)] = max(int(runs or 0), 0)
+        if str(state) in terminal_states and int(durations or 0) > 0:
+            totals.terminal_duration_count += int(durations)
+            totals.terminal_duration_total_seconds += float(duration_total or 0.0)
+        if int(costs or 0) > 0:
+            totals.cost_count += int(costs)
+            totals.cost_total_usd += float(cost_total or 0.0)
+    return totals
+
+__all__ = [
+    "EXECUTION_COST_KEYS",
+    "ExecutionMetricsContribution",
+    "ExecutionMetricsRollupTotals",
+    "apply_execution_metrics_delta",
+    "coerce_metric_float",
+    "duration_seconds_from_payload",
+    "extract_cost_estimate_usd",
+    "load_execution_metrics_rollup",
+    "rebuild_execution_metrics_rollup",
+]
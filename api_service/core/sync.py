@@ -9,6 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 from temporalio.client import WorkflowExecutionDescription, WorkflowExecutionStatus
 
+from api_service.core.execution_metrics import (
+    ExecutionMetricsContribution,
+    apply_execution_metrics_delta,
+)
 from api_service.db.models import (
     MoonMindWorkflowState,
     TemporalExecutionCanonicalRecord,
@@ -415,6 +419,7 @@ async def sync_execution_projection(
     projection = await session.get(TemporalExecutionRecord, desc.id)
     canonical = await session.get(TemporalExecutionCanonicalRecord, desc.id)
     previous_version = int(projection.projection_version or 0) if projection else 0
+    previous_metrics = ExecutionMetricsContribution.from_record(projection)
     synced_at = synced_at or _utc_now()
     semantic_updated_at = payload.get("updated_at")
     if semantic_updated_at is None:
@@ -499,6 +504,11 @@ async def sync_execution_projection(
             close_status_value,
         )
 
+    await apply_execution_metrics_delta(
+        session,
+        previous_metrics,
+        ExecutionMetricsContribution.from_record(projection),
+    )
     return projection
 
 async def fetch_and_sync_execution(
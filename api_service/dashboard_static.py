@@ -9,6 +9,7 @@ from starlette.staticfiles import StaticFiles
 from starlette.types import Scope
 
 DASHBOARD_HTML_CACHE_CONTROL = "no-store"
+DASHBOARD_SHELL_CACHE_CONTROL = "private, no-cache"
 DASHBOARD_DIST_CACHE_CONTROL = "no-cache, must-revalidate"
 DASHBOARD_IMMUTABLE_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
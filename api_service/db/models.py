@@ -1193,6 +1193,44 @@ class OmnigentCleanupAuthority(Base):
     )
 
 
+class OmnigentBackfillCheckpoint(Base):
+    """Durable progress of a chunked legacy bridge-row backfill.
+
+    Each applied chunk advances ``cursor_workflow_id`` in the same transaction
+    as its writes, so an interrupted backfill resumes after the last committed
+    workflow instead of starting over. ``completed_at`` marks a finished pass;
+    the next run starts a fresh pass from the beginning.
+    """
+
+    __tablename__ = "omnigent_backfill_checkpoints"
+
+    backfill_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    cursor_workflow_id: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True
+    )
+    chunks_completed: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    bridge_rows_processed: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    bridge_events_processed: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
 class WorkflowCheckpointBranch(Base):
     """Product-level checkpoint branch persisted separately from git refs."""
 
@@ -2642,6 +2680,43 @@ class TemporalExecutionRecord(Base):
         return candidate
 
 
+class TemporalExecutionMetricsRollup(Base):
+    """Materialized run metrics per owner, workflow type, and lifecycle state.
+
+    Rows are adjusted incrementally whenever an execution projection changes so
+    dashboard metrics can be read with one grouped query instead of counting
+    Temporal Visibility per bucket.
+    """
+
+    __tablename__ = "temporal_execution_metric_rollups"
+
+    owner_type: Mapped[str] = mapped_column(String(16), primary_key=True)
+    owner_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    workflow_type: Mapped[str] = mapped_column(String(64), primary_key=True)
+    state: Mapped[str] = mapped_column(String(32), primary_key=True)
+    run_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    duration_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    duration_total_seconds: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default=text("0")
+    )
+    cost_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    cost_total_usd: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default=text("0")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
 class TemporalIntegrationCorrelationRecord(Base):
     """Durable lookup record for resolving integration callbacks to workflows."""
 
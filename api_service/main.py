@@ -1688,6 +1688,7 @@ async def startup_event():
             exc,
         )
     await _sync_preset_seed_catalog()
+    await _reconcile_execution_metrics_rollup()
     # Readiness uses only bounded local image inspection. Registry refresh runs
     # in the lifespan-owned reconciler after the API can serve health checks.
     omnigent_bootstrap_ready = await _reconcile_omnigent_bootstrap_once(
@@ -1791,6 +1792,28 @@ def teardown_providers():
     """
     pass
 
+async def _reconcile_execution_metrics_rollup() -> None:
+    """Seed or repair the execution metrics rollup from the projection."""
+
+    from api_service.core.execution_metrics import (
+        reconcile_execution_metrics_rollup,
+    )
+
+    try:
+        async with get_async_session_context() as session:
+            scanned = await reconcile_execution_metrics_rollup(session)
+            if scanned is not None:
+                await session.commit()
+    except (OperationalError, ProgrammingError) as exc:
+        logger.warning(
+            "Execution metrics rollup reconcile skipped because tables are unavailable: %s",
+            exc,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Execution metrics rollup reconcile failed: %s", exc, exc_info=True
+        )
+
 async def _sync_preset_seed_catalog() -> None:
     """Ensure YAML-backed default task presets exist in the catalog."""
 
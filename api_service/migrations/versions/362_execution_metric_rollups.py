@@ -0,0 +1,59 @@
+"""Materialize execution metrics per owner, workflow type, and state.
+
+Revision ID: 362_execution_metric_rollups
+Revises: 361_omnigent_execution_authority
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "362_execution_metric_rollups"
+down_revision: Union[str, None] = "361_omnigent_execution_authority"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "temporal_execution_metric_rollups",
+        sa.Column("owner_type", sa.String(length=16), nullable=False),
+        sa.Column("owner_key", sa.String(length=64), nullable=False),
+        sa.Column("workflow_type", sa.String(length=64), nullable=False),
+        sa.Column("state", sa.String(length=32), nullable=False),
+        sa.Column("run_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("duration_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "duration_total_seconds",
+            sa.Float(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("cost_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cost_total_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint(
+            "owner_type",
+            "owner_key",
+            "workflow_type",
+            "state",
+            name="pk_temporal_execution_metric_rollups",
+        ),
+    )
+    # The rollup is seeded (costs included) by
+    # ``reconcile_execution_metrics_rollup`` during API startup, which works on
+    # every dialect and reuses the projection sync's metric extraction.
+
+
+def downgrade() -> None:
+    op.drop_table("temporal_execution_metric_rollups")
@@ -0,0 +1,51 @@
+"""Durable checkpoints for the chunked Omnigent bridge-row backfill.
+
+Revision ID: 363_omnigent_backfill_ckpt
+Revises: 362_execution_metric_rollups
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "363_omnigent_backfill_ckpt"
+down_revision: Union[str, None] = "362_execution_metric_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "omnigent_backfill_checkpoints",
+        sa.Column("backfill_name", sa.String(length=64), primary_key=True),
+        sa.Column("cursor_workflow_id", sa.String(length=255), nullable=True),
+        sa.Column(
+            "chunks_completed", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "bridge_rows_processed", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "bridge_events_processed",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("omnigent_backfill_checkpoints")
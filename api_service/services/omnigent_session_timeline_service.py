@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from datetime import UTC, datetime
 from urllib.parse import quote
 
@@ -23,6 +24,10 @@ _EVENT_OBSERVATION_TYPES = (
     "provider_event_batch",
 )
 _SNAPSHOT_OBSERVATION_TYPES = ("snapshot", "provider_snapshot")
+_TIMELINE_OBSERVATION_GROUPS = {
+    "snapshot": _SNAPSHOT_OBSERVATION_TYPES,
+    "event": _EVENT_OBSERVATION_TYPES,
+}
 
 
 class OmnigentSessionProjectionNotFound(LookupError):
@@ -45,29 +50,33 @@ class OmnigentSessionTimelineService:
             raise OmnigentSessionProjectionNotFound(session_id)
         return session
 
-    async def timeline(self, session_id: str) -> dict:
-        session = await self._session(session_id)
-        active_turn = (
-            await self._repos.turn_attempts.get(session.active_turn_attempt_id)
-            if session.active_turn_attempt_id is not None
-            else None
-        )
-        turn_attempt_count = await self._repos.turn_attempts.count_for_session(
-            session_id
-        )
-        latest_snapshot = await self._repos.observations.latest_for_session(
-            session_id, observation_types=_SNAPSHOT_OBSERVATION_TYPES
+    async def _evidence(self, session_id: str, **observation_type_groups):
+        evidence = await self._repos.session_evidence(
+            session_id, observation_type_groups=observation_type_groups
         )
-        latest_event = await self._repos.observations.latest_for_session(
-            session_id, observation_types=_EVENT_OBSERVATION_TYPES
-        )
-        active_command = await self._repos.commands.active_for_session(session_id)
-        latest_decision = await self._repos.decisions.latest_for_session(session_id)
-        if latest_decision is None and session.last_decision_ref is not None:
-            latest_decision = await self._repos.decisions.get(
-                session.last_decision_ref
-            )
-        cleanup = await self._repos.cleanup.get(session_id)
+        if evidence is None:
+            raise OmnigentSessionProjectionNotFound(session_id)
+        return evidence
+
+    async def timeline_etag(self, session_id: str) -> str:
+        """Return the timeline validator from one aggregate evidence query.
+
+        The validator covers the session revision plus the newest write and
+        row count of every evidence table the timeline reads, since appends
+        to those tables do not always touch the session row.
+        """
+
+        version = await self._repos.session_evidence_version(session_id)
+        if version is None:
+            raise OmnigentSessionProjectionNotFound(session_id)
+        identity = ":".join(str(part) for part in version)
+        digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        return f'"{digest[:32]}"'
+
+    async def timeline(self, session_id: str) -> dict:
+        evidence = await self._evidence(session_id, **_TIMELINE_OBSERVATION_GROUPS)
+        session = evidence.session
+        latest_decision = evidence.latest_decision
         telemetry = TelemetrySettings.from_env()
         encoded_session_id = quote(session_id, safe="")
         trace_link = (
@@ -84,29 +93,30 @@ class OmnigentSessionTimelineService:
         )
         return build_timeline(
             session=session,
-            turn_attempts=[active_turn] if active_turn is not None else (),
+            turn_attempts=(
+                [evidence.active_turn] if evidence.active_turn is not None else ()
+            ),
             observations=[
-                item
-                for item in (latest_snapshot, latest_event)
-                if item is not None
+                evidence.latest_observations[group]
+                for group in _TIMELINE_OBSERVATION_GROUPS
+                if group in evidence.latest_observations
             ],
-            commands=[active_command] if active_command is not None else (),
+            commands=(
+                [evidence.active_command]
+                if evidence.active_command is not None
+                else ()
+            ),
             decisions=[latest_decision] if latest_decision is not None else (),
-            cleanup=cleanup,
-            turn_attempt_count=turn_attempt_count,
+            cleanup=evidence.cleanup,
+            turn_attempt_count=evidence.turn_attempt_count,
             trace_link=trace_link,
             log_link=log_link,
         ).to_dict()
 
     async def diagnostic_target(self, session_id: str, kind: str) -> str:
-        session = await self._session(session_id)
         telemetry = TelemetrySettings.from_env()
         if kind == "trace":
-            decision = await self._repos.decisions.latest_for_session(session_id)
-            if decision is None and session.last_decision_ref is not None:
-                decision = await self._repos.decisions.get(
-                    session.last_decision_ref
-                )
+            decision = (await self._evidence(session_id)).latest_decision
             trace_id = (
                 safe_timeline_ref(decision.trace_ref)
                 if decision is not None
@@ -116,6 +126,7 @@ class OmnigentSessionTimelineService:
                 telemetry.trace_url_template, trace_id=trace_id
             )
         else:
+            session = await self._session(session_id)
             target = build_backend_url(
                 telemetry.logs_url_template,
                 workflow_id=session.moonmind_workflow_id,
@@ -126,10 +137,12 @@ class OmnigentSessionTimelineService:
         return target
 
     async def stuck_state(self, session_id: str) -> dict:
-        await self._session(session_id)
         inspection = await inspect_stuck_state(
             self._repos, session_id=session_id, now=datetime.now(UTC)
         )
+        if inspection is None:
+            # Quarantined sessions have no inspection; unknown ones are a 404.
+            await self._session(session_id)
         findings = inspection.findings if inspection is not None else ()
         response = inspection.response if inspection is not None else None
         return {
@@ -14,6 +14,37 @@ from moonmind.workflows.temporal.remediation_tools import (
 )
 from moonmind.workflows.temporal.runtime.store import ManagedRunStore
 
+_TAIL_BLOCK_BYTES = 64 * 1024
+_TAIL_MAX_BYTES = 4 * 1024 * 1024
+
+
+def _read_tail_lines(
+    path: Path,
+    limit: int,
+    *,
+    max_bytes: int = _TAIL_MAX_BYTES,
+) -> list[str]:
+    """Return the last ``limit`` lines of ``path`` reading backwards from EOF.
+
+    At most ``max_bytes`` are read, so a huge diagnostics file never has to be
+    loaded whole just to show its final lines.
+    """
+
+    with path.open("rb") as handle:
+        position = handle.seek(0, 2)
+        floor = max(0, position - max_bytes)
+        buffer = b""
+        while position > floor and buffer.count(b"\n") <= limit:
+            step = min(_TAIL_BLOCK_BYTES, position - floor)
+            position -= step
+            handle.seek(position)
+            buffer = handle.read(step) + buffer
+    lines = buffer.decode("utf-8", errors="replace").splitlines()
+    if position > 0 and lines:
+        # The first line may start mid-record; only keep complete lines.
+        lines = lines[1:]
+    return lines[-limit:]
+
 
 class ManagedRunRemediationLogAdapter:
     """Read the canonical managed-run journal/spool/artifact fallback."""
@@ -71,13 +102,11 @@ class ManagedRunRemediationLogAdapter:
                     lines=(),
                     next_cursor=None,
                 )
-            content = await asyncio.to_thread(
-                path.read_text, encoding="utf-8", errors="replace"
-            )
+            lines = await asyncio.to_thread(_read_tail_lines, path, limit)
             return RemediationLogReadResult(
                 agent_run_id=agent_run_id,
                 stream=stream,
-                lines=tuple(content.splitlines()[-limit:]),
+                lines=tuple(lines),
                 next_cursor=None,
             )
         streams = (
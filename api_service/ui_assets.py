@@ -163,6 +163,26 @@ def _dist_root_manifest_mtime_ns(dist_root: Path) -> int:
     except OSError:
         return -1
 
+def ui_assets_build_key(entrypoint: str = "dashboard") -> tuple[Any, ...]:
+    """Return a cheap key that changes whenever ``ui_assets`` output may change.
+
+    Only the environment and candidate manifest mtimes are consulted, so callers
+    can hold rendered asset tags in memory without re-walking the manifest.
+    """
+    configured_manifest_path = _configured_manifest_path()
+    if configured_manifest_path:
+        dist_roots: tuple[Path, ...] = (
+            _dist_root_for_manifest(configured_manifest_path),
+        )
+    else:
+        dist_roots = (bundled_ui_dist_root(), local_ui_dist_root())
+    return (
+        entrypoint,
+        os.environ.get("MOONMIND_UI_DEV_SERVER_URL", "").strip(),
+        _lenient_ui_assets(),
+        tuple((str(root), _dist_root_manifest_mtime_ns(root)) for root in dist_roots),
+    )
+
 def resolve_dashboard_dist_root(entrypoint: str = "dashboard") -> Path:
     configured_manifest_path = _configured_manifest_path()
     if configured_manifest_path:
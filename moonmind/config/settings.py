@@ -167,6 +167,42 @@ class TemporalSettings(BaseSettings):
         validation_alias="TEMPORAL_DEPLOYMENT_WORKER_CONCURRENCY",
         ge=1,
     )
+    worker_resource_tuning_enabled: bool = Field(
+        True,
+        validation_alias="TEMPORAL_WORKER_RESOURCE_TUNING_ENABLED",
+        description=(
+            "Admit tasks on host-bound fleets by measured CPU and memory headroom "
+            "instead of a fixed slot count."
+        ),
+    )
+    worker_target_memory_usage: float = Field(
+        0.8,
+        validation_alias="TEMPORAL_WORKER_TARGET_MEMORY_USAGE",
+        gt=0.0,
+        le=1.0,
+    )
+    worker_target_cpu_usage: float = Field(
+        0.9,
+        validation_alias="TEMPORAL_WORKER_TARGET_CPU_USAGE",
+        gt=0.0,
+        le=1.0,
+    )
+    worker_resource_tuning_min_slots: int = Field(
+        1,
+        validation_alias="TEMPORAL_WORKER_RESOURCE_TUNING_MIN_SLOTS",
+        ge=1,
+        description="Slots a resource-tuned fleet always admits regardless of load.",
+    )
+    worker_resource_tuning_max_slots_multiplier: int = Field(
+        1,
+        validation_alias="TEMPORAL_WORKER_RESOURCE_TUNING_MAX_SLOTS_MULTIPLIER",
+        ge=1,
+        description=(
+            "Resource-tuned fleets may grow to this multiple of their configured "
+            "worker concurrency when the host has headroom. The default of 1 "
+            "only throttles below the configured concurrency."
+        ),
+    )
     integration_poll_initial_seconds: int = Field(
         5,
         validation_alias="TEMPORAL_INTEGRATION_POLL_INITIAL_SECONDS",
@@ -198,6 +234,40 @@ class TemporalSettings(BaseSettings):
         validation_alias="TEMPORAL_MANIFEST_CONTINUE_AS_NEW_PHASE_THRESHOLD",
         ge=1,
     )
+    payload_codec_encode_enabled: bool = Field(
+        False,
+        validation_alias="TEMPORAL_PAYLOAD_CODEC_ENCODE_ENABLED",
+        description=(
+            "Compress and claim-check large Temporal payloads. Opt-in: enable "
+            "only once every client and worker decodes MoonMind payloads. "
+            "Decoding of already-encoded payloads stays enabled when this is off."
+        ),
+    )
+    payload_compression_threshold_bytes: int = Field(
+        16 * 1024,
+        validation_alias="TEMPORAL_PAYLOAD_COMPRESSION_THRESHOLD_BYTES",
+        ge=0,
+        description="Payloads at or above this size are zlib-compressed; 0 disables.",
+    )
+    payload_claim_check_threshold_bytes: int = Field(
+        256 * 1024,
+        validation_alias="TEMPORAL_PAYLOAD_CLAIM_CHECK_THRESHOLD_BYTES",
+        ge=0,
+        description=(
+            "Encoded payloads at or above this size are offloaded to the artifact "
+            "store and replaced by a claim-check reference; 0 disables."
+        ),
+    )
+    payload_claim_check_retention_seconds: int = Field(
+        180 * 24 * 60 * 60,
+        validation_alias="TEMPORAL_PAYLOAD_CLAIM_CHECK_RETENTION_SECONDS",
+        ge=0,
+        description=(
+            "Artifact lifecycle sweeps delete claim-check blobs not rewritten for "
+            "this long. Keep it above TEMPORAL_NAMESPACE_RETENTION_DAYS plus the "
+            "longest workflow run; 0 disables cleanup."
+        ),
+    )
     model_config = SettingsConfigDict(
         populate_by_name=True,
         env_prefix="",
@@ -968,6 +1038,41 @@ class WorkflowSettings(BaseSettings):
         validation_alias=AliasChoices("WORKFLOW_SKILLS_CACHE_ROOT"),
         description="Immutable cache root for verified skill artifacts.",
     )
+    skills_content_cache_root: str = Field(
+        "",
+        validation_alias=AliasChoices("WORKFLOW_SKILLS_CONTENT_CACHE_ROOT"),
+        description=(
+            "Absolute path of the host-level cache of extracted skill content "
+            "keyed by content digest; run workspaces receive reflinked or copied "
+            "files from it. Empty disables the cache."
+        ),
+    )
+    skills_content_cache_max_bytes: int = Field(
+        1024 * 1024 * 1024,
+        ge=0,
+        validation_alias=AliasChoices("WORKFLOW_SKILLS_CONTENT_CACHE_MAX_BYTES"),
+        description=(
+            "LRU size budget for the skill content cache. Set to 0 to disable "
+            "the cache and extract skill artifacts into every run."
+        ),
+    )
+    git_object_cache_root: str = Field(
+        "",
+        validation_alias=AliasChoices("WORKFLOW_GIT_OBJECT_CACHE_ROOT"),
+        description=(
+            "Host-level directory of bare repository mirrors used to seed run "
+            "workspace clones. Leave empty to clone every workspace directly."
+        ),
+    )
+    git_object_cache_max_bytes: int = Field(
+        20 * 1024 * 1024 * 1024,
+        ge=0,
+        validation_alias=AliasChoices("WORKFLOW_GIT_OBJECT_CACHE_MAX_BYTES"),
+        description=(
+            "LRU size budget for the git object cache. Set to 0 to disable the "
+            "cache even when a root is configured."
+        ),
+    )
     skills_workspace_root: str = Field(
         "runs",
         validation_alias=AliasChoices("WORKFLOW_SKILLS_WORKSPACE_ROOT"),
@@ -1534,6 +1639,15 @@ class JiraSettings(BaseSettings):
     jira_retry_attempts: int = Field(
         3, alias="ATLASSIAN_JIRA_RETRY_ATTEMPTS", ge=1
     )
+    jira_browser_metadata_cache_ttl_seconds: float = Field(
+        300.0, alias="ATLASSIAN_JIRA_BROWSER_METADATA_CACHE_TTL_SECONDS", ge=0.0
+    )
+    jira_browser_metadata_cache_stale_seconds: float = Field(
+        3600.0, alias="ATLASSIAN_JIRA_BROWSER_METADATA_CACHE_STALE_SECONDS", ge=0.0
+    )
+    jira_browser_issue_cache_ttl_seconds: float = Field(
+        15.0, alias="ATLASSIAN_JIRA_BROWSER_ISSUE_CACHE_TTL_SECONDS", ge=0.0
+    )
 
     @field_validator("jira_allowed_projects", mode="before")
     @classmethod
@@ -1748,6 +1862,14 @@ class MemorySettings(BaseSettings):
         gt=0,
         description="Maximum token budget for memory context packed into a request.",
     )
+    plane_timeout_ms: int = Field(
+        2000,
+        ge=0,
+        description=(
+            "Deadline for collecting each memory plane into a context pack; "
+            "0 waits for every plane."
+        ),
+    )
 
     @field_validator("planning", "history", "long_term", mode="before")
     @classmethod
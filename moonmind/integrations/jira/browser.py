@@ -19,6 +19,7 @@ from moonmind.config.settings import (
     settings,
 )
 from moonmind.integrations.jira.auth import resolve_jira_connection
+from moonmind.integrations.jira.cache import JiraBrowserCache, JiraCacheKey
 from moonmind.integrations.jira.client import JiraClient
 from moonmind.integrations.jira.errors import JiraToolError
 
@@ -31,6 +32,7 @@ _JIRA_ISSUE_KEY_RE = re.compile(r"^[A-Za-z][A-Za-z0-9]+-\d+$")
 _BOARD_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
 _JIRA_ATTACHMENT_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
 _JIRA_BROWSER_PAGE_SIZE = 50
+_JIRA_ISSUE_WATERMARK_FIELDS = "updated"
 _ACCEPTANCE_HEADING_RE = re.compile(
     r"(?im)^\s*(acceptance\s+criteria|acceptance|ac)\s*:?\s*$"
 )
@@ -40,6 +42,13 @@ class _JiraProjectScope:
     keys: frozenset[str]
     ids: frozenset[str]
 
+@dataclass(frozen=True)
+class _JiraIssueListing:
+    """Cached board issue payloads plus the watermark used to revalidate them."""
+
+    watermark: tuple[int, str]
+    issues: tuple[Mapping[str, Any], ...]
+
 class JiraBrowserModel(BaseModel):
     """Base model for Jira browser responses."""
 
@@ -178,9 +187,11 @@ class JiraBrowserService:
         *,
         atlassian_settings: AtlassianSettings | None = None,
         feature_flags: FeatureFlagsSettings | None = None,
+        cache: JiraBrowserCache | None = None,
     ) -> None:
         self._settings = atlassian_settings or settings.atlassian
         self._feature_flags = feature_flags or settings.feature_flags
+        self._cache = cache
 
     async def verify_connection(
         self,
@@ -221,9 +232,9 @@ class JiraBrowserService:
             async with self._jira_client() as client:
                 results = await asyncio.gather(
                     *(
-                        self._request_json_with_client(
+                        self._request_metadata_json(
                             client,
-                            method="GET",
+                            scope=("project", project_key),
                             path=f"/project/{project_key}",
                             action="jira_browser.list_projects",
                             context={"projectKey": project_key},
@@ -250,8 +261,9 @@ class JiraBrowserService:
                 )
             return JiraListResponse[JiraProject](items=projects)
 
-        payload = await self._request_json(
-            method="GET",
+        payload = await self._request_metadata_json(
+            None,
+            scope=None,
             path="/project/search",
             action="jira_browser.list_projects",
             params={"maxResults": 50},
@@ -271,8 +283,9 @@ class JiraBrowserService:
         self._ensure_enabled()
         normalized_project = self._normalize_project_key(project_key)
         self._ensure_project_allowed(normalized_project)
-        payload = await self._request_json(
-            method="GET",
+        payload = await self._request_metadata_json(
+            None,
+            scope=("project", normalized_project),
             path="agile:/board",
             action="jira_browser.list_boards",
             params={"projectKeyOrId": normalized_project, "maxResults": 50},
@@ -326,7 +339,7 @@ class JiraBrowserService:
                 if normalized_project is not None
                 else None
             )
-            issues_payload = await self._fetch_board_issues(
+            issues_payload = await self._fetch_board_issues_cached(
                 normalized_board_id,
                 client=client,
             )
@@ -470,6 +483,34 @@ class JiraBrowserService:
             )
         return attachment, payload_bytes, content_type
 
+    def invalidate_cache(
+        self,
+        *,
+        project_key: str | None = None,
+        board_id: str | None = None,
+    ) -> int:
+        """Drop cached Jira metadata and issue listings for this connection.
+
+        With no arguments every entry for the connection is dropped; otherwise
+        only entries scoped to the given project and/or board are removed.
+        """
+
+        if self._cache is None:
+            return 0
+        connection_key = self._cache_connection_key()
+        scopes: set[tuple[str, str]] = set()
+        if project_key is not None:
+            scopes.add(("project", self._normalize_project_key(project_key)))
+        if board_id is not None:
+            scopes.add(("board", self._normalize_board_id(board_id)))
+
+        def _matches(key: JiraCacheKey) -> bool:
+            if not key or key[0] != connection_key:
+                return False
+            return not scopes or (len(key) > 2 and key[2] in scopes)
+
+        return self._cache.invalidate(_matches)
+
     @asynccontextmanager
     async def _jira_client(self) -> AsyncIterator[JiraClient]:
         connection = await resolve_jira_connection(self._settings)
@@ -520,6 +561,90 @@ class JiraBrowserService:
             context=context,
         )
 
+    async def _request_metadata_json(
+        self,
+        client: JiraClient | None,
+        *,
+        scope: tuple[str, str] | None,
+        path: str,
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Any:
+        """GET slow-changing Jira metadata through the stale-while-revalidate cache.
+
+        Foreground loads reuse ``client`` when one is open; background refreshes
+        always open their own client because the caller's may be closed by then.
+        """
+
+        async def _refresh() -> Any:
+            return await self._request_json(
+                method="GET",
+                path=path,
+                action=action,
+                params=params,
+                context=context,
+            )
+
+        async def _load() -> Any:
+            if client is None:
+                return await _refresh()
+            return await self._request_json_with_client(
+                client,
+                method="GET",
+                path=path,
+                action=action,
+                params=params,
+                context=context,
+            )
+
+        if self._cache is None:
+            return await _load()
+        jira_cfg = self._settings.jira
+        return await self._cache.get_or_load(
+            self._cache_key("metadata", scope, path, params),
+            load=_load,
+            refresh=_refresh,
+            ttl_seconds=jira_cfg.jira_browser_metadata_cache_ttl_seconds,
+            stale_seconds=jira_cfg.jira_browser_metadata_cache_stale_seconds,
+        )
+
+    def _cache_key(
+        self,
+        kind: str,
+        scope: tuple[str, str] | None,
+        path: str,
+        params: Mapping[str, Any] | None,
+    ) -> JiraCacheKey:
+        normalized_params = tuple(
+            sorted((str(name), str(value)) for name, value in (params or {}).items())
+        )
+        return (self._cache_connection_key(), kind, scope, path, normalized_params)
+
+    def _cache_connection_key(self) -> tuple[str, ...]:
+        """Identify the Jira connection from non-secret settings.
+
+        Credentials are deliberately excluded: rotating a token does not change
+        the Jira site being browsed, and secrets must never be held in keys.
+        """
+
+        cfg = self._settings
+        return tuple(
+            str(value or "").strip()
+            for value in (
+                cfg.atlassian_auth_mode,
+                cfg.atlassian_auth_mode_secret_ref,
+                cfg.atlassian_cloud_id,
+                cfg.atlassian_cloud_id_secret_ref,
+                cfg.atlassian_site_url or cfg.atlassian_url,
+                cfg.atlassian_site_url_secret_ref,
+                cfg.atlassian_service_account_email,
+                cfg.atlassian_service_account_email_secret_ref,
+                cfg.atlassian_email or cfg.atlassian_username,
+                cfg.atlassian_email_secret_ref,
+            )
+        )
+
     async def _request_bytes(
         self,
         *,
@@ -565,9 +690,9 @@ class JiraBrowserService:
         client: JiraClient,
         policy_project_key: str | None = None,
     ) -> JiraBoard:
-        payload = await self._request_json_with_client(
+        payload = await self._request_metadata_json(
             client,
-            method="GET",
+            scope=("board", board_id),
             path=f"agile:/board/{board_id}",
             action="jira_browser.get_board",
             context={"boardId": board_id},
@@ -592,9 +717,9 @@ class JiraBrowserService:
         client: JiraClient,
         policy_project_key: str | None = None,
     ) -> Mapping[str, Any]:
-        payload = await self._request_json_with_client(
+        payload = await self._request_metadata_json(
             client,
-            method="GET",
+            scope=("board", board_id),
             path=f"agile:/board/{board_id}/configuration",
             action="jira_browser.list_columns",
             context={"boardId": board_id},
@@ -619,9 +744,9 @@ class JiraBrowserService:
     ) -> None:
         start_at = 0
         while True:
-            payload = await self._request_json_with_client(
+            payload = await self._request_metadata_json(
                 client,
-                method="GET",
+                scope=("project", project_key),
                 path="agile:/board",
                 action="jira_browser.list_boards",
                 params={
@@ -690,6 +815,98 @@ class JiraBrowserService:
                 break
         return issues
 
+    async def _fetch_board_issues_cached(
+        self,
+        board_id: str,
+        *,
+        client: JiraClient,
+    ) -> list[Mapping[str, Any]]:
+        """Return board issues, revalidating short-lived listings by watermark.
+
+        A listing younger than the issue TTL is served as-is. Once it expires, a
+        one-issue probe ordered by ``updated`` is compared with the cached
+        (total, latest-updated) watermark; only a changed watermark triggers the
+        full paginated fetch.
+        """
+
+        ttl_seconds = self._settings.jira.jira_browser_issue_cache_ttl_seconds
+        if self._cache is None or ttl_seconds <= 0:
+            return await self._fetch_board_issues(board_id, client=client)
+        jql = self._board_issue_scope_jql()
+        key = self._cache_key(
+            "issues",
+            ("board", board_id),
+            f"agile:/board/{board_id}/issue",
+            {"jql": jql},
+        )
+        cached = self._cache.peek(key)
+        if cached is not None and self._cache.age(cached) < ttl_seconds:
+            self._cache.stats.hits += 1
+            return list(cached.value.issues)
+
+        async def _load() -> _JiraIssueListing:
+            if cached is not None:
+                watermark = await self._fetch_board_issue_watermark(
+                    board_id,
+                    jql=jql,
+                    client=client,
+                )
+                if watermark == cached.value.watermark:
+                    return cached.value
+            issues = await self._fetch_board_issues(board_id, client=client)
+            return _JiraIssueListing(
+                watermark=self._issue_listing_watermark(issues),
+                issues=tuple(issues),
+            )
+
+        self._cache.stats.misses += 1
+        listing = await self._cache.load(key, _load)
+        return list(listing.issues)
+
+    async def _fetch_board_issue_watermark(
+        self,
+        board_id: str,
+        *,
+        jql: str,
+        client: JiraClient,
+    ) -> tuple[int, str]:
+        payload = await self._request_json_with_client(
+            client,
+            method="GET",
+            path=f"agile:/board/{board_id}/issue",
+            action="jira_browser.list_issues",
+            params={
+                "fields": _JIRA_ISSUE_WATERMARK_FIELDS,
+                "jql": f"{jql} ORDER BY updated DESC",
+                "maxResults": 1,
+                "startAt": 0,
+            },
+            context={"boardId": board_id},
+        )
+        if not isinstance(payload, Mapping):
+            return (-1, "")
+        raw_items = payload.get("issues", [])
+        items = raw_items if isinstance(raw_items, list) else []
+        latest = self._issue_listing_watermark(
+            [item for item in items if isinstance(item, Mapping)]
+        )[1]
+        total = payload.get("total")
+        return (total if isinstance(total, int) else -1, latest)
+
+    def _issue_listing_watermark(
+        self,
+        issues: list[Mapping[str, Any]],
+    ) -> tuple[int, str]:
+        latest = ""
+        for issue in issues:
+            fields = issue.get("fields")
+            if not isinstance(fields, Mapping):
+                continue
+            updated = str(fields.get("updated") or "")
+            if updated > latest:
+                latest = updated
+        return (len(issues), latest)
+
     def _board_issue_scope_jql(self) -> str:
         recent_done_days = self._feature_flags.jira_create_page_recent_done_days
         if recent_done_days <= 0:
@@ -727,9 +944,9 @@ class JiraBrowserService:
         client: JiraClient,
     ) -> _JiraProjectScope:
         self._ensure_project_allowed(project_key)
-        payload = await self._request_json_with_client(
+        payload = await self._request_metadata_json(
             client,
-            method="GET",
+            scope=("project", project_key),
             path=f"/project/{project_key}",
             action="jira_browser.get_project_scope",
             context={"projectKey": project_key},
@@ -0,0 +1,217 @@
+"""Per-connection metadata cache for the Jira browser service.
+
+Projects, boards, and board configuration change rarely, so the Create-page
+browser serves them from a stale-while-revalidate cache. Concurrent identical
+loads share one upstream call, and callers can invalidate entries explicitly
+when they know Jira changed underneath them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JiraCacheKey = tuple[Any, ...]
+JiraCacheLoader = Callable[[], Awaitable[Any]]
+
+_DEFAULT_MAX_ENTRIES = 2048
+
+@dataclass(frozen=True, slots=True)
+class JiraCacheEntry:
+    """One cached upstream payload and the time it was last validated."""
+
+    value: Any
+    stored_at: float
+
+@dataclass(slots=True)
+class JiraCacheStats:
+    """Counters describing how the cache served requests."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    loads: int = 0
+    refresh_failures: int = 0
+
+class JiraBrowserCache:
+    """Bounded in-process cache with TTLs, request coalescing, and invalidation.
+
+    Keys are tuples whose first element identifies the Jira connection, so one
+    process-wide cache can serve several connections without mixing payloads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max(int(max_entries), 1)
+        self._clock = clock
+        self._entries: OrderedDict[JiraCacheKey, JiraCacheEntry] = OrderedDict()
+        self._inflight: dict[JiraCacheKey, asyncio.Future[Any]] = {}
+        self._refresh_tasks: dict[JiraCacheKey, asyncio.Task[Any]] = {}
+        self._generation = 0
+        self.stats = JiraCacheStats()
+
+    def peek(self, key: JiraCacheKey) -> JiraCacheEntry | None:
+        """Return the cached entry for ``key`` without loading or refreshing."""
+
+        return self._entries.get(key)
+
+    def age(self, entry: JiraCacheEntry) -> float:
+        return max(self._clock() - entry.stored_at, 0.0)
+
+    async def get_or_load(
+        self,
+        key: JiraCacheKey,
+        *,
+        load: JiraCacheLoader,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        refresh: JiraCacheLoader | None = None,
+    ) -> Any:
+        """Serve ``key`` from cache, revalidating stale entries in the background.
+
+        Entries younger than ``ttl_seconds`` are returned directly. Entries that
+        are past the TTL but within ``stale_seconds`` of it are returned
+        immediately while ``refresh`` (or ``load``) repopulates the entry.
+        Anything older is loaded in the foreground.
+        """
+
+        if ttl_seconds <= 0:
+            return await load()
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self.age(entry)
+            if age < ttl_seconds:
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < ttl_seconds + max(stale_seconds, 0.0):
+                self.stats.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._schedule_refresh(key, refresh or load)
+                return entry.value
+        self.stats.misses += 1
+        return await self.load(key, load)
+
+    async def load(self, key: JiraCacheKey, loader: JiraCacheLoader) -> Any:
+        """Run ``loader`` for ``key`` once, sharing the result with concurrent callers."""
+
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The leading caller was cancelled; retry rather than fail a
+                # follower that is still waiting for the payload.
+                if pending.cancelled():
+                    continue
+                raise
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        self.stats.loads += 1
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Followers re-raise the exception; avoid "never retrieved" noise
+            # when nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            if generation == self._generation:
+                self._store(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def invalidate(self, predicate: Callable[[JiraCacheKey], bool] | None = None) -> int:
+        """Drop matching entries (all entries when ``predicate`` is omitted).
+
+        Loads already in flight when invalidation happens do not repopulate the
+        cache, so callers never see data fetched before the invalidation.
+        """
+
+        self._generation += 1
+        if predicate is None:
+            removed = len(self._entries)
+            self._entries.clear()
+        else:
+            doomed = [key for key in self._entries if predicate(key)]
+            for key in doomed:
+                del self._entries[key]
+            removed = len(doomed)
+        for key, task in list(self._refresh_tasks.items()):
+            if predicate is None or predicate(key):
+                task.cancel()
+        return removed
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: JiraCacheKey, value: Any) -> None:
+        self._entries[key] = JiraCacheEntry(value=value, stored_at=self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _schedule_refresh(self, key: JiraCacheKey, loader: JiraCacheLoader) -> None:
+        if key in self._refresh_tasks or key in self._inflight:
+            return
+
+        async def _refresh() -> None:
+            try:
+                await self.load(key, loader)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.stats.refresh_failures += 1
+                logger.info(
+                    "jira_browser_cache_refresh_failed error_type=%s",
+                    type(exc).__name__,
+                )
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.get_running_loop().create_task(_refresh())
+
+_shared_cache: JiraBrowserCache | None = None
+
+def get_jira_browser_cache() -> JiraBrowserCache:
+    """Return the process-wide Jira browser cache."""
+
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = JiraBrowserCache()
+    return _shared_cache
+
+__all__ = [
+    "JiraBrowserCache",
+    "JiraCacheEntry",
+    "JiraCacheKey",
+    "JiraCacheStats",
+    "get_jira_browser_cache",
+]
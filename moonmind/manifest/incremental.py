@@ -6,6 +6,7 @@ import hashlib
 import json
 import re
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping, MutableMapping, Protocol, Sequence
@@ -72,6 +73,11 @@ class SourceSnapshot:
     cursor: dict[str, Any]
     documents: dict[str, str] = field(default_factory=dict)
     document_chunks: dict[str, list[str]] = field(default_factory=dict)
+    # Per-chunk ``[chunk_hash, offset_start, offset_end]`` aligned with
+    # ``document_chunks``; absent for documents indexed by older releases.
+    document_chunk_spans: dict[str, list[tuple[str, int, int]]] = field(
+        default_factory=dict
+    )
 
     @classmethod
     def from_dict(cls, source_id: str, raw: Mapping[str, Any]) -> "SourceSnapshot":
@@ -88,8 +94,30 @@ class SourceSnapshot:
                 for key, value in dict(raw.get("document_chunks") or {}).items()
                 if isinstance(value, list)
             },
+            document_chunk_spans={
+                str(key): [
+                    (str(item[0]), int(item[1]), int(item[2]))
+                    for item in value
+                    if isinstance(item, list) and len(item) == 3
+                ]
+                for key, value in dict(raw.get("document_chunk_spans") or {}).items()
+                if isinstance(value, list)
+            },
         )
 
+    def chunk_spans_by_point(self, document_id: str) -> dict[str, tuple[str, int, int]]:
+        """Map a document's previous point ids to their chunk spans.
+
+        Returns an empty mapping when spans were not recorded, so callers fall
+        back to treating every previous chunk as stale.
+        """
+
+        point_ids = self.document_chunks.get(document_id, [])
+        spans = self.document_chunk_spans.get(document_id)
+        if not spans or len(spans) != len(point_ids):
+            return {}
+        return dict(zip(point_ids, spans))
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "state_hash": self.state_hash,
@@ -99,6 +127,10 @@ class SourceSnapshot:
                 key: list(value)
                 for key, value in sorted(self.document_chunks.items())
             },
+            "document_chunk_spans": {
+                key: [list(span) for span in value]
+                for key, value in sorted(self.document_chunk_spans.items())
+            },
         }
 
 
@@ -152,6 +184,10 @@ class IncrementalChangeSet:
     stale_point_ids: list[str]
     chunks: list[IndexedChunk]
     next_snapshot: SourceSnapshot
+    # Unchanged chunks of changed documents whose offsets moved; their
+    # vectors are kept and only the payload is rewritten.
+    relocated_chunks: list[IndexedChunk] = field(default_factory=list)
+    reused_chunk_count: int = 0
 
     @property
     def has_changes(self) -> bool:
@@ -165,6 +201,9 @@ class IncrementalIndexWriter(Protocol):
     def upsert_chunks(self, chunks: Sequence[IndexedChunk]) -> None:
         raise NotImplementedError
 
+    def update_chunk_payloads(self, chunks: Sequence[IndexedChunk]) -> None:
+        raise NotImplementedError
+
 
 def default_state_path(*, manifest_name: str, index_name: str) -> Path:
     return (
@@ -241,6 +280,15 @@ def source_documents(
     return documents
 
 
+def _chunk_point_id(document: SourceDocument, chunk_hash: str, occurrence: int) -> str:
+    # Keyed by content rather than offsets so an unchanged chunk keeps its
+    # point (and embedding) when an earlier edit shifts it within the document.
+    point_seed = "|".join(
+        [document.source_id, document.document_id, chunk_hash, str(occurrence)]
+    )
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, point_seed))
+
+
 def chunk_document(
     document: SourceDocument,
     *,
@@ -254,24 +302,25 @@ def chunk_document(
         return []
 
     chunks: list[IndexedChunk] = []
+    occurrences: Counter[str] = Counter()
     cursor = 0
     end = len(document.text)
     while cursor < end:
         chunk_end = min(end, cursor + chunk_size)
+        if chunk_end < end:
+            # End on a line break in the back half of the window when there is
+            # one, so boundaries re-align after an edit instead of shifting
+            # every later chunk of the document.
+            newline = document.text.rfind("\n", cursor + chunk_size // 2, chunk_end)
+            if newline >= 0:
+                chunk_end = newline + 1
         text = document.text[cursor:chunk_end]
         chunk_hash = _sha256_text(text)
-        point_seed = "|".join(
-            [
-                document.source_id,
-                document.document_id,
-                str(cursor),
-                str(chunk_end),
-                chunk_hash,
-            ]
-        )
+        occurrence = occurrences[chunk_hash]
+        occurrences[chunk_hash] += 1
         chunks.append(
             IndexedChunk(
-                point_id=str(uuid.uuid5(uuid.NAMESPACE_URL, point_seed)),
+                point_id=_chunk_point_id(document, chunk_hash, occurrence),
                 source_id=document.source_id,
                 document_id=document.document_id,
                 chunk_hash=chunk_hash,
@@ -323,25 +372,53 @@ def build_changeset(
     if previous:
         for document_id in deleted_document_ids:
             stale_point_ids.extend(previous.document_chunks.get(document_id, []))
-        for document in changed_documents:
-            stale_point_ids.extend(previous.document_chunks.get(document.document_id, []))
 
     new_chunks_by_document: dict[str, list[str]] = {}
+    new_spans_by_document: dict[str, list[tuple[str, int, int]]] = {}
     chunks: list[IndexedChunk] = []
+    relocated_chunks: list[IndexedChunk] = []
+    reused_chunk_count = 0
     for document in changed_documents:
         document_chunks = chunk_document(document, splitter=splitter)
-        chunks.extend(document_chunks)
+        previous_spans = (
+            previous.chunk_spans_by_point(document.document_id) if previous else {}
+        )
+        current_point_ids = {chunk.point_id for chunk in document_chunks}
+        if previous:
+            stale_point_ids.extend(
+                point_id
+                for point_id in previous.document_chunks.get(document.document_id, [])
+                if point_id not in previous_spans or point_id not in current_point_ids
+            )
+        for chunk in document_chunks:
+            previous_span = previous_spans.get(chunk.point_id)
+            if previous_span is None:
+                chunks.append(chunk)
+                continue
+            reused_chunk_count += 1
+            if previous_span[1:] != (chunk.offset_start, chunk.offset_end):
+                relocated_chunks.append(chunk)
         new_chunks_by_document[document.document_id] = [
             chunk.point_id for chunk in document_chunks
         ]
+        new_spans_by_document[document.document_id] = [
+            (chunk.chunk_hash, chunk.offset_start, chunk.offset_end)
+            for chunk in document_chunks
+        ]
 
     next_document_chunks: dict[str, list[str]] = {}
+    next_document_spans: dict[str, list[tuple[str, int, int]]] = {}
     if previous:
         for document_id in unchanged_document_ids:
             next_document_chunks[document_id] = list(
                 previous.document_chunks.get(document_id, [])
             )
+            if document_id in previous.document_chunk_spans:
+                next_document_spans[document_id] = list(
+                    previous.document_chunk_spans[document_id]
+                )
     next_document_chunks.update(new_chunks_by_document)
+    next_document_spans.update(new_spans_by_document)
 
     return IncrementalChangeSet(
         source_id=source_id,
@@ -357,7 +434,10 @@ def build_changeset(
             cursor=dict(cursor),
             documents=current_hashes,
             document_chunks=next_document_chunks,
+            document_chunk_spans=next_document_spans,
         ),
+        relocated_chunks=relocated_chunks,
+        reused_chunk_count=reused_chunk_count,
     )
 
 
@@ -391,3 +471,12 @@ class QdrantIncrementalIndexWriter:
                 vectors=vectors,
                 payloads=[chunk.payload() for chunk in batch],
             )
+
+    def update_chunk_payloads(self, chunks: Sequence[IndexedChunk]) -> None:
+        if not chunks:
+            return
+        self._qdrant.overwrite_payloads(
+            collection_name=self._collection_name,
+            ids=[chunk.point_id for chunk in chunks],
+            payloads=[chunk.payload() for chunk in chunks],
+        )
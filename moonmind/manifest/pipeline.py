@@ -248,6 +248,10 @@ class ManifestPipeline:
                 if self._index_writer is not None:
                     self._index_writer.delete_points(changeset.stale_point_ids)
                     self._index_writer.upsert_chunks(changeset.chunks)
+                    if changeset.relocated_chunks:
+                        self._index_writer.update_chunk_payloads(
+                            changeset.relocated_chunks
+                        )
 
                 index_state.sources[ds.id] = changeset.next_snapshot
                 index_state.save(state_path)
@@ -264,11 +268,14 @@ class ManifestPipeline:
                 result.total_docs += len(documents)
                 result.total_chunks += len(changeset.chunks)
                 self.log.info(
-                    "Source %s: fetched %d docs, indexed %d docs, deleted %d docs",
+                    "Source %s: fetched %d docs, indexed %d docs, deleted %d docs "
+                    "(%d chunks embedded, %d reused)",
                     ds.id,
                     len(documents),
                     len(changeset.changed_documents),
                     len(changeset.deleted_document_ids),
+                    len(changeset.chunks),
+                    changeset.reused_chunk_count,
                 )
 
             except Exception as exc:
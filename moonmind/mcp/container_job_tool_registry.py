@@ -149,7 +149,14 @@ def _submit_input_schema() -> dict[str, Any]:
 class ContainerJobToolRegistry:
     """Discovery + dispatch for the five asynchronous container-job tools."""
 
+    _tool_metadata: list[ToolMetadata] | None = None
+
     def list_tools(self) -> list[ToolMetadata]:
+        if self._tool_metadata is None:
+            self._tool_metadata = self._build_tool_metadata()
+        return list(self._tool_metadata)
+
+    def _build_tool_metadata(self) -> list[ToolMetadata]:
         return [
             ToolMetadata(
                 name="container.submit",
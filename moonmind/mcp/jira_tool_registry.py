@@ -29,6 +29,7 @@ from moonmind.mcp.tool_registry import (
     ToolMetadata,
     ToolNotFoundError,
     _ToolDefinition,
+    _tool_metadata,
 )
 
 @dataclass(frozen=True, slots=True)
@@ -45,21 +46,13 @@ class JiraToolRegistry:
     def __init__(self, *, enabled_actions: set[str] | None = None) -> None:
         self._enabled_actions = enabled_actions or set()
         self._tools: dict[str, _ToolDefinition] = {}
+        self._tool_metadata: list[ToolMetadata] | None = None
         self._register_default_tools()
 
     def list_tools(self) -> list[ToolMetadata]:
-        output: list[ToolMetadata] = []
-        for definition in sorted(self._tools.values(), key=lambda item: item.name):
-            output.append(
-                ToolMetadata(
-                    name=definition.name,
-                    description=definition.description,
-                    input_schema=definition.argument_model.model_json_schema(
-                        by_alias=True
-                    ),
-                )
-            )
-        return output
+        if self._tool_metadata is None:
+            self._tool_metadata = _tool_metadata(self._tools.values())
+        return list(self._tool_metadata)
 
     async def call_tool(
         self,
@@ -176,6 +169,7 @@ class JiraToolRegistry:
             argument_model=argument_model,
             handler=handler,
         )
+        self._tool_metadata = None
 
     async def _handle_create_issue(
         self, args: BaseModel, context: JiraToolExecutionContext
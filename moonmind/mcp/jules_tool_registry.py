@@ -12,6 +12,7 @@ from moonmind.mcp.tool_registry import (
     ToolMetadata,
     ToolNotFoundError,
     _ToolDefinition,
+    _tool_metadata,
 )
 from moonmind.schemas.jules_models import (
     JulesCreateTaskRequest,
@@ -34,22 +35,14 @@ class JulesToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, _ToolDefinition] = {}
+        self._tool_metadata: list[ToolMetadata] | None = None
         self._register_default_tools()
 
     def list_tools(self) -> list[ToolMetadata]:
         """Return registered tools with schemas for discovery endpoint."""
-        output: list[ToolMetadata] = []
-        for definition in sorted(self._tools.values(), key=lambda item: item.name):
-            output.append(
-                ToolMetadata(
-                    name=definition.name,
-                    description=definition.description,
-                    input_schema=definition.argument_model.model_json_schema(
-                        by_alias=True
-                    ),
-                )
-            )
-        return output
+        if self._tool_metadata is None:
+            self._tool_metadata = _tool_metadata(self._tools.values())
+        return list(self._tool_metadata)
 
     async def call_tool(
         self,
@@ -104,6 +97,7 @@ class JulesToolRegistry:
             argument_model=argument_model,
             handler=handler,
         )
+        self._tool_metadata = None
 
     async def _handle_create_task(
         self,
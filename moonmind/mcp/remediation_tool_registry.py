@@ -12,6 +12,7 @@ from moonmind.mcp.tool_registry import (
     ToolMetadata,
     ToolNotFoundError,
     _ToolDefinition,
+    _tool_metadata,
 )
 from moonmind.workflows.temporal.remediation_tools import (
     RemediationEvidenceToolService,
@@ -53,6 +54,8 @@ class RemediationArtifactRequest(BaseModel):
     artifact_ref: str | dict[str, Any] = Field(alias="artifactRef")
     include_content: bool = Field(False, alias="includeContent")
     max_content_bytes: int = Field(65_536, alias="maxContentBytes")
+    offset: int = Field(0, ge=0)
+    tail: bool = False
 
 
 class RemediationActionRequest(BaseModel):
@@ -88,6 +91,7 @@ class RemediationToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, _ToolDefinition] = {}
+        self._tool_metadata: list[ToolMetadata] | None = None
         for name in self._PAGE_TO_METHOD:
             self._register(
                 name,
@@ -121,14 +125,9 @@ class RemediationToolRegistry:
         )
 
     def list_tools(self) -> list[ToolMetadata]:
-        return [
-            ToolMetadata(
-                name=item.name,
-                description=item.description,
-                input_schema=item.argument_model.model_json_schema(by_alias=True),
-            )
-            for item in sorted(self._tools.values(), key=lambda value: value.name)
-        ]
+        if self._tool_metadata is None:
+            self._tool_metadata = _tool_metadata(self._tools.values())
+        return list(self._tool_metadata)
 
     async def call_tool(
         self,
@@ -148,6 +147,7 @@ class RemediationToolRegistry:
 
     def _register(self, name: str, description: str, model: type[BaseModel], handler: Any) -> None:
         self._tools[name] = _ToolDefinition(name, description, model, handler)
+        self._tool_metadata = None
 
     async def _handle_page(
         self, request: RemediationEvidencePageRequest, dispatch: Any
@@ -197,6 +197,8 @@ class RemediationToolRegistry:
             artifact_ref=request.artifact_ref,
             include_content=request.include_content,
             max_content_bytes=request.max_content_bytes,
+            offset=request.offset,
+            tail=request.tail,
             principal=context.principal,
         )
         return asdict(result)
@@ -23,6 +23,7 @@ from moonmind.mcp.tool_registry import (
     ToolMetadata,
     ToolNotFoundError,
     _ToolDefinition,
+    _tool_metadata,
 )
 from moonmind.workflows.agent_skills.agent_skills_activities import AgentSkillsActivities
 from moonmind.workflows.skills.run_projection import load_resolved_skillset
@@ -53,23 +54,15 @@ class SkillsOnDemandToolRegistry:
     def __init__(self, *, expose_commands: bool = False) -> None:
         self._expose_commands = expose_commands
         self._tools: dict[str, _ToolDefinition] = {}
+        self._tool_metadata: list[ToolMetadata] | None = None
         self._register_default_tools()
 
     def list_tools(self) -> list[ToolMetadata]:
         if not self._expose_commands:
             return []
-        output: list[ToolMetadata] = []
-        for definition in sorted(self._tools.values(), key=lambda item: item.name):
-            output.append(
-                ToolMetadata(
-                    name=definition.name,
-                    description=definition.description,
-                    input_schema=definition.argument_model.model_json_schema(
-                        by_alias=True
-                    ),
-                )
-            )
-        return output
+        if self._tool_metadata is None:
+            self._tool_metadata = _tool_metadata(self._tools.values())
+        return list(self._tool_metadata)
 
     async def call_tool(
         self,
@@ -118,6 +111,7 @@ class SkillsOnDemandToolRegistry:
             argument_model=argument_model,
             handler=handler,
         )
+        self._tool_metadata = None
 
     async def _handle_query(
         self,
@@ -7,7 +7,7 @@ single substrate migration.  The base registry types are kept for consumers.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterable
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -93,6 +93,19 @@ class _ToolDefinition:
     handler: ToolHandler
 
 
+def _tool_metadata(definitions: Iterable[_ToolDefinition]) -> list[ToolMetadata]:
+    """Build sorted discovery metadata, generating each argument schema."""
+
+    return [
+        ToolMetadata(
+            name=definition.name,
+            description=definition.description,
+            input_schema=definition.argument_model.model_json_schema(by_alias=True),
+        )
+        for definition in sorted(definitions, key=lambda item: item.name)
+    ]
+
+
 __all__ = [
     "ResourceListResponse",
     "ResourceMetadata",
@@ -7,10 +7,15 @@ evidence refs, and expose matches as bounded context entries.
 
 from __future__ import annotations
 
+import fcntl
 import hashlib
+import heapq
 import json
+import math
 import re
-from collections.abc import Iterable, Mapping, Sequence
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Literal
 
@@ -37,6 +42,8 @@ _SHA_RE = re.compile(r"\b[0-9a-f]{12,64}\b", re.IGNORECASE)
 _LINE_RE = re.compile(r"\bline\s+\d+\b", re.IGNORECASE)
 _LONG_NUMBER_RE = re.compile(r"\b\d{4,}\b")
 _SPACE_RE = re.compile(r"\s+")
+_TOKEN_BOUNDARY_RE = re.compile(r"^\W+|\W+$")
+_TOKEN_OVERLAP_THRESHOLD = 0.6
 _SECRETISH_RE = re.compile(
     r"(ghp_|github_pat_|AIza|ATATT|AKIA|"
     r"-----BEGIN [A-Z ]*PRIVATE KEY-----|"
@@ -190,41 +197,55 @@ class FixPattern(BaseModel):
 
 
 class FileFixPatternStore:
-    """Append-safe JSONL store for compact fix-pattern records.
+    """Append-only JSONL store for compact fix-pattern records.
 
     The store persists only normalized signatures, playbook text, and evidence
     refs. It intentionally does not store raw logs.
+
+    Upserts append the merged record and the last record per signature wins;
+    the log is compacted once superseded records outnumber live ones. Lookups
+    use an in-memory inverted token index that is refreshed incrementally from
+    bytes appended since the last read.
     """
 
-    def __init__(self, path: str | Path) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        compaction_min_records: int = 256,
+    ) -> None:
         self.path = Path(path)
+        self.compaction_min_records = max(1, compaction_min_records)
+        self._lock = threading.RLock()
+        self._file_id: tuple[int, int] | None = None
+        self._offset = 0
+        self._record_count = 0
+        self._patterns: dict[str, FixPattern] = {}
+        self._by_text: dict[str, set[str]] = {}
+        self._tokens: dict[str, frozenset[str]] = {}
+        self._token_index: dict[str, set[str]] = {}
 
     def list_patterns(self) -> list[FixPattern]:
-        if not self.path.exists():
-            return []
-        patterns: list[FixPattern] = []
-        for line in self.path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            patterns.append(FixPattern.model_validate_json(line))
-        return patterns
+        with self._lock:
+            self._refresh()
+            return sorted(self._patterns.values(), key=lambda item: item.pattern_ref)
 
     def upsert(self, pattern: FixPattern) -> FixPattern:
-        patterns = self.list_patterns()
-        merged = False
-        next_patterns: list[FixPattern] = []
-        for existing in patterns:
-            if existing.signature.signature_id == pattern.signature.signature_id:
-                existing = _merge_patterns(existing, pattern)
-                merged = True
-            next_patterns.append(existing)
-        if not merged:
-            next_patterns.append(pattern)
-        self._write_patterns(next_patterns)
-        for candidate in next_patterns:
-            if candidate.signature.signature_id == pattern.signature.signature_id:
-                return candidate
-        raise RuntimeError("upserted fix pattern could not be reloaded")
+        signature_id = pattern.signature.signature_id
+        with self._lock, self._file_lock():
+            self._refresh()
+            existing = self._patterns.get(signature_id)
+            merged = _merge_patterns(existing, pattern) if existing else pattern
+            line = merged.model_dump_json(by_alias=True, exclude_none=True) + "\n"
+            with self.path.open("ab") as handle:
+                handle.write(line.encode("utf-8"))
+            self._refresh()
+            if (
+                self._record_count >= self.compaction_min_records
+                and self._record_count > 2 * len(self._patterns)
+            ):
+                self._compact()
+            return self._patterns[signature_id]
 
     def find_matches(
         self,
@@ -240,11 +261,21 @@ class FileFixPatternStore:
         signature_id = (
             signature.signature_id if isinstance(signature, ErrorSignature) else None
         )
-        if not normalized and not signature_id:
+        if (not normalized and not signature_id) or limit <= 0:
             return []
 
+        with self._lock:
+            self._refresh()
+            candidates: set[str] = set()
+            if signature_id and signature_id in self._patterns:
+                candidates.add(signature_id)
+            if normalized:
+                candidates.update(self._by_text.get(normalized, ()))
+                candidates.update(self._overlap_candidates(_clean_tokens(normalized)))
+            patterns = [self._patterns[candidate] for candidate in candidates]
+
         matches: list[tuple[tuple[int, int], FixPattern]] = []
-        for pattern in self.list_patterns():
+        for pattern in sorted(patterns, key=lambda item: item.pattern_ref):
             score = 0
             if signature_id and pattern.signature.signature_id == signature_id:
                 score = 100
@@ -252,14 +283,112 @@ class FileFixPatternStore:
                 score = 90
             elif (
                 normalized
-                and _token_overlap(normalized, pattern.signature.normalized_text) >= 0.6
+                and _token_overlap(normalized, pattern.signature.normalized_text)
+                >= _TOKEN_OVERLAP_THRESHOLD
             ):
                 score = 50
             if score:
                 matches.append(((score, pattern.success_count), pattern))
 
-        matches.sort(key=lambda item: item[0], reverse=True)
-        return [pattern for _, pattern in matches[: max(limit, 0)]]
+        top = heapq.nlargest(limit, matches, key=lambda item: item[0])
+        return [pattern for _, pattern in top]
+
+    def _overlap_candidates(self, query_tokens: set[str]) -> set[str]:
+        """Return patterns that can reach the 0.6 token-overlap threshold.
+
+        A pattern sharing at least 60% of the query tokens must contain one of
+        the query's ``n - ceil(0.6 * n) + 1`` rarest tokens, so only those
+        posting lists are read.
+        """
+
+        if not query_tokens:
+            return set()
+        # The epsilon keeps float rounding from making the filter stricter
+        # than the exact overlap check applied to each candidate.
+        required = math.ceil(_TOKEN_OVERLAP_THRESHOLD * len(query_tokens) - 1e-9)
+        postings = sorted(
+            (self._token_index.get(token, set()) for token in query_tokens),
+            key=len,
+        )
+        candidates: set[str] = set()
+        for posting in postings[: len(query_tokens) - required + 1]:
+            candidates.update(posting)
+        max_tokens = len(query_tokens) / _TOKEN_OVERLAP_THRESHOLD + 1e-9
+        return {
+            candidate
+            for candidate in candidates
+            if len(self._tokens[candidate]) <= max_tokens
+        }
+
+    def _refresh(self) -> None:
+        """Apply records appended since the last read, or reload on rewrite."""
+
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._reset(None)
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._offset:
+            self._reset(file_id)
+        if stat.st_size == self._offset:
+            return
+        with self.path.open("rb") as handle:
+            handle.seek(self._offset)
+            chunk = handle.read(stat.st_size - self._offset)
+        complete = chunk.rfind(b"\n") + 1
+        if not complete:
+            return
+        for line in chunk[:complete].splitlines():
+            if not line.strip():
+                continue
+            self._index(FixPattern.model_validate_json(line))
+            self._record_count += 1
+        self._offset += complete
+
+    def _reset(self, file_id: tuple[int, int] | None) -> None:
+        self._file_id = file_id
+        self._offset = 0
+        self._record_count = 0
+        self._patterns.clear()
+        self._by_text.clear()
+        self._tokens.clear()
+        self._token_index.clear()
+
+    def _index(self, pattern: FixPattern) -> None:
+        signature_id = pattern.signature.signature_id
+        previous = self._patterns.get(signature_id)
+        if previous is not None:
+            self._unindex(previous)
+        self._patterns[signature_id] = pattern
+        normalized = pattern.signature.normalized_text
+        self._by_text.setdefault(normalized, set()).add(signature_id)
+        tokens = frozenset(_clean_tokens(normalized))
+        self._tokens[signature_id] = tokens
+        for token in tokens:
+            self._token_index.setdefault(token, set()).add(signature_id)
+
+    def _unindex(self, pattern: FixPattern) -> None:
+        signature_id = pattern.signature.signature_id
+        normalized = pattern.signature.normalized_text
+        _discard_posting(self._by_text, normalized, signature_id)
+        for token in self._tokens.pop(signature_id, frozenset()):
+            _discard_posting(self._token_index, token, signature_id)
+
+    def _compact(self) -> None:
+        self._write_patterns(list(self._patterns.values()))
+        stat = self.path.stat()
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._offset = stat.st_size
+        self._record_count = len(self._patterns)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+        with lock_path.open("a+", encoding="utf-8") as lock_handle:
+            fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
+            yield
 
     def _write_patterns(self, patterns: Sequence[FixPattern]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -358,15 +487,25 @@ def _merge_patterns(existing: FixPattern, incoming: FixPattern) -> FixPattern:
     )
 
 
-def _token_overlap(left: str, right: str) -> float:
-    def _clean_tokens(text: str) -> set[str]:
-        tokens: set[str] = set()
-        for token in text.split():
-            cleaned = re.sub(r"^\W+|\W+$", "", token)
-            if cleaned:
-                tokens.add(cleaned)
-        return tokens
+def _clean_tokens(text: str) -> set[str]:
+    tokens: set[str] = set()
+    for token in text.split():
+        cleaned = _TOKEN_BOUNDARY_RE.sub("", token)
+        if cleaned:
+            tokens.add(cleaned)
+    return tokens
 
+
+def _discard_posting(index: dict[str, set[str]], key: str, value: str) -> None:
+    posting = index.get(key)
+    if posting is None:
+        return
+    posting.discard(value)
+    if not posting:
+        del index[key]
+
+
+def _token_overlap(left: str, right: str) -> float:
     left_tokens = _clean_tokens(left)
     right_tokens = _clean_tokens(right)
     if not left_tokens or not right_tokens:
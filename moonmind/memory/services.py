@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Protocol
@@ -23,6 +30,45 @@ from moonmind.schemas.step_execution_models import (
     StepExecutionIdentityModel,
 )
 
+logger = logging.getLogger(__name__)
+
+_PLANE_EXECUTOR_MAX_WORKERS = 8
+_plane_executor: ThreadPoolExecutor | None = None
+_plane_executor_lock = threading.Lock()
+# Plane calls that outlive their deadline keep a worker busy until the backend
+# returns. Counting every unfinished call against the pool size stops a stuck
+# backend from queueing work behind it without bound.
+_plane_slots = threading.BoundedSemaphore(_PLANE_EXECUTOR_MAX_WORKERS)
+
+
+def _shared_plane_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool used to collect memory planes concurrently."""
+
+    global _plane_executor
+    with _plane_executor_lock:
+        if _plane_executor is None:
+            _plane_executor = ThreadPoolExecutor(
+                max_workers=_PLANE_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="moonmind-memory-plane",
+            )
+        return _plane_executor
+
+
+def _submit_plane(
+    fn: Callable[[], list[MemoryCandidate]],
+) -> Future[list[MemoryCandidate]] | None:
+    """Run ``fn`` on the plane pool, or return ``None`` when every slot is busy."""
+
+    if not _plane_slots.acquire(blocking=False):
+        return None
+    try:
+        future = _shared_plane_executor().submit(fn)
+    except BaseException:
+        _plane_slots.release()
+        raise
+    future.add_done_callback(lambda _future: _plane_slots.release())
+    return future
+
 
 class PlanningAdapter(Protocol):
     def prefetch(self, planning_ref: str | None) -> list[MemoryCandidate]:
@@ -201,42 +247,102 @@ class InMemoryPlanningAdapter:
 
 @dataclass
 class InMemoryTaskHistoryStore:
+    """Plane B store indexed by namespace/repo scope, run kind, and recency.
+
+    ``digests`` and ``fix_patterns`` remain the insertion-ordered records;
+    searches only read the requested scope, newest first.
+    """
+
     digests: list[RunDigest] = field(default_factory=list)
     fix_patterns: list[FixPattern] = field(default_factory=list)
+    _digest_keys: dict[tuple[str, str], RunDigest] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _digests_by_scope: dict[
+        tuple[str, str], list[tuple[datetime, str, str, RunDigest]]
+    ] = field(default_factory=dict, init=False, repr=False)
+    _patterns_by_scope: dict[tuple[str, str], dict[str, FixPattern]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        digests, patterns = self.digests, self.fix_patterns
+        self.digests, self.fix_patterns = [], []
+        for digest in digests:
+            self.upsert_digest(digest)
+        for pattern in patterns:
+            self.upsert_fix_pattern(pattern)
 
     def upsert_digest(self, digest: RunDigest) -> None:
-        self.digests = [
-            existing
-            for existing in self.digests
-            if existing.run_ref.kind != digest.run_ref.kind
-            or existing.run_ref.id != digest.run_ref.id
-        ]
-        self.digests.append(digest)
+        key = (digest.run_ref.kind, digest.run_ref.id)
+        with self._lock:
+            previous = self._digest_keys.pop(key, None)
+            if previous is not None:
+                self.digests.remove(previous)
+                bucket = self._digests_by_scope[(previous.namespace_id, previous.repo)]
+                bucket.remove(_recency_entry(previous))
+            self._digest_keys[key] = digest
+            self.digests.append(digest)
+            bisect.insort(
+                self._digests_by_scope.setdefault((digest.namespace_id, digest.repo), []),
+                _recency_entry(digest),
+                key=lambda entry: entry[:3],
+            )
 
     def upsert_fix_pattern(self, pattern: FixPattern) -> None:
-        self.fix_patterns = [
-            existing
-            for existing in self.fix_patterns
-            if existing.namespace_id != pattern.namespace_id
-            or existing.repo != pattern.repo
-            or existing.signature.value != pattern.signature.value
-        ]
-        self.fix_patterns.append(pattern)
+        with self._lock:
+            scoped = self._patterns_by_scope.setdefault(
+                (pattern.namespace_id, pattern.repo), {}
+            )
+            previous = scoped.pop(pattern.signature.value, None)
+            if previous is not None:
+                self.fix_patterns.remove(previous)
+            scoped[pattern.signature.value] = pattern
+            self.fix_patterns.append(pattern)
+
+    def search(
+        self,
+        query: str,
+        *,
+        namespace_id: str,
+        repo: str,
+        run_kind: str | None = None,
+        max_tokens: int | None = None,
+    ) -> list[MemoryCandidate]:
+        """Return scoped candidates ranked by query-term score, then recency.
+
+        ``run_kind`` narrows digests to one ``RunRef.kind``. ``max_tokens``
+        drops candidates too large to ever fit that budget.
+        """
 
-    def search(self, query: str, *, namespace_id: str, repo: str) -> list[MemoryCandidate]:
         query_terms = _terms(query)
-        candidates: list[MemoryCandidate] = []
-        for digest in self.digests:
-            if digest.namespace_id == namespace_id and digest.repo == repo:
-                candidates.append(digest.as_candidate())
-        for pattern in self.fix_patterns:
-            if pattern.namespace_id == namespace_id and pattern.repo == repo:
-                candidates.append(pattern.as_candidate())
-        return sorted(
+        scope = (namespace_id, repo)
+        with self._lock:
+            digests = [
+                entry[3]
+                for entry in reversed(self._digests_by_scope.get(scope, ()))
+                if run_kind is None or entry[3].run_ref.kind == run_kind
+            ]
+            patterns = sorted(
+                self._patterns_by_scope.get(scope, {}).values(),
+                key=lambda pattern: pattern.updated_at,
+                reverse=True,
+            )
+        candidates = [digest.as_candidate() for digest in digests]
+        candidates.extend(pattern.as_candidate() for pattern in patterns)
+        ranked = sorted(
             candidates,
             key=lambda candidate: _score(candidate.text, query_terms),
             reverse=True,
         )
+        return _truncate_to_budget(ranked, max_tokens)
+
+
+def _recency_entry(digest: RunDigest) -> tuple[datetime, str, str, RunDigest]:
+    return (digest.created_at, digest.run_ref.kind, digest.run_ref.id, digest)
 
 
 @dataclass
@@ -413,51 +519,114 @@ class RetrievalGateway:
                 degraded_components=["memory_disabled"],
             )
 
-        candidates: list[MemoryCandidate] = []
-        degraded: list[str] = []
-        candidates.extend(
-            self._collect(
-                "planning",
-                lambda: self.planning.prefetch(planning_ref)
-                if self.settings.planning == "beads"
-                else [],
-                degraded,
+        # Planes are independent, so collect them concurrently; the pack is
+        # still assembled in plane order.
+        max_tokens = active_budget.usable_tokens
+        started = time.perf_counter()
+        planes: list[tuple[str, Callable[[], list[MemoryCandidate]]]] = []
+        if self.settings.planning == "beads":
+            planes.append(
+                (
+                    "planning",
+                    lambda: _truncate_to_budget(
+                        self.planning.prefetch(planning_ref), max_tokens
+                    ),
+                )
             )
-        )
-        candidates.extend(
-            self._collect(
-                "history",
-                lambda: self.history.search(query, namespace_id=namespace_id, repo=repo)
-                if self.settings.history == "digest"
-                else [],
-                degraded,
+        if self.settings.history == "digest":
+            planes.append(
+                (
+                    "history",
+                    lambda: self.history.search(
+                        query,
+                        namespace_id=namespace_id,
+                        repo=repo,
+                        max_tokens=max_tokens,
+                    ),
+                )
             )
-        )
-        candidates.extend(
-            memory.as_candidate()
-            for memory in self._collect(
-                "long_term",
-                lambda: self.long_term.search(
-                    query,
-                    namespace_id=namespace_id,
-                    repo=repo,
+        if self.settings.long_term == "mem0":
+            planes.append(
+                (
+                    "long_term",
+                    lambda: _truncate_to_budget(
+                        [
+                            memory.as_candidate()
+                            for memory in self.long_term.search(
+                                query,
+                                namespace_id=namespace_id,
+                                repo=repo,
+                            )
+                        ],
+                        max_tokens,
+                    ),
                 )
-                if self.settings.long_term == "mem0"
-                else [],
-                degraded,
             )
-        )
+        futures = [(name, _submit_plane(collect)) for name, collect in planes]
+
+        candidates: list[MemoryCandidate] = []
+        degraded: list[str] = []
+        for name, future in futures:
+            candidates.extend(self._collect(name, future, degraded, started))
         candidates.extend(self.document_candidates)
         return _pack(query, candidates, active_budget, degraded)
 
-    def _collect(self, name: str, callback, degraded: list[str]):
-        if not self.settings.fail_open:
-            return callback()
-        try:
-            return callback()
-        except Exception:
+    def _collect(
+        self,
+        name: str,
+        future: Future[list[MemoryCandidate]] | None,
+        degraded: list[str],
+        started: float,
+    ) -> list[MemoryCandidate]:
+        """Wait for one plane until the shared deadline, honoring fail-open."""
+
+        if future is None:
+            logger.warning(
+                "Memory plane %s skipped: %d plane calls are still in flight",
+                name,
+                _PLANE_EXECUTOR_MAX_WORKERS,
+            )
+            if not self.settings.fail_open:
+                raise TimeoutError(
+                    f"memory plane {name} skipped: plane workers are saturated"
+                )
             degraded.append(name)
             return []
+        timeout_ms = self.settings.plane_timeout_ms
+        wait_seconds: float | None = None
+        if timeout_ms:
+            elapsed = time.perf_counter() - started
+            wait_seconds = max(0.0, timeout_ms / 1000 - elapsed)
+        try:
+            return future.result(timeout=wait_seconds)
+        except FutureTimeoutError as exc:
+            future.cancel()
+            logger.info("Memory plane %s exceeded %sms; skipping it", name, timeout_ms)
+            if not self.settings.fail_open:
+                raise TimeoutError(
+                    f"memory plane {name} exceeded {timeout_ms}ms"
+                ) from exc
+        except Exception:
+            if not self.settings.fail_open:
+                raise
+        degraded.append(name)
+        return []
+
+
+def _truncate_to_budget(
+    candidates: list[MemoryCandidate],
+    max_tokens: int | None,
+) -> list[MemoryCandidate]:
+    """Drop ranked candidates that could never fit into ``max_tokens``.
+
+    ``_pack`` is first-fit across planes, so any candidate no larger than the
+    budget may still be included after bigger ones are skipped; only those
+    larger than the whole budget can be discarded up front.
+    """
+
+    if max_tokens is None:
+        return list(candidates)
+    return [candidate for candidate in candidates if candidate.token_cost <= max_tokens]
 
 
 def planning_candidate(
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from . import metrics, spans, telemetry
 from .backfill import (
+    DEFAULT_BACKFILL_CHUNK_SIZE,
     BackfillPlan,
     BackfillReport,
     plan_backfill,
@@ -48,6 +49,7 @@ from .stuck_state_reconciliation import (
     StuckStateReconciliationService,
     StuckStateSweepResult,
     inspect_stuck_state,
+    inspect_stuck_states,
 )
 from .timeline import (
     SessionTimeline,
@@ -96,6 +98,7 @@ from .records import (
     ObservationRecord,
     OmnigentControlPlaneError,
     RevisionConflictError,
+    SessionEvidenceRecord,
     SessionRecord,
     TerminalSessionOverwriteError,
     TurnAttemptRecord,
@@ -143,6 +146,7 @@ __all__ = [
     "CanonicalTurnCommandService",
     "CONFLICT_OUTCOMES",
     "CURRENT_SCHEMA_VERSION",
+    "DEFAULT_BACKFILL_CHUNK_SIZE",
     "SUPPORTED_SCHEMA_VERSIONS",
     "TURN_STATES",
     "TURN_STATE_ACCEPTED",
@@ -176,6 +180,7 @@ __all__ = [
     "OmnigentControlPlaneError",
     "OmnigentControlPlaneStore",
     "RevisionConflictError",
+    "SessionEvidenceRecord",
     "SessionRecord",
     "SessionRepository",
     "TerminalSessionOverwriteError",
@@ -213,6 +218,7 @@ __all__ = [
     "StuckStateReconciliationService",
     "StuckStateSweepResult",
     "inspect_stuck_state",
+    "inspect_stuck_states",
     # new-admission readiness
     "AdmissionReadiness",
     "CapabilityReadiness",
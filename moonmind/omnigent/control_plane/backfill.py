@@ -21,19 +21,34 @@ provider session. This module folds those rows into the new durable aggregates
 
 Both ``dry_run`` and idempotent apply modes are supported: repeat dry-run and
 repeat apply produce the same plan and leave the same rows.
+
+:func:`run_backfill` streams the legacy tables in bounded chunks of workflows
+ordered by ``moonmind_workflow_id``. A workflow's rows always land in one chunk,
+so every group is planned whole. Each chunk loads only its own bridge rows and
+events, commits its writes separately, and advances a durable
+``omnigent_backfill_checkpoints`` cursor in the same transaction, so a rerun
+after a crash resumes after the last committed chunk. The deterministic
+identities keep a replayed chunk idempotent.
 """
 
 from __future__ import annotations
 
+import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api_service.db.models import OmnigentBridgeSession, OmnigentBridgeSessionEvent
+from api_service.db.models import (
+    OmnigentBackfillCheckpoint,
+    OmnigentBridgeSession,
+    OmnigentBridgeSessionEvent,
+)
 
+from . import metrics
 from .records import compute_digest
 from .repositories import ControlPlaneRepositories
 
@@ -59,6 +74,13 @@ _MIGRATION_OBSERVATION_TYPE = "legacy_bridge_row"
 _MIGRATION_EVENT_OBSERVATION_TYPE = "legacy_bridge_event"
 _MIGRATION_SOURCE = "bridge_backfill"
 
+# Checkpoint row owned by the bridge-row backfill.
+_CHECKPOINT_NAME = "bridge_rows"
+# Workflows folded per chunk (and per transaction) by default.
+DEFAULT_BACKFILL_CHUNK_SIZE = 200
+
+logger = logging.getLogger(__name__)
+
 
 def _canonical_session_id(workflow_id: str, group_key: str) -> str:
     return "ocs_" + compute_digest(["session", workflow_id, group_key])[:40]
@@ -142,24 +164,57 @@ class BackfillPlan:
             "preserved_evidence_rows": self.preserved_evidence_rows,
         }
 
+    def extend(self, other: "BackfillPlan") -> None:
+        self.sessions.extend(other.sessions)
+        self.turn_attempts.extend(other.turn_attempts)
+        self.aliases.extend(other.aliases)
+        self.quarantined_groups.extend(other.quarantined_groups)
+        self.preserved_evidence_rows += other.preserved_evidence_rows
+
 
 @dataclass
 class BackfillReport:
     dry_run: bool
+    # The full plan is retained only for dry runs or when requested;
+    # ``plan_totals`` always carries its summary counters.
     plan: BackfillPlan
+    plan_totals: dict[str, int] = field(
+        default_factory=lambda: BackfillPlan().summary()
+    )
     sessions_written: int = 0
     turn_attempts_written: int = 0
     observations_written: int = 0
     aliases_written: int = 0
+    # Progress of this invocation; a resumed run counts only its own chunks.
+    chunks_processed: int = 0
+    workflows_processed: int = 0
+    bridge_rows_processed: int = 0
+    bridge_events_processed: int = 0
+    elapsed_seconds: float = 0.0
+    resumed_after_workflow_id: Optional[str] = None
+    completed: bool = False
 
     def summary(self) -> dict[str, Any]:
+        elapsed = self.elapsed_seconds
         return {
             "dry_run": self.dry_run,
-            "plan": self.plan.summary(),
+            "plan": dict(self.plan_totals),
             "sessions_written": self.sessions_written,
             "turn_attempts_written": self.turn_attempts_written,
             "observations_written": self.observations_written,
             "aliases_written": self.aliases_written,
+            "progress": {
+                "chunks": self.chunks_processed,
+                "workflows": self.workflows_processed,
+                "bridge_rows": self.bridge_rows_processed,
+                "bridge_events": self.bridge_events_processed,
+                "elapsed_seconds": round(elapsed, 3),
+                "bridge_rows_per_second": (
+                    round(self.bridge_rows_processed / elapsed, 3) if elapsed else 0.0
+                ),
+                "resumed_after_workflow_id": self.resumed_after_workflow_id,
+                "completed": self.completed,
+            },
         }
 
 
@@ -180,7 +235,11 @@ def _terminal_state_for(rows: list[OmnigentBridgeSession]) -> Optional[str]:
 
 
 async def plan_backfill(session: AsyncSession) -> BackfillPlan:
-    """Compute a deterministic, side-effect-free backfill plan."""
+    """Compute a deterministic, side-effect-free backfill plan.
+
+    Loads every bridge row at once; :func:`run_backfill` plans the same groups
+    chunk by chunk.
+    """
 
     rows = list(
         (
@@ -194,6 +253,11 @@ async def plan_backfill(session: AsyncSession) -> BackfillPlan:
         .scalars()
         .all()
     )
+    return _plan_rows(rows)
+
+
+def _plan_rows(rows: Sequence[OmnigentBridgeSession]) -> BackfillPlan:
+    """Plan every group formed by ``rows``; groups never span workflows."""
 
     groups: dict[tuple[str, str], list[OmnigentBridgeSession]] = {}
     for row in rows:
@@ -319,164 +383,333 @@ async def _evidence_bounded_index(row: OmnigentBridgeSession) -> dict[str, Any]:
     return index
 
 
-async def run_backfill(
-    session_factory: Callable[[], Any], *, dry_run: bool = True
-) -> BackfillReport:
-    """Plan (and, unless ``dry_run``, idempotently apply) the backfill.
-
-    Idempotent: canonical sessions, turn attempts, observations, and aliases all
-    use deterministic identities, so a repeat apply writes nothing new.
-    """
-
-    async with session_factory() as session:
-        plan = await plan_backfill(session)
-        report = BackfillReport(dry_run=dry_run, plan=plan)
-        if dry_run:
-            return report
+async def _next_workflow_ids(
+    session: AsyncSession, *, after: Optional[str], limit: int
+) -> list[str]:
+    statement = (
+        select(OmnigentBridgeSession.moonmind_workflow_id)
+        .distinct()
+        .order_by(OmnigentBridgeSession.moonmind_workflow_id)
+        .limit(limit)
+    )
+    if after is not None:
+        statement = statement.where(OmnigentBridgeSession.moonmind_workflow_id > after)
+    return list((await session.execute(statement)).scalars().all())
 
-        bridge_by_id = {
-            row.bridge_session_id: row
-            for row in (
-                await session.execute(select(OmnigentBridgeSession))
-            )
-            .scalars()
-            .all()
-        }
 
-        # Index the legacy per-event stream so artifacts referenced only by an
-        # event row (not by a session-level ref) are preserved as canonical
-        # observations before the legacy tables can be retired.
-        events_by_bridge: dict[str, list[OmnigentBridgeSessionEvent]] = {}
-        for event in (
-            (
-                await session.execute(
-                    select(OmnigentBridgeSessionEvent).order_by(
-                        OmnigentBridgeSessionEvent.bridge_session_id,
-                        OmnigentBridgeSessionEvent.sequence,
-                    )
+async def _load_chunk_rows(
+    session: AsyncSession, workflow_ids: Sequence[str]
+) -> list[OmnigentBridgeSession]:
+    return list(
+        (
+            await session.execute(
+                select(OmnigentBridgeSession)
+                .where(OmnigentBridgeSession.moonmind_workflow_id.in_(workflow_ids))
+                .order_by(
+                    OmnigentBridgeSession.created_at,
+                    OmnigentBridgeSession.bridge_session_id,
                 )
             )
-            .scalars()
-            .all()
-        ):
-            events_by_bridge.setdefault(event.bridge_session_id, []).append(event)
-
-        repos = ControlPlaneRepositories.bind(session)
-
-        for planned in plan.sessions:
-            existing = await repos.sessions.get(planned.session_id)
-            if existing is None:
-                await repos.sessions.create(
-                    session_id=planned.session_id,
-                    moonmind_workflow_id=planned.moonmind_workflow_id,
-                    provider=planned.provider,
-                    compatibility_profile=planned.compatibility_profile,
-                    provider_session_ref=planned.provider_session_ref,
-                    chat_binding_id=planned.chat_binding_id,
-                    metadata={
-                        "backfilled_from_bridge": planned.canonical_bridge_session_id,
-                        "member_bridge_session_ids": planned.member_bridge_session_ids,
-                    },
-                )
-                report.sessions_written += 1
-                if planned.terminal_state:
-                    # Freshly created canonical row: revision 1, fencing
-                    # generation 0. The migration declares that authority so the
-                    # terminal write is fenced like any other lifecycle write
-                    # (#3704), not an unguarded overwrite.
-                    await repos.sessions.mark_terminal(
-                        planned.session_id,
-                        planned.terminal_state,
-                        expected_revision=1,
-                        expected_fencing_generation=0,
-                    )
+        )
+        .scalars()
+        .all()
+    )
 
-        for planned_turn in plan.turn_attempts:
-            existing_turn = await repos.turn_attempts.get(planned_turn.turn_attempt_id)
-            if existing_turn is None:
-                await repos.turn_attempts.create(
-                    turn_attempt_id=planned_turn.turn_attempt_id,
-                    session_id=planned_turn.session_id,
-                    idempotency_key=planned_turn.idempotency_key,
-                    lineage_kind=planned_turn.lineage_kind,
-                )
-                report.turn_attempts_written += 1
-
-            # Preserve the member row's evidence as an append-only observation.
-            bridge_row = bridge_by_id.get(planned_turn.bridge_session_id)
-            if bridge_row is not None:
-                before = await repos.observations.list_for_session(
-                    planned_turn.session_id,
-                    observation_type=_MIGRATION_OBSERVATION_TYPE,
-                )
-                dedup = f"{_MIGRATION_OBSERVATION_TYPE}:{bridge_row.bridge_session_id}"
-                observed_at = bridge_row.updated_at or bridge_row.created_at or _EPOCH_SENTINEL
-                await repos.observations.append(
-                    observation_id="oob_" + compute_digest(["evidence", dedup])[:40],
-                    session_id=planned_turn.session_id,
-                    observation_type=_MIGRATION_OBSERVATION_TYPE,
-                    source=_MIGRATION_SOURCE,
-                    observed_at=observed_at,
-                    deduplication_key=dedup,
-                    payload_ref=bridge_row.external_state_ref,
-                    bounded_index=await _evidence_bounded_index(bridge_row),
-                )
-                after = await repos.observations.list_for_session(
-                    planned_turn.session_id,
-                    observation_type=_MIGRATION_OBSERVATION_TYPE,
-                )
-                if len(after) > len(before):
-                    report.observations_written += 1
-
-            # Preserve per-event artifact evidence for this member row so an
-            # artifact referenced only by an event survives legacy retirement.
-            for event in events_by_bridge.get(planned_turn.bridge_session_id, []):
-                if not event.artifact_ref:
-                    continue
-                event_dedup = f"{_MIGRATION_EVENT_OBSERVATION_TYPE}:{event.event_id}"
-                before_events = await repos.observations.list_for_session(
-                    planned_turn.session_id,
-                    observation_type=_MIGRATION_EVENT_OBSERVATION_TYPE,
+
+async def _load_chunk_events(
+    session: AsyncSession, workflow_ids: Sequence[str]
+) -> dict[str, list[OmnigentBridgeSessionEvent]]:
+    # Only events that can carry preserved evidence are loaded.
+    member_ids = select(OmnigentBridgeSession.bridge_session_id).where(
+        OmnigentBridgeSession.moonmind_workflow_id.in_(workflow_ids)
+    )
+    events_by_bridge: dict[str, list[OmnigentBridgeSessionEvent]] = {}
+    for event in (
+        (
+            await session.execute(
+                select(OmnigentBridgeSessionEvent)
+                .where(
+                    OmnigentBridgeSessionEvent.bridge_session_id.in_(member_ids),
+                    OmnigentBridgeSessionEvent.artifact_ref.is_not(None),
                 )
-                await repos.observations.append(
-                    observation_id="obe_" + compute_digest(["event", event_dedup])[:40],
-                    session_id=planned_turn.session_id,
-                    observation_type=_MIGRATION_EVENT_OBSERVATION_TYPE,
-                    source=_MIGRATION_SOURCE,
-                    observed_at=event.timestamp,
-                    deduplication_key=event_dedup,
-                    source_sequence=event.sequence,
-                    payload_ref=event.artifact_ref,
-                    bounded_index={
-                        "bridge_session_id": event.bridge_session_id,
-                        "event_id": event.event_id,
-                        "sequence": event.sequence,
-                        "direction": event.direction,
-                        "event_type": event.event_type,
-                        "normalized_status": event.normalized_status,
-                        "artifact_ref": event.artifact_ref,
-                    },
+                .order_by(
+                    OmnigentBridgeSessionEvent.bridge_session_id,
+                    OmnigentBridgeSessionEvent.sequence,
                 )
-                after_events = await repos.observations.list_for_session(
-                    planned_turn.session_id,
-                    observation_type=_MIGRATION_EVENT_OBSERVATION_TYPE,
+            )
+        )
+        .scalars()
+        .all()
+    ):
+        events_by_bridge.setdefault(event.bridge_session_id, []).append(event)
+    return events_by_bridge
+
+
+async def _apply_plan(
+    session: AsyncSession,
+    plan: BackfillPlan,
+    bridge_by_id: dict[str, OmnigentBridgeSession],
+    events_by_bridge: dict[str, list[OmnigentBridgeSessionEvent]],
+    report: BackfillReport,
+) -> None:
+    repos = ControlPlaneRepositories.bind(session)
+
+    for planned in plan.sessions:
+        existing = await repos.sessions.get(planned.session_id)
+        if existing is None:
+            await repos.sessions.create(
+                session_id=planned.session_id,
+                moonmind_workflow_id=planned.moonmind_workflow_id,
+                provider=planned.provider,
+                compatibility_profile=planned.compatibility_profile,
+                provider_session_ref=planned.provider_session_ref,
+                chat_binding_id=planned.chat_binding_id,
+                metadata={
+                    "backfilled_from_bridge": planned.canonical_bridge_session_id,
+                    "member_bridge_session_ids": planned.member_bridge_session_ids,
+                },
+            )
+            report.sessions_written += 1
+            if planned.terminal_state:
+                # Freshly created canonical row: revision 1, fencing
+                # generation 0. The migration declares that authority so the
+                # terminal write is fenced like any other lifecycle write
+                # (#3704), not an unguarded overwrite.
+                await repos.sessions.mark_terminal(
+                    planned.session_id,
+                    planned.terminal_state,
+                    expected_revision=1,
+                    expected_fencing_generation=0,
                 )
-                if len(after_events) > len(before_events):
-                    report.observations_written += 1
 
-        for alias in plan.aliases:
-            existing_alias = await repos.chat_binding_aliases.resolve(
-                alias.chat_binding_id
+    for planned_turn in plan.turn_attempts:
+        existing_turn = await repos.turn_attempts.get(planned_turn.turn_attempt_id)
+        if existing_turn is None:
+            await repos.turn_attempts.create(
+                turn_attempt_id=planned_turn.turn_attempt_id,
+                session_id=planned_turn.session_id,
+                idempotency_key=planned_turn.idempotency_key,
+                lineage_kind=planned_turn.lineage_kind,
+            )
+            report.turn_attempts_written += 1
+
+        # Preserve the member row's evidence as an append-only observation.
+        bridge_row = bridge_by_id.get(planned_turn.bridge_session_id)
+        if bridge_row is not None:
+            before = await repos.observations.list_for_session(
+                planned_turn.session_id,
+                observation_type=_MIGRATION_OBSERVATION_TYPE,
+            )
+            dedup = f"{_MIGRATION_OBSERVATION_TYPE}:{bridge_row.bridge_session_id}"
+            observed_at = bridge_row.updated_at or bridge_row.created_at or _EPOCH_SENTINEL
+            await repos.observations.append(
+                observation_id="oob_" + compute_digest(["evidence", dedup])[:40],
+                session_id=planned_turn.session_id,
+                observation_type=_MIGRATION_OBSERVATION_TYPE,
+                source=_MIGRATION_SOURCE,
+                observed_at=observed_at,
+                deduplication_key=dedup,
+                payload_ref=bridge_row.external_state_ref,
+                bounded_index=await _evidence_bounded_index(bridge_row),
+            )
+            after = await repos.observations.list_for_session(
+                planned_turn.session_id,
+                observation_type=_MIGRATION_OBSERVATION_TYPE,
+            )
+            if len(after) > len(before):
+                report.observations_written += 1
+
+        # Preserve per-event artifact evidence for this member row so an
+        # artifact referenced only by an event survives legacy retirement.
+        for event in events_by_bridge.get(planned_turn.bridge_session_id, []):
+            if not event.artifact_ref:
+                continue
+            event_dedup = f"{_MIGRATION_EVENT_OBSERVATION_TYPE}:{event.event_id}"
+            before_events = await repos.observations.list_for_session(
+                planned_turn.session_id,
+                observation_type=_MIGRATION_EVENT_OBSERVATION_TYPE,
             )
-            await repos.chat_binding_aliases.register(
-                chat_binding_id=alias.chat_binding_id,
-                session_id=alias.session_id,
-                alias_state=alias.alias_state,
-                diagnostic_reason=alias.diagnostic_reason,
+            await repos.observations.append(
+                observation_id="obe_" + compute_digest(["event", event_dedup])[:40],
+                session_id=planned_turn.session_id,
+                observation_type=_MIGRATION_EVENT_OBSERVATION_TYPE,
+                source=_MIGRATION_SOURCE,
+                observed_at=event.timestamp,
+                deduplication_key=event_dedup,
+                source_sequence=event.sequence,
+                payload_ref=event.artifact_ref,
+                bounded_index={
+                    "bridge_session_id": event.bridge_session_id,
+                    "event_id": event.event_id,
+                    "sequence": event.sequence,
+                    "direction": event.direction,
+                    "event_type": event.event_type,
+                    "normalized_status": event.normalized_status,
+                    "artifact_ref": event.artifact_ref,
+                },
             )
-            if existing_alias is None:
-                report.aliases_written += 1
+            after_events = await repos.observations.list_for_session(
+                planned_turn.session_id,
+                observation_type=_MIGRATION_EVENT_OBSERVATION_TYPE,
+            )
+            if len(after_events) > len(before_events):
+                report.observations_written += 1
+
+    for alias in plan.aliases:
+        existing_alias = await repos.chat_binding_aliases.resolve(
+            alias.chat_binding_id
+        )
+        await repos.chat_binding_aliases.register(
+            chat_binding_id=alias.chat_binding_id,
+            session_id=alias.session_id,
+            alias_state=alias.alias_state,
+            diagnostic_reason=alias.diagnostic_reason,
+        )
+        if existing_alias is None:
+            report.aliases_written += 1
+
+
+async def _load_checkpoint(
+    session: AsyncSession,
+) -> Optional[OmnigentBackfillCheckpoint]:
+    return await session.get(OmnigentBackfillCheckpoint, _CHECKPOINT_NAME)
+
+
+async def _advance_checkpoint(
+    session: AsyncSession,
+    *,
+    cursor: Optional[str],
+    restart: bool,
+    chunk_rows: int,
+    chunk_events: int,
+    completed: bool,
+) -> None:
+    checkpoint = await _load_checkpoint(session)
+    now = datetime.now(timezone.utc)
+    if checkpoint is None:
+        checkpoint = OmnigentBackfillCheckpoint(backfill_name=_CHECKPOINT_NAME)
+        session.add(checkpoint)
+        restart = True
+    if restart:
+        checkpoint.chunks_completed = 0
+        checkpoint.bridge_rows_processed = 0
+        checkpoint.bridge_events_processed = 0
+        checkpoint.started_at = now
+        checkpoint.completed_at = None
+    checkpoint.cursor_workflow_id = cursor
+    if chunk_rows:
+        checkpoint.chunks_completed += 1
+        checkpoint.bridge_rows_processed += chunk_rows
+        checkpoint.bridge_events_processed += chunk_events
+    if completed:
+        checkpoint.completed_at = now
 
-        await session.commit()
 
+async def run_backfill(
+    session_factory: Callable[[], Any],
+    *,
+    dry_run: bool = True,
+    chunk_size: int = DEFAULT_BACKFILL_CHUNK_SIZE,
+    resume: bool = True,
+    on_progress: Optional[Callable[[BackfillReport], None]] = None,
+    keep_plan: Optional[bool] = None,
+) -> BackfillReport:
+    """Plan (and, unless ``dry_run``, idempotently apply) the backfill.
+
+    Workflows are processed ``chunk_size`` at a time, one transaction per
+    chunk. An apply run with ``resume`` continues after the checkpoint left by
+    an interrupted run; a finished pass (or ``resume=False``) starts over.
+    ``dry_run`` never reads or writes the checkpoint. ``on_progress`` receives
+    the report after every chunk. The report keeps every planned item only when
+    ``keep_plan`` is set (default: dry runs only); otherwise each chunk's plan is
+    released once applied and only ``plan_totals`` accumulate.
+
+    Idempotent: canonical sessions, turn attempts, observations, and aliases all
+    use deterministic identities, so a repeat apply writes nothing new.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    report = BackfillReport(dry_run=dry_run, plan=BackfillPlan())
+    retain_plan = dry_run if keep_plan is None else keep_plan
+    started = time.monotonic()
+    cursor: Optional[str] = None
+    if resume and not dry_run:
+        async with session_factory() as session:
+            checkpoint = await _load_checkpoint(session)
+        if (
+            checkpoint is not None
+            and checkpoint.completed_at is None
+            and checkpoint.cursor_workflow_id is not None
+        ):
+            cursor = checkpoint.cursor_workflow_id
+            report.resumed_after_workflow_id = cursor
+            logger.info("Resuming Omnigent bridge backfill after workflow %s", cursor)
+
+    while True:
+        # The first chunk of a pass that is not resuming resets the checkpoint.
+        restart = (
+            report.chunks_processed == 0 and report.resumed_after_workflow_id is None
+        )
+        chunk_started = time.monotonic()
+        async with session_factory() as session:
+            workflow_ids = await _next_workflow_ids(
+                session, after=cursor, limit=chunk_size
+            )
+            if not workflow_ids:
+                if not dry_run:
+                    await _advance_checkpoint(
+                        session,
+                        cursor=cursor,
+                        restart=restart,
+                        chunk_rows=0,
+                        chunk_events=0,
+                        completed=True,
+                    )
+                    await session.commit()
+                break
+            rows = await _load_chunk_rows(session, workflow_ids)
+            chunk_plan = _plan_rows(rows)
+            chunk_events = 0
+            if not dry_run:
+                events_by_bridge = await _load_chunk_events(session, workflow_ids)
+                chunk_events = sum(len(events) for events in events_by_bridge.values())
+                await _apply_plan(
+                    session,
+                    chunk_plan,
+                    {row.bridge_session_id: row for row in rows},
+                    events_by_bridge,
+                    report,
+                )
+                await _advance_checkpoint(
+                    session,
+                    cursor=workflow_ids[-1],
+                    restart=restart,
+                    chunk_rows=len(rows),
+                    chunk_events=chunk_events,
+                    completed=False,
+                )
+                await session.commit()
+
+        cursor = workflow_ids[-1]
+        for name, count in chunk_plan.summary().items():
+            report.plan_totals[name] += count
+        if retain_plan:
+            report.plan.extend(chunk_plan)
+        report.chunks_processed += 1
+        report.workflows_processed += len(workflow_ids)
+        report.bridge_rows_processed += len(rows)
+        report.bridge_events_processed += chunk_events
+        report.elapsed_seconds = time.monotonic() - started
+        metrics.increment(metrics.BACKFILL_BRIDGE_ROWS, amount=len(rows))
+        metrics.increment(metrics.BACKFILL_BRIDGE_EVENTS, amount=chunk_events)
+        metrics.observe(
+            metrics.BACKFILL_CHUNK_LATENCY, time.monotonic() - chunk_started
+        )
+        if on_progress is not None:
+            on_progress(report)
+
+    report.completed = True
+    report.elapsed_seconds = time.monotonic() - started
+    logger.info("Omnigent bridge backfill finished: %s", report.summary()["progress"])
     return report
@@ -206,6 +206,12 @@ EXACT_IMAGE_CONFORMANCE = "omnigent_exact_image_conformance"
 PROTECTED_LIVE_EVIDENCE_AGE = "omnigent_protected_live_evidence_age_seconds"
 PROVIDER_VERIFICATION_RUNNER_HEALTH = "omnigent_provider_verification_runner_health"
 
+# --- Migration backfill -----------------------------------------------------
+
+BACKFILL_BRIDGE_ROWS = "omnigent_backfill_bridge_rows"
+BACKFILL_BRIDGE_EVENTS = "omnigent_backfill_bridge_events"
+BACKFILL_CHUNK_LATENCY = "omnigent_backfill_chunk_latency_seconds"
+
 
 METRICS: dict[str, MetricDefinition] = {
     m.name: m
@@ -239,6 +245,10 @@ METRICS: dict[str, MetricDefinition] = {
         _def(EXACT_IMAGE_CONFORMANCE, COUNTER, ("status",)),
         _def(PROTECTED_LIVE_EVIDENCE_AGE, OBSERVATION, (), "seconds"),
         _def(PROVIDER_VERIFICATION_RUNNER_HEALTH, COUNTER, ("status",)),
+        # Migration backfill
+        _def(BACKFILL_BRIDGE_ROWS, COUNTER),
+        _def(BACKFILL_BRIDGE_EVENTS, COUNTER),
+        _def(BACKFILL_CHUNK_LATENCY, OBSERVATION, (), "seconds"),
     )
 }
 
@@ -474,6 +474,24 @@ class CleanupAuthorityRecord:
     updated_at: Optional[datetime] = None
 
 
+@dataclass(frozen=True)
+class SessionEvidenceRecord:
+    """Bounded read evidence for one canonical session, loaded together.
+
+    ``latest_observations`` is keyed by the caller's observation type group;
+    ``latest_decision`` falls back to the session's ``last_decision_ref`` when
+    the decision journal has no row for the session.
+    """
+
+    session: SessionRecord
+    active_turn: Optional[TurnAttemptRecord] = None
+    turn_attempt_count: int = 0
+    latest_observations: dict[str, ObservationRecord] = field(default_factory=dict)
+    active_command: Optional[CommandRecord] = None
+    latest_decision: Optional[DecisionRecord] = None
+    cleanup: Optional[CleanupAuthorityRecord] = None
+
+
 @dataclass(frozen=True)
 class CasResult:
     """Result of a compare-and-swap / fencing-guarded repository operation.
@@ -17,9 +17,10 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, AsyncIterator, Callable, Optional, Sequence
 
-from sqlalchemy import case, func, or_, select
+from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from api_service.db.models import (
     OmnigentChatBindingAlias,
@@ -62,6 +63,7 @@ from .records import (
     NotCommandOwnerError,
     ObservationRecord,
     RevisionConflictError,
+    SessionEvidenceRecord,
     SessionRecord,
     TerminalSessionOverwriteError,
     TurnAttemptRecord,
@@ -384,7 +386,11 @@ class SessionRepository(_RepositoryBase):
         return _session_record(row) if row is not None else None
 
     async def list_reconciliation_candidates(
-        self, *, limit: int = 100, offset: int = 0
+        self,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
     ) -> list[SessionRecord]:
         """Return a bounded batch whose lifecycle may still require convergence.
 
@@ -394,25 +400,29 @@ class SessionRepository(_RepositoryBase):
 
         A bounded ``offset`` rotates the stable ordering so a large eligible
         population does not permanently monopolize the first ``limit`` rows when
-        healthy active rows never advance ``updated_at``.
+        healthy active rows never advance ``updated_at``. Sweeps that walk the
+        whole population pass ``after``, a ``session_id`` keyset cursor: pages
+        are then ordered by primary key, so rows the sweep itself updates never
+        move ahead of or behind the cursor.
         """
 
         bounded_limit = max(1, min(int(limit), 500))
         bounded_offset = max(0, min(int(offset), 10_000))
-        stmt = (
-            select(OmnigentSession)
-            .where(
-                OmnigentSession.historical_read_state != "quarantined",
-                or_(
-                    OmnigentSession.terminal_state.is_(None),
-                    OmnigentSession.cleanup_state.is_(None),
-                    OmnigentSession.cleanup_state.notin_(("complete", "closed")),
-                ),
-            )
-            .order_by(OmnigentSession.updated_at, OmnigentSession.session_id)
-            .offset(bounded_offset)
-            .limit(bounded_limit)
+        stmt = select(OmnigentSession).where(
+            OmnigentSession.historical_read_state != "quarantined",
+            or_(
+                OmnigentSession.terminal_state.is_(None),
+                OmnigentSession.cleanup_state.is_(None),
+                OmnigentSession.cleanup_state.notin_(("complete", "closed")),
+            ),
         )
+        if after is not None:
+            stmt = stmt.where(OmnigentSession.session_id > after).order_by(
+                OmnigentSession.session_id
+            )
+        else:
+            stmt = stmt.order_by(OmnigentSession.updated_at, OmnigentSession.session_id)
+        stmt = stmt.offset(bounded_offset).limit(bounded_limit)
         rows = (await self._session.execute(stmt)).scalars().all()
         return [_session_record(row) for row in rows]
 
@@ -1303,6 +1313,19 @@ class TurnAttemptRepository(_RepositoryBase):
         row = await self._session.get(OmnigentTurnAttempt, turn_attempt_id)
         return _turn_record(row) if row is not None else None
 
+    async def get_many(
+        self, turn_attempt_ids: Sequence[str]
+    ) -> dict[str, TurnAttemptRecord]:
+        """Return the turn attempts that exist among ``turn_attempt_ids``."""
+
+        if not turn_attempt_ids:
+            return {}
+        stmt = select(OmnigentTurnAttempt).where(
+            OmnigentTurnAttempt.turn_attempt_id.in_(list(turn_attempt_ids))
+        )
+        rows = (await self._session.execute(stmt)).scalars().all()
+        return {row.turn_attempt_id: _turn_record(row) for row in rows}
+
     async def get_by_idempotency_key(
         self, idempotency_key: str
     ) -> Optional[TurnAttemptRecord]:
@@ -1698,6 +1721,68 @@ class ObservationRepository(_RepositoryBase):
         row = (await self._session.execute(stmt)).scalars().first()
         return _observation_record(row) if row is not None else None
 
+    async def latest_for_sessions(
+        self,
+        session_ids: Sequence[str],
+        *,
+        observation_type_groups: dict[str, Sequence[str]],
+    ) -> dict[tuple[str, str], ObservationRecord]:
+        """Return the newest observation per session and type group in one query.
+
+        ``observation_type_groups`` maps a group name to the observation types
+        it covers (as :meth:`latest_for_session` ``observation_types``). The
+        result is keyed by ``(session_id, group)``; a window function ranks
+        each partition so only one row per key is materialized.
+        """
+
+        if not session_ids or not observation_type_groups:
+            return {}
+        group = case(
+            *(
+                (OmnigentObservation.observation_type.in_(list(types)), name)
+                for name, types in observation_type_groups.items()
+            ),
+            else_=None,
+        )
+        ranked = (
+            select(
+                OmnigentObservation.observation_id.label("observation_id"),
+                group.label("type_group"),
+                func.row_number()
+                .over(
+                    partition_by=(OmnigentObservation.session_id, group),
+                    order_by=(
+                        OmnigentObservation.observed_at.desc(),
+                        OmnigentObservation.observation_id.desc(),
+                    ),
+                )
+                .label("rank"),
+            )
+            .where(
+                OmnigentObservation.session_id.in_(list(session_ids)),
+                OmnigentObservation.observation_type.in_(
+                    [
+                        observation_type
+                        for types in observation_type_groups.values()
+                        for observation_type in types
+                    ]
+                ),
+            )
+            .subquery()
+        )
+        stmt = select(OmnigentObservation, ranked.c.type_group).join(
+            ranked,
+            and_(
+                OmnigentObservation.observation_id == ranked.c.observation_id,
+                ranked.c.rank == 1,
+            ),
+        )
+        rows = (await self._session.execute(stmt)).all()
+        return {
+            (row.session_id, type_group): _observation_record(row)
+            for row, type_group in rows
+        }
+
 
 # --- CommandRepository -------------------------------------------------------
 
@@ -1905,6 +1990,49 @@ class CommandRepository(_RepositoryBase):
         row = (await self._session.execute(stmt)).scalars().first()
         return _command_record(row) if row is not None else None
 
+    async def active_for_sessions(
+        self, session_ids: Sequence[str]
+    ) -> dict[str, CommandRecord]:
+        """Set-based :meth:`active_for_session` for a batch of sessions."""
+
+        if not session_ids:
+            return {}
+        precedence = case(
+            (OmnigentCommand.status == COMMAND_STATE_DELIVERY_UNKNOWN, 0),
+            else_=1,
+        )
+        ranked = (
+            select(
+                OmnigentCommand.command_id.label("command_id"),
+                func.row_number()
+                .over(
+                    partition_by=OmnigentCommand.session_id,
+                    order_by=(
+                        precedence,
+                        OmnigentCommand.updated_at.desc(),
+                        OmnigentCommand.command_id,
+                    ),
+                )
+                .label("rank"),
+            )
+            .where(
+                OmnigentCommand.session_id.in_(list(session_ids)),
+                OmnigentCommand.status.in_(
+                    [COMMAND_STATE_DELIVERY_UNKNOWN, COMMAND_STATE_CLAIMED]
+                ),
+            )
+            .subquery()
+        )
+        stmt = select(OmnigentCommand).join(
+            ranked,
+            and_(
+                OmnigentCommand.command_id == ranked.c.command_id,
+                ranked.c.rank == 1,
+            ),
+        )
+        rows = (await self._session.execute(stmt)).scalars().all()
+        return {row.session_id: _command_record(row) for row in rows}
+
     async def _load_command_for_update(self, command_id: str) -> OmnigentCommand:
         row = await self._session.get(
             OmnigentCommand, command_id, with_for_update=True
@@ -2346,6 +2474,49 @@ class DecisionRepository(_RepositoryBase):
         rows = (await self._session.execute(stmt)).scalars().all()
         return [_decision_record(row) for row in rows]
 
+    async def recent_for_sessions(
+        self, session_ids: Sequence[str], *, limit: int = 10
+    ) -> dict[str, list[DecisionRecord]]:
+        """Set-based :meth:`recent_for_session`: newest first, per session."""
+
+        if not session_ids:
+            return {}
+        bounded_limit = max(1, min(int(limit), 100))
+        order = (
+            OmnigentReconciliationDecision.created_at.desc(),
+            OmnigentReconciliationDecision.decision_id.desc(),
+        )
+        ranked = (
+            select(
+                OmnigentReconciliationDecision.decision_id.label("decision_id"),
+                func.row_number()
+                .over(
+                    partition_by=OmnigentReconciliationDecision.session_id,
+                    order_by=order,
+                )
+                .label("rank"),
+            )
+            .where(OmnigentReconciliationDecision.session_id.in_(list(session_ids)))
+            .subquery()
+        )
+        stmt = (
+            select(OmnigentReconciliationDecision)
+            .join(
+                ranked,
+                and_(
+                    OmnigentReconciliationDecision.decision_id
+                    == ranked.c.decision_id,
+                    ranked.c.rank <= bounded_limit,
+                ),
+            )
+            .order_by(OmnigentReconciliationDecision.session_id, *order)
+        )
+        rows = (await self._session.execute(stmt)).scalars().all()
+        recent: dict[str, list[DecisionRecord]] = {}
+        for row in rows:
+            recent.setdefault(row.session_id, []).append(_decision_record(row))
+        return recent
+
     async def list_for_session(
         self,
         session_id: str,
@@ -2425,6 +2596,37 @@ class DecisionRepository(_RepositoryBase):
         )
         return int((await self._session.execute(stmt)).scalar_one())
 
+    async def count_for_sessions_by_reason(
+        self, session_ids: Sequence[str], reason_codes: Sequence[str]
+    ) -> dict[tuple[str, str], int]:
+        """Set-based :meth:`count_for_session_reason` keyed by ``(session, reason)``.
+
+        Pairs with no recorded decision are absent from the result.
+        """
+
+        if not session_ids or not reason_codes:
+            return {}
+        stmt = (
+            select(
+                OmnigentReconciliationDecision.session_id,
+                OmnigentReconciliationDecision.reason_code,
+                func.count(),
+            )
+            .where(
+                OmnigentReconciliationDecision.session_id.in_(list(session_ids)),
+                OmnigentReconciliationDecision.reason_code.in_(list(reason_codes)),
+            )
+            .group_by(
+                OmnigentReconciliationDecision.session_id,
+                OmnigentReconciliationDecision.reason_code,
+            )
+        )
+        rows = (await self._session.execute(stmt)).all()
+        return {
+            (session_id, reason_code): int(count)
+            for session_id, reason_code, count in rows
+        }
+
 
 # --- ChatBindingAliasRepository ----------------------------------------------
 
@@ -2522,6 +2724,19 @@ class CleanupAuthorityRepository(_RepositoryBase):
         row = await self._session.get(OmnigentCleanupAuthority, session_id)
         return _cleanup_record(row) if row is not None else None
 
+    async def get_many(
+        self, session_ids: Sequence[str]
+    ) -> dict[str, CleanupAuthorityRecord]:
+        """Return the cleanup authorities that exist among ``session_ids``."""
+
+        if not session_ids:
+            return {}
+        stmt = select(OmnigentCleanupAuthority).where(
+            OmnigentCleanupAuthority.session_id.in_(list(session_ids))
+        )
+        rows = (await self._session.execute(stmt)).scalars().all()
+        return {row.session_id: _cleanup_record(row) for row in rows}
+
     async def _load_for_update(self, session_id: str) -> OmnigentCleanupAuthority:
         """Load (or lazily create) the cleanup-authority row under a row lock."""
 
@@ -2751,6 +2966,173 @@ class ControlPlaneRepositories:
             cleanup=CleanupAuthorityRepository(session),
         )
 
+    async def session_evidence(
+        self,
+        session_id: str,
+        *,
+        observation_type_groups: dict[str, Sequence[str]],
+    ) -> Optional[SessionEvidenceRecord]:
+        """Load one session and its bounded read evidence in a single query.
+
+        Every evidence row is picked by a correlated ``ORDER BY ... LIMIT 1``
+        subquery (the portable form of a lateral join) and outer-joined onto
+        the session row, with the same ordering as the per-aggregate
+        ``latest_for_session`` / ``active_for_session`` reads.
+        """
+
+        turn = aliased(OmnigentTurnAttempt)
+        command = aliased(OmnigentCommand)
+        decision = aliased(OmnigentReconciliationDecision)
+        cleanup = aliased(OmnigentCleanupAuthority)
+        observations = {
+            name: aliased(OmnigentObservation) for name in observation_type_groups
+        }
+
+        def _latest_observation_id(types: Sequence[str]):
+            candidate = aliased(OmnigentObservation)
+            return (
+                select(candidate.observation_id)
+                .where(
+                    candidate.session_id == OmnigentSession.session_id,
+                    candidate.observation_type.in_(list(types)),
+                )
+                .order_by(candidate.observed_at.desc(), candidate.observation_id.desc())
+                .limit(1)
+                .correlate(OmnigentSession)
+                .scalar_subquery()
+            )
+
+        active_command = aliased(OmnigentCommand)
+        active_command_id = (
+            select(active_command.command_id)
+            .where(
+                active_command.session_id == OmnigentSession.session_id,
+                active_command.status.in_(
+                    [COMMAND_STATE_DELIVERY_UNKNOWN, COMMAND_STATE_CLAIMED]
+                ),
+            )
+            .order_by(
+                case(
+                    (active_command.status == COMMAND_STATE_DELIVERY_UNKNOWN, 0),
+                    else_=1,
+                ),
+                active_command.updated_at.desc(),
+                active_command.command_id,
+            )
+            .limit(1)
+            .correlate(OmnigentSession)
+            .scalar_subquery()
+        )
+        latest = aliased(OmnigentReconciliationDecision)
+        latest_decision_id = (
+            select(latest.decision_id)
+            .where(latest.session_id == OmnigentSession.session_id)
+            .order_by(latest.created_at.desc(), latest.decision_id.desc())
+            .limit(1)
+            .correlate(OmnigentSession)
+            .scalar_subquery()
+        )
+        counted = aliased(OmnigentTurnAttempt)
+        turn_attempt_count = (
+            select(func.count())
+            .select_from(counted)
+            .where(counted.session_id == OmnigentSession.session_id)
+            .correlate(OmnigentSession)
+            .scalar_subquery()
+        )
+
+        stmt = (
+            select(
+                OmnigentSession,
+                turn,
+                turn_attempt_count,
+                command,
+                decision,
+                cleanup,
+                *observations.values(),
+            )
+            .outerjoin(
+                turn, turn.turn_attempt_id == OmnigentSession.active_turn_attempt_id
+            )
+            .outerjoin(command, command.command_id == active_command_id)
+            .outerjoin(
+                decision,
+                decision.decision_id
+                == func.coalesce(latest_decision_id, OmnigentSession.last_decision_ref),
+            )
+            .outerjoin(cleanup, cleanup.session_id == OmnigentSession.session_id)
+        )
+        for name, observation in observations.items():
+            stmt = stmt.outerjoin(
+                observation,
+                observation.observation_id
+                == _latest_observation_id(observation_type_groups[name]),
+            )
+        stmt = stmt.where(OmnigentSession.session_id == session_id)
+        row = (await self.sessions._session.execute(stmt)).first()
+        if row is None:
+            return None
+        session_row, turn_row, count, command_row, decision_row, cleanup_row = row[:6]
+        return SessionEvidenceRecord(
+            session=_session_record(session_row),
+            active_turn=_turn_record(turn_row) if turn_row is not None else None,
+            turn_attempt_count=int(count or 0),
+            latest_observations={
+                name: _observation_record(observation_row)
+                for name, observation_row in zip(observations, row[6:])
+                if observation_row is not None
+            },
+            active_command=(
+                _command_record(command_row) if command_row is not None else None
+            ),
+            latest_decision=(
+                _decision_record(decision_row) if decision_row is not None else None
+            ),
+            cleanup=_cleanup_record(cleanup_row) if cleanup_row is not None else None,
+        )
+
+    async def session_evidence_version(
+        self, session_id: str
+    ) -> Optional[tuple[Any, ...]]:
+        """Return a cheap change token over one session and its evidence.
+
+        Observation appends do not write the session row and command,
+        decision, turn and cleanup writes do not always advance its revision,
+        so the token also folds in each evidence table's newest write time and
+        row count, all read by one aggregate query.
+        """
+
+        def _aggregate(model, *columns):
+            aggregates = [func.max(column) for column in columns]
+            aggregates.append(func.count())
+            return [
+                select(aggregate)
+                .where(model.session_id == OmnigentSession.session_id)
+                .correlate(OmnigentSession)
+                .scalar_subquery()
+                for aggregate in aggregates
+            ]
+
+        stmt = select(
+            OmnigentSession.session_id,
+            OmnigentSession.revision,
+            OmnigentSession.updated_at,
+            *_aggregate(
+                OmnigentObservation,
+                OmnigentObservation.observed_at,
+                OmnigentObservation.created_at,
+            ),
+            *_aggregate(OmnigentTurnAttempt, OmnigentTurnAttempt.updated_at),
+            *_aggregate(OmnigentCommand, OmnigentCommand.updated_at),
+            *_aggregate(
+                OmnigentReconciliationDecision,
+                OmnigentReconciliationDecision.created_at,
+            ),
+            *_aggregate(OmnigentCleanupAuthority, OmnigentCleanupAuthority.updated_at),
+        ).where(OmnigentSession.session_id == session_id)
+        row = (await self.sessions._session.execute(stmt)).first()
+        return tuple(row) if row is not None else None
+
 
 class OmnigentControlPlaneStore:
     """Session-factory-bound entry point for the control-plane repositories.
@@ -10,19 +10,23 @@ persistent ambiguity only after a redacted diagnostic artifact exists.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Any, Callable, Optional, Protocol
+from typing import Any, Callable, Optional, Protocol, Sequence
 
 from . import metrics, spans
 from .records import (
     COMMAND_STATE_CLAIMED,
     COMMAND_STATE_PENDING,
+    CleanupAuthorityRecord,
+    CommandRecord,
     ControlPlaneOutcome,
     DecisionRecord,
     ObservationRecord,
     SessionRecord,
+    TurnAttemptRecord,
     compute_digest,
 )
 from .repositories import ControlPlaneRepositories
@@ -46,6 +50,11 @@ _EVENT_OBSERVATION_TYPES = (
 )
 _SNAPSHOT_OBSERVATION_TYPES = ("snapshot", "provider_snapshot")
 _LIVENESS_OBSERVATION_TYPES = ("heartbeat", "liveness", "provider_liveness")
+_OBSERVATION_TYPE_GROUPS = {
+    "event": _EVENT_OBSERVATION_TYPES,
+    "snapshot": _SNAPSHOT_OBSERVATION_TYPES,
+    "liveness": _LIVENESS_OBSERVATION_TYPES,
+}
 _TERMINAL_PROVIDER_STATES = frozenset(
     {
         "completed",
@@ -65,6 +74,8 @@ _ACTIVE_PROVIDER_STATES = frozenset(
     {"active", "running", "working", "in_progress", "queued", "starting", "idle"}
 )
 _DETECTION_BUCKET = timedelta(minutes=10)
+_SWEEP_PAGE_SIZE = 100
+_SWEEP_RESPONSE_CONCURRENCY = 8
 logger = logging.getLogger("moonmind.omnigent.control_plane.stuck_state")
 
 
@@ -242,39 +253,73 @@ def _consecutive_no_progress(
     return count
 
 
-async def inspect_stuck_state(
+@dataclass(frozen=True)
+class _SessionEvidence:
+    active_turn: Optional[TurnAttemptRecord]
+    latest_event: Optional[ObservationRecord]
+    latest_snapshot: Optional[ObservationRecord]
+    latest_liveness: Optional[ObservationRecord]
+    active_command: Optional[CommandRecord]
+    cleanup: Optional[CleanupAuthorityRecord]
+    recent_decisions: list[DecisionRecord]
+
+
+async def _load_evidence(
     repos: ControlPlaneRepositories,
+    sessions: Sequence[SessionRecord],
     *,
-    session_id: str,
-    now: datetime,
-    policy: StuckStatePolicy = StuckStatePolicy(),
-) -> Optional[StuckStateInspection]:
-    """Load bounded durable evidence and evaluate one canonical session."""
+    policy: StuckStatePolicy,
+) -> dict[str, _SessionEvidence]:
+    """Load bounded durable evidence for a batch in a fixed number of queries."""
 
+    session_ids = [session.session_id for session in sessions]
     with spans.omnigent_span(spans.OBSERVATION_LOAD, observation_source="durable_index"):
-        session = await repos.sessions.get(session_id)
-        if session is None or session.historical_read_state == "quarantined":
-            return None
-        active_turn = (
-            await repos.turn_attempts.get(session.active_turn_attempt_id)
-            if session.active_turn_attempt_id is not None
-            else None
-        )
-        latest_event = await repos.observations.latest_for_session(
-            session_id, observation_types=_EVENT_OBSERVATION_TYPES
+        turns = await repos.turn_attempts.get_many(
+            [
+                session.active_turn_attempt_id
+                for session in sessions
+                if session.active_turn_attempt_id is not None
+            ]
         )
-        latest_snapshot = await repos.observations.latest_for_session(
-            session_id, observation_types=_SNAPSHOT_OBSERVATION_TYPES
+        observations = await repos.observations.latest_for_sessions(
+            session_ids, observation_type_groups=_OBSERVATION_TYPE_GROUPS
         )
-        latest_liveness = await repos.observations.latest_for_session(
-            session_id, observation_types=_LIVENESS_OBSERVATION_TYPES
+        commands = await repos.commands.active_for_sessions(session_ids)
+        cleanups = await repos.cleanup.get_many(session_ids)
+        decisions = await repos.decisions.recent_for_sessions(
+            session_ids, limit=max(policy.no_progress_max, 1)
         )
-        active_command = await repos.commands.active_for_session(session_id)
-        cleanup = await repos.cleanup.get(session_id)
-        recent_decisions = await repos.decisions.recent_for_session(
-            session_id, limit=max(policy.no_progress_max, 1)
+    return {
+        session.session_id: _SessionEvidence(
+            active_turn=(
+                turns.get(session.active_turn_attempt_id)
+                if session.active_turn_attempt_id is not None
+                else None
+            ),
+            latest_event=observations.get((session.session_id, "event")),
+            latest_snapshot=observations.get((session.session_id, "snapshot")),
+            latest_liveness=observations.get((session.session_id, "liveness")),
+            active_command=commands.get(session.session_id),
+            cleanup=cleanups.get(session.session_id),
+            recent_decisions=decisions.get(session.session_id, []),
         )
+        for session in sessions
+    }
+
 
+def _detect(
+    session: SessionRecord,
+    evidence: _SessionEvidence,
+    *,
+    now: datetime,
+    policy: StuckStatePolicy,
+) -> list[StuckStateFinding]:
+    latest_event = evidence.latest_event
+    latest_snapshot = evidence.latest_snapshot
+    latest_liveness = evidence.latest_liveness
+    active_turn = evidence.active_turn
+    active_command = evidence.active_command
+    cleanup = evidence.cleanup
     provider_terminal, provider_active = _provider_state(latest_snapshot, latest_event)
     host_active, host_owner, profile_active, profile_consumer = _lease_signals(
         latest_snapshot
@@ -336,7 +381,9 @@ async def inspect_stuck_state(
         cleanup_started_at=cleanup_started_at,
         conformance_evidence_at=conformance_at,
         conformance_runner_available=runner_available,
-        consecutive_no_progress=_consecutive_no_progress(session, recent_decisions),
+        consecutive_no_progress=_consecutive_no_progress(
+            session, evidence.recent_decisions
+        ),
     )
     if liveness_only_since is not None:
         _observe_metric(
@@ -383,9 +430,18 @@ async def inspect_stuck_state(
         expected_revision=session.revision,
         fencing_generation_ordinal=session.fencing_generation,
     ):
-        findings = detect_stuck_state(
-            session=session, signals=signals, now=now, policy=policy
+        return list(
+            detect_stuck_state(session=session, signals=signals, now=now, policy=policy)
         )
+
+
+def _plan(
+    session: SessionRecord,
+    findings: list[StuckStateFinding],
+    reason_counts: dict[tuple[str, str], int],
+    *,
+    policy: StuckStatePolicy,
+) -> StuckStateInspection:
     prior_count = 0
     if findings:
         # A repeated sweep can add the generic no-progress finding alongside
@@ -393,9 +449,7 @@ async def inspect_stuck_state(
         # its unbucketed command identity remains stable and its bounded
         # reconcile -> quarantine progression cannot reset under a new reason.
         counts = [
-            await repos.decisions.count_for_session_reason(
-                session_id, finding.reason.value
-            )
+            reason_counts.get((session.session_id, finding.reason.value), 0)
             for finding in findings
         ]
         dominant_index = max(range(len(findings)), key=lambda index: counts[index])
@@ -420,6 +474,95 @@ async def inspect_stuck_state(
     return StuckStateInspection(session, tuple(findings), response)
 
 
+async def inspect_stuck_states(
+    repos: ControlPlaneRepositories,
+    sessions: Sequence[SessionRecord],
+    *,
+    now: datetime,
+    policy: StuckStatePolicy = StuckStatePolicy(),
+) -> list[StuckStateInspection]:
+    """Evaluate a batch of canonical sessions against set-loaded evidence.
+
+    Evidence for the whole batch is fetched with one query per evidence kind
+    and evaluated in memory; quarantined sessions are skipped.
+    """
+
+    eligible = [
+        session
+        for session in sessions
+        if session.historical_read_state != "quarantined"
+    ]
+    if not eligible:
+        return []
+    evidence = await _load_evidence(repos, eligible, policy=policy)
+    detected = [
+        (
+            session,
+            _detect(session, evidence[session.session_id], now=now, policy=policy),
+        )
+        for session in eligible
+    ]
+    reason_counts = await repos.decisions.count_for_sessions_by_reason(
+        [session.session_id for session, findings in detected if findings],
+        sorted(
+            {finding.reason.value for _session, findings in detected for finding in findings}
+        ),
+    )
+    return [
+        _plan(session, findings, reason_counts, policy=policy)
+        for session, findings in detected
+    ]
+
+
+async def inspect_stuck_state(
+    repos: ControlPlaneRepositories,
+    *,
+    session_id: str,
+    now: datetime,
+    policy: StuckStatePolicy = StuckStatePolicy(),
+) -> Optional[StuckStateInspection]:
+    """Load bounded durable evidence and evaluate one canonical session.
+
+    The session and its latest evidence come from one
+    :meth:`ControlPlaneRepositories.session_evidence` query, plus one for the
+    recent decision window. Sweeps use :func:`inspect_stuck_states`, which
+    loads the same evidence for a whole batch with set-based queries.
+    """
+
+    with spans.omnigent_span(spans.OBSERVATION_LOAD, observation_source="durable_index"):
+        bundle = await repos.session_evidence(
+            session_id, observation_type_groups=_OBSERVATION_TYPE_GROUPS
+        )
+        if bundle is None or bundle.session.historical_read_state == "quarantined":
+            return None
+        session = bundle.session
+        evidence = _SessionEvidence(
+            active_turn=bundle.active_turn,
+            latest_event=bundle.latest_observations.get("event"),
+            latest_snapshot=bundle.latest_observations.get("snapshot"),
+            latest_liveness=bundle.latest_observations.get("liveness"),
+            active_command=bundle.active_command,
+            cleanup=bundle.cleanup,
+            recent_decisions=await repos.decisions.recent_for_session(
+                session_id, limit=max(policy.no_progress_max, 1)
+            ),
+        )
+    findings = _detect(session, evidence, now=now, policy=policy)
+    reason_counts = {
+        (session_id, reason): await repos.decisions.count_for_session_reason(
+            session_id, reason
+        )
+        for reason in dict.fromkeys(finding.reason.value for finding in findings)
+    }
+    return _plan(session, findings, reason_counts, policy=policy)
+
+
+def _least_recently_updated(session: SessionRecord) -> tuple[Any, ...]:
+    if session.updated_at is None:
+        return (0, session.session_id)
+    return (1, session.updated_at, session.session_id)
+
+
 class StuckStateReconciliationService:
     """Periodically converge stuck canonical sessions without provider guesses."""
 
@@ -430,35 +573,123 @@ class StuckStateReconciliationService:
         dispatcher: ReconcileDispatcher,
         diagnostic_publisher: DiagnosticPublisher,
         policy: StuckStatePolicy = StuckStatePolicy(),
+        response_concurrency: int = _SWEEP_RESPONSE_CONCURRENCY,
     ) -> None:
         self._session_factory = session_factory
         self._dispatcher = dispatcher
         self._diagnostics = diagnostic_publisher
         self._policy = policy
+        self._response_concurrency = max(1, int(response_concurrency))
+        # Keyset position (session_id) of the last candidate inspected, so a
+        # sweep bounded by ``limit`` resumes where the previous one stopped
+        # instead of rereading the same rows every tick.
+        self._cursor: Optional[str] = None
 
     async def sweep(
-        self, *, now: Optional[datetime] = None, limit: int = 100
+        self,
+        *,
+        now: Optional[datetime] = None,
+        limit: int = 100,
+        page_size: int = _SWEEP_PAGE_SIZE,
     ) -> StuckStateSweepResult:
+        """Inspect up to ``limit`` candidates in ``session_id`` keyset pages.
+
+        Each page is inspected least recently updated first. Its evidence is
+        loaded with a handful of set-based queries and evaluated in memory;
+        only sessions that need a response are handled, at most
+        ``response_concurrency`` at a time. The walk continues from the
+        previous sweep's cursor and wraps around once, so every eligible
+        candidate is reached even when the population exceeds ``limit``.
+        """
+
         observed_now = now or datetime.now(UTC)
         result = StuckStateSweepResult()
-        async with self._session_factory() as db:
-            repos = ControlPlaneRepositories.bind(db)
-            candidates = await repos.sessions.list_reconciliation_candidates(limit=limit)
-        for candidate in candidates:
-            result.scanned += 1
-            try:
-                await self._reconcile_one(candidate.session_id, observed_now, result)
-            except Exception:
-                # One provider/artifact/storage failure must not starve every
-                # later candidate in the bounded batch. The durable schedule
-                # retries failed candidates on its next tick.
-                result.failures += 1
-                logger.warning(
-                    "Omnigent stuck-state candidate inspection failed",
-                    exc_info=True,
+        bounded_limit = max(1, int(limit))
+        bounded_page = max(1, min(int(page_size), bounded_limit))
+        origin = self._cursor
+        cursor = origin
+        wrapped = origin is None
+        while result.scanned < bounded_limit:
+            requested = min(bounded_page, bounded_limit - result.scanned)
+            async with self._session_factory() as db:
+                repos = ControlPlaneRepositories.bind(db)
+                page = await repos.sessions.list_reconciliation_candidates(
+                    limit=requested, after=cursor or ""
                 )
+            exhausted = len(page) < requested
+            if wrapped and origin is not None and page and page[-1].session_id > origin:
+                # Second lap: stop at the row the sweep started after.
+                page = [item for item in page if item.session_id <= origin]
+                exhausted = True
+            if page:
+                cursor = page[-1].session_id
+            result.scanned += len(page)
+            await self._sweep_page(
+                sorted(page, key=_least_recently_updated), observed_now, result
+            )
+            if exhausted:
+                if wrapped:
+                    self._cursor = None
+                    return result
+                wrapped = True
+                cursor = None
+        self._cursor = cursor
         return result
 
+    async def _sweep_page(
+        self,
+        candidates: list[SessionRecord],
+        now: datetime,
+        result: StuckStateSweepResult,
+    ) -> None:
+        if not candidates:
+            return
+        try:
+            async with self._session_factory() as db:
+                inspections = await inspect_stuck_states(
+                    ControlPlaneRepositories.bind(db),
+                    candidates,
+                    now=now,
+                    policy=self._policy,
+                )
+        except Exception:
+            logger.warning(
+                "Omnigent stuck-state batch inspection failed; inspecting candidates individually",
+                exc_info=True,
+            )
+            for candidate in candidates:
+                await self._guarded(
+                    self._reconcile_one(candidate.session_id, now, result), result
+                )
+            return
+        semaphore = asyncio.Semaphore(self._response_concurrency)
+
+        async def respond(inspection: StuckStateInspection) -> None:
+            async with semaphore:
+                await self._guarded(self._respond(inspection, now, result), result)
+
+        await asyncio.gather(
+            *(
+                respond(inspection)
+                for inspection in inspections
+                if inspection.findings and inspection.response is not None
+            )
+        )
+
+    @staticmethod
+    async def _guarded(operation: Any, result: StuckStateSweepResult) -> None:
+        try:
+            await operation
+        except Exception:
+            # One provider/artifact/storage failure must not starve every
+            # later candidate in the bounded batch. The durable schedule
+            # retries failed candidates on its next tick.
+            result.failures += 1
+            logger.warning(
+                "Omnigent stuck-state candidate inspection failed",
+                exc_info=True,
+            )
+
     async def validate_reconcile_request(
         self,
         *,
@@ -654,7 +885,16 @@ class StuckStateReconciliationService:
         inspection = await self._inspect(session_id, now)
         if inspection is None or not inspection.findings or inspection.response is None:
             return
+        await self._respond(inspection, now, result)
+
+    async def _respond(
+        self,
+        inspection: StuckStateInspection,
+        now: datetime,
+        result: StuckStateSweepResult,
+    ) -> None:
         response = inspection.response
+        assert response is not None
         session = inspection.session
         reason = inspection.findings[0].reason.value
         decision_identity = self._identity(
@@ -819,4 +1059,5 @@ __all__ = [
     "StuckStateReconciliationService",
     "StuckStateSweepResult",
     "inspect_stuck_state",
+    "inspect_stuck_states",
 ]
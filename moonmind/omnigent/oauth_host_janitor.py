@@ -472,6 +472,13 @@ class OmnigentOAuthHostJanitor:
         known_containers = {
             lease.container_name: lease for lease in leases if lease.container_name
         }
+        # One labelled listing answers every container question in this pass,
+        # so the daemon cost does not grow with the number of leases.
+        snapshot = (
+            await self._runtime.resource_snapshot()
+            if hasattr(self._runtime, "resource_snapshot")
+            else None
+        )
         for lease in leases:
             if profile_id and lease.provider_profile_id != profile_id:
                 continue
@@ -484,7 +491,11 @@ class OmnigentOAuthHostJanitor:
             reconciliation_action = reconciliation_required.get(lease.lease_id)
             missing = bool(
                 lease.container_name
-                and not await self._runtime.container_exists(lease.container_name)
+                and not (
+                    snapshot.container_running(lease.container_name)
+                    if snapshot is not None
+                    else await self._runtime.container_exists(lease.container_name)
+                )
             )
             # ``allocating`` and ``starting`` precede the container
             # materialization authority handoff. A deterministic container name
@@ -600,11 +611,20 @@ class OmnigentOAuthHostJanitor:
                     ),
                 }
             )
-        for container_name in await self._runtime.list_managed_containers():
+        managed_containers = (
+            snapshot.managed_containers()
+            if snapshot is not None
+            else await self._runtime.list_managed_containers()
+        )
+        for container_name in managed_containers:
             if container_name in known_containers:
                 continue
-            host_lease_ref = await self._runtime.managed_container_host_lease_ref(
-                container_name
+            host_lease_ref = (
+                snapshot.host_lease_ref(container_name)
+                if snapshot is not None
+                else await self._runtime.managed_container_host_lease_ref(
+                    container_name
+                )
             )
             if host_lease_ref:
                 live_lease = await self._repository.get_host_lease(host_lease_ref)
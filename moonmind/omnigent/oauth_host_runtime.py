@@ -10,7 +10,7 @@ import re
 import shutil
 import tarfile
 import tempfile
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -26,6 +26,7 @@ from moonmind.omnigent.mounted_tool_preflight import (
     preflight_mounted_tools,
 )
 from moonmind.omnigent.oauth_hosts import (
+    HOST_CONTAINER_NAME_PREFIX,
     HostPreflightFailure,
     OmnigentOAuthHostError,
     deterministic_host_container_name,
@@ -80,7 +81,10 @@ from moonmind.security.execution_fanout_capabilities import (
 )
 from moonmind.utils.logging import redact_sensitive_text
 from moonmind.workflows.adapters.github_service import GitHubService
-from moonmind.workflows.adapters.omnigent_client import OmnigentHttpClient
+from moonmind.workflows.adapters.omnigent_client import (
+    OmnigentClientError,
+    OmnigentHttpClient,
+)
 from moonmind.workflows.skills.run_projection import (
     load_resolved_skillset,
     materialize_run_skill_snapshot,
@@ -90,6 +94,10 @@ from moonmind.workflows.temporal.runtime.command_runner import run_runtime_comma
 from moonmind.workflows.temporal.runtime.git_auth import (
     build_github_token_git_environment,
 )
+from moonmind.workflows.temporal.runtime.git_object_cache import (
+    clone_through_cache,
+    shared_git_object_cache,
+)
 from moonmind.workflows.temporal.runtime.workspace_locators import (
     SandboxWorkspaceRecord,
     SandboxWorkspaceRecordStore,
@@ -110,6 +118,80 @@ _FORBIDDEN_ENV = (
     "GEMINI_API_KEY",
     "GOOGLE_API_KEY",
 )
+_MANAGED_HOST_LABEL = "moonmind.kind=omnigent-oauth-host"
+_HOST_VOLUME_SUFFIXES = ("-state", "-artifacts", "-cache")
+# Resource listings are read in full; a listing that reaches this bound is
+# treated as unavailable rather than trusted as complete.
+_RESOURCE_LISTING_LIMIT_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class OmnigentHostContainerState:
+    """One container row from a host resource listing."""
+
+    running: bool
+    kind: str
+    host_lease_ref: str | None
+
+
+@dataclass(frozen=True)
+class OmnigentHostResourceSnapshot:
+    """Containers and volumes observed by one Docker listing pass.
+
+    Answers existence, running-state and ownership-label questions without a
+    per-resource ``docker inspect``. A name absent from ``containers`` was not
+    listed, which for the janitor's label-filtered pass means it is not a
+    running Omnigent host container.
+    """
+
+    containers: Mapping[str, OmnigentHostContainerState]
+    volumes: frozenset[str]
+
+    def container_running(self, container_name: str) -> bool:
+        state = self.containers.get(container_name)
+        return state is not None and state.running
+
+    def container_present(self, container_name: str) -> bool:
+        return container_name in self.containers
+
+    def volume_present(self, volume_name: str) -> bool:
+        return volume_name in self.volumes
+
+    def managed_containers(self) -> list[str]:
+        return [
+            name
+            for name, state in self.containers.items()
+            if state.kind == "omnigent-oauth-host"
+        ]
+
+    def host_lease_ref(self, container_name: str) -> str | None:
+        state = self.containers.get(container_name)
+        if state is None:
+            return None
+        if state.kind != "omnigent-oauth-host":
+            raise OmnigentOAuthHostError(
+                "refusing to inspect a container outside Omnigent ownership",
+                code="OMNIGENT_HOST_OWNERSHIP_MISMATCH",
+            )
+        return state.host_lease_ref
+
+
+def _host_volume_names(container_name: str) -> tuple[str, ...]:
+    return tuple(f"{container_name}{suffix}" for suffix in _HOST_VOLUME_SUFFIXES)
+
+
+def _readiness_backoff(
+    *, total_seconds: float, max_interval_seconds: float
+) -> Iterator[float]:
+    """Yield capped, doubling probe delays whose sum stays within the budget."""
+
+    delay = _READINESS_INITIAL_INTERVAL_SECONDS
+    remaining = total_seconds
+    while remaining > 0:
+        delay = min(delay, max_interval_seconds, remaining)
+        yield delay
+        remaining -= delay
+        delay *= 2
 
 
 @dataclass(frozen=True)
@@ -234,10 +316,13 @@ _MAX_RESTORE_TOTAL_BYTES = 256 * 1024 * 1024
 # the live host identity after the runner tunnel is ready. Cold image and
 # catalog startup has exceeded one minute on the supported local Compose path;
 # keep the wait bounded but large enough for that authoritative online edge.
-_HOST_REGISTRATION_ATTEMPTS = 91
-_HOST_REGISTRATION_INTERVAL_SECONDS = 2
-_HOST_EXEC_PREFLIGHT_ATTEMPTS = 11
-_HOST_EXEC_PREFLIGHT_INTERVAL_SECONDS = 1
+# Readiness probes back off exponentially from a short first delay so a fast
+# startup is observed when it happens rather than at the next fixed interval.
+_HOST_REGISTRATION_WAIT_SECONDS = 180.0
+_HOST_REGISTRATION_MAX_INTERVAL_SECONDS = 2.0
+_HOST_EXEC_PREFLIGHT_WAIT_SECONDS = 10.0
+_HOST_EXEC_PREFLIGHT_MAX_INTERVAL_SECONDS = 1.0
+_READINESS_INITIAL_INTERVAL_SECONDS = 0.05
 _DEFAULT_PUBLISH_GIT_USER_NAME = "MoonMind Worker"
 _DEFAULT_PUBLISH_GIT_USER_EMAIL = "moonmind-worker@users.noreply.github.com"
 # Restore payloads are read through the durable artifact contract as raw bytes,
@@ -2189,15 +2274,9 @@ class OmnigentOAuthHostRuntime:
                 f"{container_name}-cache",
                 check=False,
             )
-            volume_names = (
-                f"{container_name}-state",
-                f"{container_name}-artifacts",
-                f"{container_name}-cache",
+            container_present, remaining_volumes = (
+                await self._remaining_host_resources(container_name)
             )
-            container_present = await self._container_present(container_name)
-            remaining_volumes = [
-                name for name in volume_names if await self._volume_present(name)
-            ]
             cleanup_ok = not container_present and not remaining_volumes
             runtime_files_removed = False
             if cleanup_ok:
@@ -2330,7 +2409,7 @@ class OmnigentOAuthHostRuntime:
             "ps",
             "-a",
             "--filter",
-            "label=moonmind.kind=omnigent-oauth-host",
+            f"label={_MANAGED_HOST_LABEL}",
             "--format",
             "{{.Names}}",
             check=False,
@@ -2339,6 +2418,90 @@ class OmnigentOAuthHostRuntime:
             return []
         return [line.strip() for line in result[1].splitlines() if line.strip()]
 
+    async def resource_snapshot(self) -> OmnigentHostResourceSnapshot | None:
+        """List managed host containers and their volumes in two daemon calls.
+
+        Containers are selected by the ``moonmind.kind`` ownership label and
+        volumes by the deterministic host name prefix. Returns ``None`` when
+        either listing fails or is too large to trust as complete, so callers
+        fall back to per-resource inspection.
+        """
+
+        return await self._list_resources(
+            container_filter=f"label={_MANAGED_HOST_LABEL}",
+            volume_filter=f"name={HOST_CONTAINER_NAME_PREFIX}",
+        )
+
+    async def _list_resources(
+        self, *, container_filter: str, volume_filter: str
+    ) -> OmnigentHostResourceSnapshot | None:
+        containers = await self._run(
+            "docker",
+            "ps",
+            "-a",
+            "--filter",
+            container_filter,
+            "--format",
+            (
+                '{{.Names}}\t{{.State}}\t{{.Label "moonmind.kind"}}\t'
+                '{{.Label "moonmind.host_lease_id"}}'
+            ),
+            check=False,
+            output_limit_bytes=_RESOURCE_LISTING_LIMIT_BYTES,
+        )
+        volumes = await self._run(
+            "docker",
+            "volume",
+            "ls",
+            "--filter",
+            volume_filter,
+            "--format",
+            "{{.Name}}",
+            check=False,
+            output_limit_bytes=_RESOURCE_LISTING_LIMIT_BYTES,
+        )
+        if any(
+            code != 0 or len(output.encode("utf-8")) >= _RESOURCE_LISTING_LIMIT_BYTES
+            for code, output, _error in (containers, volumes)
+        ):
+            return None
+        states: dict[str, OmnigentHostContainerState] = {}
+        for line in containers[1].splitlines():
+            name, _, rest = line.strip().partition("\t")
+            if not name:
+                continue
+            state, _, rest = rest.partition("\t")
+            kind, _, lease_ref = rest.partition("\t")
+            states[name] = OmnigentHostContainerState(
+                running=state.strip() == "running",
+                kind=kind.strip(),
+                host_lease_ref=lease_ref.strip() or None,
+            )
+        return OmnigentHostResourceSnapshot(
+            containers=states,
+            volumes=frozenset(
+                line.strip() for line in volumes[1].splitlines() if line.strip()
+            ),
+        )
+
+    async def _remaining_host_resources(
+        self, container_name: str
+    ) -> tuple[bool, list[str]]:
+        """Return whether ``container_name`` and which of its volumes remain."""
+
+        volume_names = _host_volume_names(container_name)
+        snapshot = await self._list_resources(
+            container_filter=f"name={container_name}",
+            volume_filter=f"name={container_name}",
+        )
+        if snapshot is None:
+            return await self._container_present(container_name), [
+                name for name in volume_names if await self._volume_present(name)
+            ]
+        return snapshot.container_present(container_name), [
+            name for name in volume_names if snapshot.volume_present(name)
+        ]
+
     async def managed_container_host_lease_ref(self, container_name: str) -> str | None:
         """Return the durable lease identity carried by a managed container."""
 
@@ -2390,16 +2553,9 @@ class OmnigentOAuthHostRuntime:
         await self._run(
             "docker", "volume", "rm", "-f", f"{container_name}-cache", check=False
         )
-        remaining_container = await self._container_present(container_name)
-        remaining_volumes = [
-            name
-            for name in (
-                f"{container_name}-state",
-                f"{container_name}-artifacts",
-                f"{container_name}-cache",
-            )
-            if await self._volume_present(name)
-        ]
+        remaining_container, remaining_volumes = (
+            await self._remaining_host_resources(container_name)
+        )
         if remaining_container or remaining_volumes:
             raise OmnigentOAuthHostError(
                 "orphaned Omnigent host cleanup could not be reconciled",
@@ -3183,14 +3339,35 @@ class OmnigentOAuthHostRuntime:
                 github_token, base_env=os.environ
             )
 
-        clone_args = ["git", "clone"]
+        branch_args: list[str] = []
         # A remote clone can fetch just the authored branch; a local source keeps
         # every ref so a subsequent checkout can select it.
         if start and source_kind != "local":
-            clone_args.extend(["--branch", start, "--single-branch"])
-        clone_args.extend(["--", source, str(workspace)])
-        code, _out, err = await self._run(*clone_args, env=git_env, check=False)
-        if code != 0:
+            branch_args = ["--branch", start, "--single-branch"]
+        err = ""
+
+        async def clone(extra_args: Sequence[str]) -> bool:
+            nonlocal err
+            code, _out, err = await self._run(
+                "git",
+                "clone",
+                *branch_args,
+                *extra_args,
+                "--",
+                source,
+                str(workspace),
+                env=git_env,
+                check=False,
+            )
+            return code == 0
+
+        if not await clone_through_cache(
+            source,
+            workspace,
+            clone,
+            env=git_env,
+            cache=None if source_kind == "local" else shared_git_object_cache(),
+        ):
             raise OmnigentOAuthHostError(
                 f"workspace repository materialization failed: {err.strip()[:200]}",
                 code="OMNIGENT_WORKSPACE_MATERIALIZATION_FAILED",
@@ -3880,7 +4057,11 @@ class OmnigentOAuthHostRuntime:
         # accept ``docker exec``. Keep this readiness check local to the live
         # container so a short startup race does not tear down an otherwise
         # valid host and consume the activity-level retry budget.
-        for attempt in range(_HOST_EXEC_PREFLIGHT_ATTEMPTS):
+        delays = _readiness_backoff(
+            total_seconds=_HOST_EXEC_PREFLIGHT_WAIT_SECONDS,
+            max_interval_seconds=_HOST_EXEC_PREFLIGHT_MAX_INTERVAL_SECONDS,
+        )
+        while True:
             projections = await self._run(
                 "docker",
                 "exec",
@@ -3902,8 +4083,10 @@ class OmnigentOAuthHostRuntime:
                 )
                 if workspace[0] == 0:
                     return
-            if attempt + 1 < _HOST_EXEC_PREFLIGHT_ATTEMPTS:
-                await asyncio.sleep(_HOST_EXEC_PREFLIGHT_INTERVAL_SECONDS)
+            delay = next(delays, None)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
         raise OmnigentOAuthHostError(
             "OAuth host runtime command failed",
             code=HostPreflightFailure.LOGIN_STATUS_FAILED.value,
@@ -3920,19 +4103,22 @@ class OmnigentOAuthHostRuntime:
             host_lease.lease_id
         )
         adapter = self._runtime_adapter(binding)
-        for attempt in range(_HOST_REGISTRATION_ATTEMPTS):
-            hosts = await self._client.list_hosts()
+        delays = _readiness_backoff(
+            total_seconds=_HOST_REGISTRATION_WAIT_SECONDS,
+            max_interval_seconds=_HOST_REGISTRATION_MAX_INTERVAL_SECONDS,
+        )
+        while True:
             if expected_id:
                 matches = [
                     host
-                    for host in hosts
+                    for host in await self._registered_hosts(expected_id)
                     if str(host.get("id") or host.get("hostId") or host.get("host_id"))
                     == expected_id
                 ]
             else:
                 matches = [
                     host
-                    for host in hosts
+                    for host in await self._client.list_hosts()
                     if str(host.get("name") or host.get("hostname") or "")
                     in {expected_name, str(adapter["compose_service"])}
                 ]
@@ -3945,13 +4131,39 @@ class OmnigentOAuthHostRuntime:
                 return dict(online[0])
             if len(online) > 1:
                 break
-            if attempt + 1 < _HOST_REGISTRATION_ATTEMPTS:
-                await asyncio.sleep(_HOST_REGISTRATION_INTERVAL_SECONDS)
+            delay = next(delays, None)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
         raise OmnigentOAuthHostError(
             "expected exactly one compatible online host after bounded registration wait",
             code=HostPreflightFailure.HOST_NOT_REGISTERED.value,
         )
 
+    async def _registered_hosts(self, host_id: str) -> list[dict[str, Any]]:
+        """Look up one host by id instead of listing the whole catalog.
+
+        An unknown id is not yet registered. Responses may wrap the record in
+        a ``host`` envelope; clients without a single-host lookup, or whose
+        response carries no host id, fall back to the catalog listing.
+        """
+
+        if not hasattr(self._client, "get_host"):
+            return await self._client.list_hosts()
+        try:
+            host = await self._client.get_host(host_id)
+        except OmnigentClientError as exc:
+            if exc.status_code == 404:
+                return []
+            raise
+        if isinstance(host, Mapping) and isinstance(host.get("host"), Mapping):
+            host = host["host"]
+        if not isinstance(host, Mapping) or not (
+            host.get("id") or host.get("hostId") or host.get("host_id")
+        ):
+            return await self._client.list_hosts()
+        return [dict(host)]
+
     @staticmethod
     def _ready_host_harnesses(host: Mapping[str, Any]) -> set[str]:
         capabilities = (
@@ -3974,12 +4186,13 @@ class OmnigentOAuthHostRuntime:
         *args: str,
         env: Mapping[str, str] | None = None,
         check: bool = True,
+        output_limit_bytes: int = 4096,
     ) -> tuple[int, str, str]:
         return_code, stdout, stderr = await run_runtime_command(
             args,
             env=env,
             timeout_seconds=600,
-            output_limit_bytes=4096,
+            output_limit_bytes=output_limit_bytes,
         )
         output = stdout.decode("utf-8", errors="replace")
         error = stderr.decode("utf-8", errors="replace")
@@ -3991,4 +4204,8 @@ class OmnigentOAuthHostRuntime:
         return return_code, output, error
 
 
-__all__ = ["OmnigentOAuthHostRuntime"]
+__all__ = [
+    "OmnigentHostContainerState",
+    "OmnigentHostResourceSnapshot",
+    "OmnigentOAuthHostRuntime",
+]
@@ -103,9 +103,12 @@ def deterministic_host_lease_id(provider_lease_id: str) -> str:
     return f"ohl_{digest}"
 
 
+HOST_CONTAINER_NAME_PREFIX = "mm-omnigent-host-"
+
+
 def deterministic_host_container_name(host_lease_id: str) -> str:
     safe = "".join(ch for ch in host_lease_id.lower() if ch.isalnum() or ch == "-")
-    return f"mm-omnigent-host-{safe[:40]}"
+    return f"{HOST_CONTAINER_NAME_PREFIX}{safe[:40]}"
 
 
 class OmnigentOAuthHostRepository:
@@ -812,6 +815,7 @@ __all__ = [
     "CLEANUP_CLAIMABLE_HOST_STATES",
     "HEARTBEAT_HOST_STATES",
     "HOST_CLEANUP_CLAIMED_ERROR_CODE",
+    "HOST_CONTAINER_NAME_PREFIX",
     "HOST_PROFILE_BUSY_ERROR_CODE",
     "HostPreflightFailure",
     "OmnigentOAuthHostError",
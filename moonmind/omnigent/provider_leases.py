@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Mapping, Protocol
 
+from sqlalchemy import select
+
 from moonmind.omnigent.harness_platform.execution_plan import (
     OmnigentExecutionPlanEnvelope,
 )
@@ -69,111 +71,156 @@ class OmnigentProviderLeaseCoordinator:
         step_execution_id: str,
         idempotency_key: str,
     ) -> tuple[AcquiredProviderLease, ...]:
-        from api_service.db.models import ManagedAgentProviderProfile
-
         by_profile: dict[str, list[str]] = {}
         for slot, binding in plan.payload.credentialBindings.items():
             by_profile.setdefault(binding.providerProfileRef, []).append(slot)
-        acquired: list[AcquiredProviderLease] = []
-        try:
-            for profile_ref in sorted(by_profile):
-                async with self._session_factory() as session:
-                    profile = await session.get(
-                        ManagedAgentProviderProfile, profile_ref
-                    )
-                    if profile is None:
-                        raise HarnessPlatformError(
-                            f"Provider Profile {profile_ref} no longer exists",
-                            code=HarnessPlatformFailure.OMNIGENT_PROVIDER_PROFILE_INCOMPATIBLE,
-                        )
-                    auth_state = getattr(
-                        profile.auth_state, "value", profile.auth_state
-                    )
-                    if not profile.enabled or auth_state != "connected":
-                        raise HarnessPlatformError(
-                            f"Provider Profile {profile_ref} is not launch ready",
-                            code=HarnessPlatformFailure.OMNIGENT_PROVIDER_PROFILE_INCOMPATIBLE,
-                        )
-                    runtime_id = profile.runtime_id
-                    capacity_scope_ref = profile.capacity_scope_ref
-                owner_id = deterministic_lease_owner_id(
-                    profile_id=profile_ref,
-                    purpose=CredentialLeasePurpose.EXECUTION_OMNIGENT,
-                    workflow_id=workflow_id,
-                    step_execution_id=step_execution_id,
-                    idempotency_key=idempotency_key,
+        profile_refs = sorted(by_profile)
+        profiles = await self._load_profiles(profile_refs)
+        for profile_ref in profile_refs:
+            profile = profiles.get(profile_ref)
+            if profile is None:
+                raise HarnessPlatformError(
+                    f"Provider Profile {profile_ref} no longer exists",
+                    code=HarnessPlatformFailure.OMNIGENT_PROVIDER_PROFILE_INCOMPATIBLE,
                 )
-                lease: CredentialLease | None = None
-                try:
-                    lease = await self._leases.acquire_execution_lease(
-                        runtime_id=runtime_id,
+            auth_state = getattr(profile.auth_state, "value", profile.auth_state)
+            if not profile.enabled or auth_state != "connected":
+                raise HarnessPlatformError(
+                    f"Provider Profile {profile_ref} is not launch ready",
+                    code=HarnessPlatformFailure.OMNIGENT_PROVIDER_PROFILE_INCOMPATIBLE,
+                )
+        scopes = {
+            profile_ref: (
+                profiles[profile_ref].runtime_id,
+                profiles[profile_ref].capacity_scope_ref,
+            )
+            for profile_ref in profile_refs
+        }
+        # Acquisition blocks until capacity is free and profiles may share a
+        # runtime or capacity scope, so leases are taken one at a time in
+        # sorted order to keep a single global lock order. Leases are
+        # recorded as soon as they exist so a failure or cancellation
+        # anywhere releases all of them.
+        pending: dict[str, CredentialLease] = {}
+        try:
+            for profile_ref in profile_refs:
+                await self._acquire_profile_lease(
+                    plan=plan,
+                    profile_ref=profile_ref,
+                    runtime_id=scopes[profile_ref][0],
+                    capacity_scope_ref=scopes[profile_ref][1],
+                    owner_id=deterministic_lease_owner_id(
                         profile_id=profile_ref,
-                        owner_id=owner_id,
                         purpose=CredentialLeasePurpose.EXECUTION_OMNIGENT,
-                        metadata={
-                            "capacityScopeRef": capacity_scope_ref,
-                            "executionPlanRef": plan.planRef,
-                        },
-                    )
-                    inspection = await self._leases.inspect_lease(lease)
-                    if inspection.get("active") is False:
-                        raise HarnessPlatformError(
-                            f"Provider Profile lease is not active for {profile_ref}",
-                            code=HarnessPlatformFailure.OMNIGENT_PROVIDER_LEASE_UNAVAILABLE,
-                        )
-                    # Reload after the capacity handoff. This generation becomes
-                    # sticky and is persisted before any secret is resolved.
-                    async with self._session_factory() as session:
-                        leased_profile = await session.get(
-                            ManagedAgentProviderProfile, profile_ref
-                        )
-                        if leased_profile is None:
-                            raise HarnessPlatformError(
-                                f"Provider Profile {profile_ref} disappeared after lease acquisition",
-                                code=HarnessPlatformFailure.OMNIGENT_PROVIDER_PROFILE_INCOMPATIBLE,
-                            )
-                        generation = int(leased_profile.credential_generation)
-                except Exception as exc:
-                    if lease is not None:
-                        try:
-                            await self._leases.release_lease(lease)
-                        except Exception as release_exc:
-                            raise HarnessPlatformError(
-                                f"Provider Profile lease cleanup failed for {profile_ref}",
-                                code=HarnessPlatformFailure.OMNIGENT_CLEANUP_DEFERRED,
-                            ) from release_exc
-                    if isinstance(exc, HarnessPlatformError):
-                        raise
+                        workflow_id=workflow_id,
+                        step_execution_id=step_execution_id,
+                        idempotency_key=idempotency_key,
+                    ),
+                    pending=pending,
+                )
+            # Reload after the capacity handoff. These generations become
+            # sticky and are persisted before any secret is resolved.
+            leased_profiles = await self._load_profiles(profile_refs)
+            acquired: list[AcquiredProviderLease] = []
+            for profile_ref in profile_refs:
+                leased_profile = leased_profiles.get(profile_ref)
+                if leased_profile is None:
                     raise HarnessPlatformError(
-                        f"Provider Profile capacity is unavailable for {profile_ref}",
-                        code=HarnessPlatformFailure.OMNIGENT_PROVIDER_LEASE_UNAVAILABLE,
-                    ) from exc
-                assert lease is not None
+                        f"Provider Profile {profile_ref} disappeared after lease acquisition",
+                        code=HarnessPlatformFailure.OMNIGENT_PROVIDER_PROFILE_INCOMPATIBLE,
+                    )
+                lease = pending[profile_ref]
                 for slot in sorted(by_profile[profile_ref]):
                     acquired.append(
                         AcquiredProviderLease(
                             slot=slot,
                             provider_profile_ref=profile_ref,
-                            capacity_scope_ref=capacity_scope_ref,
+                            capacity_scope_ref=scopes[profile_ref][1],
                             provider_lease_ref=f"provider-profile-lease:{lease.lease_id}",
-                            credential_generation=generation,
+                            credential_generation=int(
+                                leased_profile.credential_generation
+                            ),
                             lease=lease,
                         )
                     )
             return tuple(acquired)
         except BaseException:
-            await self.release_all(acquired)
+            await self._release_leases(
+                [pending[ref] for ref in profile_refs if ref in pending]
+            )
             raise
 
+    async def _load_profiles(self, profile_refs: list[str]) -> dict[str, Any]:
+        """Load the plan's Provider Profiles with one query."""
+
+        from api_service.db.models import ManagedAgentProviderProfile
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ManagedAgentProviderProfile).where(
+                    ManagedAgentProviderProfile.profile_id.in_(profile_refs)
+                )
+            )
+            return {profile.profile_id: profile for profile in result.scalars().all()}
+
+    async def _acquire_profile_lease(
+        self,
+        *,
+        plan: OmnigentExecutionPlanEnvelope,
+        profile_ref: str,
+        runtime_id: str,
+        capacity_scope_ref: str,
+        owner_id: str,
+        pending: dict[str, CredentialLease],
+    ) -> None:
+        lease: CredentialLease | None = None
+        try:
+            lease = await self._leases.acquire_execution_lease(
+                runtime_id=runtime_id,
+                profile_id=profile_ref,
+                owner_id=owner_id,
+                purpose=CredentialLeasePurpose.EXECUTION_OMNIGENT,
+                metadata={
+                    "capacityScopeRef": capacity_scope_ref,
+                    "executionPlanRef": plan.planRef,
+                },
+            )
+            pending[profile_ref] = lease
+            inspection = await self._leases.inspect_lease(lease)
+            if inspection.get("active") is False:
+                raise HarnessPlatformError(
+                    f"Provider Profile lease is not active for {profile_ref}",
+                    code=HarnessPlatformFailure.OMNIGENT_PROVIDER_LEASE_UNAVAILABLE,
+                )
+        except Exception as exc:
+            if lease is not None:
+                pending.pop(profile_ref, None)
+                try:
+                    await self._leases.release_lease(lease)
+                except Exception as release_exc:
+                    raise HarnessPlatformError(
+                        f"Provider Profile lease cleanup failed for {profile_ref}",
+                        code=HarnessPlatformFailure.OMNIGENT_CLEANUP_DEFERRED,
+                    ) from release_exc
+            if isinstance(exc, HarnessPlatformError):
+                raise
+            raise HarnessPlatformError(
+                f"Provider Profile capacity is unavailable for {profile_ref}",
+                code=HarnessPlatformFailure.OMNIGENT_PROVIDER_LEASE_UNAVAILABLE,
+            ) from exc
+
     async def release_all(
         self, leases: list[AcquiredProviderLease] | tuple[AcquiredProviderLease, ...]
     ) -> None:
+        await self._release_leases([acquired.lease for acquired in leases])
+
+    async def _release_leases(self, leases: list[CredentialLease]) -> None:
         released: set[str] = set()
-        for acquired in reversed(tuple(leases)):
-            if acquired.lease.lease_id in released:
+        for lease in reversed(leases):
+            if lease.lease_id in released:
                 continue
-            await self._leases.release_lease(acquired.lease)
-            released.add(acquired.lease.lease_id)
+            await self._leases.release_lease(lease)
+            released.add(lease.lease_id)
 
     async def release_from_binding(
         self, provider_leases: Mapping[str, Mapping[str, Any]]
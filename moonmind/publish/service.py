@@ -6,15 +6,16 @@ import asyncio
 import contextlib
 import os
 import re
+import secrets
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Literal, Protocol
 from uuid import UUID
 
 from moonmind.security.outbound_scan import (
-    OutboundBundleItem,
+    OutboundFinding,
+    OutboundLineScanner,
     resolve_high_security_mode,
-    scan_outbound_bundle,
 )
 from moonmind.workflows.adapters.github_service import GitHubService
 from moonmind.utils.cli import verify_cli_is_executable
@@ -64,9 +65,61 @@ class PublishResult:
             return f"published branch {self.branch_name}"
         return self.reason
 
-_PUBLISH_PUSH_SCAN_MAX_COMMIT_METADATA_CHARS = 100_000
-_PUBLISH_PUSH_SCAN_MAX_FILE_DIFF_CHARS = 200_000
-_PUBLISH_PUSH_SCAN_MAX_CHANGED_FILES = 200
+_PUBLISH_PUSH_SCAN_TIMEOUT_SECONDS = 120
+_PUBLISH_PUSH_SCAN_READ_BYTES = 64 * 1024
+
+
+class _PushPatchScanner:
+    """Split a ``git log -p`` stream by commit and file, scanning as it goes.
+
+    Commit metadata is framed by a per-scan boundary line that commit messages
+    cannot forge and is scanned in full. Inside a hunk only added lines are
+    scanned: context and removed lines are already on the remote.
+    """
+
+    def __init__(self, *, boundary: str, commit_range: str) -> None:
+        self._boundary = boundary
+        self._patch_marker = f"{boundary}-patch"
+        self._commits_location = f"git.push.commits:{commit_range}"
+        self._location = self._commits_location
+        self._state = "patch"
+        self._scanner = OutboundLineScanner()
+
+    def feed(self, line: str) -> OutboundFinding | None:
+        if line == self._boundary:
+            self._state = "metadata"
+            self._location = self._commits_location
+            return None
+        if line == self._patch_marker:
+            self._state = "patch"
+            return None
+        if self._state == "metadata":
+            return self._scanner.scan_line(line, location=self._location)
+        if line.startswith("diff --git "):
+            self._state = "header"
+            self._location = "git.push.diff"
+            return None
+        if self._state == "header":
+            if line.startswith("+++ "):
+                path = _patch_target_path(line[4:])
+                if path:
+                    self._location = f"git.push.diff:{path}"
+            elif line.startswith("@@"):
+                self._state = "hunk"
+            return None
+        if self._state == "hunk" and line.startswith("+"):
+            return self._scanner.scan_line(line[1:], location=self._location)
+        return None
+
+
+def _patch_target_path(value: str) -> str | None:
+    path = value.rstrip("\t").strip()
+    if len(path) >= 2 and path.startswith('"') and path.endswith('"'):
+        path = path[1:-1]
+    if path == "/dev/null":
+        return None
+    return path.removeprefix("b/") or None
+
 
 class PublishService:
     """Service to publish changes to Git branches or Pull Requests."""
@@ -468,61 +521,10 @@ class PublishService:
                 )
         commit_range = f"{base_ref}..{branch_name}"
         try:
-            commit_metadata = await self._read_git_text_for_scan(
+            finding = await self._scan_git_push_stream(
                 repo_dir=repo_dir,
                 env=env,
-                timeout=15,
-                args=[
-                    "log",
-                    (
-                        "--format=commit %H%nparents %P%nauthor %an <%ae>%n"
-                        + "subject %s%nbody%n%B%n---END-COMMIT---"
-                    ),
-                    commit_range,
-                ],
-            )
-            changed_files_text = await self._read_git_text_for_scan(
-                repo_dir=repo_dir,
-                env=env,
-                timeout=15,
-                args=["diff", "--name-only", commit_range],
-            )
-            bundle = [
-                OutboundBundleItem(
-                    location=f"git.push.commits:{commit_range}",
-                    content=commit_metadata[
-                        :_PUBLISH_PUSH_SCAN_MAX_COMMIT_METADATA_CHARS
-                    ],
-                )
-            ]
-            changed_files = [
-                line.strip()
-                for line in changed_files_text.splitlines()
-                if line.strip()
-            ][:_PUBLISH_PUSH_SCAN_MAX_CHANGED_FILES]
-            diff_semaphore = asyncio.Semaphore(10)
-
-            async def _diff_item(changed_file: str) -> OutboundBundleItem:
-                async with diff_semaphore:
-                    file_diff = await self._read_git_text_for_scan(
-                        repo_dir=repo_dir,
-                        env=env,
-                        timeout=20,
-                        args=[
-                            "diff",
-                            "--no-ext-diff",
-                            commit_range,
-                            "--",
-                            changed_file,
-                        ],
-                    )
-                return OutboundBundleItem(
-                    location=f"git.push.diff:{changed_file}",
-                    content=file_diff[:_PUBLISH_PUSH_SCAN_MAX_FILE_DIFF_CHARS],
-                )
-
-            bundle.extend(
-                await asyncio.gather(*(_diff_item(path) for path in changed_files))
+                commit_range=commit_range,
             )
         except Exception as exc:
             safe_detail = redact_sensitive_text(str(exc))
@@ -531,13 +533,98 @@ class PublishService:
                 f"scan payload for {commit_range}: {safe_detail}"
             ) from exc
 
-        scan_result = scan_outbound_bundle(bundle, high_security_mode=True)
-        if scan_result.allowed:
+        if finding is None:
             return
-        diagnostics = "; ".join(scan_result.sanitized_diagnostics)
         raise RuntimeError(
-            "outbound git push blocked by high security scan: " + diagnostics
+            "outbound git push blocked by high security scan: "
+            f"Blocked outbound content: {finding.category} at {finding.location}"
+        )
+
+    async def _scan_git_push_stream(
+        self,
+        *,
+        repo_dir: Path,
+        env: dict[str, str],
+        commit_range: str,
+    ) -> OutboundFinding | None:
+        """Scan every commit in ``commit_range`` from one ``git log -p`` stream.
+
+        Merge commits are diffed against their first parent.
+
+        Returns the first blocking finding, stopping git as soon as it is seen.
+        """
+
+        boundary = f"---moonmind-push-scan-{secrets.token_hex(8)}---"
+        scanner = _PushPatchScanner(boundary=boundary, commit_range=commit_range)
+        proc = await asyncio.create_subprocess_exec(
+            self._git_binary,
+            "-c",
+            f"safe.directory={repo_dir.resolve()}",
+            "-c",
+            "core.quotepath=off",
+            "-C",
+            str(repo_dir),
+            "log",
+            "-p",
+            # Without this, merge commits print no patch and content
+            # introduced by a merge resolution would never be scanned.
+            "--diff-merges=first-parent",
+            "--no-color",
+            "--no-ext-diff",
+            "--no-textconv",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            (
+                f"--format={boundary}%ncommit %H%nparents %P%nauthor %an <%ae>%n"
+                + f"subject %s%nbody%n%B%n{boundary}-patch"
+            ),
+            commit_range,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
         )
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout, stderr = proc.stdout, proc.stderr
+        stderr_task = asyncio.ensure_future(stderr.read())
+
+        async def _consume() -> OutboundFinding | None:
+            partial: list[bytes] = []
+            while chunk := await stdout.read(_PUBLISH_PUSH_SCAN_READ_BYTES):
+                if b"\n" not in chunk:
+                    partial.append(chunk)
+                    continue
+                head, *lines, tail = chunk.split(b"\n")
+                partial.append(head)
+                for raw in (b"".join(partial), *lines):
+                    finding = scanner.feed(
+                        raw.decode("utf-8", errors="replace").rstrip("\r")
+                    )
+                    if finding is not None:
+                        return finding
+                partial = [tail]
+            if any(partial):
+                return scanner.feed(b"".join(partial).decode("utf-8", errors="replace"))
+            return None
+
+        try:
+            finding = await asyncio.wait_for(
+                _consume(), timeout=_PUBLISH_PUSH_SCAN_TIMEOUT_SECONDS
+            )
+            if finding is not None:
+                return finding
+            await proc.wait()
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stderr_bytes = await stderr_task
+        if proc.returncode != 0:
+            detail = (
+                stderr_bytes.decode("utf-8", errors="replace").strip()
+                or f"git exited with {proc.returncode}"
+            )
+            raise RuntimeError(detail)
+        return None
 
     async def _read_git_text_for_scan(
         self,
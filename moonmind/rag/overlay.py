@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
+import logging
+import uuid
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable, List, MutableMapping, Sequence
 
+from qdrant_client.http import models as qmodels
+
 from moonmind.rag.embedding import EmbeddingClient
 from moonmind.rag.qdrant_client import RagQdrantClient
 from moonmind.rag.settings import RagRuntimeSettings
 
+logger = logging.getLogger(__name__)
+
+_INDEX_PAYLOAD_FIELDS = ("path", "chunk_hash", "offset_start", "offset_end")
+
 @dataclass(slots=True)
 class OverlayChunk:
     path: Path
@@ -33,6 +43,12 @@ def chunk_file(path: Path, *, chunk_chars: int, overlap: int) -> Iterable[Overla
     results: list[OverlayChunk] = []
     while cursor < end:
         chunk_end = min(end, cursor + chunk_chars)
+        if chunk_end < end:
+            # Prefer a line break in the back half of the window so an edit
+            # only changes the chunks around it, not every later chunk.
+            newline = text.rfind("\n", cursor + chunk_chars // 2, chunk_end)
+            if newline >= 0:
+                chunk_end = newline + 1
         chunk = OverlayChunk(
             path=path,
             offset_start=cursor,
@@ -45,6 +61,50 @@ def chunk_file(path: Path, *, chunk_chars: int, overlap: int) -> Iterable[Overla
         cursor = max(chunk_end - overlap, cursor + 1)
     return results
 
+@dataclass(slots=True)
+class OverlayPointIndex:
+    """Known overlay points per path: ``{path: {point_id: (hash, start, end)}}``."""
+
+    version: int
+    by_path: dict[str, dict[str, tuple[str, int, int]]] = field(default_factory=dict)
+
+
+_point_indexes: "weakref.WeakKeyDictionary[RagQdrantClient, dict[str, OverlayPointIndex]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def overlay_point_id(*, collection_name: str, path: str, chunk_hash: str, occurrence: int) -> str:
+    seed = "|".join([collection_name, path, chunk_hash, str(occurrence)])
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, seed))
+
+
+def _load_point_index(qdrant: RagQdrantClient, collection_name: str) -> OverlayPointIndex:
+    """Return the cached point index, rebuilding it if the collection moved on."""
+
+    indexes = _point_indexes.setdefault(qdrant, {})
+    version = qdrant.collection_version(collection_name)
+    cached = indexes.get(collection_name)
+    if cached is not None and cached.version == version:
+        return cached
+    index = OverlayPointIndex(version=version)
+    for point_id, payload in qdrant.scroll_payloads(
+        collection_name=collection_name,
+        fields=_INDEX_PAYLOAD_FIELDS,
+    ):
+        path = payload.get("path")
+        chunk_hash = payload.get("chunk_hash")
+        if not isinstance(path, str) or not isinstance(chunk_hash, str):
+            continue
+        index.by_path.setdefault(path, {})[point_id] = (
+            chunk_hash,
+            int(payload.get("offset_start") or 0),
+            int(payload.get("offset_end") or 0),
+        )
+    indexes[collection_name] = index
+    return index
+
+
 def upsert_overlay_files(
     *,
     files: Sequence[Path],
@@ -53,13 +113,44 @@ def upsert_overlay_files(
     embedder: EmbeddingClient,
     qdrant: RagQdrantClient,
 ) -> int:
+    """Bring the run overlay in line with ``files``; returns their chunk count.
+
+    Chunks already present for a path (same content hash and occurrence) are
+    not embedded again; moved chunks get a payload-only rewrite, and points
+    for vanished content are removed with one filtered delete.
+    """
+
     collection_name = settings.overlay_collection_name(run_id)
     qdrant.ensure_overlay_collection(collection_name)
+    index = _load_point_index(qdrant, collection_name)
     expires_at = (
         datetime.now(timezone.utc) + timedelta(hours=settings.overlay_ttl_hours)
     ).isoformat()
+
+    def payload_for(chunk: OverlayChunk) -> MutableMapping[str, object]:
+        return {
+            "path": str(chunk.path),
+            "offset_start": chunk.offset_start,
+            "offset_end": chunk.offset_end,
+            "chunk_hash": chunk.chunk_hash,
+            "trust_class": "workspace_overlay",
+            "run_id": run_id,
+            "expires_at": expires_at,
+            "text": chunk.text,
+        }
+
     total_chunks = 0
+    new_ids: List[str] = []
+    vectors: List[List[float]] = []
+    payloads: List[MutableMapping[str, object]] = []
+    moved_ids: List[str] = []
+    moved_payloads: List[MutableMapping[str, object]] = []
+    submitted_paths: List[str] = []
+    keep_ids: List[str] = []
+    next_entries: dict[str, dict[str, tuple[str, int, int]]] = {}
+    has_stale = False
     for file_path in files:
+        path = str(file_path)
         chunks = list(
             chunk_file(
                 file_path,
@@ -67,29 +158,74 @@ def upsert_overlay_files(
                 overlap=settings.overlay_chunk_overlap,
             )
         )
-        if not chunks:
-            continue
-        payloads: List[MutableMapping[str, object]] = []
-        vectors: List[List[float]] = []
+        known = index.by_path.get(path, {})
+        submitted_paths.append(path)
+        entries: dict[str, tuple[str, int, int]] = {}
+        occurrences: Counter[str] = Counter()
         for chunk in chunks:
-            vector = embedder.embed(chunk.text)
-            vectors.append(vector)
-            payloads.append(
-                {
-                    "path": str(chunk.path),
-                    "offset_start": chunk.offset_start,
-                    "offset_end": chunk.offset_end,
-                    "chunk_hash": chunk.chunk_hash,
-                    "trust_class": "workspace_overlay",
-                    "run_id": run_id,
-                    "expires_at": expires_at,
-                    "text": chunk.text,
-                }
+            chunk_hash = chunk.chunk_hash
+            point_id = overlay_point_id(
+                collection_name=collection_name,
+                path=path,
+                chunk_hash=chunk_hash,
+                occurrence=occurrences[chunk_hash],
             )
+            occurrences[chunk_hash] += 1
+            span = (chunk_hash, chunk.offset_start, chunk.offset_end)
+            entries[point_id] = span
+            keep_ids.append(point_id)
+            previous = known.get(point_id)
+            if previous is None:
+                new_ids.append(point_id)
+                vectors.append(embedder.embed(chunk.text))
+                payloads.append(payload_for(chunk))
+            elif previous != span:
+                moved_ids.append(point_id)
+                moved_payloads.append(payload_for(chunk))
+        has_stale = has_stale or any(point_id not in entries for point_id in known)
+        next_entries[path] = entries
+        total_chunks += len(chunks)
+
+    if not submitted_paths:
+        return 0
+    paths_filter = qmodels.FieldCondition(
+        key="path", match=qmodels.MatchAny(any=submitted_paths)
+    )
+    if has_stale:
+        qdrant.delete_where(
+            collection_name=collection_name,
+            points_filter=qmodels.Filter(
+                must=[paths_filter],
+                must_not=[qmodels.HasIdCondition(has_id=keep_ids)],
+            ),
+        )
+    if new_ids:
         qdrant.upsert_overlay_vectors(
             collection_name=collection_name,
             vectors=vectors,
             payloads=payloads,
+            ids=new_ids,
         )
-        total_chunks += len(chunks)
+    if moved_ids:
+        qdrant.overwrite_payloads(
+            collection_name=collection_name,
+            ids=moved_ids,
+            payloads=moved_payloads,
+        )
+    if len(new_ids) + len(moved_ids) < len(keep_ids):
+        # Resubmitting a file extends the TTL of its untouched chunks too.
+        qdrant.set_payload_where(
+            collection_name=collection_name,
+            payload={"expires_at": expires_at},
+            points_filter=qmodels.Filter(must=[paths_filter]),
+        )
+    index.by_path.update(next_entries)
+    index.version = qdrant.collection_version(collection_name)
+    logger.debug(
+        "Overlay %s: %d chunks submitted, %d embedded, %d moved",
+        collection_name,
+        total_chunks,
+        len(new_ids),
+        len(moved_ids),
+    )
     return total_chunks
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence
@@ -19,6 +23,88 @@ from moonmind.rag.context_pack import ContextItem
 
 logger = logging.getLogger(__name__)
 
+_SEARCH_EXECUTOR_MAX_WORKERS = 8
+_search_executor: ThreadPoolExecutor | None = None
+_search_executor_lock = threading.Lock()
+
+
+def _shared_search_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used for concurrent collection searches."""
+
+    global _search_executor
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(
+                max_workers=_SEARCH_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="moonmind-qdrant-search",
+            )
+        return _search_executor
+
+
+def _vector_digest(vector: Sequence[float]) -> str:
+    return hashlib.blake2b(array("d", vector).tobytes(), digest_size=16).hexdigest()
+
+
+def _filters_digest(filters: Mapping[str, Any]) -> str:
+    return json.dumps(
+        {key: value for key, value in filters.items() if value is not None},
+        sort_keys=True,
+        default=str,
+    )
+
+
+_SearchCacheKey = tuple[str, str, str, int, int]
+
+
+class _SearchResultCache:
+    """Thread-safe bounded LRU of per-collection scored points.
+
+    Keys carry the collection's local write version, so any upsert or delete
+    through the owning client makes older entries unreachable. The TTL bounds
+    staleness from writers in other processes.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(0, int(max_entries))
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._entries: OrderedDict[
+            _SearchCacheKey, tuple[float, list[qmodels.ScoredPoint]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl_seconds > 0
+
+    def get(self, key: _SearchCacheKey) -> list[qmodels.ScoredPoint] | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, points = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return [point.model_copy(deep=True) for point in points]
+
+    def put(self, key: _SearchCacheKey, points: Sequence[qmodels.ScoredPoint]) -> None:
+        if not self.enabled:
+            return
+        snapshot = [point.model_copy(deep=True) for point in points]
+        with self._lock:
+            self._entries[key] = (time.monotonic(), snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_collection(self, collection_name: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == collection_name]:
+                del self._entries[key]
+
 
 @dataclass(slots=True)
 class SearchResult:
@@ -88,6 +174,8 @@ class RagQdrantClient:
         overlay_chunk_chars: int,
         overlay_chunk_overlap: int,
         embedding_dimensions: Optional[int],
+        search_cache_size: int = 256,
+        search_cache_ttl_seconds: float = 30.0,
     ) -> None:
         self.collection = collection
         self.overlay_mode = overlay_mode
@@ -101,6 +189,12 @@ class RagQdrantClient:
             self._client = QdrantClient(
                 host=host, port=port, api_key=api_key, timeout=10
             )
+        self._search_cache = _SearchResultCache(
+            max_entries=search_cache_size,
+            ttl_seconds=search_cache_ttl_seconds,
+        )
+        self._collection_versions: dict[str, int] = {}
+        self._versions_lock = threading.Lock()
 
     @property
     def client(self) -> QdrantClient:
@@ -390,28 +484,51 @@ class RagQdrantClient:
         overlay_collection: Optional[str],
         trust_overrides: Optional[Mapping[str, str]] = None,
     ) -> SearchResult:
+        """Search every target collection for ``query_vector``.
+
+        Canonical and overlay collections are queried concurrently on a shared
+        executor, and per-collection results are served from a bounded LRU
+        until the collection is written through this client.
+        """
+
         start = time.perf_counter()
         filter_obj = self._build_filter(filters)
+        filter_key = _filters_digest(filters)
+        vector_key = _vector_digest(query_vector)
         target_collections = self._resolve_collections(collections)
-        canonical = self._search_canonical_collections(
-            collection_names=target_collections,
-            query_vector=query_vector,
-            limit=top_k,
-            query_filter=filter_obj,
-        )
-        canonical = self._rank_points(canonical)
-        overlay_points = []
-        if overlay_policy == "include" and overlay_collection:
+        include_overlay = overlay_policy == "include" and bool(overlay_collection)
+        jobs = [(name, False) for name in target_collections]
+        if include_overlay:
+            jobs.append((str(overlay_collection), True))
+
+        def run(collection_name: str, is_overlay: bool) -> list[qmodels.ScoredPoint]:
             try:
-                overlay_filter = self._build_filter(filters)
-                overlay_points = self._search_collection_points(
-                    collection_name=overlay_collection,
+                return self._search_collection_cached(
+                    collection_name=collection_name,
                     query_vector=query_vector,
+                    vector_key=vector_key,
                     limit=top_k,
-                    query_filter=overlay_filter,
+                    query_filter=filter_obj,
+                    filter_key=filter_key,
                 )
             except UnexpectedResponse:
-                overlay_points = []
+                if not is_overlay:
+                    raise
+                return []
+
+        if len(jobs) == 1:
+            outcomes = [run(*jobs[0])]
+        else:
+            executor = _shared_search_executor()
+            futures: list[Future[list[qmodels.ScoredPoint]]] = [
+                executor.submit(run, name, is_overlay) for name, is_overlay in jobs
+            ]
+            outcomes = [future.result() for future in futures]
+
+        canonical = self._rank_points(
+            point for outcome in outcomes[: len(target_collections)] for point in outcome
+        )
+        overlay_points = outcomes[-1] if include_overlay else []
         merge = self._merge_results(overlay_points, canonical, trust_overrides)
         merge.sort(key=lambda item: item.score, reverse=True)
         latency_ms = (time.perf_counter() - start) * 1000
@@ -430,37 +547,39 @@ class RagQdrantClient:
             raise RuntimeError("At least one Qdrant collection is required.")
         return tuple(names)
 
-    def _search_canonical_collections(
+    def collection_version(self, collection_name: str) -> int:
+        with self._versions_lock:
+            return self._collection_versions.get(collection_name, 0)
+
+    def _bump_collection_version(self, collection_name: str) -> None:
+        with self._versions_lock:
+            self._collection_versions[collection_name] = (
+                self._collection_versions.get(collection_name, 0) + 1
+            )
+        self._search_cache.discard_collection(collection_name)
+
+    def _search_collection_cached(
         self,
         *,
-        collection_names: Sequence[str],
+        collection_name: str,
         query_vector: Sequence[float],
+        vector_key: str,
         limit: int,
         query_filter: qmodels.Filter | None,
+        filter_key: str,
     ) -> list[qmodels.ScoredPoint]:
-        if len(collection_names) == 1:
-            return self._search_collection_points(
-                collection_name=collection_names[0],
+        version = self.collection_version(collection_name)
+        key = (collection_name, vector_key, filter_key, limit, version)
+        points = self._search_cache.get(key)
+        if points is None:
+            points = self._search_collection_points(
+                collection_name=collection_name,
                 query_vector=query_vector,
                 limit=limit,
                 query_filter=query_filter,
             )
-
-        canonical: list[qmodels.ScoredPoint] = []
-        with ThreadPoolExecutor(max_workers=len(collection_names)) as executor:
-            futures = [
-                executor.submit(
-                    self._search_collection_points,
-                    collection_name=collection_name,
-                    query_vector=query_vector,
-                    limit=limit,
-                    query_filter=query_filter,
-                )
-                for collection_name in collection_names
-            ]
-            for future in futures:
-                canonical.extend(future.result())
-        return canonical
+            self._search_cache.put(key, points)
+        return points
 
     def _search_collection_points(
         self,
@@ -478,6 +597,12 @@ class RagQdrantClient:
             with_vectors=False,
             query_filter=query_filter,
         )
+        return self._tag_collection(points, collection_name)
+
+    @staticmethod
+    def _tag_collection(
+        points: list[qmodels.ScoredPoint], collection_name: str
+    ) -> list[qmodels.ScoredPoint]:
         for point in points:
             payload = point.payload or {}
             payload.setdefault("collection", collection_name)
@@ -644,10 +769,13 @@ class RagQdrantClient:
         collection_name: str,
         vectors: List[List[float]],
         payloads: List[MutableMapping[str, Any]],
+        ids: Optional[List[str]] = None,
     ) -> None:
-        ids = [str(uuid4()) for _ in vectors]
+        if ids is None:
+            ids = [str(uuid4()) for _ in vectors]
         batch = qmodels.Batch(ids=ids, vectors=vectors, payloads=payloads)
         self._client.upsert(collection_name=collection_name, points=batch)
+        self._bump_collection_version(collection_name)
 
     def upsert_memory_vectors(
         self,
@@ -662,6 +790,7 @@ class RagQdrantClient:
         target = collection_name or self.collection
         batch = qmodels.Batch(ids=ids, vectors=vectors, payloads=payloads)
         self._client.upsert(collection_name=target, points=batch)
+        self._bump_collection_version(target)
 
     def upsert_canonical_vectors(
         self,
@@ -683,6 +812,87 @@ class RagQdrantClient:
             payloads=list(payloads),
         )
         self._client.upsert(collection_name=collection_name, points=batch)
+        self._bump_collection_version(collection_name)
+
+    def overwrite_payloads(
+        self,
+        *,
+        collection_name: str,
+        ids: Sequence[str],
+        payloads: Sequence[MutableMapping[str, Any]],
+    ) -> None:
+        """Replace point payloads in one batch request, keeping their vectors."""
+
+        if len(ids) != len(payloads):
+            raise RuntimeError(
+                "Payload overwrite requires equal id and payload counts"
+            )
+        if not ids:
+            return
+        self._client.batch_update_points(
+            collection_name=collection_name,
+            update_operations=[
+                qmodels.OverwritePayloadOperation(
+                    overwrite_payload=qmodels.SetPayload(
+                        payload=dict(payload),
+                        points=[point_id],
+                    )
+                )
+                for point_id, payload in zip(ids, payloads)
+            ],
+        )
+        self._bump_collection_version(collection_name)
+
+    def scroll_payloads(
+        self,
+        *,
+        collection_name: str,
+        fields: Sequence[str],
+        page_size: int = 256,
+    ) -> Iterable[tuple[str, Mapping[str, Any]]]:
+        """Yield ``(point_id, payload)`` for every point, fetching only ``fields``."""
+
+        offset: Any = None
+        while True:
+            kwargs: dict[str, Any] = {
+                "collection_name": collection_name,
+                "limit": page_size,
+                "with_payload": qmodels.PayloadSelectorInclude(include=list(fields)),
+                "with_vectors": False,
+            }
+            if offset is not None:
+                kwargs["offset"] = offset
+            points, offset = self._client.scroll(**kwargs)
+            for point in points:
+                yield str(point.id), dict(point.payload or {})
+            if offset is None:
+                return
+
+    def set_payload_where(
+        self,
+        *,
+        collection_name: str,
+        payload: Mapping[str, Any],
+        points_filter: qmodels.Filter,
+    ) -> None:
+        self._client.set_payload(
+            collection_name=collection_name,
+            payload=dict(payload),
+            points=points_filter,
+        )
+        self._bump_collection_version(collection_name)
+
+    def delete_where(
+        self,
+        *,
+        collection_name: str,
+        points_filter: qmodels.Filter,
+    ) -> None:
+        self._client.delete(
+            collection_name=collection_name,
+            points_selector=qmodels.FilterSelector(filter=points_filter),
+        )
+        self._bump_collection_version(collection_name)
 
     def delete_vectors(
         self,
@@ -694,12 +904,14 @@ class RagQdrantClient:
             return
         selector = qmodels.PointIdsList(points=list(point_ids))
         self._client.delete(collection_name=collection_name, points_selector=selector)
+        self._bump_collection_version(collection_name)
 
     def delete_overlay_collection(self, collection_name: str) -> None:
         try:
             self._client.delete_collection(collection_name=collection_name)
         except UnexpectedResponse:
             logger.debug("Overlay collection %s already absent", collection_name)
+        self._bump_collection_version(collection_name)
 
     def sync_collection_dimensions(
         self,
@@ -729,6 +941,7 @@ class RagQdrantClient:
             )
 
         self._client.delete_collection(collection_name=collection_name)
+        self._bump_collection_version(collection_name)
         self._create_collection(
             collection_name=collection_name, vector_size=expected_size
         )
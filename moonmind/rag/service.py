@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 import uuid
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
-from typing import Any, Mapping, Protocol, Sequence
+from typing import Any, Callable, Mapping, Protocol, Sequence, TypeVar
 
 import httpx
 
@@ -21,6 +24,29 @@ from moonmind.rag.telemetry import VectorTelemetry
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_STAGE_EXECUTOR_MAX_WORKERS = 8
+_stage_executor: ThreadPoolExecutor | None = None
+_stage_executor_lock = threading.Lock()
+
+def _shared_stage_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool for retrieval stages that run alongside search."""
+
+    global _stage_executor
+    with _stage_executor_lock:
+        if _stage_executor is None:
+            _stage_executor = ThreadPoolExecutor(
+                max_workers=_STAGE_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="moonmind-retrieval-stage",
+            )
+        return _stage_executor
+
+def _timed(fn: Callable[..., _T], *args: Any, **kwargs: Any) -> tuple[_T, float]:
+    started = time.perf_counter()
+    value = fn(*args, **kwargs)
+    return value, round((time.perf_counter() - started) * 1000, 2)
+
 class PlanningAdapter(Protocol):
     def prefetch(self, planning_ref: str) -> ContextItem | None:
         pass
@@ -115,7 +141,18 @@ class ContextRetrievalService:
         stale_overlay_allowed: bool = False,
         embedding_timeout_ms: int | None = None,
         search_timeout_ms: int | None = None,
+        planning_timeout_ms: int | None = None,
+        memory_timeout_ms: int | None = None,
     ) -> ContextPack:
+        """Retrieve a context pack, overlapping the independent stages.
+
+        Planning prefetch, long-term memory lookup and the overlay freshness
+        probe start immediately on a shared pool while the query is embedded
+        and searched. Embedding and search deadlines fail the request; a
+        planning or memory stage that misses its deadline is dropped from the
+        pack instead. Per-stage timings are reported under ``usage["stages"]``.
+        """
+
         normalized_budgets = self._normalize_budgets(budgets)
         self._enforce_token_budget(query=query, top_k=top_k, budgets=normalized_budgets)
         started = time.perf_counter()
@@ -135,19 +172,23 @@ class ContextRetrievalService:
             if collection_name not in self._verified_collections:
                 self._qdrant.ensure_collection_ready(collection_name)
                 self._verified_collections.add(collection_name)
-        embedding_started = time.perf_counter()
-        with self._telemetry.timer("embedding"):
-            vector = self.embedding_client.embed(query)
-        self._enforce_stage_deadline(
-            stage="embedding",
-            started=embedding_started,
-            timeout_ms=embedding_timeout_ms,
+        executor = _shared_stage_executor()
+        stages: dict[str, dict[str, Any]] = {}
+        planning_future = executor.submit(
+            _timed, self._prefetch_planning_context, planning_ref
+        )
+        memory_future = executor.submit(
+            _timed,
+            self._retrieve_long_term_memory_items,
+            query=query,
+            filters=filters,
         )
         # The caller's immutable run identity wins over the environment-derived
         # one: the API process has no RUN_ID, so a session capability would
         # otherwise silently omit its run overlay.
         effective_run_id = run_id or self._settings.run_id
         overlay_collection = None
+        overlay_future: Future[bool] | None = None
         if (
             overlay_policy == "include"
             and effective_run_id
@@ -156,12 +197,23 @@ class ContextRetrievalService:
             overlay_collection = self._settings.overlay_collection_name(
                 effective_run_id
             )
-            if not self._overlay_is_fresh(
+            overlay_future = executor.submit(
+                self._overlay_is_fresh,
                 overlay_collection,
                 max_age_seconds=overlay_max_age_seconds,
                 stale_overlay_allowed=stale_overlay_allowed,
-            ):
-                overlay_collection = None
+            )
+        embedding_started = time.perf_counter()
+        with self._telemetry.timer("embedding"):
+            vector = self.embedding_client.embed(query)
+        stages["embedding"] = self._stage_report("ok", embedding_started)
+        self._enforce_stage_deadline(
+            stage="embedding",
+            started=embedding_started,
+            timeout_ms=embedding_timeout_ms,
+        )
+        if overlay_future is not None and not overlay_future.result():
+            overlay_collection = None
         search_started = time.perf_counter()
         with self._telemetry.timer("search"):
             result = self._qdrant.search(
@@ -173,19 +225,32 @@ class ContextRetrievalService:
                 overlay_collection=overlay_collection,
                 trust_overrides=None,
             )
+        stages["search"] = self._stage_report("ok", search_started)
         self._enforce_stage_deadline(
             stage="search", started=search_started, timeout_ms=search_timeout_ms
         )
-        planning_items = self._prefetch_planning_context(planning_ref)
-        memory_items, memory_latency_ms = self._retrieve_long_term_memory_items(
-            query=query,
-            filters=filters,
+        planning_items, _planning_ms = self._collect_stage(
+            "planning",
+            planning_future,
+            default=([], 0.0),
+            stages=stages,
+            started=started,
+            timeout_ms=planning_timeout_ms,
+        )
+        (memory_items, memory_latency_ms), _memory_ms = self._collect_stage(
+            "memory",
+            memory_future,
+            default=(([], 0.0), 0.0),
+            stages=stages,
+            started=started,
+            timeout_ms=memory_timeout_ms,
         )
         items = [*planning_items, *memory_items, *result.items]
         usage = {
             "tokens": _estimate_tokens(query)
             + sum(_estimate_tokens(item.text) for item in items),
             "latency_ms": round(result.latency_ms + memory_latency_ms, 2),
+            "stages": stages,
         }
         self._enforce_latency_budget(
             started=started, budgets=normalized_budgets, usage=usage
@@ -202,6 +267,51 @@ class ContextRetrievalService:
             initiation_mode=initiation_mode,
         )
 
+    @staticmethod
+    def _stage_report(status: str, started: float) -> dict[str, Any]:
+        return {
+            "status": status,
+            "ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    @staticmethod
+    def _collect_stage(
+        stage: str,
+        future: Future[tuple[_T, float]],
+        *,
+        default: tuple[_T, float],
+        stages: dict[str, dict[str, Any]],
+        started: float,
+        timeout_ms: int | None,
+    ) -> tuple[_T, float]:
+        """Wait for a concurrent stage until its deadline, else drop it.
+
+        Stages start with the request, so the deadline is measured from
+        ``started``; without a timeout the stage is awaited. Stage errors
+        propagate, as each stage applies the fail-open policy itself.
+        """
+
+        wait_seconds: float | None = None
+        if timeout_ms:
+            elapsed = time.perf_counter() - started
+            wait_seconds = max(0.0, timeout_ms / 1000 - elapsed)
+        try:
+            value = future.result(timeout=wait_seconds)
+        except FutureTimeoutError:
+            future.cancel()
+            logger.info(
+                "[retrieval] %s stage exceeded %sms; returning partial context",
+                stage,
+                timeout_ms,
+            )
+            stages[stage] = {
+                "status": "timeout",
+                "ms": round((time.perf_counter() - started) * 1000, 2),
+            }
+            return default
+        stages[stage] = {"status": "ok", "ms": value[1]}
+        return value
+
     def _retrieve_via_gateway(
         self,
         *,
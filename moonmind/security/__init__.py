@@ -16,6 +16,7 @@ from moonmind.security.outbound_scan import (
     OUTBOUND_SCAN_POLICY_REF,
     OutboundBundleItem,
     OutboundFinding,
+    OutboundLineScanner,
     OutboundScanDecision,
     OutboundScanResult,
     resolve_high_security_mode,
@@ -30,6 +31,7 @@ __all__ = [
     "OUTBOUND_SCAN_POLICY_REF",
     "OutboundBundleItem",
     "OutboundFinding",
+    "OutboundLineScanner",
     "OutboundScanDecision",
     "OutboundScanResult",
     "attach_evidence_digest",
@@ -81,6 +81,110 @@ _GITHUB_TOKEN_PATTERN = re.compile(
 _PRIVATE_KEY_PATTERN = re.compile(
     r"(?is)-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----"
 )
+_PRIVATE_KEY_BEGIN_PATTERN = re.compile(r"(?i)-----BEGIN [A-Z ]*PRIVATE KEY-----")
+_PRIVATE_KEY_END_PATTERN = re.compile(r"(?i)-----END [A-Z ]*PRIVATE KEY-----")
+# The single-line categories folded into one alternation so a line is matched
+# in one pass; group names are the finding categories.
+_LINE_FINDING_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{category}>(?i:{pattern.pattern.removeprefix('(?i)')}))"
+        for category, pattern in (
+            ("authorization", _AUTHORIZATION_PATTERN),
+            ("token", _GITHUB_TOKEN_PATTERN),
+            ("credential", _SECRET_ASSIGNMENT_PATTERN),
+        )
+    )
+)
+# A secret key or bearer scheme at the end of a line whose value may follow on
+# the next line; whole-text scans match these across the line break.
+_PENDING_VALUE_PATTERN = re.compile(
+    r"(?i)(?:\b(?:token|password|secret|api[_-]?key|credential)\s*(?:[:=]\s*)?"
+    r"|\b(?:authorization\s*:\s*)?bearer\s*)\Z"
+)
+_MAX_PRIVATE_KEY_BLOCK_LINES = 256
+
+
+class OutboundLineScanner:
+    """Incremental scanner for outbound content read one line at a time.
+
+    Each line is matched once against the combined single-line patterns, so a
+    caller streaming a large payload can stop at the first finding instead of
+    buffering the payload and scanning it per category. Private key blocks
+    span lines and are tracked until their END marker at the same location,
+    and a key or bearer scheme ending a line is matched together with the
+    next line at the same location, as a whole-text scan would.
+    """
+
+    def __init__(self) -> None:
+        self._key_block_location: str | None = None
+        self._key_block: list[str] = []
+        self._pending_location: str | None = None
+        self._pending_value_prefix = ""
+
+    def scan_line(self, line: str, *, location: str) -> OutboundFinding | None:
+        prefix = ""
+        if self._pending_location == location:
+            prefix = f"{self._pending_value_prefix}\n"
+        self._pending_location = None
+        self._pending_value_prefix = ""
+        if prefix:
+            combined = prefix + line
+            match = _LINE_FINDING_PATTERN.search(combined)
+            if match is not None and match.start() < len(prefix):
+                return OutboundFinding(
+                    category=match.lastgroup or "credential",
+                    location=location,
+                    redacted_preview=redact_sensitive_text(match.group(0)),
+                )
+            pending = _PENDING_VALUE_PATTERN.search(combined)
+            if pending is not None and pending.start() < len(prefix):
+                # Blank lines between a key and its value keep it pending.
+                self._pending_location = location
+                self._pending_value_prefix = pending.group(0)
+
+        if self._key_block_location is not None:
+            if location == self._key_block_location:
+                self._key_block.append(line)
+                if _PRIVATE_KEY_END_PATTERN.search(line):
+                    return self._private_key_finding(location)
+                if len(self._key_block) > _MAX_PRIVATE_KEY_BLOCK_LINES:
+                    self._reset_key_block()
+            else:
+                self._reset_key_block()
+
+        match = _LINE_FINDING_PATTERN.search(line)
+        if match is not None:
+            return OutboundFinding(
+                category=match.lastgroup or "credential",
+                location=location,
+                redacted_preview=redact_sensitive_text(match.group(0)),
+            )
+        if self._pending_location is None:
+            pending = _PENDING_VALUE_PATTERN.search(line)
+            if pending is not None:
+                self._pending_location = location
+                self._pending_value_prefix = pending.group(0)
+        if self._key_block_location is None:
+            begin = _PRIVATE_KEY_BEGIN_PATTERN.search(line)
+            if begin is not None:
+                self._key_block_location = location
+                self._key_block = [line[begin.start():]]
+                if _PRIVATE_KEY_END_PATTERN.search(line, begin.end()):
+                    return self._private_key_finding(location)
+        return None
+
+    def _private_key_finding(self, location: str) -> OutboundFinding:
+        block = "\n".join(self._key_block)
+        self._reset_key_block()
+        return OutboundFinding(
+            category="private_key",
+            location=location,
+            redacted_preview=redact_sensitive_text(block) or "[REDACTED]",
+        )
+
+    def _reset_key_block(self) -> None:
+        self._key_block_location = None
+        self._key_block = []
 
 
 def resolve_high_security_mode(
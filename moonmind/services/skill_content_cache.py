@@ -0,0 +1,307 @@
+"""Host-level cache of extracted skill content keyed by content digest.
+
+Resolved skill snapshots reference immutable artifacts, so the same skill
+version is extracted identically for every run on a host. The cache keeps one
+extracted copy per ``(digest, format)`` and projects it into run workspaces
+with reflinks (or plain copies when the filesystem cannot clone) instead of
+re-reading and re-extracting the artifact.
+
+Entries are published atomically by renaming a fully prepared temporary
+directory, and evicted by renaming them out of the object tree before
+deletion, so readers never observe a half-written or half-deleted entry.
+Workspaces never share an inode with the cache, so a run cannot alter the
+content later runs receive. Each entry still records the size and mtime of
+its files, and lookups discard entries that were modified in place on the
+host.
+"""
+
+from __future__ import annotations
+
+import errno
+import json
+import logging
+import os
+import shutil
+import stat
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_OBJECTS_DIR = "objects"
+_TMP_DIR = "tmp"
+_TREE_DIR = "tree"
+_SIZE_FILE = "size_bytes"
+_FILES_FILE = "files.json"
+_FICLONE = 0x40049409
+_WRITE_BITS = 0o222
+
+_shared_cache: SkillContentCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+class SkillContentCache:
+    """Digest-keyed store of extracted skill trees with an LRU size budget."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int,
+        min_idle_seconds: float = 300.0,
+    ) -> None:
+        if not str(root or "").strip():
+            raise ValueError("root must be provided")
+        self.root = Path(root).expanduser().resolve()
+        self.max_bytes = max(0, int(max_bytes))
+        self.min_idle_seconds = max(0.0, float(min_idle_seconds))
+        self._lock = threading.Lock()
+        self._reflinks_supported = True
+
+    @staticmethod
+    def entry_key(content_digest: str, content_format: str) -> str:
+        algorithm, _, value = str(content_digest).partition(":")
+        if not value:
+            algorithm, value = "sha256", algorithm
+        value = value.strip().lower()
+        if not value or not value.isalnum() or not algorithm.isalnum():
+            raise ValueError(f"unsupported skill content digest: {content_digest!r}")
+        return f"{algorithm.lower()}-{value}-{content_format}"
+
+    def lookup(self, key: str) -> Path | None:
+        """Return the cached tree for ``key`` and mark it recently used."""
+
+        entry = self._objects_dir / key
+        tree = entry / _TREE_DIR
+        if not tree.is_dir():
+            return None
+        if not _tree_unmodified(entry):
+            logger.warning("Discarding modified skill content cache entry %s", key)
+            self._discard(key)
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            return None
+        return tree
+
+    def store(self, key: str, populate: Callable[[Path], None]) -> Path:
+        """Publish a new entry built by ``populate`` and return its tree.
+
+        ``populate`` receives an empty directory to fill. Failures leave no
+        entry behind. When another worker publishes the same key first, its
+        entry wins and the local copy is discarded.
+        """
+
+        existing = self.lookup(key)
+        if existing is not None:
+            return existing
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        staging = self._tmp_dir / f"{key}.{uuid.uuid4().hex}"
+        tree = staging / _TREE_DIR
+        tree.mkdir(parents=True)
+        try:
+            populate(tree)
+            files = _seal_tree(tree)
+            size_bytes = sum(size for size, _mtime_ns, _mode in files.values())
+            (staging / _FILES_FILE).write_text(
+                json.dumps(files, sort_keys=True), encoding="utf-8"
+            )
+            (staging / _SIZE_FILE).write_text(f"{size_bytes}\n", encoding="ascii")
+            try:
+                staging.rename(self._objects_dir / key)
+            except OSError as exc:
+                if exc.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+        published = self.lookup(key)
+        if published is None:
+            raise RuntimeError(f"skill content cache entry vanished after publish: {key}")
+        return published
+
+    def project(self, tree: Path, target: Path) -> None:
+        """Populate ``target`` with the contents of a cached ``tree``.
+
+        Projected files get back the modes they were extracted with rather
+        than the cache's sealed, read-only modes.
+        """
+
+        modes = _extracted_modes(tree.parent)
+        target.mkdir(parents=True, exist_ok=True)
+        for source_dir, dir_names, file_names in os.walk(tree):
+            relative = Path(source_dir).relative_to(tree)
+            destination_dir = target / relative
+            for name in dir_names:
+                (destination_dir / name).mkdir(exist_ok=True)
+            for name in file_names:
+                destination = destination_dir / name
+                self._link_file(Path(source_dir) / name, destination)
+                mode = modes.get(str(relative / name))
+                if mode is None:
+                    mode = destination.lstat().st_mode | stat.S_IWUSR
+                destination.chmod(mode & 0o7777)
+
+    def evict(self, *, keep: frozenset[str] = frozenset()) -> list[str]:
+        """Drop least recently used entries until the cache fits its budget.
+
+        Entries in ``keep`` and entries used within ``min_idle_seconds`` are
+        never evicted, so concurrent projections on the host are not disturbed.
+        """
+
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _key, _used_at, size in entries)
+            if total <= self.max_bytes:
+                return []
+            cutoff = time.time() - self.min_idle_seconds
+            evicted: list[str] = []
+            for key, used_at, size in sorted(entries, key=lambda item: item[1]):
+                if total <= self.max_bytes:
+                    break
+                if key in keep or used_at > cutoff:
+                    continue
+                if self._discard(key):
+                    total -= size
+                    evicted.append(key)
+            if evicted:
+                logger.info(
+                    "Evicted %d skill content cache entries; %d bytes retained",
+                    len(evicted),
+                    total,
+                )
+            return evicted
+
+    @property
+    def _objects_dir(self) -> Path:
+        return self.root / _OBJECTS_DIR
+
+    @property
+    def _tmp_dir(self) -> Path:
+        return self.root / _TMP_DIR
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        entries: list[tuple[str, float, int]] = []
+        try:
+            children = list(self._objects_dir.iterdir())
+        except FileNotFoundError:
+            return entries
+        for entry in children:
+            try:
+                used_at = entry.stat().st_mtime
+                size = int((entry / _SIZE_FILE).read_text(encoding="ascii"))
+            except (OSError, ValueError):
+                continue
+            entries.append((entry.name, used_at, size))
+        return entries
+
+    def _discard(self, key: str) -> bool:
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        graveyard = self._tmp_dir / f"evict.{key}.{uuid.uuid4().hex}"
+        try:
+            (self._objects_dir / key).rename(graveyard)
+        except OSError:
+            return False
+        shutil.rmtree(graveyard, ignore_errors=True)
+        return True
+
+    def _link_file(self, source: Path, destination: Path) -> None:
+        if self._reflinks_supported:
+            if _reflink(source, destination):
+                return
+            self._reflinks_supported = False
+        shutil.copy2(source, destination)
+
+
+def _seal_tree(tree: Path) -> dict[str, tuple[int, int, int]]:
+    """Strip write bits from cached files; return their size, mtime and mode.
+
+    The recorded mode is the one the file was extracted with, so projections
+    can restore it.
+    """
+
+    files: dict[str, tuple[int, int, int]] = {}
+    for source_dir, _dir_names, file_names in os.walk(tree):
+        for name in file_names:
+            path = Path(source_dir) / name
+            file_stat = path.lstat()
+            mode = file_stat.st_mode & 0o7777
+            path.chmod(mode & ~_WRITE_BITS)
+            files[str(path.relative_to(tree))] = (
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+                mode,
+            )
+    return files
+
+
+def _extracted_modes(entry: Path) -> dict[str, int]:
+    try:
+        files = json.loads((entry / _FILES_FILE).read_text(encoding="utf-8"))
+        return {relative: int(mode) for relative, (_s, _m, mode) in files.items()}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def _tree_unmodified(entry: Path) -> bool:
+    tree = entry / _TREE_DIR
+    try:
+        files = json.loads((entry / _FILES_FILE).read_text(encoding="utf-8"))
+        for relative, (size, mtime_ns, _mode) in files.items():
+            file_stat = (tree / relative).lstat()
+            if file_stat.st_size != size or file_stat.st_mtime_ns != mtime_ns:
+                return False
+    except (OSError, ValueError, TypeError):
+        return False
+    return True
+
+
+def _reflink(source: Path, destination: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - non-POSIX hosts
+        return False
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+    shutil.copymode(source, destination)
+    return True
+
+
+def shared_skill_content_cache() -> SkillContentCache | None:
+    """Return the process-wide cache configured in workflow settings."""
+
+    global _shared_cache
+    from moonmind.config.settings import settings
+
+    max_bytes = settings.workflow.skills_content_cache_max_bytes
+    root = str(settings.workflow.skills_content_cache_root or "").strip()
+    if max_bytes <= 0 or not root:
+        return None
+    if not Path(root).expanduser().is_absolute():
+        logger.warning(
+            "Skill content cache disabled: WORKFLOW_SKILLS_CONTENT_CACHE_ROOT "
+            "must be an absolute path, got %r",
+            root,
+        )
+        return None
+    with _shared_cache_lock:
+        resolved = Path(root).expanduser().resolve()
+        if (
+            _shared_cache is None
+            or _shared_cache.root != resolved
+            or _shared_cache.max_bytes != max_bytes
+        ):
+            _shared_cache = SkillContentCache(resolved, max_bytes=max_bytes)
+        return _shared_cache
+
+
+__all__ = ["SkillContentCache", "shared_skill_content_cache"]
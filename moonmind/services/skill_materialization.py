@@ -1,6 +1,7 @@
 import io
 import json
 import hashlib
+import logging
 import shutil
 import tarfile
 from pathlib import Path
@@ -13,6 +14,9 @@ from moonmind.schemas.agent_skill_models import (
     RuntimeMaterializationMode,
     RuntimeSkillMaterialization,
 )
+from moonmind.services.skill_content_cache import SkillContentCache
+
+logger = logging.getLogger(__name__)
 
 _CANONICAL_ALIAS = ".agents/skills"
 
@@ -28,6 +32,7 @@ class AgentSkillMaterializer:
         projection_owner_uid: int | None = None,
         projection_owner_gid: int | None = None,
         project_adapter_aliases: bool = True,
+        content_cache: SkillContentCache | None = None,
     ) -> None:
         if not workspace_root:
             raise ValueError("workspace_root must be provided")
@@ -42,6 +47,7 @@ class AgentSkillMaterializer:
         self.projection_owner_uid = projection_owner_uid
         self.projection_owner_gid = projection_owner_gid
         self.project_adapter_aliases = project_adapter_aliases
+        self.content_cache = content_cache
 
     async def materialize(
         self,
@@ -96,29 +102,9 @@ class AgentSkillMaterializer:
                 raise RuntimeError(f"Failed to prepare skills_active directory: {ex}") from ex
 
             try:
-                for skill in resolved_skillset.skills:
-                    if not skill.content_ref:
-                        raise RuntimeError(
-                            "resolved skill snapshot cannot be materialized: "
-                            f"skill '{skill.skill_name}' has no content_ref"
-                        )
-                    if not self._artifact_service:
-                        raise RuntimeError(
-                            "resolved skill snapshot cannot be materialized: "
-                            "artifact service is required for skill content refs"
-                        )
-                    _artifact, payload = await self._artifact_service.read(
-                        artifact_id=skill.content_ref,
-                        principal="system",
-                        allow_restricted_raw=True,
-                    )
-                    self._verify_payload_digest(skill, payload)
-                    skill_dir = staging_dir / skill.skill_name
-                    skill_dir.mkdir(parents=True, exist_ok=True)
-                    if skill.format == AgentSkillFormat.BUNDLE:
-                        self._extract_skill_bundle(payload, skill_dir)
-                    else:
-                        (skill_dir / "SKILL.md").write_bytes(payload)
+                cache_stats = await self._populate_skill_content(
+                    resolved_skillset.skills, staging_dir
+                )
                 self._copy_builtin_support_directories(staging_dir)
 
                 (staging_dir / "_manifest.json").write_text(
@@ -257,6 +243,8 @@ class AgentSkillMaterializer:
                     "visiblePath": str(visible_path),
                 }
             )
+            if cache_stats is not None:
+                result.metadata["skillContentCache"] = cache_stats
 
         # Ensure compatibility paths or index refs are filled depending on mode.
         if mode in (RuntimeMaterializationMode.PROMPT_BUNDLED, RuntimeMaterializationMode.HYBRID):
@@ -266,6 +254,83 @@ class AgentSkillMaterializer:
             
         return result
 
+    async def _populate_skill_content(
+        self,
+        skills: list[Any],
+        staging_dir: Path,
+    ) -> dict[str, int] | None:
+        for skill in skills:
+            if not skill.content_ref:
+                raise RuntimeError(
+                    "resolved skill snapshot cannot be materialized: "
+                    f"skill '{skill.skill_name}' has no content_ref"
+                )
+            if not self._artifact_service:
+                raise RuntimeError(
+                    "resolved skill snapshot cannot be materialized: "
+                    "artifact service is required for skill content refs"
+                )
+
+        cache = self.content_cache
+        cache_keys: dict[int, str] = {}
+        cached_trees: dict[int, Path] = {}
+        if cache is not None:
+            for index, skill in enumerate(skills):
+                if not skill.content_digest:
+                    continue
+                try:
+                    key = cache.entry_key(skill.content_digest, skill.format.value)
+                except ValueError:
+                    continue
+                cache_keys[index] = key
+                tree = cache.lookup(key)
+                if tree is not None:
+                    cached_trees[index] = tree
+
+        # The artifact service may wrap a single AsyncSession, so cache misses
+        # are read one at a time.
+        misses = [index for index in range(len(skills)) if index not in cached_trees]
+        payloads: dict[int, bytes] = {}
+        for index in misses:
+            _artifact, payloads[index] = await self._artifact_service.read(
+                artifact_id=skills[index].content_ref,
+                principal="system",
+                allow_restricted_raw=True,
+            )
+
+        for index, skill in enumerate(skills):
+            skill_dir = staging_dir / skill.skill_name
+            tree = cached_trees.get(index)
+            if tree is None:
+                payload = payloads[index]
+                self._verify_payload_digest(skill, payload)
+                key = cache_keys.get(index)
+                if key is None:
+                    skill_dir.mkdir(parents=True, exist_ok=True)
+                    self._write_skill_content(skill, payload, skill_dir)
+                    continue
+                tree = cache.store(
+                    key,
+                    lambda target, skill=skill, payload=payload: (
+                        self._write_skill_content(skill, payload, target)
+                    ),
+                )
+            cache.project(tree, skill_dir)
+
+        if cache is None:
+            return None
+        try:
+            cache.evict(keep=frozenset(cache_keys.values()))
+        except OSError as exc:
+            logger.warning("Skill content cache eviction failed: %s", exc)
+        return {"hits": len(cached_trees), "misses": len(misses)}
+
+    def _write_skill_content(self, skill: Any, payload: bytes, skill_dir: Path) -> None:
+        if skill.format == AgentSkillFormat.BUNDLE:
+            self._extract_skill_bundle(payload, skill_dir)
+        else:
+            (skill_dir / "SKILL.md").write_bytes(payload)
+
     def _active_backing_dir(self, snapshot_id: str) -> Path:
         if self.backing_root is not None:
             return self.backing_root
@@ -1,7 +1,12 @@
 import abc
 import asyncio
+import atexit
+import copy
+import logging
 import re
+import threading
 import typing
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
@@ -31,6 +36,11 @@ _PUBLISH_METADATA_KEY = "publish"
 _SIDE_EFFECT_METADATA_KEY = "sideEffect"
 _AGENT_SKILL_NAME_RE = re.compile(r"^[a-z0-9](?:[a-z0-9_-]{0,62}[a-z0-9])?$")
 _CAPABILITY_TOKEN_RE = re.compile(r"^[a-z0-9](?:[a-z0-9_.:-]{0,126}[a-z0-9])?$")
+_SKILL_INDEX_MAX_FILES = 4096
+_SKILL_INDEX_MAX_WATCHES = 8
+_SKILL_INDEX_WATCH_JOIN_SECONDS = 2.0
+
+logger = logging.getLogger(__name__)
 
 class SkillResolutionContext:
     """Contextual parameters for skill resolution (e.g. paths, run ID)."""
@@ -90,6 +100,7 @@ class BuiltInSkillLoader(SkillLoader):
             self.skills_root,
             AgentSkillSourceKind.BUILT_IN,
             skip_names={"local"},
+            watch=True,
         )
         discovered = {entry.skill_name for entry in results}
         for name in [
@@ -205,11 +216,179 @@ class DeploymentSkillLoader(SkillLoader):
         return results
 
 
+class _SkillDirectoryWatch:
+    """Background watcher that bumps ``generation`` whenever a directory changes."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.generation = 0
+        self.live = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"skill-index-watch:{path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            from watchfiles import watch
+        except ImportError:
+            return
+        try:
+            for changes in watch(
+                self.path,
+                watch_filter=None,
+                debounce=50,
+                step=10,
+                stop_event=self._stop,
+                rust_timeout=1000,
+                yield_on_timeout=True,
+                raise_interrupt=False,
+            ):
+                if changes:
+                    self.generation += 1
+                self.live = True
+        except Exception as exc:  # pragma: no cover - backend specific
+            logger.debug("Skill directory watch on %s stopped: %s", self.path, exc)
+        finally:
+            self.live = False
+            self.generation += 1
+
+    def close(self, *, timeout: float | None = None) -> None:
+        """Stop the watcher and wait up to ``timeout`` seconds for it to exit."""
+
+        self._stop.set()
+        if timeout is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+
+class _SkillScanIndex:
+    """Process-wide cache of skill directory scans and parsed frontmatter.
+
+    Frontmatter is keyed by ``SKILL.md`` path and revalidated against the
+    file's (mtime, size, inode) signature, so only changed files are reparsed.
+    Directories scanned with ``watch=True`` are observed with watchfiles
+    (inotify on Linux); while the watcher is live and has seen no change since
+    the last scan, that scan is served without touching the filesystem;
+    changes become visible once the watcher reports them (tens of
+    milliseconds). All other directories fall back to a stat sweep.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_files: int = _SKILL_INDEX_MAX_FILES,
+        max_watches: int = _SKILL_INDEX_MAX_WATCHES,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._max_files = max_files
+        self._max_watches = max_watches
+        self._frontmatter: OrderedDict[
+            Path, tuple[tuple[int, int, int], dict[str, typing.Any]]
+        ] = OrderedDict()
+        self._scans: dict[
+            tuple[Path, AgentSkillSourceKind, frozenset[str]],
+            tuple[int, list[ResolvedSkillEntry]],
+        ] = {}
+        self._watches: dict[Path, _SkillDirectoryWatch] = {}
+
+    def frontmatter(self, skill_dir: Path) -> dict[str, typing.Any]:
+        skill_file = skill_dir / "SKILL.md"
+        try:
+            stat = skill_file.stat()
+        except OSError as exc:
+            raise ValueError(
+                f"failed to read skill frontmatter from {skill_file}: {exc}"
+            ) from exc
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            cached = self._frontmatter.get(skill_file)
+            if cached is not None and cached[0] == signature:
+                self._frontmatter.move_to_end(skill_file)
+                return copy.deepcopy(cached[1])
+        parsed = _parse_skill_frontmatter(skill_file)
+        with self._lock:
+            self._frontmatter[skill_file] = (signature, parsed)
+            self._frontmatter.move_to_end(skill_file)
+            while len(self._frontmatter) > self._max_files:
+                self._frontmatter.popitem(last=False)
+        return copy.deepcopy(parsed)
+
+    def scan(
+        self,
+        skills_dir: Path,
+        source_kind: AgentSkillSourceKind,
+        *,
+        skip_names: set[str] | None = None,
+        watch: bool = False,
+    ) -> list[ResolvedSkillEntry]:
+        key = (skills_dir, source_kind, frozenset(skip_names or ()))
+        watcher = self._watch(skills_dir) if watch else None
+        if watcher is None or not watcher.live:
+            return _sweep_skills_dir(skills_dir, source_kind, skip_names=skip_names)
+        generation = watcher.generation
+        with self._lock:
+            cached = self._scans.get(key)
+        if cached is None or cached[0] != generation:
+            results = _sweep_skills_dir(skills_dir, source_kind, skip_names=skip_names)
+            cached = (generation, results)
+            with self._lock:
+                self._scans[key] = cached
+        return [entry.model_copy(deep=True) for entry in cached[1]]
+
+    def close(
+        self, *, timeout: float | None = _SKILL_INDEX_WATCH_JOIN_SECONDS
+    ) -> None:
+        with self._lock:
+            watches = list(self._watches.values())
+            self._watches.clear()
+            self._scans.clear()
+            self._frontmatter.clear()
+        for watcher in watches:
+            watcher.close()
+        for watcher in watches:
+            watcher.close(timeout=timeout)
+
+    def _watch(self, skills_dir: Path) -> _SkillDirectoryWatch | None:
+        with self._lock:
+            watcher = self._watches.get(skills_dir)
+            if watcher is not None:
+                return watcher
+            if len(self._watches) >= self._max_watches or not skills_dir.is_dir():
+                return None
+            watcher = _SkillDirectoryWatch(skills_dir)
+            self._watches[skills_dir] = watcher
+            return watcher
+
+
+_skill_scan_index = _SkillScanIndex()
+# Watch threads sit inside the native watchfiles loop; stop them before the
+# interpreter finalizes so they are not torn down mid-call.
+atexit.register(_skill_scan_index.close)
+
+
 def _scan_for_skills(
     skills_dir: Path,
     source_kind: AgentSkillSourceKind,
     *,
     skip_names: set[str] | None = None,
+    watch: bool = False,
+) -> list[ResolvedSkillEntry]:
+    return _skill_scan_index.scan(
+        skills_dir,
+        source_kind,
+        skip_names=skip_names,
+        watch=watch,
+    )
+
+
+def _sweep_skills_dir(
+    skills_dir: Path,
+    source_kind: AgentSkillSourceKind,
+    *,
+    skip_names: set[str] | None = None,
 ) -> list[ResolvedSkillEntry]:
     results = []
     if not skills_dir.is_dir():
@@ -298,7 +477,10 @@ def _is_moonmind_active_projection(skills_dir: Path) -> bool:
 
 
 def _load_skill_frontmatter(skill_dir: Path) -> dict[str, typing.Any]:
-    skill_file = skill_dir / "SKILL.md"
+    return _skill_scan_index.frontmatter(skill_dir)
+
+
+def _parse_skill_frontmatter(skill_file: Path) -> dict[str, typing.Any]:
     try:
         lines = skill_file.read_text(encoding="utf-8").splitlines()
     except OSError as exc:
@@ -27,6 +27,7 @@ from moonmind.services.skill_resolution import (
     AgentSkillResolver,
     SkillResolutionContext,
 )
+from moonmind.services.skill_content_cache import shared_skill_content_cache
 from moonmind.services.skill_materialization import AgentSkillMaterializer
 
 
@@ -605,6 +606,7 @@ class AgentSkillsActivities:
         materializer = AgentSkillMaterializer(
             workspace_root=workspace_root,
             artifact_service=self._artifact_service,
+            content_cache=shared_skill_content_cache(),
         )
         return await materializer.materialize(
             resolved_skillset=resolved_skillset,
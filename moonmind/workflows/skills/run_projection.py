@@ -139,6 +139,7 @@ async def materialize_run_skill_snapshot(
             owned_roots=(active_root,),
         )
 
+    from moonmind.services.skill_content_cache import shared_skill_content_cache
     from moonmind.services.skill_materialization import AgentSkillMaterializer
 
     materializer = AgentSkillMaterializer(
@@ -149,6 +150,7 @@ async def materialize_run_skill_snapshot(
         projection_owner_uid=projection_owner_uid,
         projection_owner_gid=projection_owner_gid,
         project_adapter_aliases=project_adapter_aliases,
+        content_cache=shared_skill_content_cache(),
     )
     try:
         materialization = await materializer.materialize(
@@ -128,6 +128,7 @@ from moonmind.schemas.agent_skill_models import (
     ResolvedSkillSet,
     RuntimeMaterializationMode,
 )
+from moonmind.services.skill_content_cache import shared_skill_content_cache
 from moonmind.services.skill_materialization import AgentSkillMaterializer
 from moonmind.workflows.temporal.jira_agent_skills import JIRA_AGENT_SKILLS
 from moonmind.workflows.skills.deployment_tools import (
@@ -10333,6 +10334,7 @@ class TemporalAgentRuntimeActivities:
                 projection_owner_uid=_MANAGED_AGENT_UID,
                 projection_owner_gid=_MANAGED_AGENT_GID,
                 project_adapter_aliases=project_adapter_aliases,
+                content_cache=shared_skill_content_cache(),
             )
             materialization = await materializer.materialize(
                 resolved_skillset=resolved_skillset,
@@ -11866,6 +11868,8 @@ class TemporalAgentRuntimeActivities:
                     self._artifact_service
                 ),
             )
+            # Keep the service so its candidate cursor carries across ticks.
+            self._omnigent_stuck_state_service = stuck_state_service
         validated_omnigent_request = None
         if isinstance(omnigent_reconcile_request, Mapping):
             if stuck_state_service is None:
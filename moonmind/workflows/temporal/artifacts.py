@@ -73,6 +73,9 @@ class TemporalArtifactValidationError(TemporalArtifactError):
 class TemporalArtifactAuthorizationError(TemporalArtifactError):
     """Raised when principal is not permitted to access an artifact."""
 
+def _s3_error_code(exc: ClientError) -> str:
+    return str(exc.response.get("Error", {}).get("Code", ""))
+
 def _is_retryable_single_put_read_error(exc: Exception) -> bool:
     if isinstance(exc, (FileNotFoundError, KeyError)):
         return True
@@ -132,6 +135,18 @@ class ArtifactReadPolicy:
     preview_artifact_ref: ArtifactRef | None
     default_read_ref: ArtifactRef
 
+@dataclass(slots=True, frozen=True)
+class ArtifactByteRange:
+    """A contiguous slice of artifact bytes and where it sits in the object."""
+
+    data: bytes
+    offset: int
+    total_size: int
+
+    @property
+    def end(self) -> int:
+        return self.offset + len(self.data)
+
 @dataclass(slots=True, frozen=True)
 class LifecycleSweepSummary:
     """Lifecycle sweep results."""
@@ -140,10 +155,12 @@ class LifecycleSweepSummary:
     expired_candidate_count: int
     soft_deleted_count: int
     hard_deleted_count: int
+    payload_claim_check_deleted_count: int = 0
 
 @dataclass(slots=True, frozen=True)
 class _StorageLifecycleConfig:
     hard_delete_after: timedelta
+    payload_claim_check_retention: timedelta | None = None
 
 def _encode_base32(value: int, length: int) -> str:
     chars = ["0"] * length
@@ -426,12 +443,50 @@ class TemporalArtifactStore:
     ) -> Iterable[bytes]:
         raise NotImplementedError
 
+    def read_range(self, storage_key: str, *, offset: int, length: int) -> bytes:
+        """Return up to ``length`` bytes starting at ``offset``.
+
+        Backends override this with a native seek or ranged request; the
+        default streams the object and keeps only the requested window.
+        """
+
+        if length <= 0:
+            return b""
+        start = max(0, offset)
+        buffer = bytearray()
+        position = 0
+        for chunk in self.read_chunks(storage_key):
+            chunk_end = position + len(chunk)
+            if chunk_end > start:
+                buffer.extend(chunk[max(0, start - position) :])
+                if len(buffer) >= length:
+                    break
+            position = chunk_end
+        return bytes(buffer[:length])
+
+    def read_tail(self, storage_key: str, *, length: int) -> tuple[bytes, int]:
+        """Return the last ``length`` bytes and the total object size."""
+
+        window = bytearray()
+        size = 0
+        for chunk in self.read_chunks(storage_key):
+            size += len(chunk)
+            if length > 0:
+                window.extend(chunk)
+                del window[: max(0, len(window) - length)]
+        return bytes(window), size
+
     def read_path(self, storage_key: str) -> Path:
         raise NotImplementedError
 
     def delete(self, storage_key: str) -> None:
         raise NotImplementedError
 
+    def list_objects(self, prefix: str) -> Iterable[tuple[str, datetime]]:
+        """Yield ``(storage_key, last_modified)`` for objects under ``prefix``."""
+
+        raise NotImplementedError
+
     def create_multipart_upload(
         self,
         *,
@@ -562,12 +617,38 @@ class LocalTemporalArtifactStore(TemporalArtifactStore):
                     break
                 yield chunk
 
+    def read_range(self, storage_key: str, *, offset: int, length: int) -> bytes:
+        if length <= 0:
+            return b""
+        with self.resolve_storage_key(storage_key).open("rb") as handle:
+            handle.seek(max(0, offset))
+            return handle.read(length)
+
+    def read_tail(self, storage_key: str, *, length: int) -> tuple[bytes, int]:
+        with self.resolve_storage_key(storage_key).open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if length <= 0:
+                return b"", size
+            handle.seek(max(0, size - length))
+            return handle.read(length), size
+
     def read_path(self, storage_key: str) -> Path:
         return self.resolve_storage_key(storage_key)
 
     def delete(self, storage_key: str) -> None:
         self.resolve_storage_key(storage_key).unlink(missing_ok=True)
 
+    def list_objects(self, prefix: str) -> Iterable[tuple[str, datetime]]:
+        base = self.resolve_storage_key(prefix)
+        if not base.is_dir():
+            return
+        resolved_root = self.root.resolve()
+        for path in base.rglob("*"):
+            if not path.is_file() or path.name.endswith(".tmp"):
+                continue
+            modified = datetime.fromtimestamp(path.stat().st_mtime, UTC)
+            yield path.relative_to(resolved_root).as_posix(), modified
+
     def presign_download(
         self,
         *,
@@ -743,6 +824,51 @@ class S3TemporalArtifactStore(TemporalArtifactStore):
         finally:
             stream.close()
 
+    def read_range(self, storage_key: str, *, offset: int, length: int) -> bytes:
+        if length <= 0:
+            return b""
+        start = max(0, offset)
+        try:
+            response = self._client.get_object(
+                Bucket=self._bucket,
+                Key=storage_key,
+                Range=f"bytes={start}-{start + length - 1}",
+            )
+        except ClientError as exc:
+            if _s3_error_code(exc) == "InvalidRange":
+                return b""
+            raise
+        body = response["Body"]
+        try:
+            return body.read()
+        finally:
+            body.close()
+
+    def read_tail(self, storage_key: str, *, length: int) -> tuple[bytes, int]:
+        if length <= 0:
+            response = self._client.head_object(Bucket=self._bucket, Key=storage_key)
+            return b"", int(response.get("ContentLength") or 0)
+        try:
+            response = self._client.get_object(
+                Bucket=self._bucket,
+                Key=storage_key,
+                Range=f"bytes=-{length}",
+            )
+        except ClientError as exc:
+            # Suffix ranges are unsatisfiable only for empty objects.
+            if _s3_error_code(exc) == "InvalidRange":
+                return b"", 0
+            raise
+        body = response["Body"]
+        try:
+            data = body.read()
+        finally:
+            body.close()
+        content_range = str(response.get("ContentRange") or "")
+        _, _, total = content_range.rpartition("/")
+        size = int(total) if total.isdigit() else len(data)
+        return data, size
+
     def read_path(self, storage_key: str) -> Path:
         raise TemporalArtifactValidationError(
             "read_path is unavailable for S3-backed artifacts"
@@ -751,6 +877,12 @@ class S3TemporalArtifactStore(TemporalArtifactStore):
     def delete(self, storage_key: str) -> None:
         self._client.delete_object(Bucket=self._bucket, Key=storage_key)
 
+    def list_objects(self, prefix: str) -> Iterable[tuple[str, datetime]]:
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
+            for item in page.get("Contents", []):
+                yield str(item["Key"]), item["LastModified"]
+
     def create_multipart_upload(
         self,
         *,
@@ -1231,6 +1363,7 @@ class TemporalArtifactService:
         presign_ttl_seconds: int | None = None,
         direct_upload_max_bytes: int | None = None,
         lifecycle_hard_delete_after_seconds: int | None = None,
+        payload_claim_check_retention_seconds: int | None = None,
     ) -> None:
         self._repository = repository
         self._store: TemporalArtifactStore = store or self._build_store_from_settings()
@@ -1258,8 +1391,21 @@ class TemporalArtifactService:
             if lifecycle_hard_delete_after_seconds is not None
             else settings.workflow.temporal_artifact_lifecycle_hard_delete_after_seconds
         )
+        claim_check_retention_seconds = max(
+            0,
+            int(
+                payload_claim_check_retention_seconds
+                if payload_claim_check_retention_seconds is not None
+                else settings.temporal.payload_claim_check_retention_seconds
+            ),
+        )
         self._lifecycle = _StorageLifecycleConfig(
             hard_delete_after=timedelta(seconds=max(0, int(hard_delete_after_seconds))),
+            payload_claim_check_retention=(
+                timedelta(seconds=claim_check_retention_seconds)
+                if claim_check_retention_seconds
+                else None
+            ),
         )
 
     @staticmethod
@@ -2104,6 +2250,104 @@ class TemporalArtifactService:
             artifact.storage_key, chunk_size=chunk_size
         )
 
+    async def read_range(
+        self,
+        *,
+        artifact_id: str,
+        principal: str,
+        offset: int = 0,
+        length: int,
+        allow_restricted_raw: bool = False,
+    ) -> tuple[db_models.TemporalArtifact, ArtifactByteRange]:
+        """Read ``length`` bytes from ``offset`` without loading the whole object."""
+
+        artifact = await self._readable_artifact(
+            artifact_id,
+            principal=principal,
+            allow_restricted_raw=allow_restricted_raw,
+        )
+        start = max(0, int(offset))
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(
+                None,
+                lambda: self._store.read_range(
+                    artifact.storage_key, offset=start, length=max(0, int(length))
+                ),
+            )
+            total_size = artifact.size_bytes
+            if total_size is None:
+                _, total_size = await loop.run_in_executor(
+                    None,
+                    lambda: self._store.read_tail(artifact.storage_key, length=0),
+                )
+        except Exception as exc:
+            raise TemporalArtifactStateError("artifact bytes are missing") from exc
+        logger.info(
+            "Temporal artifact ranged read operation principal=%s artifact_id=%s "
+            "offset=%s bytes=%s",
+            principal,
+            artifact.artifact_id,
+            start,
+            len(data),
+        )
+        return artifact, ArtifactByteRange(
+            data=data,
+            offset=start,
+            total_size=int(total_size),
+        )
+
+    async def read_tail(
+        self,
+        *,
+        artifact_id: str,
+        principal: str,
+        length: int,
+        allow_restricted_raw: bool = False,
+    ) -> tuple[db_models.TemporalArtifact, ArtifactByteRange]:
+        """Read the last ``length`` bytes of an artifact."""
+
+        artifact = await self._readable_artifact(
+            artifact_id,
+            principal=principal,
+            allow_restricted_raw=allow_restricted_raw,
+        )
+        try:
+            data, total_size = await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: self._store.read_tail(
+                    artifact.storage_key, length=max(0, int(length))
+                ),
+            )
+        except Exception as exc:
+            raise TemporalArtifactStateError("artifact bytes are missing") from exc
+        logger.info(
+            "Temporal artifact tail read operation principal=%s artifact_id=%s bytes=%s",
+            principal,
+            artifact.artifact_id,
+            len(data),
+        )
+        return artifact, ArtifactByteRange(
+            data=data,
+            offset=max(0, total_size - len(data)),
+            total_size=total_size,
+        )
+
+    async def _readable_artifact(
+        self,
+        artifact_id: str,
+        *,
+        principal: str,
+        allow_restricted_raw: bool,
+    ) -> db_models.TemporalArtifact:
+        artifact = await self._repository.get_artifact(artifact_id)
+        await self._assert_artifact_read_access(artifact, principal=principal)
+        if artifact.status is not db_models.TemporalArtifactStatus.COMPLETE:
+            raise TemporalArtifactStateError("artifact is not readable")
+        if not allow_restricted_raw:
+            await self._assert_artifact_raw_access(artifact, principal=principal)
+        return artifact
+
     async def read_path(
         self,
         *,
@@ -2505,18 +2749,32 @@ class TemporalArtifactService:
             hard_deleted += 1
 
         await self._repository.commit()
+        claim_checks_deleted = 0
+        if self._lifecycle.payload_claim_check_retention is not None:
+            from moonmind.workflows.temporal.data_converter import (
+                sweep_payload_claim_checks,
+            )
+
+            claim_checks_deleted = await asyncio.to_thread(
+                sweep_payload_claim_checks,
+                self._store,
+                namespace=self._default_namespace,
+                older_than=sweep_now - self._lifecycle.payload_claim_check_retention,
+            )
         logger.info(
-            "Temporal artifact sweep_lifecycle principal=%s run_id=%s soft_deleted=%s hard_deleted=%s",
+            "Temporal artifact sweep_lifecycle principal=%s run_id=%s soft_deleted=%s hard_deleted=%s payload_claim_checks_deleted=%s",
             principal,
             lifecycle_run_id,
             soft_deleted,
             hard_deleted,
+            claim_checks_deleted,
         )
         return LifecycleSweepSummary(
             run_id=lifecycle_run_id,
             expired_candidate_count=len(expired),
             soft_deleted_count=soft_deleted,
             hard_deleted_count=hard_deleted,
+            payload_claim_check_deleted_count=claim_checks_deleted,
         )
 
     async def compute_preview(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import time
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -303,6 +304,31 @@ async def query_workflow(
         return await handle.query(query_name)
     return await handle.query(query_name, arg)
 
+class TemporalVisibilityGroupBySupport:
+    """Remember which attributes the Visibility store refused to group by.
+
+    Most Visibility stores only support ``GROUP BY ExecutionStatus``. A refusal
+    is remembered for ``retry_after_seconds`` so count endpoints skip the doomed
+    probe, then retried in case the store was upgraded.
+    """
+
+    def __init__(self, *, retry_after_seconds: float = 600.0) -> None:
+        self._retry_after_seconds = retry_after_seconds
+        self._unsupported_until: dict[str, float] = {}
+
+    def is_unsupported(self, attr: str) -> bool:
+        until = self._unsupported_until.get(attr)
+        if until is None:
+            return False
+        if time.monotonic() >= until:
+            self._unsupported_until.pop(attr, None)
+            return False
+        return True
+
+    def mark_unsupported(self, attr: str) -> None:
+        self._unsupported_until[attr] = time.monotonic() + self._retry_after_seconds
+
+
 class TemporalClientAdapter:
     """Adapter for communicating with the Temporal server."""
 
@@ -311,6 +337,7 @@ class TemporalClientAdapter:
         self._client = client
         self._lock = asyncio.Lock()
         self._workflow_topology: TemporalWorkerTopology | None = None
+        self.visibility_group_by = TemporalVisibilityGroupBySupport()
 
     async def get_client(self) -> Client:
         """Get or initialize the Temporal client connection."""
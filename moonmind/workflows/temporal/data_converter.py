@@ -1,9 +1,249 @@
-"""Shared Temporal payload conversion contract for MoonMind runtimes."""
+"""Shared Temporal payload conversion contract for MoonMind runtimes.
+
+Payloads are serialized by the Pydantic converter and then passed through
+:class:`MoonMindPayloadCodec`, which compresses large payloads and offloads very
+large ones to the artifact store behind a claim-check reference. Every encoded
+payload carries a codec version in its metadata; payloads without MoonMind
+encoding metadata (all histories written before the codec existed) decode
+unchanged.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import json
+import zlib
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from temporalio.api.common.v1 import Payload
 from temporalio.contrib.pydantic import pydantic_data_converter
+from temporalio.converter import DataConverter, PayloadCodec
+
+from moonmind.config.settings import settings
+
+if TYPE_CHECKING:
+    from moonmind.workflows.temporal.artifacts import TemporalArtifactStore
+
+ENCODING_METADATA_KEY = "encoding"
+CODEC_VERSION_METADATA_KEY = "moonmind-codec-version"
+CODEC_VERSION = b"1"
+ZLIB_ENCODING = b"binary/moonmind-zlib"
+CLAIM_CHECK_ENCODING = b"json/moonmind-claim-check"
+CLAIM_CHECK_SCOPE = "temporal-payloads"
+
+_SUPPORTED_CODEC_VERSIONS = frozenset({CODEC_VERSION})
+_ZLIB_LEVEL = 6
+
+
+class PayloadCodecError(RuntimeError):
+    """Raised when an encoded payload cannot be restored."""
+
+
+class MoonMindPayloadCodec(PayloadCodec):
+    """Compress and claim-check large Temporal payloads.
+
+    Encoding wraps the complete original payload (metadata included), so the
+    decoded payload is byte-for-byte what the Pydantic converter produced.
+    Claim-check blobs are content addressed, so retried encodes of the same
+    payload reuse one stored object. Every encode rewrites the blob, which
+    refreshes its age for :func:`sweep_payload_claim_checks`.
+    """
+
+    def __init__(
+        self,
+        *,
+        compression_threshold_bytes: int,
+        claim_check_threshold_bytes: int,
+        store_factory: Callable[[], TemporalArtifactStore] | None = None,
+        namespace: str = "default",
+        encode_enabled: bool = True,
+    ) -> None:
+        self._compression_threshold_bytes = max(0, int(compression_threshold_bytes))
+        self._claim_check_threshold_bytes = max(0, int(claim_check_threshold_bytes))
+        self._store_factory = store_factory
+        self._store: TemporalArtifactStore | None = None
+        self._namespace = namespace
+        self._encode_enabled = encode_enabled
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        if not self._encode_enabled:
+            return list(payloads)
+        return [await self._encode_one(payload) for payload in payloads]
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        return [await self._decode_one(payload) for payload in payloads]
+
+    async def _encode_one(self, payload: Payload) -> Payload:
+        if _codec_version(payload) is not None:
+            return payload
+        size = payload.ByteSize()
+        if (
+            not self._compression_threshold_bytes
+            or size < self._compression_threshold_bytes
+        ):
+            encoded = payload
+        else:
+            compressed = zlib.compress(payload.SerializeToString(), _ZLIB_LEVEL)
+            encoded = (
+                _wrap(ZLIB_ENCODING, compressed) if len(compressed) < size else payload
+            )
+        if (
+            self._claim_check_threshold_bytes
+            and self._store_factory is not None
+            and encoded.ByteSize() >= self._claim_check_threshold_bytes
+        ):
+            encoded = await self._claim_check(encoded)
+        return encoded
+
+    async def _claim_check(self, payload: Payload) -> Payload:
+        blob = payload.SerializeToString()
+        sha256 = hashlib.sha256(blob, usedforsecurity=False).hexdigest()
+        store = self._resolve_store()
+        storage_key = store.build_content_addressed_storage_key(
+            namespace=self._namespace,
+            scope=CLAIM_CHECK_SCOPE,
+            sha256=sha256,
+        )
+        await asyncio.to_thread(
+            store.write_bytes,
+            storage_key,
+            blob,
+            content_type="application/x-protobuf",
+        )
+        reference = {"storageKey": storage_key, "sha256": sha256, "sizeBytes": len(blob)}
+        return _wrap(
+            CLAIM_CHECK_ENCODING,
+            json.dumps(reference, separators=(",", ":"), sort_keys=True).encode(),
+        )
+
+    async def _decode_one(self, payload: Payload) -> Payload:
+        version = _codec_version(payload)
+        if version is None:
+            return payload
+        if version not in _SUPPORTED_CODEC_VERSIONS:
+            raise PayloadCodecError(
+                f"Unsupported MoonMind payload codec version {version!r}"
+            )
+        encoding = payload.metadata.get(ENCODING_METADATA_KEY)
+        if encoding == ZLIB_ENCODING:
+            try:
+                inner = zlib.decompress(payload.data)
+            except zlib.error as exc:
+                raise PayloadCodecError("Corrupt compressed Temporal payload") from exc
+        elif encoding == CLAIM_CHECK_ENCODING:
+            inner = await self._resolve_claim_check(payload.data)
+        else:
+            raise PayloadCodecError(
+                f"Unknown MoonMind payload encoding {encoding!r}"
+            )
+        restored = Payload()
+        restored.ParseFromString(inner)
+        # A claim-checked payload may itself be compressed.
+        return await self._decode_one(restored)
+
+    async def _resolve_claim_check(self, data: bytes) -> bytes:
+        try:
+            reference = json.loads(data)
+            storage_key = str(reference["storageKey"])
+            expected_sha256 = str(reference["sha256"])
+        except (ValueError, KeyError, TypeError) as exc:
+            raise PayloadCodecError("Malformed payload claim-check reference") from exc
+        if self._store_factory is None:
+            raise PayloadCodecError(
+                "Payload claim-check reference found but no artifact store is configured"
+            )
+        blob = await asyncio.to_thread(self._resolve_store().read_bytes, storage_key)
+        observed = hashlib.sha256(blob, usedforsecurity=False).hexdigest()
+        if observed != expected_sha256:
+            raise PayloadCodecError(
+                f"Payload claim-check digest mismatch for {storage_key}"
+            )
+        return blob
+
+    def _resolve_store(self) -> TemporalArtifactStore:
+        if self._store is None:
+            assert self._store_factory is not None
+            self._store = self._store_factory()
+        return self._store
+
+
+def _wrap(encoding: bytes, data: bytes) -> Payload:
+    return Payload(
+        metadata={
+            ENCODING_METADATA_KEY: encoding,
+            CODEC_VERSION_METADATA_KEY: CODEC_VERSION,
+        },
+        data=data,
+    )
+
+
+def _codec_version(payload: Payload) -> bytes | None:
+    return payload.metadata.get(CODEC_VERSION_METADATA_KEY)
+
+
+def sweep_payload_claim_checks(
+    store: TemporalArtifactStore,
+    *,
+    namespace: str,
+    older_than: datetime,
+) -> int:
+    """Delete claim-check blobs last written before ``older_than``.
+
+    The cutoff must leave room for the Temporal namespace retention period plus
+    the longest workflow run, since replays re-read every claim-checked payload
+    in a history. Returns the number of blobs deleted.
+    """
+
+    prefix = store.build_content_addressed_storage_key(
+        namespace=namespace,
+        scope=CLAIM_CHECK_SCOPE,
+        sha256="0" * 64,
+    ).rsplit("/sha256/", 1)[0]
+    deleted = 0
+    for storage_key, last_modified in store.list_objects(f"{prefix}/sha256/"):
+        if last_modified < older_than:
+            store.delete(storage_key)
+            deleted += 1
+    return deleted
+
+
+def _artifact_store_from_settings() -> TemporalArtifactStore:
+    from moonmind.workflows.temporal.artifacts import TemporalArtifactService
+
+    return TemporalArtifactService._build_store_from_settings()
+
+
+def build_moonmind_data_converter(
+    *,
+    store_factory: Callable[[], TemporalArtifactStore] | None = (
+        _artifact_store_from_settings
+    ),
+) -> DataConverter:
+    """Return the Pydantic data converter wrapped with the MoonMind payload codec."""
+
+    codec = MoonMindPayloadCodec(
+        compression_threshold_bytes=settings.temporal.payload_compression_threshold_bytes,
+        claim_check_threshold_bytes=settings.temporal.payload_claim_check_threshold_bytes,
+        store_factory=store_factory,
+        namespace=settings.workflow.temporal_artifact_default_namespace or "default",
+        encode_enabled=settings.temporal.payload_codec_encode_enabled,
+    )
+    return dataclasses.replace(pydantic_data_converter, payload_codec=codec)
+
 
-MOONMIND_TEMPORAL_DATA_CONVERTER = pydantic_data_converter
+MOONMIND_TEMPORAL_DATA_CONVERTER = build_moonmind_data_converter()
 
-__all__ = ["MOONMIND_TEMPORAL_DATA_CONVERTER"]
+__all__ = [
+    "CLAIM_CHECK_ENCODING",
+    "CODEC_VERSION",
+    "MOONMIND_TEMPORAL_DATA_CONVERTER",
+    "MoonMindPayloadCodec",
+    "PayloadCodecError",
+    "ZLIB_ENCODING",
+    "build_moonmind_data_converter",
+    "sweep_payload_claim_checks",
+]
@@ -22,7 +22,10 @@ from moonmind.omnigent.policies import (
     policy_authority_evidence,
     validate_policy_authority_evidence,
 )
-from moonmind.workflows.temporal.artifacts import TemporalArtifactService
+from moonmind.workflows.temporal.artifacts import (
+    ArtifactByteRange,
+    TemporalArtifactService,
+)
 from moonmind.workflows.temporal.remediation_context import (
     REMEDIATION_CONTEXT_LINK_TYPE,
     RemediationLifecyclePublisher,
@@ -151,6 +154,8 @@ class RemediationArtifactReadResult:
     size_bytes: int
     content: str | None
     content_truncated: bool
+    offset: int = 0
+    next_offset: int | None = None
 
 class RemediationLogReader(Protocol):
     """Read bounded historical logs for a target agent run."""
@@ -378,9 +383,17 @@ class RemediationEvidenceToolService:
         artifact_ref: str | Mapping[str, Any],
         include_content: bool = False,
         max_content_bytes: int = 65_536,
+        offset: int = 0,
+        tail: bool = False,
         principal: str = "service:remediation-tools",
     ) -> RemediationArtifactReadResult:
-        """Read metadata and bounded redacted content for a linked artifact."""
+        """Read metadata and bounded redacted content for a linked artifact.
+
+        Only the requested byte window is fetched from storage. Forward reads
+        start at ``offset`` and stop on a line boundary, returning
+        ``next_offset`` to continue from; ``tail`` reads the last
+        ``max_content_bytes`` starting at the first whole line.
+        """
 
         link = await self._load_link(remediation_workflow_id)
         context = await self._read_context_payload(link=link, principal=principal)
@@ -391,12 +404,21 @@ class RemediationEvidenceToolService:
             raise RemediationEvidenceToolError(
                 f"Artifact {artifact_id} is not listed in remediation context."
             )
-        artifact, payload = await self._artifact_service.read(
-            artifact_id=artifact_id,
-            principal=principal,
-        )
         bound = max(0, min(int(max_content_bytes), 1_048_576))
-        bounded = payload[:bound] if include_content else b""
+        if include_content and tail:
+            artifact, window = await self._artifact_service.read_tail(
+                artifact_id=artifact_id,
+                principal=principal,
+                length=bound,
+            )
+        else:
+            artifact, window = await self._artifact_service.read_range(
+                artifact_id=artifact_id,
+                principal=principal,
+                offset=offset,
+                length=bound if include_content else 0,
+            )
+        content_offset, bounded, next_offset = _line_aligned_window(window, tail=tail)
         return RemediationArtifactReadResult(
             artifact_id=artifact_id,
             metadata=_redact_payload_value(
@@ -404,13 +426,16 @@ class RemediationEvidenceToolService:
                 if isinstance(artifact.metadata_json, Mapping)
                 else {}
             ),
-            size_bytes=len(payload),
+            size_bytes=window.total_size,
             content=(
                 _redact_text(bounded.decode("utf-8", errors="replace"))
                 if include_content
                 else None
             ),
-            content_truncated=include_content and len(payload) > len(bounded),
+            content_truncated=include_content
+            and (content_offset > 0 or content_offset + len(bounded) < window.total_size),
+            offset=content_offset if include_content else 0,
+            next_offset=next_offset if include_content else None,
         )
 
     async def read_evidence_page(
@@ -474,9 +499,10 @@ class RemediationEvidenceToolService:
                 )
                 items.append(item)
                 continue
-            artifact, payload = await self._artifact_service.read(
+            artifact, window = await self._artifact_service.read_range(
                 artifact_id=artifact_id,
                 principal=principal,
+                length=content_bound if include_content else 0,
             )
             item.update(
                 {
@@ -487,15 +513,14 @@ class RemediationEvidenceToolService:
                         if isinstance(artifact.metadata_json, Mapping)
                         else {}
                     ),
-                    "sizeBytes": len(payload),
+                    "sizeBytes": window.total_size,
                 }
             )
             if include_content:
-                bounded = payload[:content_bound]
                 item["content"] = _redact_text(
-                    bounded.decode("utf-8", errors="replace")
+                    window.data.decode("utf-8", errors="replace")
                 )
-                item["contentTruncated"] = len(payload) > len(bounded)
+                item["contentTruncated"] = window.total_size > window.end
             items.append(item)
         next_cursor = start + len(page_refs)
         if next_cursor >= len(refs):
@@ -1551,6 +1576,34 @@ def _artifact_id_from_ref(value: str | Mapping[str, Any] | Any) -> str | None:
         return _string_or_none(value.get("artifact_id") or value.get("artifactId"))
     return _string_or_none(value)
 
+def _line_aligned_window(
+    window: ArtifactByteRange,
+    *,
+    tail: bool,
+) -> tuple[int, bytes, int | None]:
+    """Trim a byte window to whole lines; return (offset, bytes, next_offset).
+
+    A window that cannot be aligned (a single line longer than the window) is
+    returned unchanged so callers always make progress.
+    """
+
+    data = window.data
+    offset = window.offset
+    if tail:
+        if offset > 0:
+            newline = data.find(b"\n")
+            if 0 <= newline < len(data) - 1:
+                data = data[newline + 1 :]
+                offset += newline + 1
+        return offset, data, None
+    if window.end >= window.total_size:
+        return offset, data, None
+    newline = data.rfind(b"\n")
+    if newline >= 0:
+        data = data[: newline + 1]
+    return offset, data, offset + len(data) if data else None
+
+
 def _bounded_tail_lines(context: Mapping[str, Any], requested: int | None) -> int | None:
     max_tail_lines = 2000
     boundedness = context.get("boundedness")
@@ -0,0 +1,434 @@
+"""Host-level bare mirror cache that seeds workspace clones with git objects.
+
+Every run clones its repository into a fresh workspace. The cache keeps one
+bare mirror per normalized repository source, fetches it incrementally under a
+per-repository lock, and hands it to ``git clone --reference-if-able`` so the
+clone only transfers objects the mirror does not already hold.
+
+Clones always ``--dissociate`` from the mirror: the workspace copies the
+objects it borrowed, so it stays valid after eviction and inside containers
+that cannot see the cache root. Mirrors never record the remote URL or any
+credentials; each fetch names the source explicitly and uses the caller's git
+environment.
+
+Mirrors are published atomically by renaming a fully fetched and
+connectivity-checked staging repository, and evicted by renaming them out of
+the mirror tree before deletion. Readers hold a shared lock for the duration
+of their clone, so eviction skips mirrors that are in use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from pathlib import Path
+from typing import IO
+from urllib.parse import urlsplit
+
+from moonmind.utils.logging import redact_sensitive_text
+from moonmind.workflows.temporal.runtime.command_runner import run_runtime_command
+
+logger = logging.getLogger(__name__)
+
+_MIRRORS_DIR = "mirrors"
+_LOCKS_DIR = "locks"
+_TMP_DIR = "tmp"
+_REPO_DIR = "repo.git"
+_SIZE_FILE = "size_bytes"
+_SOURCE_FILE = "source"
+_FETCH_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+_GIT_TIMEOUT_SECONDS = 1800.0
+_LOCK_POLL_SECONDS = 0.1
+_REMOTE_SCHEMES = frozenset({"https", "http", "ssh", "git"})
+
+_shared_cache: GitObjectCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+class GitObjectCache:
+    """Per-host bare mirrors keyed by repository source with an LRU size budget."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int,
+        min_idle_seconds: float = 300.0,
+    ) -> None:
+        if not str(root or "").strip():
+            raise ValueError("root must be provided")
+        self.root = Path(root).expanduser().resolve()
+        self.max_bytes = max(0, int(max_bytes))
+        self.min_idle_seconds = max(0.0, float(min_idle_seconds))
+
+    @staticmethod
+    def normalize_source(source: str) -> str | None:
+        """Return the canonical ``host/path`` identity of a remote source.
+
+        Scheme, credentials, a trailing ``.git`` and host case are ignored so
+        HTTPS and SSH spellings of one repository share a mirror. Plain local
+        paths and unrecognized sources are not cached because cloning them is
+        already a local copy; ``file://`` URLs go through the pack transport
+        and are cached like remotes.
+        """
+
+        normalized = str(source or "").strip()
+        if not normalized:
+            return None
+        if "://" not in normalized:
+            user_host, separator, path = normalized.partition(":")
+            if not separator or "@" not in user_host or path.startswith("/"):
+                return None
+            host = user_host.rpartition("@")[2]
+        else:
+            parsed = urlsplit(normalized)
+            scheme = parsed.scheme.lower()
+            if scheme == "file":
+                host = "file"
+            elif scheme in _REMOTE_SCHEMES and parsed.hostname:
+                host = parsed.hostname
+                if parsed.port:
+                    host = f"{host}:{parsed.port}"
+            else:
+                return None
+            path = parsed.path
+        path = path.strip("/").removesuffix(".git").strip("/")
+        if not host or not path or ".." in path.split("/"):
+            return None
+        return f"{host.lower()}/{path}"
+
+    @classmethod
+    def repository_key(cls, source: str) -> str | None:
+        canonical = cls.normalize_source(source)
+        if canonical is None:
+            return None
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+    @contextlib.asynccontextmanager
+    async def reference(
+        self,
+        source: str,
+        *,
+        env: Mapping[str, str] | None = None,
+    ) -> AsyncIterator[Path | None]:
+        """Yield a freshly fetched mirror of ``source``, or ``None``.
+
+        The mirror is created or incrementally fetched under an exclusive
+        per-repository lock, which is downgraded to a shared lock while the
+        caller clones from it. ``None`` means the source is not cacheable or
+        the mirror could not be brought up to date; callers clone normally.
+        """
+
+        key = self.repository_key(source)
+        if key is None:
+            yield None
+            return
+        self._locks_dir.mkdir(parents=True, exist_ok=True)
+        with (self._locks_dir / f"{key}.lock").open("a+b") as handle:
+            await _acquire_lock(handle, fcntl.LOCK_EX)
+            try:
+                mirror = await self._refresh(key, source, env)
+            finally:
+                # flock conversion is not atomic and may wait behind another
+                # exclusive waiter, so it must not run on the event loop.
+                await asyncio.to_thread(fcntl.flock, handle.fileno(), fcntl.LOCK_SH)
+            try:
+                yield mirror
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        await asyncio.to_thread(self.evict, keep=frozenset({key}))
+
+    async def invalidate(self, source: str) -> bool:
+        """Drop the mirror for ``source`` so the next reference rebuilds it."""
+
+        key = self.repository_key(source)
+        if key is None:
+            return False
+        return await asyncio.to_thread(self._invalidate, key)
+
+    def evict(self, *, keep: frozenset[str] = frozenset()) -> list[str]:
+        """Drop least recently used mirrors until the cache fits its budget.
+
+        Mirrors in ``keep``, mirrors used within ``min_idle_seconds`` and
+        mirrors another clone or fetch currently holds are never evicted.
+        """
+
+        entries = self._entries()
+        total = sum(size for _key, _used_at, size in entries)
+        if total <= self.max_bytes:
+            return []
+        cutoff = time.time() - self.min_idle_seconds
+        evicted: list[str] = []
+        for key, used_at, size in sorted(entries, key=lambda item: item[1]):
+            if total <= self.max_bytes:
+                break
+            if key in keep or used_at > cutoff:
+                continue
+            with self._try_lock(key) as locked:
+                if locked and self._discard(key):
+                    total -= size
+                    evicted.append(key)
+        if evicted:
+            logger.info(
+                "Evicted %d git object cache mirrors; %d bytes retained",
+                len(evicted),
+                total,
+            )
+        return evicted
+
+    @property
+    def _mirrors_dir(self) -> Path:
+        return self.root / _MIRRORS_DIR
+
+    @property
+    def _locks_dir(self) -> Path:
+        return self.root / _LOCKS_DIR
+
+    @property
+    def _tmp_dir(self) -> Path:
+        return self.root / _TMP_DIR
+
+    async def _refresh(
+        self, key: str, source: str, env: Mapping[str, str] | None
+    ) -> Path | None:
+        entry = self._mirrors_dir / key
+        repository = entry / _REPO_DIR
+        if entry.exists():
+            if await self._intact(repository):
+                # A failed fetch is usually the remote or the caller's
+                # credentials, not the mirror; keep it for the next caller.
+                if not await self._fetch(repository, source, env):
+                    return None
+                await asyncio.to_thread(_record_size, entry)
+                return repository
+            logger.warning("Rebuilding git object cache mirror %s", key)
+            await asyncio.to_thread(self._discard, key)
+        return await self._create(key, source, env)
+
+    async def _create(
+        self, key: str, source: str, env: Mapping[str, str] | None
+    ) -> Path | None:
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._mirrors_dir.mkdir(parents=True, exist_ok=True)
+        staging = self._tmp_dir / f"{key}.{uuid.uuid4().hex}"
+        repository = staging / _REPO_DIR
+        try:
+            staging.mkdir(parents=True)
+            if not await self._git(env, "init", "--quiet", "--bare", str(repository)):
+                return None
+            if not await self._fetch(repository, source, env):
+                return None
+            if not await self._git(
+                env,
+                "-C",
+                str(repository),
+                "fsck",
+                "--connectivity-only",
+                "--no-dangling",
+                "--no-progress",
+            ):
+                return None
+            (staging / _SOURCE_FILE).write_text(
+                f"{self.normalize_source(source)}\n", encoding="utf-8"
+            )
+            await asyncio.to_thread(_record_size, staging)
+            staging.rename(self._mirrors_dir / key)
+        except OSError:
+            logger.warning("Unable to publish git object cache mirror %s", key)
+            return None
+        finally:
+            if staging.exists():
+                await asyncio.to_thread(shutil.rmtree, staging, ignore_errors=True)
+        return self._mirrors_dir / key / _REPO_DIR
+
+    async def _intact(self, repository: Path) -> bool:
+        return await self._git(
+            None, "-C", str(repository), "rev-parse", "--is-bare-repository"
+        )
+
+    async def _fetch(
+        self, repository: Path, source: str, env: Mapping[str, str] | None
+    ) -> bool:
+        return await self._git(
+            env,
+            "-C",
+            str(repository),
+            "fetch",
+            "--quiet",
+            "--prune",
+            "--no-write-fetch-head",
+            "--",
+            source,
+            *_FETCH_REFSPECS,
+        )
+
+    async def _git(self, env: Mapping[str, str] | None, *args: str) -> bool:
+        return_code, _stdout, stderr = await run_runtime_command(
+            ("git", *args),
+            env=env,
+            timeout_seconds=_GIT_TIMEOUT_SECONDS,
+            output_limit_bytes=2048,
+        )
+        if return_code != 0:
+            logger.warning(
+                "git object cache command failed rc=%s: git %s: %s",
+                return_code,
+                redact_sensitive_text(" ".join(args)),
+                stderr.decode("utf-8", errors="replace").strip()[:400],
+            )
+        return return_code == 0
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        entries: list[tuple[str, float, int]] = []
+        try:
+            children = list(self._mirrors_dir.iterdir())
+        except FileNotFoundError:
+            return entries
+        for entry in children:
+            try:
+                used_at = (entry / _SIZE_FILE).stat().st_mtime
+                size = int((entry / _SIZE_FILE).read_text(encoding="ascii"))
+            except (OSError, ValueError):
+                continue
+            entries.append((entry.name, used_at, size))
+        return entries
+
+    @contextlib.contextmanager
+    def _try_lock(self, key: str) -> Iterator[bool]:
+        self._locks_dir.mkdir(parents=True, exist_ok=True)
+        with (self._locks_dir / f"{key}.lock").open("a+b") as handle:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _invalidate(self, key: str) -> bool:
+        with self._try_lock(key) as locked:
+            return locked and self._discard(key)
+
+    def _discard(self, key: str) -> bool:
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        graveyard = self._tmp_dir / f"evict.{key}.{uuid.uuid4().hex}"
+        try:
+            (self._mirrors_dir / key).rename(graveyard)
+        except OSError:
+            return False
+        shutil.rmtree(graveyard, ignore_errors=True)
+        return True
+
+
+async def _acquire_lock(handle: IO[bytes], operation: int) -> None:
+    """Take an advisory lock without blocking the event loop."""
+
+    while True:
+        try:
+            fcntl.flock(handle.fileno(), operation | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+
+
+def _record_size(entry: Path) -> None:
+    """Write the mirror's on-disk size; the file's mtime marks its last use."""
+
+    total = 0
+    for directory, _dir_names, file_names in os.walk(entry / _REPO_DIR):
+        for name in file_names:
+            try:
+                total += (Path(directory) / name).lstat().st_size
+            except OSError:
+                continue
+    (entry / _SIZE_FILE).write_text(f"{total}\n", encoding="ascii")
+
+
+def reference_clone_args(mirror: Path | None) -> list[str]:
+    """Return ``git clone`` options that borrow objects from ``mirror``."""
+
+    if mirror is None:
+        return []
+    return ["--reference-if-able", str(mirror), "--dissociate"]
+
+
+async def clone_through_cache(
+    source: str,
+    workspace: Path,
+    clone: Callable[[Sequence[str]], Awaitable[bool]],
+    *,
+    env: Mapping[str, str] | None = None,
+    cache: GitObjectCache | None = None,
+) -> bool:
+    """Clone ``source`` into ``workspace`` seeded from the host mirror cache.
+
+    ``clone`` receives extra ``git clone`` options and reports success. When a
+    clone from the mirror fails, the partial workspace is removed and the
+    plain clone is retried; if that succeeds the mirror is presumed damaged
+    and dropped so the next run rebuilds it.
+    """
+
+    if cache is None:
+        return await clone(())
+    async with cache.reference(source, env=env) as mirror:
+        if mirror is not None:
+            try:
+                if await clone(reference_clone_args(mirror)):
+                    return True
+            except Exception:
+                logger.warning(
+                    "Clone from git object cache mirror failed; cloning directly",
+                    exc_info=True,
+                )
+            await asyncio.to_thread(shutil.rmtree, workspace, ignore_errors=True)
+    cloned = await clone(())
+    if cloned and mirror is not None:
+        await cache.invalidate(source)
+    return cloned
+
+
+def shared_git_object_cache() -> GitObjectCache | None:
+    """Return the process-wide cache configured in workflow settings."""
+
+    global _shared_cache
+    from moonmind.config.settings import settings
+
+    max_bytes = settings.workflow.git_object_cache_max_bytes
+    root = str(settings.workflow.git_object_cache_root or "").strip()
+    if max_bytes <= 0 or not root:
+        return None
+    with _shared_cache_lock:
+        resolved = Path(root).expanduser().resolve()
+        if (
+            _shared_cache is None
+            or _shared_cache.root != resolved
+            or _shared_cache.max_bytes != max_bytes
+        ):
+            _shared_cache = GitObjectCache(resolved, max_bytes=max_bytes)
+        return _shared_cache
+
+
+__all__ = [
+    "GitObjectCache",
+    "clone_through_cache",
+    "reference_clone_args",
+    "shared_git_object_cache",
+]
@@ -11,7 +11,7 @@ import shlex
 import shutil
 import stat
 import subprocess
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path, PurePosixPath
 from typing import Any, Literal, cast
@@ -68,6 +68,7 @@ from .github_auth_broker import (
     render_git_credential_helper_script,
 )
 from .git_auth import build_github_token_git_environment
+from .git_object_cache import clone_through_cache, shared_git_object_cache
 from .store import ManagedRunStore
 from .log_streamer import RuntimeLogStreamer
 from .managed_api_key_resolve import resolve_github_token_for_launch
@@ -1140,14 +1141,30 @@ class ManagedRuntimeLauncher:
         command_env = (
             git_env if self._source_uses_github_https(clone_source) else None
         )
-        clone_args: list[str] = ["clone"]
+        branch_args: list[str] = []
         if branch and not Path(clone_source).exists():
-            clone_args.extend(["--branch", branch, "--single-branch"])
-        clone_args.extend(["--", clone_source, str(run_workspace)])
-        cloned = await self._run_git_command(
-            clone_args,
-            allow_failure=True,
+            branch_args = ["--branch", branch, "--single-branch"]
+
+        async def clone(extra_args: Sequence[str]) -> bool:
+            return await self._run_git_command(
+                [
+                    "clone",
+                    *branch_args,
+                    *extra_args,
+                    "--",
+                    clone_source,
+                    str(run_workspace),
+                ],
+                allow_failure=True,
+                env=command_env,
+            )
+
+        cloned = await clone_through_cache(
+            clone_source,
+            run_workspace,
+            clone,
             env=command_env,
+            cache=shared_git_object_cache(),
         )
         if not cloned:
             return None
@@ -1501,14 +1518,29 @@ class ManagedRuntimeLauncher:
         clone_branch = self._normalize_clone_branch(branch)
         command_env = git_env if self._source_uses_github_https(source) else None
 
-        clone_cmd = ["git", "clone"]
+        branch_args: list[str] = []
         if clone_branch:
-            clone_cmd.extend(["--branch", clone_branch, "--single-branch"])
-        clone_cmd.extend([source, str(repo_path)])
-        await self._run_checked_command(
-            *clone_cmd,
-            cwd=str(workspace_root),
+            branch_args = ["--branch", clone_branch, "--single-branch"]
+
+        async def clone(extra_args: Sequence[str]) -> bool:
+            await self._run_checked_command(
+                "git",
+                "clone",
+                *branch_args,
+                *extra_args,
+                source,
+                str(repo_path),
+                cwd=str(workspace_root),
+                env=command_env,
+            )
+            return True
+
+        await clone_through_cache(
+            source,
+            repo_path,
+            clone,
             env=command_env,
+            cache=shared_git_object_cache(),
         )
 
         await self._checkout_resolved_read_only_revision(
@@ -69,6 +69,7 @@ from .github_auth_broker import (
     render_git_credential_helper_script,
 )
 from .git_auth import build_github_token_git_environment
+from .git_object_cache import clone_through_cache, shared_git_object_cache
 from .managed_session_observability import ManagedSessionObservabilityBridge
 from .managed_session_store import (
     TERMINAL_MANAGED_SESSION_STATUSES,
@@ -1551,14 +1552,31 @@ class DockerCodexManagedSessionController:
         ).strip()
         branch = ManagedRuntimeLauncher._normalize_clone_branch(branch)
 
-        clone_command = ["git", "clone"]
+        branch_args: list[str] = []
         if branch:
-            clone_command.extend(["--branch", branch, "--single-branch"])
-        clone_command.extend([source, str(workspace_path)])
-        await self._run_git_host_command(
-            clone_command,
-            request=request,
-            git_env=git_env,
+            branch_args = ["--branch", branch, "--single-branch"]
+
+        async def clone(extra_args: Sequence[str]) -> bool:
+            await self._run_git_host_command(
+                [
+                    "git",
+                    "clone",
+                    *branch_args,
+                    *extra_args,
+                    source,
+                    str(workspace_path),
+                ],
+                request=request,
+                git_env=git_env,
+            )
+            return True
+
+        await clone_through_cache(
+            source,
+            workspace_path,
+            clone,
+            env={**os.environ, **git_env},
+            cache=shared_git_object_cache(),
         )
         self._normalize_container_path_ownership((workspace_path,))
 
@@ -6,6 +6,8 @@ import asyncio
 import codecs
 import json
 import logging
+import os
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Protocol
@@ -23,6 +25,8 @@ from .session_observability_bridge import ManagedSessionObservabilityBridge
 logger = logging.getLogger(__name__)
 
 _LOG_READ_CHUNK_BYTES = 64 * 1024
+_NATIVE_WATCH_SWEEP_FACTOR = 5
+_NATIVE_WATCH_RETRY_SECONDS = 5.0
 _SESSION_STATE_FILENAME = ".moonmind-codex-session-state.json"
 _CANARY_EVIDENCE_ARTIFACT_NAME = "codex_conformance_canary.evidence.json"
 _CANARY_MARKER_ARTIFACT_NAME = "codex_conformance_canary.marker.json"
@@ -46,8 +50,166 @@ class ArtifactStorageWriter(Protocol):
     ) -> tuple[Path, str]:
         pass
 
+def _file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def _file_signatures(paths: Iterable[str]) -> dict[str, tuple[int, int] | None]:
+    return {path: _file_signature(path) for path in paths}
+
+class _SpoolChangeMultiplexer:
+    """Wake per-session tailers when their spool or runtime state files change.
+
+    A single watchfiles watcher (inotify on Linux) covers the directories of
+    every registered session, so idle sessions cost no wakeups. One stat sweep
+    over all tracked files backs it up: it runs every ``poll_interval_seconds``
+    while native watching is unavailable or still starting, and at a slower
+    safety interval once the watcher is live.
+    """
+
+    def __init__(self, *, poll_interval_seconds: float) -> None:
+        self._poll_interval_seconds = max(0.001, float(poll_interval_seconds))
+        self._sessions: dict[str, tuple[tuple[str, ...], asyncio.Event]] = {}
+        self._path_sessions: dict[str, set[str]] = {}
+        self._signatures: dict[str, tuple[int, int] | None] = {}
+        self._watched_dirs: frozenset[str] = frozenset()
+        self._restart = asyncio.Event()
+        self._live = False
+        self._native_available = True
+        self._watch_task: asyncio.Task[None] | None = None
+        self._sweep_task: asyncio.Task[None] | None = None
+
+    def register(self, session_id: str, paths: Iterable[Path]) -> asyncio.Event:
+        """Track ``paths`` for ``session_id`` and return its (already set) wake event."""
+
+        self.unregister(session_id)
+        wake = asyncio.Event()
+        wake.set()
+        tracked = tuple(dict.fromkeys(os.path.realpath(path) for path in paths))
+        self._sessions[session_id] = (tracked, wake)
+        for path in tracked:
+            self._path_sessions.setdefault(path, set()).add(session_id)
+            if path not in self._signatures:
+                self._signatures[path] = _file_signature(path)
+        self._restart.set()
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch_changes())
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_changes())
+        return wake
+
+    def unregister(self, session_id: str) -> None:
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return
+        for path in entry[0]:
+            owners = self._path_sessions.get(path)
+            if owners is None:
+                continue
+            owners.discard(session_id)
+            if not owners:
+                del self._path_sessions[path]
+                self._signatures.pop(path, None)
+        self._restart.set()
+        if not self._sessions and self._sweep_task is not None:
+            self._sweep_task.cancel()
+
+    def wake(self, session_id: str) -> None:
+        entry = self._sessions.get(session_id)
+        if entry is not None:
+            entry[1].set()
+
+    def _wake_path(self, path: str) -> None:
+        for session_id in self._path_sessions.get(path, ()):
+            self.wake(session_id)
+
+    def _wake_all(self) -> None:
+        for _paths, wake in self._sessions.values():
+            wake.set()
+
+    def _is_tracked(self, _change: object, path: str) -> bool:
+        return path in self._path_sessions
+
+    def _directories(self) -> set[str]:
+        return {os.path.dirname(path) for path in self._path_sessions}
+
+    async def _watch_changes(self) -> None:
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            self._native_available = False
+            return
+        while self._sessions:
+            self._restart.clear()
+            directories = frozenset(
+                directory
+                for directory in self._directories()
+                if os.path.isdir(directory)
+            )
+            self._watched_dirs = directories
+            if not directories:
+                await self._restart.wait()
+                continue
+            try:
+                async for changes in awatch(
+                    *sorted(directories),
+                    watch_filter=self._is_tracked,
+                    debounce=50,
+                    step=10,
+                    stop_event=self._restart,
+                    rust_timeout=1000,
+                    yield_on_timeout=True,
+                    recursive=False,
+                ):
+                    if not self._live:
+                        # Writes that landed while the watcher was starting
+                        # produced no events; let every tailer catch up once.
+                        self._live = True
+                        self._wake_all()
+                    for _change, path in changes:
+                        self._wake_path(path)
+            except Exception as exc:  # pragma: no cover - backend specific
+                logger.debug("Session spool watch stopped: %s", exc)
+                self._live = False
+                try:
+                    await asyncio.wait_for(
+                        self._restart.wait(),
+                        timeout=_NATIVE_WATCH_RETRY_SECONDS,
+                    )
+                except TimeoutError:
+                    pass
+            finally:
+                self._live = False
+
+    async def _sweep_changes(self) -> None:
+        while self._sessions:
+            interval = self._poll_interval_seconds
+            if self._live:
+                interval *= _NATIVE_WATCH_SWEEP_FACTOR
+            await asyncio.sleep(interval)
+            observed = await asyncio.to_thread(
+                _file_signatures, list(self._signatures)
+            )
+            for path, signature in observed.items():
+                if path in self._signatures and self._signatures[path] != signature:
+                    self._signatures[path] = signature
+                    self._wake_path(path)
+            if self._native_available and any(
+                os.path.isdir(directory)
+                for directory in self._directories() - self._watched_dirs
+            ):
+                self._restart.set()
+
 class ManagedSessionSupervisor:
-    """Track session spool progress and publish durable observability artifacts."""
+    """Track session spool progress and publish durable observability artifacts.
+
+    Session tailers sleep until a shared :class:`_SpoolChangeMultiplexer`
+    reports that their stdout/stderr spool or runtime state file changed, then
+    read only the bytes appended since the tracked offsets.
+    """
 
     def __init__(
         self,
@@ -63,6 +225,9 @@ class ManagedSessionSupervisor:
         self._poll_interval_seconds = poll_interval_seconds
         self._tasks: dict[str, asyncio.Task[None]] = {}
         self._stop_events: dict[str, asyncio.Event] = {}
+        self._changes = _SpoolChangeMultiplexer(
+            poll_interval_seconds=poll_interval_seconds
+        )
 
     @staticmethod
     def _stdout_path(record: CodexManagedSessionRecord) -> Path:
@@ -277,38 +442,42 @@ class ManagedSessionSupervisor:
     async def _watch(self, session_id: str) -> None:
         stop_event = self._stop_events[session_id]
         initial_record = self._store.load(session_id)
-        stream_offsets = (
-            self._initial_stream_offsets(initial_record)
-            if initial_record is not None
-            else {"stdout": 0, "stderr": 0}
-        )
+        if initial_record is None:
+            return
+        stream_offsets = self._initial_stream_offsets(initial_record)
         stream_decoders: dict[str, codecs.IncrementalDecoder] = {}
-        while not stop_event.is_set():
-            record = self._store.load(session_id)
-            if record is None:
-                return
-            record = await self._sync_active_turn_state(record)
-            emitted = self._publish_new_output_chunks(
-                record,
-                stream_offsets,
-                stream_decoders,
-            )
-            combined_offset = sum(stream_offsets.values())
-            if emitted or combined_offset != (record.last_log_offset or 0):
-                await self._store.update(
-                    session_id,
-                    last_log_offset=combined_offset,
-                    stdout_log_offset=stream_offsets.get("stdout", 0),
-                    stderr_log_offset=stream_offsets.get("stderr", 0),
-                    last_log_at=datetime.now(tz=UTC),
-                )
-            try:
-                await asyncio.wait_for(
-                    stop_event.wait(),
-                    timeout=self._poll_interval_seconds,
+        wake = self._changes.register(
+            session_id,
+            (
+                self._stdout_path(initial_record),
+                self._stderr_path(initial_record),
+                self._session_state_path(initial_record),
+            ),
+        )
+        try:
+            while not stop_event.is_set():
+                wake.clear()
+                record = self._store.load(session_id)
+                if record is None:
+                    return
+                record = await self._sync_active_turn_state(record)
+                emitted = self._publish_new_output_chunks(
+                    record,
+                    stream_offsets,
+                    stream_decoders,
                 )
-            except TimeoutError:
-                continue
+                combined_offset = sum(stream_offsets.values())
+                if emitted or combined_offset != (record.last_log_offset or 0):
+                    await self._store.update(
+                        session_id,
+                        last_log_offset=combined_offset,
+                        stdout_log_offset=stream_offsets.get("stdout", 0),
+                        stderr_log_offset=stream_offsets.get("stderr", 0),
+                        last_log_at=datetime.now(tz=UTC),
+                    )
+                await wake.wait()
+        finally:
+            self._changes.unregister(session_id)
 
     async def start(self, record: CodexManagedSessionRecord) -> None:
         existing = self._tasks.get(record.session_id)
@@ -933,6 +1102,7 @@ class ManagedSessionSupervisor:
         stop_event = self._stop_events.pop(session_id, None)
         if stop_event is not None:
             stop_event.set()
+            self._changes.wake(session_id)
         task = self._tasks.pop(session_id, None)
         if task is not None:
             await asyncio.gather(task, return_exceptions=True)
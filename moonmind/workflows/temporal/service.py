@@ -5715,12 +5715,18 @@ class TemporalExecutionService:
         *,
         synced_at: datetime | None = None,
     ) -> TemporalExecutionRecord:
+        from api_service.core.execution_metrics import (
+            ExecutionMetricsContribution,
+            apply_execution_metrics_delta,
+        )
+
         payload = self._projection_payload_from_source(source)
         projection = await self._load_projection_execution(
             source.workflow_id,
             include_orphaned=True,
         )
         previous_version = int(projection.projection_version or 0) if projection else 0
+        previous_metrics = ExecutionMetricsContribution.from_record(projection)
         if projection is None:
             projection = TemporalExecutionRecord(
                 **payload,
@@ -5740,6 +5746,11 @@ class TemporalExecutionService:
         projection.source_mode = (
             TemporalExecutionProjectionSourceMode.TEMPORAL_AUTHORITATIVE
         )
+        await apply_execution_metrics_delta(
+            self._session,
+            previous_metrics,
+            ExecutionMetricsContribution.from_record(projection),
+        )
         return projection
 
     def _build_projection_fallback(
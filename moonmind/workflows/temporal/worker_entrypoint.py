@@ -14,6 +14,7 @@ from moonmind.config.settings import settings
 from moonmind.workflows.temporal.workers import (
     WORKFLOW_FLEET,
     build_worker_activity_bindings,
+    build_worker_slot_options,
     build_worker_spec,
     describe_configured_worker,
 )
@@ -52,8 +53,8 @@ async def main():
     worker_kwargs = {
         "workflows": spec.workflows,
         "activities": spec.activities,
-        "max_concurrent_activities": topology.concurrency_limit or 100,
         "workflow_runner": UnsandboxedWorkflowRunner(),
+        **build_worker_slot_options(topology),
     }
     if spec.versioning_enabled:
         worker_kwargs["deployment_config"] = WorkerDeploymentConfig(
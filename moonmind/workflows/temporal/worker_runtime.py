@@ -37,7 +37,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from structlog.stdlib import ProcessorFormatter
 from temporalio.client import Client
 from temporalio.common import VersioningBehavior
-from temporalio.contrib.pydantic import pydantic_data_converter
 from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.worker import (
     UnsandboxedWorkflowRunner,
@@ -103,6 +102,7 @@ from moonmind.workflows.temporal.artifacts import (
     TemporalArtifactService,
 )
 from moonmind.workflows.temporal.container_job_backend import DockerContainerJobBackend
+from moonmind.workflows.temporal.data_converter import MOONMIND_TEMPORAL_DATA_CONVERTER
 from moonmind.workflows.temporal.jira_agent_skills import JIRA_AGENT_SKILLS
 from moonmind.workflows.temporal.jules_bundle import JULES_AGENT_IDS
 from moonmind.workflows.temporal.runtime.launcher import ManagedRuntimeLauncher
@@ -137,6 +137,7 @@ from moonmind.workflows.temporal.workers import (
     SANDBOX_FLEET,
     WORKFLOW_FLEET,
     build_worker_activity_bindings,
+    build_worker_slot_options,
     build_worker_spec,
     describe_configured_worker,
     list_registered_workflow_types,
@@ -3017,12 +3018,8 @@ async def _build_runtime_activities(topology) -> tuple[AsyncExitStack, list[obje
         raise
 
 
-def _worker_concurrency_kwargs(topology) -> dict[str, int]:
-    if topology.concurrency_limit is None:
-        return {}
-    if topology.fleet == WORKFLOW_FLEET:
-        return {"max_concurrent_workflow_tasks": topology.concurrency_limit}
-    return {"max_concurrent_activities": topology.concurrency_limit}
+def _worker_concurrency_kwargs(topology) -> dict[str, Any]:
+    return build_worker_slot_options(topology)
 
 
 def _enforce_codex_config_for_managed_fleet(fleet: str) -> None:
@@ -3111,7 +3108,7 @@ async def main_async() -> None:
 
     client_kwargs = {
         "namespace": settings.temporal.namespace,
-        "data_converter": pydantic_data_converter,
+        "data_converter": MOONMIND_TEMPORAL_DATA_CONVERTER,
         "interceptors": interceptors,
     }
     if runtime:
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any, Callable, Sequence
 
 from temporalio import activity, workflow
+from temporalio.worker import ResourceBasedSlotConfig, WorkerTuner
 
 from pr_resolver_core import (
     IMPLEMENTATION_CONTRACT,
@@ -69,6 +70,11 @@ _FLEET_RESOURCE_CLASSES = {
     AGENT_RUNTIME_FLEET: "cpu_mem_heavy",
     DEPLOYMENT_FLEET: "singleton_control",
 }
+# Fleets whose throughput is bounded by host CPU and memory. Rate-limited and
+# singleton fleets keep fixed slot counts because their limits live elsewhere
+# (provider quotas, single-writer control planes).
+_RESOURCE_TUNED_CLASSES = frozenset({"light", "io_bound", "cpu_mem_heavy"})
+_DEFAULT_CONCURRENCY_LIMIT = 100
 _FLEET_EGRESS_POLICIES = {
     WORKFLOW_FLEET: "temporal-only",
     ARTIFACTS_FLEET: "artifact-store-only",
@@ -490,6 +496,51 @@ def describe_configured_worker(
     )
 
 
+def build_worker_slot_options(
+    topology: TemporalWorkerTopology,
+    *,
+    temporal_settings: TemporalSettings | None = None,
+) -> dict[str, Any]:
+    """Return the Temporal ``Worker`` slot keyword arguments for one fleet.
+
+    Host-bound fleets get a resource-based tuner that admits tasks while
+    measured CPU and memory stay under the configured targets, bounded below
+    by ``worker_resource_tuning_min_slots`` and above by the fleet concurrency
+    times ``worker_resource_tuning_max_slots_multiplier``. Other fleets, and
+    all fleets when tuning is disabled, keep the fixed concurrency limit.
+    Slot usage is reported by the Temporal runtime as the
+    ``temporal_worker_task_slots_used``/``_available`` gauges.
+    """
+
+    temporal_cfg = temporal_settings or settings.temporal
+    is_workflow_fleet = topology.fleet == WORKFLOW_FLEET
+    if (
+        not temporal_cfg.worker_resource_tuning_enabled
+        or topology.resource_class not in _RESOURCE_TUNED_CLASSES
+    ):
+        if topology.concurrency_limit is None:
+            return {}
+        if is_workflow_fleet:
+            return {"max_concurrent_workflow_tasks": topology.concurrency_limit}
+        return {"max_concurrent_activities": topology.concurrency_limit}
+
+    maximum_slots = (
+        topology.concurrency_limit or _DEFAULT_CONCURRENCY_LIMIT
+    ) * temporal_cfg.worker_resource_tuning_max_slots_multiplier
+    bounded = ResourceBasedSlotConfig(
+        minimum_slots=min(temporal_cfg.worker_resource_tuning_min_slots, maximum_slots),
+        maximum_slots=maximum_slots,
+    )
+    return {
+        "tuner": WorkerTuner.create_resource_based(
+            target_memory_usage=temporal_cfg.worker_target_memory_usage,
+            target_cpu_usage=temporal_cfg.worker_target_cpu_usage,
+            workflow_config=bounded if is_workflow_fleet else None,
+            activity_config=None if is_workflow_fleet else bounded,
+        )
+    }
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="moonmind-temporal-worker-bootstrap")
     parser.add_argument(
@@ -538,6 +589,7 @@ __all__ = [
     "TemporalWorkerTopology",
     "build_all_worker_topologies",
     "build_worker_activity_bindings",
+    "build_worker_slot_options",
     "build_worker_topology",
     "describe_configured_worker",
     "main",
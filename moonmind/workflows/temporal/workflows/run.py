@@ -922,6 +922,9 @@ class GateTransitionDecision:
 # memo command require a reset/versioning cutover; see
 # docs/tmp/RunStatusMemoUpsertCutover.md.
 RUN_STATUS_MEMO_UPSERT_PATCH = "run-status-memo-upsert-v1"
+# Publishes the bounded progress summary into the memo whenever step counts
+# change so list views read it from Visibility instead of querying each run.
+RUN_PROGRESS_MEMO_PATCH = "run-progress-memo-v1"
 RUN_JSON_ARTIFACT_WRITE_COMPLETE_PATCH = "run-json-artifact-write-complete-v1"
 RUN_TEMPORAL_PR_RESOLVER_OWNERSHIP_PATCH = "run-temporal-pr-resolver-ownership-v1"
 RUN_PR_RESOLVER_CAPABILITY_PREFLIGHT_PATCH = "run-pr-resolver-capability-preflight-v1"
@@ -1683,6 +1686,8 @@ class MoonMindRunWorkflow:
             "currentStepTitle": None,
             "updatedAt": "1970-01-01T00:00:00+00:00",
         }
+        self._published_progress: dict[str, Any] | None = None
+        self._progress_memo_version = 0
 
     def _retry_policy_for_route(self, route: TemporalActivityRoute) -> RetryPolicy:
         return RetryPolicy(
@@ -2525,6 +2530,39 @@ class MoonMindRunWorkflow:
             self._step_ledger_rows,
             updated_at=updated_at,
         )
+        self._publish_progress_memo()
+
+    def _publish_progress_memo(self) -> None:
+        """Upsert ``memo.progress`` when the step counts actually change.
+
+        The ``version`` stamp increases monotonically within a run so readers
+        can tell a workflow-published snapshot from legacy memo progress.
+        """
+        comparable = {
+            key: value
+            for key, value in self._progress_snapshot.items()
+            if key != "updatedAt"
+        }
+        if comparable == self._published_progress:
+            return
+        if not self._patched_or_false_outside_workflow(RUN_PROGRESS_MEMO_PATCH):
+            return
+        self._published_progress = comparable
+        self._progress_memo_version += 1
+        try:
+            workflow.upsert_memo(
+                {
+                    "progress": {
+                        **self._progress_snapshot,
+                        "version": self._progress_memo_version,
+                    }
+                }
+            )
+        except Exception as exc:
+            self._get_logger().warning(
+                "Failed to upsert progress memo",
+                extra={"error": str(exc)},
+            )
 
     def _recovery_source_text(
         self,
@@ -47,6 +47,7 @@ def global_test_settings():
 
     settings.workflow.test_mode = True
     settings.workflow.enable_proposals = False
+    settings.workflow.skills_content_cache_max_bytes = 0
 
 
 def _relative_test_path(path: Path) -> Path:
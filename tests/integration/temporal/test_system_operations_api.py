@@ -48,9 +48,10 @@ def test_worker_pause_route_matches_settings_runtime_contract(
     # intentionally submodule-free and does not contain production UI assets.
     monkeypatch.setattr(
         workflow_console,
-        "_vite_assets_or_error",
-        lambda _page: '<script type="module" src="/assets/test.js"></script>',
+        "ui_assets",
+        lambda _entrypoint: '<script type="module" src="/assets/test.js"></script>',
     )
+    monkeypatch.setattr(workflow_console, "_dashboard_shells", {})
     engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/system-ops-int.db")
 
     async def _setup():
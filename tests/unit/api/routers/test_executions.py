@@ -24,6 +24,7 @@ from temporalio.service import RPCError, RPCStatusCode
 from api_service.api.routers.executions import (
     _get_service,
     get_temporal_client_adapter,
+    get_temporal_visibility_group_by_support,
     _artifact_id_from_ref,
     _build_original_workflow_input_snapshot_payload,
     _build_recurring_target,
@@ -88,7 +89,10 @@ from moonmind.workflows.temporal.publication_recovery import (
     publication_operation_key,
     publication_recovery_workflow_id,
 )
-from moonmind.workflows.temporal.client import WorkflowStartResult
+from moonmind.workflows.temporal.client import (
+    TemporalVisibilityGroupBySupport,
+    WorkflowStartResult,
+)
 from moonmind.workflows.temporal.service import ExecutionDependencySummary
 from moonmind.workflows.temporal import (
     TemporalExecutionNotFoundError,
@@ -3472,6 +3476,151 @@ def test_list_executions_source_temporal_hydrates_live_progress_concurrently() -
     assert max_active_queries == 2
 
 
+def test_list_executions_source_temporal_reads_published_progress_from_memo() -> None:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[_get_service] = lambda: AsyncMock()
+
+    class _EmptyCanonicalResult:
+        def scalars(self) -> "_EmptyCanonicalResult":
+            return self
+
+        def all(self) -> list[TemporalExecutionCanonicalRecord]:
+            return []
+
+    class _Session:
+        async def execute(self, _stmt: object) -> _EmptyCanonicalResult:
+            return _EmptyCanonicalResult()
+
+    app.dependency_overrides[get_async_session] = lambda: _Session()
+    _override_user_dependencies(app, is_superuser=True)
+
+    def _workflow(workflow_id: str, *, published: bool) -> SimpleNamespace:
+        progress: dict[str, object] = {
+            "total": 4,
+            "pending": 0,
+            "ready": 0,
+            "executing": 1,
+            "awaitingExternal": 0,
+            "reviewing": 0,
+            "completed": 3,
+            "failed": 0,
+            "skipped": 0,
+            "canceled": 0,
+            "currentStepTitle": "Publish",
+            "updatedAt": "2026-04-04T18:11:15+00:00",
+        }
+        if published:
+            progress["version"] = 7
+
+        async def _memo() -> dict[str, object]:
+            return {"title": "Live workflow", "progress": progress}
+
+        return SimpleNamespace(
+            id=workflow_id,
+            run_id=f"run-{workflow_id}",
+            namespace="default",
+            workflow_type="MoonMind.UserWorkflow",
+            status="RUNNING",
+            start_time=datetime(2026, 4, 4, 18, 0, tzinfo=UTC),
+            close_time=None,
+            execution_time=None,
+            search_attributes={
+                "mm_state": "executing",
+                "mm_owner_id": "system",
+                "mm_owner_type": "system",
+                "mm_entry": "run",
+            },
+            memo=_memo,
+        )
+
+    class _WorkflowIterator:
+        current_page = [
+            _workflow("mm:published", published=True),
+            _workflow("mm:legacy", published=False),
+        ]
+        next_page_token: bytes | None = None
+
+        async def fetch_next_page(self) -> None:
+            return None
+
+    queried: list[str] = []
+
+    class _QueryHandle:
+        def __init__(self, workflow_id: str) -> None:
+            self._workflow_id = workflow_id
+
+        async def query(self, name: str) -> dict[str, object]:
+            assert name == "get_progress"
+            queried.append(self._workflow_id)
+            return {
+                "total": 4,
+                "completed": 4,
+                "updatedAt": "2026-04-04T18:12:00Z",
+            }
+
+    temporal_client = SimpleNamespace(
+        count_workflows=AsyncMock(return_value=SimpleNamespace(count=2)),
+        list_workflows=Mock(return_value=_WorkflowIterator()),
+        get_workflow_handle=Mock(side_effect=_QueryHandle),
+    )
+    app.dependency_overrides[get_temporal_client] = lambda: temporal_client
+
+    with TestClient(app) as test_client:
+        response = test_client.get(
+            "/api/executions",
+            params={"source": "temporal", "ownerType": "system"},
+        )
+
+    assert response.status_code == 200
+    progress_by_id = {
+        item["workflowId"]: item["progress"] for item in response.json()["items"]
+    }
+    assert queried == ["mm:legacy"]
+    assert progress_by_id["mm:published"]["completed"] == 3
+    assert progress_by_id["mm:published"]["currentStepTitle"] == "Publish"
+    assert progress_by_id["mm:legacy"]["completed"] == 4
+
+
+def test_list_executions_source_temporal_counts_while_listing() -> None:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[_get_service] = lambda: AsyncMock()
+    app.dependency_overrides[get_async_session] = _empty_session_override
+    _override_user_dependencies(app, is_superuser=True)
+
+    count_started = asyncio.Event()
+    list_started = asyncio.Event()
+
+    class _WorkflowIterator:
+        current_page: list[object] = []
+        next_page_token: bytes | None = None
+
+        async def fetch_next_page(self) -> None:
+            list_started.set()
+            await asyncio.wait_for(count_started.wait(), timeout=1)
+
+    async def _count_workflows(*, query: str) -> SimpleNamespace:
+        count_started.set()
+        await asyncio.wait_for(list_started.wait(), timeout=1)
+        return SimpleNamespace(count=0)
+
+    temporal_client = SimpleNamespace(
+        count_workflows=AsyncMock(side_effect=_count_workflows),
+        list_workflows=Mock(return_value=_WorkflowIterator()),
+    )
+    app.dependency_overrides[get_temporal_client] = lambda: temporal_client
+
+    with TestClient(app) as test_client:
+        response = test_client.get("/api/executions", params={"source": "temporal"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 0
+    assert body["countMode"] == "exact"
+    assert body["degradedCount"] is False
+
+
 def test_list_executions_source_temporal_hydrates_live_progress_for_filters() -> None:
     app = FastAPI()
     app.include_router(router)
@@ -3666,6 +3815,12 @@ def test_execution_metrics_status_filter_limits_metric_buckets() -> None:
     )
     app.dependency_overrides[get_temporal_client] = lambda: temporal_client
 
+    group_by_support = TemporalVisibilityGroupBySupport()
+    group_by_support.mark_unsupported("ExecutionStatus")
+    app.dependency_overrides[get_temporal_visibility_group_by_support] = (
+        lambda: group_by_support
+    )
+
     with TestClient(app) as test_client:
         response = test_client.get(
             "/api/executions/metrics",
@@ -3721,6 +3876,12 @@ def test_execution_metrics_counts_workflows_concurrently() -> None:
     )
     app.dependency_overrides[get_temporal_client] = lambda: temporal_client
 
+    group_by_support = TemporalVisibilityGroupBySupport()
+    group_by_support.mark_unsupported("ExecutionStatus")
+    app.dependency_overrides[get_temporal_visibility_group_by_support] = (
+        lambda: group_by_support
+    )
+
     with TestClient(app) as test_client:
         response = test_client.get(
             "/api/executions/metrics",
@@ -3732,6 +3893,235 @@ def test_execution_metrics_counts_workflows_concurrently() -> None:
     assert max_active_calls > 1
 
 
+def _count_group(value: str | None, count: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        count=count,
+        group_values=[] if value is None else [value],
+    )
+
+
+def test_execution_metrics_use_one_grouped_execution_status_count() -> None:
+    app = FastAPI()
+    app.include_router(router)
+    mock_service = AsyncMock()
+    app.dependency_overrides[_get_service] = lambda: mock_service
+    app.dependency_overrides[get_async_session] = _empty_session_override
+    _override_user_dependencies(app, is_superuser=False)
+
+    class _WorkflowIterator:
+        current_page: list[object] = []
+
+        async def fetch_next_page(self) -> None:
+            return None
+
+    temporal_client = SimpleNamespace(
+        count_workflows=AsyncMock(
+            return_value=SimpleNamespace(
+                count=10,
+                groups=[
+                    _count_group("Running", 2),
+                    _count_group("Completed", 4),
+                    _count_group("Failed", 1),
+                    _count_group("TimedOut", 1),
+                    _count_group("Terminated", 1),
+                    _count_group("Canceled", 1),
+                ],
+            )
+        ),
+        list_workflows=Mock(return_value=_WorkflowIterator()),
+    )
+    app.dependency_overrides[get_temporal_client] = lambda: temporal_client
+
+    group_by_support = TemporalVisibilityGroupBySupport()
+    app.dependency_overrides[get_temporal_visibility_group_by_support] = (
+        lambda: group_by_support
+    )
+
+    with TestClient(app) as test_client:
+        response = test_client.get(
+            "/api/executions/metrics",
+            params={"source": "temporal"},
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["totalRuns"] == 10
+    assert body["completedRuns"] == 4
+    assert body["failedRuns"] == 3
+    assert body["canceledRuns"] == 1
+    assert body["terminalRuns"] == 8
+    temporal_client.count_workflows.assert_awaited_once()
+    query = temporal_client.count_workflows.await_args.kwargs["query"]
+    assert query.endswith(" GROUP BY ExecutionStatus")
+    assert 'WorkflowType="MoonMind.UserWorkflow"' in query
+
+
+def test_execution_metrics_fall_back_when_grouped_counts_are_rejected() -> None:
+    app = FastAPI()
+    app.include_router(router)
+    mock_service = AsyncMock()
+    app.dependency_overrides[_get_service] = lambda: mock_service
+    app.dependency_overrides[get_async_session] = _empty_session_override
+    _override_user_dependencies(app, is_superuser=False)
+
+    class _WorkflowIterator:
+        current_page: list[object] = []
+
+        async def fetch_next_page(self) -> None:
+            return None
+
+    async def _count_workflows(*, query: str) -> SimpleNamespace:
+        if "GROUP BY" in query:
+            raise RPCError("group by unsupported", RPCStatusCode.INVALID_ARGUMENT, b"")
+        return SimpleNamespace(count=2)
+
+    temporal_client = SimpleNamespace(
+        count_workflows=AsyncMock(side_effect=_count_workflows),
+        list_workflows=Mock(return_value=_WorkflowIterator()),
+    )
+    app.dependency_overrides[get_temporal_client] = lambda: temporal_client
+    group_by_support = TemporalVisibilityGroupBySupport()
+    app.dependency_overrides[get_temporal_visibility_group_by_support] = (
+        lambda: group_by_support
+    )
+
+    with TestClient(app) as test_client:
+        first = test_client.get("/api/executions/metrics", params={"source": "temporal"})
+        second = test_client.get("/api/executions/metrics", params={"source": "temporal"})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json()["completedRuns"] == 2
+    assert group_by_support.is_unsupported("ExecutionStatus")
+    # One rejected grouped probe, then four concurrent counts per request.
+    assert temporal_client.count_workflows.await_count == 9
+
+
+def test_execution_metrics_state_filter_counts_per_status() -> None:
+    app = FastAPI()
+    app.include_router(router)
+    mock_service = AsyncMock()
+    app.dependency_overrides[_get_service] = lambda: mock_service
+    app.dependency_overrides[get_async_session] = _empty_session_override
+    _override_user_dependencies(app, is_superuser=False)
+
+    class _WorkflowIterator:
+        current_page: list[object] = []
+
+        async def fetch_next_page(self) -> None:
+            return None
+
+    temporal_client = SimpleNamespace(
+        count_workflows=AsyncMock(return_value=SimpleNamespace(count=1)),
+        list_workflows=Mock(return_value=_WorkflowIterator()),
+    )
+    app.dependency_overrides[get_temporal_client] = lambda: temporal_client
+    group_by_support = TemporalVisibilityGroupBySupport()
+    app.dependency_overrides[get_temporal_visibility_group_by_support] = (
+        lambda: group_by_support
+    )
+
+    with TestClient(app) as test_client:
+        response = test_client.get(
+            "/api/executions/metrics",
+            params={"source": "temporal", "state": "no_commit"},
+        )
+
+    assert response.status_code == 200
+    queries = [
+        awaited.kwargs["query"]
+        for awaited in temporal_client.count_workflows.await_args_list
+    ]
+    assert queries
+    assert not any("GROUP BY" in query for query in queries)
+    assert not group_by_support.is_unsupported("ExecutionStatus")
+
+
+def test_execution_metrics_projection_source_reads_rollup(tmp_path: Path) -> None:
+    from api_service.db.models import Base, TemporalExecutionMetricsRollup
+
+    app = FastAPI()
+    app.include_router(router)
+    mock_user = _override_user_dependencies(app, is_superuser=False)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/rollup.db")
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def _seed() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            for state, runs, durations in (
+                ("executing", 3, 0),
+                ("completed", 4, 4),
+                ("failed", 2, 2),
+            ):
+                session.add(
+                    TemporalExecutionMetricsRollup(
+                        owner_type="user",
+                        owner_key=str(mock_user.id),
+                        workflow_type="MoonMind.UserWorkflow",
+                        state=state,
+                        run_count=runs,
+                        duration_count=durations,
+                        duration_total_seconds=60.0 * durations,
+                    )
+                )
+            session.add(
+                TemporalExecutionMetricsRollup(
+                    owner_type="user",
+                    owner_key="someone-else",
+                    workflow_type="MoonMind.UserWorkflow",
+                    state="completed",
+                    run_count=50,
+                )
+            )
+            await session.commit()
+
+    asyncio.run(_seed())
+
+    async def _session_override():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[_get_service] = lambda: AsyncMock()
+    app.dependency_overrides[get_async_session] = _session_override
+    temporal_client = SimpleNamespace(count_workflows=AsyncMock(), list_workflows=Mock())
+    app.dependency_overrides[get_temporal_client] = lambda: temporal_client
+
+    try:
+        with TestClient(app) as test_client:
+            response = test_client.get(
+                "/api/executions/metrics",
+                params={"source": "projection"},
+            )
+            rejected = test_client.get(
+                "/api/executions/metrics",
+                params={"source": "projection", "repo": "MoonLadderStudios/MoonMind"},
+            )
+            default = test_client.get(
+                "/api/executions/metrics",
+                params={"workflowType": "MoonMind.UserWorkflow"},
+            )
+    finally:
+        asyncio.run(engine.dispose())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["totalRuns"] == 9
+    assert body["completedRuns"] == 4
+    assert body["failedRuns"] == 2
+    assert body["terminalRuns"] == 6
+    assert body["duration"]["averageSeconds"] == 60.0
+    assert body["duration"]["observedCount"] == 6
+    assert rejected.status_code == 422
+    assert "repo" in rejected.json()["detail"]["message"]
+    # Without an explicit source, filters the rollup covers are served from it.
+    assert default.status_code == 200
+    assert default.json()["totalRuns"] == 9
+    temporal_client.count_workflows.assert_not_called()
+    temporal_client.list_workflows.assert_not_called()
+
+
 def test_execution_status_facet_counts_static_status_values_with_workflow_scope() -> None:
     app = FastAPI()
     app.include_router(router)
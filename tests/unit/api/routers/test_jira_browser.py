@@ -164,6 +164,18 @@ class _FakeJiraBrowserService:
             "image/png",
         )
 
+    def invalidate_cache(
+        self,
+        *,
+        project_key: str | None = None,
+        board_id: str | None = None,
+    ) -> int:
+        self.calls.append(
+            ("invalidate_cache", {"project_key": project_key, "board_id": board_id})
+        )
+        self._maybe_raise()
+        return 1
+
 @pytest.fixture
 def router_app() -> tuple[FastAPI, _FakeJiraBrowserService]:
     app = FastAPI()
@@ -214,6 +226,22 @@ async def test_project_boards_endpoint(router_app: tuple[FastAPI, _FakeJiraBrows
     assert response.json()["items"][0]["id"] == "42"
     assert service.calls == [("list_boards", "ENG")]
 
+async def test_cache_invalidate_endpoint(
+    router_app: tuple[FastAPI, _FakeJiraBrowserService],
+) -> None:
+    app, service = router_app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://testserver",
+    ) as client:
+        response = await client.post("/api/jira/cache/invalidate?boardId=42")
+
+    assert response.status_code == 204
+    assert service.calls == [
+        ("invalidate_cache", {"project_key": None, "board_id": "42"})
+    ]
+
 async def test_board_columns_endpoint(router_app: tuple[FastAPI, _FakeJiraBrowserService]) -> None:
     app, service = router_app
 
@@ -263,13 +263,56 @@ def test_root_route_renders_dashboard_shell(client: TestClient) -> None:
     response = client.get("/workflows", follow_redirects=False)
 
     assert response.status_code == 200
-    assert response.headers["Cache-Control"] == "no-store"
+    assert response.headers["Cache-Control"] == "private, no-cache"
     assert "moonmind-ui-boot" in response.text
     boot_payload = _extract_boot_payload(response.text)
     assert boot_payload["page"] == "dashboard"
     assert "dashboardConfig" not in json.dumps(boot_payload)
 
 
+def test_dashboard_shell_is_cached_per_build_and_revalidated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest_path = _write_dashboard_test_manifest(tmp_path)
+    monkeypatch.setenv("VITE_MANIFEST_PATH", str(manifest_path))
+    rendered: list[str] = []
+    original_ui_assets = workflow_console_router.ui_assets
+
+    def counting_ui_assets(entrypoint: str) -> str:
+        rendered.append(entrypoint)
+        return original_ui_assets(entrypoint)
+
+    monkeypatch.setattr(workflow_console_router, "ui_assets", counting_ui_assets)
+
+    with _client_with_mock_service(monkeypatch) as (client, _mock):
+        first = client.get("/workflows")
+        etag = first.headers["ETag"]
+        other_page = client.get("/skills")
+        revalidated = client.get("/workflows/new", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert other_page.text == first.text
+        assert other_page.headers["ETag"] == etag
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert rendered == ["dashboard"]
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest["entrypoints/dashboard.tsx"]["file"] = "assets/mountPage.js"
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+        stat_result = manifest_path.stat()
+        os.utime(
+            manifest_path,
+            ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000),
+        )
+        rebuilt = client.get("/workflows", headers={"If-None-Match": etag})
+
+    assert rebuilt.status_code == 200
+    assert rebuilt.headers["ETag"] != etag
+    assert "/static/workflow_console/dist/assets/mountPage.js" in rebuilt.text
+    assert rendered == ["dashboard", "dashboard"]
+
+
 def test_default_app_url_redirects_to_dashboard() -> None:
     response = TestClient(main_app).get("/", follow_redirects=False)
 
@@ -411,7 +454,7 @@ def test_dashboard_ui_info_endpoint_exposes_spa_boundary(client: TestClient) ->
     ):
         response = client.get(path)
         assert response.status_code == 200
-        assert response.headers["Cache-Control"] == "no-store"
+        assert response.headers["Cache-Control"] == "private, no-cache"
         assert "moonmind-ui-boot" in response.text
         assert 'type="module"' in response.text
         assert "/static/workflow_console/dist/assets/" in response.text
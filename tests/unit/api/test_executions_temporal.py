@@ -16,6 +16,7 @@ from starlette.routing import NoMatchFound
 import api_service.api.routers.executions as executions_module
 from api_service.auth_providers import get_current_user
 from api_service.db.base import get_async_session
+from moonmind.workflows.temporal.client import TemporalVisibilityGroupBySupport
 
 BANNED_EXECUTION_RESPONSE_KEYS = {
     "attempt",
@@ -274,6 +275,8 @@ def test_execution_metrics_source_temporal_returns_operational_aggregates(
         "api_service.api.routers.executions.TemporalClientAdapter"
     ) as mock_adapter_cls:
         mock_adapter = mock_adapter_cls.return_value
+        mock_adapter.visibility_group_by = TemporalVisibilityGroupBySupport()
+        mock_adapter.visibility_group_by.mark_unsupported("ExecutionStatus")
         mock_client = AsyncMock()
         mock_adapter.get_client = AsyncMock(return_value=mock_client)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from typing import Any
 
@@ -512,6 +513,95 @@ async def test_streamable_http_tools_list_uses_callable_tools(
     assert "jira.get_issue" in names
 
 
+async def test_list_tools_serves_cached_catalog_with_etag(
+    router_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = JiraToolRegistry(enabled_actions={"get_issue"})
+    monkeypatch.setattr(mcp_tools_router, "_jira_registry", registry)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=router_app),
+        base_url="http://testserver",
+    ) as client:
+        first = await client.get("/api/mcp/tools")
+        second = await client.get(
+            "/api/mcp/tools", headers={"If-None-Match": first.headers["etag"]}
+        )
+        listed = await client.post(
+            "/api/mcp",
+            headers=_mcp_headers(),
+            json={"jsonrpc": "2.0", "id": "tools", "method": "tools/list"},
+        )
+
+    assert first.status_code == 200
+    assert first.headers["etag"].startswith('"')
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.content == b""
+    assert "jira.get_issue" in {
+        tool["name"] for tool in listed.json()["result"]["tools"]
+    }
+    # Schemas are generated once per registry and reused across listings.
+    assert registry.list_tools()[0] is registry.list_tools()[0]
+
+
+async def test_streamable_http_batch_runs_calls_concurrently_in_order(
+    router_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    in_flight = {"session": 0, "other": 0}
+    peak = {"session": 0, "other": 0}
+    both_started = asyncio.Event()
+
+    async def dispatch_tool(payload: Any, user: Any, session: Any = None) -> str:
+        del user, session
+        kind = "session" if payload.tool.startswith("remediation.") else "other"
+        in_flight[kind] += 1
+        peak[kind] = max(peak[kind], in_flight[kind])
+        if kind == "other":
+            if peak["other"] == 2:
+                both_started.set()
+            # Both independent calls must be running for either to finish.
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+        else:
+            await asyncio.sleep(0)
+        in_flight[kind] -= 1
+        return payload.tool
+
+    monkeypatch.setattr(mcp_tools_router, "_dispatch_tool_call", dispatch_tool)
+    names = [
+        "jira.get_issue",
+        "remediation.read_target_logs",
+        "jules.get_task",
+        "remediation.read_target_artifact",
+    ]
+
+    async with AsyncClient(
+        transport=ASGITransport(app=router_app),
+        base_url="http://testserver",
+    ) as client:
+        response = await client.post(
+            "/api/mcp",
+            headers=_mcp_headers(),
+            json=[
+                {
+                    "jsonrpc": "2.0",
+                    "id": index,
+                    "method": "tools/call",
+                    "params": {"name": name, "arguments": {}},
+                }
+                for index, name in enumerate(names)
+            ],
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body] == [0, 1, 2, 3]
+    assert [item["result"]["structuredContent"] for item in body] == names
+    assert peak == {"session": 1, "other": 2}
+
+
 async def test_streamable_http_tools_call_dispatches_to_trusted_tool(
     router_app: FastAPI,
     monkeypatch: pytest.MonkeyPatch,
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import importlib
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from api_service.core.execution_metrics import (
+    ExecutionMetricsContribution,
+    apply_execution_metrics_delta,
+    load_execution_metrics_rollup,
+    rebuild_execution_metrics_rollup,
+    reconcile_execution_metrics_rollup,
+)
+from api_service.db.models import (
+    Base,
+    MoonMindWorkflowState,
+    TemporalExecutionMetricsRollup,
+    TemporalExecutionOwnerType,
+    TemporalExecutionRecord,
+    TemporalWorkflowType,
+)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/rollup.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+def _record(
+    workflow_id: str,
+    *,
+    state: MoonMindWorkflowState,
+    minutes: int | None = None,
+    cost: float | None = None,
+) -> TemporalExecutionRecord:
+    started_at = datetime(2026, 10, 1, 12, 0, tzinfo=UTC)
+    return TemporalExecutionRecord(
+        workflow_id=workflow_id,
+        run_id=f"{workflow_id}-run",
+        namespace="moonmind",
+        workflow_type=TemporalWorkflowType.USER_WORKFLOW,
+        owner_id="owner-1",
+        owner_type=TemporalExecutionOwnerType.USER,
+        state=state,
+        entry="run",
+        search_attributes={},
+        memo={} if cost is None else {"costEstimateUsd": cost},
+        artifact_refs=[],
+        parameters={},
+        started_at=started_at,
+        created_at=started_at,
+        updated_at=started_at,
+        closed_at=(
+            None if minutes is None else started_at + timedelta(minutes=minutes)
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_delta_moves_execution_between_state_buckets(session_factory):
+    running = ExecutionMetricsContribution.from_record(
+        _record("mm:one", state=MoonMindWorkflowState.EXECUTING)
+    )
+    completed = ExecutionMetricsContribution.from_record(
+        _record("mm:one", state=MoonMindWorkflowState.COMPLETED, minutes=2, cost=0.5)
+    )
+
+    async with session_factory() as session:
+        await apply_execution_metrics_delta(session, None, running)
+        await apply_execution_metrics_delta(session, running, running)
+        await apply_execution_metrics_delta(session, running, completed)
+        await session.commit()
+
+        totals = await load_execution_metrics_rollup(
+            session,
+            owner_type="user",
+            owner_id="owner-1",
+        )
+
+    assert totals.runs_by_state == {"executing": 0, "completed": 1}
+    assert totals.total_runs == 1
+    assert totals.terminal_duration_count == 1
+    assert totals.terminal_duration_total_seconds == 120.0
+    assert totals.cost_count == 1
+    assert totals.cost_total_usd == 0.5
+
+
+@pytest.mark.asyncio
+async def test_metrics_rollup_rebuild_matches_projection(session_factory):
+    async with session_factory() as session:
+        session.add_all(
+            [
+                _record("mm:a", state=MoonMindWorkflowState.COMPLETED, minutes=1),
+                _record("mm:b", state=MoonMindWorkflowState.COMPLETED, minutes=3),
+                _record("mm:c", state=MoonMindWorkflowState.FAILED, minutes=2),
+                _record("mm:d", state=MoonMindWorkflowState.EXECUTING),
+            ]
+        )
+        session.add(
+            TemporalExecutionMetricsRollup(
+                owner_type="user",
+                owner_key="owner-1",
+                workflow_type="MoonMind.UserWorkflow",
+                state="completed",
+                run_count=-7,
+            )
+        )
+        await session.commit()
+
+        scanned = await rebuild_execution_metrics_rollup(session, batch_size=2)
+        await session.commit()
+
+        rows = (await session.scalars(select(TemporalExecutionMetricsRollup))).all()
+        totals = await load_execution_metrics_rollup(session, owner_id="owner-1")
+
+    assert scanned == 4
+    assert {row.state: row.run_count for row in rows} == {
+        "completed": 2,
+        "failed": 1,
+        "executing": 1,
+    }
+    assert totals.terminal_duration_count == 3
+    assert totals.terminal_duration_total_seconds == 360.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_rollup_reconcile_seeds_costs_and_skips_when_in_sync(
+    session_factory,
+):
+    async with session_factory() as session:
+        session.add_all(
+            [
+                _record(
+                    "mm:a",
+                    state=MoonMindWorkflowState.COMPLETED,
+                    minutes=1,
+                    cost=0.25,
+                ),
+                _record("mm:b", state=MoonMindWorkflowState.FAILED, minutes=2),
+            ]
+        )
+        await session.commit()
+
+        assert await reconcile_execution_metrics_rollup(session) == 2
+        await session.commit()
+        assert await reconcile_execution_metrics_rollup(session) is None
+
+        totals = await load_execution_metrics_rollup(session, owner_id="owner-1")
+
+    assert totals.runs_by_state == {"completed": 1, "failed": 1}
+    assert totals.cost_count == 1
+    assert totals.cost_total_usd == 0.25
+
+
+@pytest.mark.asyncio
+async def test_metrics_rollup_reconcile_repairs_drift_between_state_buckets(
+    session_factory,
+):
+    async with session_factory() as session:
+        session.add_all(
+            [
+                _record("mm:a", state=MoonMindWorkflowState.COMPLETED, minutes=1),
+                _record("mm:b", state=MoonMindWorkflowState.FAILED, minutes=2),
+            ]
+        )
+        await session.commit()
+        assert await reconcile_execution_metrics_rollup(session) == 2
+        await session.commit()
+
+        # A state change applied without its delta keeps the total run count.
+        failed = await session.get(
+            TemporalExecutionMetricsRollup,
+            ("user", "owner-1", "MoonMind.UserWorkflow", "failed"),
+        )
+        await session.delete(failed)
+        completed = await session.get(
+            TemporalExecutionMetricsRollup,
+            ("user", "owner-1", "MoonMind.UserWorkflow", "completed"),
+        )
+        completed.run_count += 1
+        await session.commit()
+
+        assert await reconcile_execution_metrics_rollup(session) == 2
+        await session.commit()
+        totals = await load_execution_metrics_rollup(session, owner_id="owner-1")
+
+    assert totals.runs_by_state == {"completed": 1, "failed": 1}
+
+
+@pytest.mark.parametrize("dialect", ["sqlite", "postgresql"])
+def test_execution_metric_rollups_migration_leaves_seeding_to_startup(
+    monkeypatch: pytest.MonkeyPatch,
+    dialect: str,
+) -> None:
+    migration = importlib.import_module(
+        "api_service.migrations.versions.362_execution_metric_rollups"
+    )
+    operations = MagicMock()
+    operations.get_bind.return_value.dialect.name = dialect
+    monkeypatch.setattr(migration, "op", operations)
+
+    migration.upgrade()
+
+    operations.create_table.assert_called_once()
+    assert operations.create_table.call_args.args[0] == (
+        "temporal_execution_metric_rollups"
+    )
+    operations.execute.assert_not_called()
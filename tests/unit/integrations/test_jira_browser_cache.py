@@ -0,0 +1,245 @@
+"""Unit tests for the Jira browser metadata cache."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from moonmind.config.settings import AtlassianSettings, FeatureFlagsSettings, JiraSettings
+from moonmind.integrations.jira.browser import JiraBrowserService
+from moonmind.integrations.jira.cache import JiraBrowserCache
+
+pytestmark = [pytest.mark.asyncio]
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class _FakeJiraTransport:
+    """In-process Jira that answers by path and counts upstream requests."""
+
+    def __init__(self, *, issue_count: int = 3) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.board_name = "Delivery"
+        self.issues = [
+            {
+                "key": f"ENG-{index}",
+                "fields": {
+                    "summary": f"Issue {index}",
+                    "status": {"id": "1", "name": "Open"},
+                    "project": {"key": "ENG"},
+                    "updated": f"2026-10-0{index}T10:00:00.000+0000",
+                },
+            }
+            for index in range(1, issue_count + 1)
+        ]
+
+    async def request(self, *, path: str, params: dict[str, Any] | None) -> Any:
+        self.calls.append({"path": path, "params": params})
+        await asyncio.sleep(0)
+        if path == "agile:/board/42":
+            return {
+                "id": 42,
+                "name": self.board_name,
+                "location": {"projectKey": "ENG"},
+            }
+        if path == "agile:/board/42/configuration":
+            return {
+                "columnConfig": {
+                    "columns": [
+                        {"name": "To Do", "statuses": [{"id": "1", "name": "Open"}]}
+                    ]
+                }
+            }
+        if path == "agile:/board/42/issue":
+            params = params or {}
+            ordered = sorted(
+                self.issues,
+                key=lambda item: item["fields"]["updated"],
+                reverse=True,
+            )
+            limit = int(params.get("maxResults") or 50)
+            start = int(params.get("startAt") or 0)
+            return {"total": len(self.issues), "issues": ordered[start : start + limit]}
+        return {}
+
+    def paths(self) -> list[str]:
+        return [call["path"] for call in self.calls]
+
+class _FakeTransportJiraBrowserService(JiraBrowserService):
+    def __init__(self, transport: _FakeJiraTransport, **kwargs: Any) -> None:
+        super().__init__(
+            atlassian_settings=AtlassianSettings(
+                atlassian_auth_mode="basic",
+                atlassian_site_url="https://example.atlassian.net",
+                atlassian_email="bot@example.com",
+                jira=JiraSettings(jira_allowed_projects="ENG"),
+            ),
+            feature_flags=FeatureFlagsSettings(jira_create_page_enabled=True),
+            **kwargs,
+        )
+        self.transport = transport
+
+    @asynccontextmanager
+    async def _jira_client(self) -> Any:
+        yield object()
+
+    async def _request_json(self, *, path: str, params: Any = None, **_: Any) -> Any:
+        return await self.transport.request(path=path, params=params)
+
+    async def _request_json_with_client(
+        self,
+        client: object,
+        *,
+        path: str,
+        params: Any = None,
+        **_: Any,
+    ) -> Any:
+        return await self.transport.request(path=path, params=params)
+
+async def test_cache_serves_fresh_entries_without_reloading() -> None:
+    clock = _Clock()
+    cache = JiraBrowserCache(clock=clock)
+    loads: list[int] = []
+
+    async def _load() -> int:
+        loads.append(1)
+        return len(loads)
+
+    assert await cache.get_or_load(("c", "k"), load=_load, ttl_seconds=10) == 1
+    clock.now += 5
+    assert await cache.get_or_load(("c", "k"), load=_load, ttl_seconds=10) == 1
+    assert loads == [1]
+    assert cache.stats.hits == 1
+
+async def test_cache_returns_stale_value_and_refreshes_in_background() -> None:
+    clock = _Clock()
+    cache = JiraBrowserCache(clock=clock)
+    values = iter(["v1", "v2"])
+
+    async def _load() -> str:
+        return next(values)
+
+    await cache.get_or_load(("c", "k"), load=_load, ttl_seconds=10, stale_seconds=60)
+    clock.now += 30
+
+    stale = await cache.get_or_load(
+        ("c", "k"), load=_load, ttl_seconds=10, stale_seconds=60
+    )
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert stale == "v1"
+    assert cache.stats.stale_hits == 1
+    assert cache.peek(("c", "k")).value == "v2"
+
+async def test_cache_coalesces_concurrent_identical_loads() -> None:
+    cache = JiraBrowserCache()
+    release = asyncio.Event()
+    loads: list[int] = []
+
+    async def _load() -> str:
+        loads.append(1)
+        await release.wait()
+        return "payload"
+
+    tasks = [
+        asyncio.create_task(cache.get_or_load(("c", "k"), load=_load, ttl_seconds=10))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["payload"] * 5
+    assert loads == [1]
+    assert cache.stats.coalesced == 4
+
+async def test_cache_invalidation_discards_inflight_results() -> None:
+    cache = JiraBrowserCache()
+    release = asyncio.Event()
+
+    async def _load() -> str:
+        await release.wait()
+        return "before-invalidation"
+
+    task = asyncio.create_task(cache.get_or_load(("c", "k"), load=_load, ttl_seconds=10))
+    await asyncio.sleep(0)
+    cache.invalidate()
+    release.set()
+
+    assert await task == "before-invalidation"
+    assert cache.peek(("c", "k")) is None
+
+async def test_browser_service_reuses_board_metadata_across_requests() -> None:
+    transport = _FakeJiraTransport()
+    cache = JiraBrowserCache()
+
+    for _ in range(3):
+        service = _FakeTransportJiraBrowserService(transport, cache=cache)
+        result = await service.list_columns("42")
+        assert [column.id for column in result.columns] == ["to-do"]
+
+    assert transport.paths() == [
+        "agile:/board/42",
+        "agile:/board/42/configuration",
+    ]
+
+async def test_browser_service_without_cache_fetches_every_time() -> None:
+    transport = _FakeJiraTransport()
+    service = _FakeTransportJiraBrowserService(transport)
+
+    await service.list_columns("42")
+    await service.list_columns("42")
+
+    assert len(transport.calls) == 4
+
+async def test_browser_service_revalidates_issue_listing_with_watermark_probe() -> None:
+    clock = _Clock()
+    transport = _FakeJiraTransport(issue_count=3)
+    cache = JiraBrowserCache(clock=clock)
+    service = _FakeTransportJiraBrowserService(transport, cache=cache)
+
+    first = await service.list_issues("42")
+    transport.calls.clear()
+    await service.list_issues("42", q="issue 2")
+    assert transport.calls == []
+
+    clock.now += 60
+    unchanged = await service.list_issues("42")
+    probe_params = [call["params"] for call in transport.calls]
+    assert probe_params[-1]["maxResults"] == 1
+    assert probe_params[-1]["jql"].endswith("ORDER BY updated DESC")
+    assert unchanged.items_by_column == first.items_by_column
+
+    transport.calls.clear()
+    clock.now += 60
+    transport.issues[0]["fields"]["updated"] = "2026-10-09T10:00:00.000+0000"
+    transport.issues[0]["fields"]["summary"] = "Renamed"
+    changed = await service.list_issues("42")
+
+    issue_calls = [
+        call for call in transport.calls if call["path"] == "agile:/board/42/issue"
+    ]
+    assert len(issue_calls) == 2
+    summaries = {item.summary for item in changed.items_by_column["to-do"]}
+    assert "Renamed" in summaries
+
+async def test_browser_service_invalidation_is_scoped_to_board() -> None:
+    transport = _FakeJiraTransport()
+    cache = JiraBrowserCache()
+    service = _FakeTransportJiraBrowserService(transport, cache=cache)
+
+    await service.list_columns("42")
+    transport.board_name = "Renamed board"
+
+    assert service.invalidate_cache(board_id="99") == 0
+    assert (await service.list_columns("42")).board.name == "Delivery"
+
+    assert service.invalidate_cache(board_id="42") == 2
+    assert (await service.list_columns("42")).board.name == "Renamed board"
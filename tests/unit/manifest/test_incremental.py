@@ -43,10 +43,12 @@ def test_changeset_detects_changed_and_deleted_documents() -> None:
 
     assert [doc.document_id for doc in second.changed_documents] == ["a.txt"]
     assert second.deleted_document_ids == ["b.txt"]
-    assert second.stale_point_ids == [
-        *first.next_snapshot.document_chunks["a.txt"],
-        *first.next_snapshot.document_chunks["b.txt"],
-    ]
+    assert second.stale_point_ids == sorted(
+        [
+            *first.next_snapshot.document_chunks["a.txt"],
+            *first.next_snapshot.document_chunks["b.txt"],
+        ]
+    )
     assert len(second.chunks) == 1
     assert second.next_snapshot.documents.keys() == {"a.txt"}
 
@@ -172,3 +174,108 @@ def test_qdrant_writer_batches_upserts() -> None:
     assert len(qdrant.upserts) > 1
     assert all(len(upsert["ids"]) <= 2 for upsert in qdrant.upserts)
     assert len(embedder.texts) == len(changeset.chunks)
+
+
+def test_changed_document_only_embeds_new_chunks() -> None:
+    splitter = SplitterConfig(chunkSize=16, chunkOverlap=0)
+    paragraphs = [f"paragraph {index:02d}\n" for index in range(8)]
+    first = build_changeset(
+        source_id="local",
+        cursor={"run": 1},
+        documents=source_documents(
+            source_id="local",
+            raw_documents=[("".join(paragraphs), {"file_path": "a.txt"})],
+        ),
+        previous=None,
+        splitter=splitter,
+    )
+
+    edited = [*paragraphs]
+    edited[2] = "paragraph two, now longer\n"
+    second = build_changeset(
+        source_id="local",
+        cursor={"run": 2},
+        documents=source_documents(
+            source_id="local",
+            raw_documents=[("".join(edited), {"file_path": "a.txt"})],
+        ),
+        previous=first.next_snapshot,
+        splitter=splitter,
+    )
+
+    assert [chunk.text for chunk in second.chunks] == [
+        "paragraph two, n",
+        "ow longer\n",
+    ]
+    assert len(second.stale_point_ids) == 1
+    assert second.reused_chunk_count == 7
+    assert [chunk.text for chunk in second.relocated_chunks] == [
+        f"paragraph {index:02d}\n" for index in range(3, 8)
+    ]
+    assert second.relocated_chunks[0].offset_start == 52
+    assert second.next_snapshot.document_chunk_spans["a.txt"][0][1:] == (0, 13)
+
+
+def test_snapshot_without_chunk_spans_treats_all_chunks_as_stale() -> None:
+    splitter = SplitterConfig(chunkSize=16, chunkOverlap=0)
+    documents = source_documents(
+        source_id="local",
+        raw_documents=[("first line\nsecond line\n", {"file_path": "a.txt"})],
+    )
+    first = build_changeset(
+        source_id="local",
+        cursor={"run": 1},
+        documents=documents,
+        previous=None,
+        splitter=splitter,
+    )
+    legacy = first.next_snapshot
+    legacy.document_chunk_spans = {}
+    legacy.documents = {"a.txt": "sha256:legacy"}
+
+    second = build_changeset(
+        source_id="local",
+        cursor={"run": 2},
+        documents=documents,
+        previous=legacy,
+        splitter=splitter,
+    )
+
+    assert second.stale_point_ids == sorted(legacy.document_chunks["a.txt"])
+    assert len(second.chunks) == len(first.chunks)
+    assert second.relocated_chunks == []
+
+
+class _PayloadQdrant:
+    def __init__(self) -> None:
+        self.overwrites: list[dict[str, object]] = []
+
+    def overwrite_payloads(self, **kwargs: object) -> None:
+        self.overwrites.append(kwargs)
+
+
+def test_qdrant_writer_rewrites_relocated_payloads_without_embedding() -> None:
+    documents = source_documents(
+        source_id="local",
+        raw_documents=[("alpha\nbeta\n", {"file_path": "a.txt"})],
+    )
+    changeset = build_changeset(
+        source_id="local",
+        cursor={"run": 1},
+        documents=documents,
+        previous=None,
+        splitter=SplitterConfig(chunkSize=6, chunkOverlap=0),
+    )
+    qdrant = _PayloadQdrant()
+    embedder = _RecordingEmbedder()
+    writer = QdrantIncrementalIndexWriter(
+        qdrant=qdrant,
+        embedder=embedder,
+        collection_name="docs",
+    )
+
+    writer.update_chunk_payloads(changeset.chunks)
+
+    assert embedder.texts == []
+    assert qdrant.overwrites[0]["ids"] == [chunk.point_id for chunk in changeset.chunks]
+    assert qdrant.overwrites[0]["payloads"][1]["offset_start"] == 6
@@ -1,6 +1,11 @@
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
 from moonmind.config.settings import MemorySettings
+from moonmind.memory import services as memory_services
 from moonmind.memory.models import (
     ContextPackBudget,
     FixPattern,
@@ -211,6 +216,189 @@ def test_retrieval_gateway_enforces_token_budget_and_records_skipped_items():
     assert pack.skipped
 
 
+def test_task_history_search_reads_scope_by_kind_and_recency():
+    provenance = MemoryProvenance(workflow_id="wf-mm-761")
+    service = TaskHistoryService()
+    started = datetime(2026, 10, 1, tzinfo=UTC)
+    store = InMemoryTaskHistoryStore()
+    for index, (repo, kind) in enumerate(
+        [
+            ("moonmind/repo", "workflow"),
+            ("moonmind/repo", "agent_job"),
+            ("moonmind/other", "workflow"),
+            ("moonmind/repo", "workflow"),
+        ]
+    ):
+        digest = service.build_run_digest(
+            namespace_id="default",
+            repo=repo,
+            run_ref=RunRef(kind=kind, id=f"run-{index}"),
+            intent=f"flaky deploy step {index}",
+            outcome="succeeded",
+            provenance=provenance,
+        )
+        digest.created_at = started + timedelta(minutes=index)
+        store.upsert_digest(digest)
+    replacement = service.build_run_digest(
+        namespace_id="default",
+        repo="moonmind/repo",
+        run_ref=RunRef(kind="workflow", id="run-0"),
+        intent="flaky deploy step 0 retried",
+        outcome="succeeded",
+        provenance=provenance,
+    )
+    store.upsert_digest(replacement)
+
+    workflows = store.search(
+        "deploy",
+        namespace_id="default",
+        repo="moonmind/repo",
+        run_kind="workflow",
+    )
+    all_runs = store.search("deploy", namespace_id="default", repo="moonmind/repo")
+    truncated = store.search(
+        "deploy",
+        namespace_id="default",
+        repo="moonmind/repo",
+        max_tokens=max(candidate.token_cost for candidate in all_runs) - 1,
+    )
+
+    assert [candidate.metadata["run_ref.id"] for candidate in workflows] == [
+        "run-0",
+        "run-3",
+    ]
+    assert "retried" in workflows[0].text
+    assert len(store.digests) == 4
+    assert truncated == [
+        candidate
+        for candidate in all_runs
+        if candidate.token_cost < max(item.token_cost for item in all_runs)
+    ]
+
+
+def test_retrieval_gateway_collects_planes_concurrently_with_plane_timeouts():
+    provenance = MemoryProvenance(workflow_id="wf-mm-761")
+    release = threading.Event()
+
+    class StalledPlanning:
+        def prefetch(self, planning_ref):
+            release.wait(5)
+            return [planning_candidate("late planning", source_ref=planning_ref)]
+
+    class SlowLongTerm:
+        def search(self, query, *, namespace_id, repo):
+            time.sleep(0.2)
+            return [
+                LongTermMemory(
+                    namespace_id=namespace_id,
+                    repo=repo,
+                    text="Prefer workflow-boundary tests.",
+                    provenance=provenance,
+                )
+            ]
+
+    class SlowHistory(InMemoryTaskHistoryStore):
+        def search(self, query, **kwargs):
+            time.sleep(0.2)
+            return super().search(query, **kwargs)
+
+    history = SlowHistory()
+    history.upsert_digest(
+        TaskHistoryService().build_run_digest(
+            namespace_id="default",
+            repo="moonmind/repo",
+            run_ref=RunRef(id="wf-1"),
+            intent="fix Temporal timeout",
+            outcome="succeeded",
+            provenance=provenance,
+        )
+    )
+    gateway = RetrievalGateway(
+        settings=MemorySettings(
+            planning="beads",
+            history="digest",
+            long_term="mem0",
+            plane_timeout_ms=350,
+        ),
+        planning=StalledPlanning(),
+        history=history,
+        long_term=SlowLongTerm(),
+    )
+
+    started = time.perf_counter()
+    try:
+        pack = gateway.retrieve_context_pack(
+            "Temporal timeout",
+            namespace_id="default",
+            repo="moonmind/repo",
+            planning_ref="beads:MM-761",
+        )
+    finally:
+        release.set()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.55
+    assert pack.degraded_components == ["planning"]
+    assert [candidate.source for candidate in pack.included] == [
+        "history",
+        "long_term",
+    ]
+
+
+def test_plane_truncation_preserves_first_fit_packing():
+    candidates = [
+        planning_candidate(name, source_ref=f"beads:{name}", token_cost=cost)
+        for name, cost in (("big", 200), ("a", 5), ("b", 5))
+    ]
+    budget = ContextPackBudget(max_tokens=100)
+
+    pack = memory_services._pack(
+        "q",
+        memory_services._truncate_to_budget(candidates, budget.usable_tokens),
+        budget,
+        [],
+    )
+
+    assert [candidate.text for candidate in pack.included] == ["a", "b"]
+
+
+def test_retrieval_gateway_skips_planes_while_workers_are_saturated(monkeypatch):
+    release = threading.Event()
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(memory_services, "_plane_slots", slots)
+
+    class StalledPlanning:
+        def prefetch(self, planning_ref):
+            release.wait(5)
+            return []
+
+    gateway = RetrievalGateway(
+        settings=MemorySettings(planning="beads", plane_timeout_ms=50),
+        planning=StalledPlanning(),
+    )
+    try:
+        first = gateway.retrieve_context_pack(
+            "q", namespace_id="default", repo="moonmind/repo"
+        )
+        started = time.perf_counter()
+        second = gateway.retrieve_context_pack(
+            "q", namespace_id="default", repo="moonmind/repo"
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        release.set()
+
+    assert first.degraded_components == ["planning"]
+    assert second.degraded_components == ["planning"]
+    assert elapsed < 0.04
+    for _ in range(100):
+        if slots.acquire(blocking=False):
+            break
+        time.sleep(0.01)
+    else:
+        pytest.fail("plane slot was not released after the call finished")
+
+
 def test_memory_feature_flags_disable_or_fail_open_components():
     class BrokenPlanning:
         def prefetch(self, planning_ref):
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import random
+import time
+
 import pytest
 
+from moonmind.memory import procedural
 from moonmind.memory.procedural import (
     EvidenceRun,
     ErrorSignature,
@@ -158,6 +162,96 @@ def test_store_merges_evidence_for_existing_signature(tmp_path) -> None:
     ]
 
 
+def test_store_appends_upserts_and_compacts_superseded_records(tmp_path) -> None:
+    signature = extract_error_signature("ValueError: invalid status from provider 1234")
+    assert signature is not None
+    path = tmp_path / "fix-patterns.jsonl"
+    store = FileFixPatternStore(path, compaction_min_records=4)
+    reader = FileFixPatternStore(path)
+
+    for index in range(3):
+        store.upsert(
+            FixPattern.from_successful_run(
+                signature=signature,
+                summary="Normalize unknown provider status values.",
+                steps=[f"Step {index}."],
+                evidence=EvidenceRun(workflowId=f"workflow-{index}", outcome="succeeded"),
+            )
+        )
+    appended_lines = path.read_text(encoding="utf-8").splitlines()
+    assert reader.find_matches(signature)[0].success_count == 3
+
+    store.upsert(
+        FixPattern.from_successful_run(
+            signature=signature,
+            summary="Normalize unknown provider status values.",
+            steps=["Step 3."],
+            evidence=EvidenceRun(workflowId="workflow-3", outcome="succeeded"),
+        )
+    )
+
+    assert len(appended_lines) == 3
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+    assert [pattern.success_count for pattern in reader.list_patterns()] == [4]
+    assert FileFixPatternStore(path).find_matches(signature)[0].steps[0] == "Step 3."
+
+
+@pytest.mark.slow
+def test_find_matches_scores_few_candidates_in_large_corpus(
+    tmp_path, monkeypatch
+) -> None:
+    rng = random.Random(763)
+    vocabulary = [f"term{index}" for index in range(5000)]
+    texts = [" ".join(rng.sample(vocabulary, 10)) for _ in range(100_000)]
+    path = tmp_path / "fix-patterns.jsonl"
+    path.write_text(
+        "".join(
+            FixPattern(
+                patternRef=f"fix-pattern://bench-{index}",
+                signature=ErrorSignature(
+                    signatureId=f"error-signature://bench-{index}",
+                    normalizedText=f"runtimeerror: {text}",
+                ),
+                summary="Synthetic benchmark pattern.",
+            ).model_dump_json(by_alias=True, exclude_none=True)
+            + "\n"
+            for index, text in enumerate(texts)
+        ),
+        encoding="utf-8",
+    )
+    store = FileFixPatternStore(path)
+    patterns = store.list_patterns()
+    target = texts[4242].split()
+    query = " ".join(["runtimeerror:", *target[:-1], "unseen"])
+
+    started = time.perf_counter()
+    linear = [
+        pattern
+        for pattern in patterns
+        if procedural._token_overlap(query, pattern.signature.normalized_text) >= 0.6
+    ]
+    linear_seconds = time.perf_counter() - started
+
+    scored: list[str] = []
+    overlap = procedural._token_overlap
+
+    def _counting_overlap(left: str, right: str) -> float:
+        scored.append(right)
+        return overlap(left, right)
+
+    monkeypatch.setattr(procedural, "_token_overlap", _counting_overlap)
+    started = time.perf_counter()
+    matches = store.find_matches(query, limit=3)
+    indexed_seconds = time.perf_counter() - started
+
+    assert [match.pattern_ref for match in matches] == [
+        pattern.pattern_ref for pattern in linear
+    ]
+    assert matches[0].pattern_ref == "fix-pattern://bench-4242"
+    assert len(scored) < len(patterns) // 20
+    assert indexed_seconds * 10 < linear_seconds
+
+
 def test_fix_patterns_project_to_memory_proposals() -> None:
     signature = extract_error_signature("RuntimeError: docker socket unavailable")
     assert signature is not None
@@ -2,9 +2,11 @@ import json
 import threading
 from types import SimpleNamespace
 
+from qdrant_client import QdrantClient
 from qdrant_client.http import models as qmodels
 
-from moonmind.rag.qdrant_client import RagQdrantClient
+from moonmind.rag import qdrant_client as qdrant_module
+from moonmind.rag.qdrant_client import RagQdrantClient, _SearchResultCache
 
 def _point(
     *,
@@ -38,6 +40,9 @@ def _client() -> RagQdrantClient:
     client.overlay_chunk_overlap = 120
     client._embedding_dimensions = None  # type: ignore[attr-defined]
     client._client = None  # type: ignore[attr-defined]
+    client._search_cache = _SearchResultCache(max_entries=0, ttl_seconds=0)  # type: ignore[attr-defined]
+    client._collection_versions = {}  # type: ignore[attr-defined]
+    client._versions_lock = threading.Lock()  # type: ignore[attr-defined]
     return client
 
 def test_search_caps_results_to_top_k_after_overlay_merge():
@@ -162,7 +167,7 @@ def test_search_uses_query_points_when_search_api_is_unavailable():
         trust_overrides=None,
     )
 
-    assert calls == ["repo-main", "repo-main__overlay__run"]
+    assert sorted(calls) == ["repo-main", "repo-main__overlay__run"]
     assert [item.source for item in result.items] == [
         "src/overlay_a.py",
         "src/canon_a.py",
@@ -594,3 +599,128 @@ def test_canonical_vectors_use_supplied_ids_and_delete_by_point_ids():
         ("upsert", "repo-main", ["point-a"], [[0.1, 0.2]]),
         ("delete", "repo-main", ["point-old"]),
     ]
+
+
+class _CountingQdrant:
+    """Delegate to an in-memory Qdrant while recording query calls."""
+
+    def __init__(self) -> None:
+        self._inner = QdrantClient(":memory:")
+        self.query_calls: list[str] = []
+
+    def query_points(self, **kwargs):
+        self.query_calls.append(kwargs["collection_name"])
+        return self._inner.query_points(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+def _local_client(**kwargs) -> tuple[RagQdrantClient, _CountingQdrant]:
+    client = RagQdrantClient(
+        host="localhost",
+        port=6333,
+        url=None,
+        api_key=None,
+        collection="docs",
+        overlay_mode="collection",
+        overlay_ttl_hours=24,
+        overlay_chunk_chars=1200,
+        overlay_chunk_overlap=120,
+        embedding_dimensions=2,
+        **kwargs,
+    )
+    qdrant = _CountingQdrant()
+    client._client = qdrant  # type: ignore[assignment]
+    for name in ("docs", "specs", "overlay"):
+        client._create_collection(collection_name=name, vector_size=2)
+    client.upsert_canonical_vectors(
+        collection_name="docs",
+        ids=["00000000-0000-0000-0000-000000000001"],
+        vectors=[[1.0, 0.0]],
+        payloads=[{"path": "docs/a.md", "text": "alpha", "repo": "moonmind"}],
+    )
+    client.upsert_canonical_vectors(
+        collection_name="specs",
+        ids=["00000000-0000-0000-0000-000000000002"],
+        vectors=[[0.0, 1.0]],
+        payloads=[{"path": "specs/b.md", "text": "bravo", "repo": "moonmind"}],
+    )
+    client.upsert_overlay_vectors(
+        collection_name="overlay",
+        vectors=[[0.9, 0.1]],
+        payloads=[{"path": "work/c.py", "text": "charlie", "repo": "moonmind"}],
+    )
+    return client, qdrant
+
+
+def _local_search(client: RagQdrantClient, **overrides):
+    options = {
+        "query_vector": [1.0, 0.0],
+        "filters": {"repo": "moonmind"},
+        "top_k": 5,
+        "collections": ("docs", "specs"),
+        "overlay_policy": "include",
+        "overlay_collection": "overlay",
+    }
+    options.update(overrides)
+    return client.search(**options)
+
+
+def test_search_queries_canonical_and_overlay_on_shared_executor():
+    client, qdrant = _local_client()
+
+    result = _local_search(client)
+
+    assert [item.source for item in result.items] == [
+        "docs/a.md",
+        "work/c.py",
+        "specs/b.md",
+    ]
+    assert result.items[1].trust_class == "workspace_overlay"
+    assert sorted(qdrant.query_calls) == ["docs", "overlay", "specs"]
+    assert qdrant_module._shared_search_executor() is (
+        qdrant_module._shared_search_executor()
+    )
+
+
+def test_repeated_search_is_cached_until_collection_is_written():
+    client, qdrant = _local_client()
+
+    first = _local_search(client)
+    first.items[0].payload["text"] = "mutated by caller"
+    second = _local_search(client)
+
+    assert len(qdrant.query_calls) == 3
+    assert second.items[0].payload["text"] == "alpha"
+
+    _local_search(client, filters={"repo": "other"})
+    assert len(qdrant.query_calls) == 6
+
+    client.upsert_canonical_vectors(
+        collection_name="docs",
+        ids=["00000000-0000-0000-0000-000000000003"],
+        vectors=[[0.8, 0.2]],
+        payloads=[{"path": "docs/d.md", "text": "delta", "repo": "moonmind"}],
+    )
+    refreshed = _local_search(client)
+
+    assert qdrant.query_calls[6:] == ["docs"]
+    assert "docs/d.md" in [item.source for item in refreshed.items]
+    assert client.collection_version("docs") == 2
+
+
+def test_overwrite_payloads_keeps_vectors_and_invalidates_cache():
+    client, qdrant = _local_client()
+    _local_search(client)
+
+    client.overwrite_payloads(
+        collection_name="docs",
+        ids=["00000000-0000-0000-0000-000000000001"],
+        payloads=[{"path": "docs/moved.md", "text": "alpha", "repo": "moonmind"}],
+    )
+    result = _local_search(client)
+
+    assert result.items[0].source == "docs/moved.md"
+    assert result.items[0].score > 0.99
+    assert qdrant.query_calls[3:] == ["docs"]
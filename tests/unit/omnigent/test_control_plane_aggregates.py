@@ -19,6 +19,7 @@ from sqlalchemy.orm import sessionmaker
 
 from api_service.db.models import (
     Base,
+    OmnigentBackfillCheckpoint,
     OmnigentBridgeSession,
     OmnigentBridgeSessionEvent,
     OmnigentExecutionPlanRecord,
@@ -1102,7 +1103,7 @@ async def test_active_chat_alias_cannot_be_reassigned(store) -> None:
 @pytest.mark.asyncio
 async def test_backfill_zero_rows(session_factory) -> None:
     report = await run_backfill(session_factory, dry_run=False)
-    assert report.plan.summary()["sessions"] == 0
+    assert report.plan_totals["sessions"] == 0
     assert report.sessions_written == 0
 
 
@@ -1119,7 +1120,7 @@ async def test_backfill_one_row(session_factory) -> None:
             )
         ],
     )
-    report = await run_backfill(session_factory, dry_run=False)
+    report = await run_backfill(session_factory, dry_run=False, keep_plan=True)
     assert report.sessions_written == 1
     assert report.turn_attempts_written == 1
     assert report.plan.turn_attempts[0].lineage_kind == "initial"
@@ -1152,7 +1153,7 @@ async def test_backfill_seven_rows_one_provider_session(session_factory) -> None
     ]
     await _seed_bridge_rows(session_factory, rows)
 
-    report = await run_backfill(session_factory, dry_run=False)
+    report = await run_backfill(session_factory, dry_run=False, keep_plan=True)
     # Seven bridge rows collapse to one canonical session authority.
     assert report.sessions_written == 1
     assert report.turn_attempts_written == 7
@@ -1194,7 +1195,7 @@ async def test_backfill_preserves_per_event_artifact_evidence(session_factory) -
             _bridge_event("e2", bridge_session_id="b1", sequence=2),
         ],
     )
-    report = await run_backfill(session_factory, dry_run=False)
+    report = await run_backfill(session_factory, dry_run=False, keep_plan=True)
     session_id = report.plan.sessions[0].session_id
 
     store = OmnigentControlPlaneStore(session_factory)
@@ -1236,7 +1237,7 @@ async def test_backfill_conflicting_authority_is_quarantined(session_factory) ->
             ),
         ],
     )
-    report = await run_backfill(session_factory, dry_run=False)
+    report = await run_backfill(session_factory, dry_run=False, keep_plan=True)
     assert report.sessions_written == 0
     assert len(report.plan.quarantined_groups) == 1
 
@@ -1282,6 +1283,116 @@ async def test_backfill_dry_run_and_apply_are_idempotent(session_factory) -> Non
     assert apply2.aliases_written == 0
 
 
+@pytest.mark.asyncio
+async def test_backfill_streams_workflow_chunks_with_checkpoint(session_factory) -> None:
+    await _seed_bridge_rows(
+        session_factory,
+        [
+            _bridge_row(
+                f"b{i}-{j}",
+                workflow_id=f"wf-{i}",
+                provider_session_id=f"psess-{i}",
+                chat_binding_id=f"cb-{i}-{j}",
+            )
+            for i in range(1, 6)
+            for j in range(2)
+        ],
+    )
+    async with session_factory() as session:
+        full_plan = await plan_backfill(session)
+    progress: list[int] = []
+
+    report = await run_backfill(
+        session_factory,
+        dry_run=False,
+        chunk_size=2,
+        on_progress=lambda r: progress.append(r.workflows_processed),
+        keep_plan=True,
+    )
+
+    # Each chunk folds whole workflows, so the streamed plan matches the
+    # one-shot plan.
+    assert progress == [2, 4, 5]
+    assert report.plan.summary() == full_plan.summary()
+    assert [s.session_id for s in report.plan.sessions] == [
+        s.session_id for s in full_plan.sessions
+    ]
+    assert report.sessions_written == 5
+    assert report.summary()["progress"]["bridge_rows"] == 10
+    assert report.completed is True
+    async with session_factory() as session:
+        checkpoint = await session.get(OmnigentBackfillCheckpoint, "bridge_rows")
+    assert checkpoint.cursor_workflow_id == "wf-5"
+    assert checkpoint.chunks_completed == 3
+    assert checkpoint.bridge_rows_processed == 10
+    assert checkpoint.completed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_backfill_apply_releases_plan_but_keeps_totals(session_factory) -> None:
+    await _seed_bridge_rows(
+        session_factory,
+        [
+            _bridge_row(
+                f"b{i}",
+                workflow_id=f"wf-{i}",
+                provider_session_id=f"psess-{i}",
+                chat_binding_id=f"cb-{i}",
+            )
+            for i in range(1, 4)
+        ],
+    )
+    async with session_factory() as session:
+        full_plan = await plan_backfill(session)
+
+    report = await run_backfill(session_factory, dry_run=False, chunk_size=2)
+
+    assert report.plan.sessions == []
+    assert report.plan.turn_attempts == []
+    assert report.plan_totals == full_plan.summary()
+    assert report.summary()["plan"] == full_plan.summary()
+    assert report.sessions_written == 3
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_after_last_committed_chunk(session_factory) -> None:
+    await _seed_bridge_rows(
+        session_factory,
+        [
+            _bridge_row(
+                f"b{i}", workflow_id=f"wf-{i}", provider_session_id=f"psess-{i}"
+            )
+            for i in range(1, 6)
+        ],
+    )
+
+    def crash_after_first_chunk(report) -> None:
+        raise RuntimeError("worker lost")
+
+    with pytest.raises(RuntimeError, match="worker lost"):
+        await run_backfill(
+            session_factory,
+            dry_run=False,
+            chunk_size=2,
+            on_progress=crash_after_first_chunk,
+        )
+
+    resumed = await run_backfill(session_factory, dry_run=False, chunk_size=2)
+    assert resumed.resumed_after_workflow_id == "wf-2"
+    assert resumed.workflows_processed == 3
+    assert resumed.sessions_written == 3
+    async with session_factory() as session:
+        checkpoint = await session.get(OmnigentBackfillCheckpoint, "bridge_rows")
+    assert checkpoint.chunks_completed == 3
+    assert checkpoint.bridge_rows_processed == 5
+
+    # A finished pass is not resumed: the next run rescans idempotently.
+    rerun = await run_backfill(session_factory, dry_run=False, chunk_size=2)
+    assert rerun.resumed_after_workflow_id is None
+    assert rerun.workflows_processed == 5
+    assert rerun.sessions_written == 0
+
+
 # --- Projection tests --------------------------------------------------------
 
 
@@ -927,3 +927,228 @@ async def test_one_diagnostic_failure_does_not_starve_later_candidates(
     assert result.failures == 1
     assert result.reconcile_requests == 1
     assert [call["session_id"] for call in dispatcher.calls] == ["sess-2"]
+
+
+@pytest.mark.asyncio
+async def test_sweep_pages_candidates_with_set_based_evidence_queries(
+    session_factory,
+) -> None:
+    from sqlalchemy import event
+
+    now = datetime(2026, 8, 19, 12, 0, tzinfo=UTC)
+    session_ids = [f"sess-{index}" for index in range(6)]
+    for session_id in session_ids:
+        await _seed_stuck_session(session_factory, session_id=session_id, now=now)
+    statements: list[str] = []
+    engine = session_factory.kw["bind"].sync_engine
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    dispatcher = _Dispatcher()
+    service = StuckStateReconciliationService(
+        session_factory=session_factory,
+        dispatcher=dispatcher,
+        diagnostic_publisher=_DiagnosticPublisher(),
+    )
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        inspections = None
+        async with session_factory() as db:
+            repos = ControlPlaneRepositories.bind(db)
+            candidates = await repos.sessions.list_reconciliation_candidates()
+            statements.clear()
+            from moonmind.omnigent.control_plane import inspect_stuck_states
+
+            inspections = await inspect_stuck_states(repos, candidates, now=now)
+        batch_selects = len(statements)
+        result = await service.sweep(now=now, page_size=4)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(inspections) == len(session_ids)
+    assert all(inspection.findings for inspection in inspections)
+    assert batch_selects <= 7
+    assert result.scanned == len(session_ids)
+    assert result.reconcile_requests == len(session_ids)
+    assert sorted(call["session_id"] for call in dispatcher.calls) == session_ids
+
+
+@pytest.mark.asyncio
+async def test_sweep_page_is_inspected_least_recently_updated_first(
+    session_factory,
+) -> None:
+    now = datetime(2026, 8, 19, 12, 0, tzinfo=UTC)
+    for index in range(4):
+        await _seed_stuck_session(session_factory, session_id=f"sess-{index}", now=now)
+    async with session_factory() as db:
+        for index, minutes in enumerate((30, 10, 40, 20)):
+            session_row = await db.get(OmnigentSession, f"sess-{index}")
+            session_row.updated_at = now - timedelta(minutes=minutes)
+        await db.commit()
+    dispatcher = _Dispatcher()
+    service = StuckStateReconciliationService(
+        session_factory=session_factory,
+        dispatcher=dispatcher,
+        diagnostic_publisher=_DiagnosticPublisher(),
+        response_concurrency=1,
+    )
+
+    result = await service.sweep(now=now, limit=4, page_size=4)
+
+    assert result.scanned == 4
+    assert [call["session_id"] for call in dispatcher.calls] == [
+        "sess-2",
+        "sess-0",
+        "sess-3",
+        "sess-1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bounded_sweeps_resume_from_keyset_cursor(session_factory) -> None:
+    now = datetime(2026, 8, 19, 12, 0, tzinfo=UTC)
+    for index in range(5):
+        await _seed_stuck_session(session_factory, session_id=f"sess-{index}", now=now)
+    dispatcher = _Dispatcher()
+    service = StuckStateReconciliationService(
+        session_factory=session_factory,
+        dispatcher=dispatcher,
+        diagnostic_publisher=_DiagnosticPublisher(),
+    )
+
+    scanned = []
+    for _tick in range(3):
+        scanned.append((await service.sweep(now=now, limit=2)).scanned)
+
+    # Later ticks continue past the rows already inspected instead of
+    # rereading the same first page.
+    assert scanned == [2, 2, 2]
+    assert sorted({call["session_id"] for call in dispatcher.calls}) == [
+        f"sess-{index}" for index in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_session_evidence_loads_the_timeline_bundle_in_one_query(
+    session_factory,
+) -> None:
+    from sqlalchemy import event
+
+    now = datetime(2026, 8, 19, 12, 0, tzinfo=UTC)
+    store = await _seed_stuck_session(session_factory, now=now)
+    async with store.transaction() as repos:
+        await repos.observations.append(
+            observation_id="event-old",
+            session_id="sess-1",
+            observation_type="provider_event",
+            source="provider_event_stream",
+            observed_at=now - timedelta(minutes=10),
+            deduplication_key="event-old",
+        )
+        await repos.observations.append(
+            observation_id="event-new",
+            session_id="sess-1",
+            observation_type="provider_event",
+            source="provider_event_stream",
+            observed_at=now - timedelta(minutes=5),
+            deduplication_key="event-new",
+        )
+        for ordinal in range(2):
+            await repos.decisions.append(
+                decision_id=f"decision-{ordinal}",
+                session_id="sess-1",
+                decision_code="await_observation",
+                expected_revision=2,
+                fencing_generation=0,
+            )
+    groups = {
+        "snapshot": ("snapshot", "provider_snapshot"),
+        "event": ("event", "provider_event"),
+        "liveness": ("heartbeat",),
+    }
+    statements: list[str] = []
+    engine = session_factory.kw["bind"].sync_engine
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    async with session_factory() as db:
+        repos = ControlPlaneRepositories.bind(db)
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            bundle = await repos.session_evidence(
+                "sess-1", observation_type_groups=groups
+            )
+            missing = await repos.session_evidence(
+                "sess-unknown", observation_type_groups=groups
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        expected_decision = await repos.decisions.latest_for_session("sess-1")
+
+    assert len(statements) == 2
+    assert missing is None
+    assert bundle.session.session_id == "sess-1"
+    assert bundle.active_turn.turn_attempt_id == "turn-sess-1"
+    assert bundle.turn_attempt_count == 1
+    assert {
+        name: observation.observation_id
+        for name, observation in bundle.latest_observations.items()
+    } == {"snapshot": "snapshot-sess-1", "event": "event-new"}
+    assert bundle.active_command is None
+    assert bundle.latest_decision == expected_decision
+    assert bundle.cleanup is None
+
+
+@pytest.mark.asyncio
+async def test_session_evidence_version_follows_appends_without_a_session_write(
+    session_factory,
+) -> None:
+    from sqlalchemy import event
+
+    now = datetime(2026, 8, 19, 12, 0, tzinfo=UTC)
+    store = await _seed_stuck_session(session_factory, now=now)
+    statements: list[str] = []
+    engine = session_factory.kw["bind"].sync_engine
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    async with session_factory() as db:
+        repos = ControlPlaneRepositories.bind(db)
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            before = await repos.session_evidence_version("sess-1")
+            missing = await repos.session_evidence_version("sess-unknown")
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+    async with store.transaction() as repos:
+        session_row = await repos.sessions.get("sess-1")
+        await repos.observations.append(
+            observation_id="event-late",
+            session_id="sess-1",
+            observation_type="provider_event",
+            source="provider_event_stream",
+            # An out-of-order event still changes the version via the count.
+            observed_at=now - timedelta(days=1),
+            deduplication_key="event-late",
+        )
+    async with store.transaction() as repos:
+        after_observation = await repos.session_evidence_version("sess-1")
+        await repos.decisions.append(
+            decision_id="decision-late",
+            session_id="sess-1",
+            decision_code="await_observation",
+            expected_revision=2,
+            fencing_generation=0,
+        )
+    async with store.transaction() as repos:
+        after_decision = await repos.session_evidence_version("sess-1")
+        unchanged_session = await repos.sessions.get("sess-1")
+
+    assert len(statements) == 2
+    assert missing is None
+    assert unchanged_session.revision == session_row.revision
+    assert len({before, after_observation, after_decision}) == 3
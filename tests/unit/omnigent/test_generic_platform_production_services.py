@@ -154,8 +154,9 @@ def test_planning_model_evidence_is_bound_to_generation_and_host_image() -> None
 
 
 class _Session:
-    def __init__(self, rows):
+    def __init__(self, rows, executed=None):
         self._rows = rows
+        self.executed = executed if executed is not None else []
 
     async def __aenter__(self):
         return self
@@ -166,9 +167,19 @@ class _Session:
     async def get(self, _model, key):
         return self._rows.get(key)
 
+    async def execute(self, statement):
+        self.executed.append(statement)
+        (keys,) = statement.compile().params.values()
+        rows = [
+            SimpleNamespace(**vars(self._rows[key]), profile_id=key)
+            for key in keys
+            if key in self._rows
+        ]
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
 
-def _session_factory(rows):
-    return lambda: _Session(rows)
+def _session_factory(rows, executed=None):
+    return lambda: _Session(rows, executed)
 
 
 class _InventoryClient:
@@ -1161,6 +1172,156 @@ async def test_provider_leases_acquire_sorted_and_release_reverse_order() -> Non
     ]
 
 
+def _lease_profiles(*refs: str) -> dict[str, SimpleNamespace]:
+    return {
+        ref: SimpleNamespace(
+            enabled=True,
+            auth_state="connected",
+            runtime_id="opencode",
+            capacity_scope_ref=f"provider-profile:{ref}",
+            credential_generation=index + 1,
+        )
+        for index, ref in enumerate(refs)
+    }
+
+
+def _lease_plan(*refs: str):
+    base = _plan("opencode-go/model").payload.model_dump(by_alias=True, mode="json")
+    base["credentialBindings"] = {
+        f"{ref}-slot": {
+            "providerProfileRef": ref,
+            "materializerRef": "opencode-auth-json@1",
+        }
+        for ref in refs
+    }
+    return create_execution_plan_envelope(base)
+
+
+@pytest.mark.asyncio
+async def test_provider_leases_acquire_one_at_a_time_with_batched_profile_loads() -> (
+    None
+):
+    refs = ("profile-a", "profile-b", "profile-c")
+    executed: list = []
+    acquired_order: list[str] = []
+    in_flight = 0
+
+    class LeaseClient:
+        async def acquire_execution_lease(self, **kwargs):
+            nonlocal in_flight
+            # Acquisition blocks until capacity frees; overlapping waits on
+            # shared scopes could deadlock, so they must never overlap.
+            in_flight += 1
+            assert in_flight == 1
+            await asyncio.sleep(0)
+            in_flight -= 1
+            acquired_order.append(kwargs["profile_id"])
+            return CredentialLease(
+                profile_id=kwargs["profile_id"],
+                runtime_id=kwargs["runtime_id"],
+                lease_id=f"lease-{kwargs['profile_id']}",
+                owner_id=kwargs["owner_id"],
+                purpose=kwargs["purpose"],
+            )
+
+        async def inspect_lease(self, _lease):
+            return {"active": True}
+
+        async def release_lease(self, _lease):
+            raise AssertionError("no lease should be released")
+
+    coordinator = OmnigentProviderLeaseCoordinator(
+        session_factory=_session_factory(_lease_profiles(*refs), executed),
+        lease_client=LeaseClient(),
+    )
+
+    acquired = await coordinator.acquire_all(
+        plan=_lease_plan(*reversed(refs)),
+        workflow_id="workflow",
+        step_execution_id="step",
+        idempotency_key="idem",
+    )
+
+    assert [
+        (item.provider_profile_ref, item.credential_generation) for item in acquired
+    ] == [
+        ("profile-a", 1),
+        ("profile-b", 2),
+        ("profile-c", 3),
+    ]
+    assert acquired_order == list(refs)
+    assert len(executed) == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_leases_release_every_acquired_lease_when_one_fails() -> None:
+    refs = ("profile-a", "profile-b", "profile-c")
+    released: list[str] = []
+
+    class LeaseClient:
+        async def acquire_execution_lease(self, **kwargs):
+            return CredentialLease(
+                profile_id=kwargs["profile_id"],
+                runtime_id=kwargs["runtime_id"],
+                lease_id=f"lease-{kwargs['profile_id']}",
+                owner_id=kwargs["owner_id"],
+                purpose=kwargs["purpose"],
+            )
+
+        async def inspect_lease(self, lease):
+            return {"active": lease.profile_id != "profile-b"}
+
+        async def release_lease(self, lease):
+            released.append(lease.profile_id)
+
+    coordinator = OmnigentProviderLeaseCoordinator(
+        session_factory=_session_factory(_lease_profiles(*refs)),
+        lease_client=LeaseClient(),
+    )
+
+    with pytest.raises(HarnessPlatformError) as exc_info:
+        await coordinator.acquire_all(
+            plan=_lease_plan(*refs),
+            workflow_id="workflow",
+            step_execution_id="step",
+            idempotency_key="idem",
+        )
+
+    assert exc_info.value.code == (
+        HarnessPlatformFailure.OMNIGENT_PROVIDER_LEASE_UNAVAILABLE
+    )
+    assert "profile-b" in str(exc_info.value)
+    # profile-c is never acquired once profile-b fails.
+    assert released == ["profile-b", "profile-a"]
+
+
+@pytest.mark.asyncio
+async def test_provider_leases_validate_profiles_before_acquiring_any() -> None:
+    profiles = _lease_profiles("profile-a", "profile-b")
+    profiles["profile-b"].auth_state = "expired"
+
+    class LeaseClient:
+        async def acquire_execution_lease(self, **_kwargs):
+            raise AssertionError("no lease should be acquired")
+
+    coordinator = OmnigentProviderLeaseCoordinator(
+        session_factory=_session_factory(profiles), lease_client=LeaseClient()
+    )
+
+    with pytest.raises(HarnessPlatformError) as exc_info:
+        await coordinator.acquire_all(
+            plan=_lease_plan("profile-a", "profile-b", "profile-missing"),
+            workflow_id="workflow",
+            step_execution_id="step",
+            idempotency_key="idem",
+        )
+
+    assert exc_info.value.code == (
+        HarnessPlatformFailure.OMNIGENT_PROVIDER_PROFILE_INCOMPATIBLE
+    )
+    assert "profile-b" in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_secret_resolution_is_role_scoped_and_generation_fenced() -> None:
     profile = SimpleNamespace(
@@ -4,6 +4,10 @@ from types import SimpleNamespace
 import pytest
 
 from moonmind.omnigent.oauth_host_janitor import OmnigentOAuthHostJanitor
+from moonmind.omnigent.oauth_host_runtime import (
+    OmnigentHostContainerState,
+    OmnigentHostResourceSnapshot,
+)
 from moonmind.omnigent.oauth_hosts import OmnigentOAuthHostError
 from moonmind.omnigent.harness_platform.stores import InMemoryRuntimeBindingStore
 
@@ -865,6 +869,63 @@ async def test_janitor_removes_label_owned_orphan_instead_of_repeating_report()
     ]
 
 
+class _SnapshotRuntime(_Runtime):
+    def __init__(self, snapshot):
+        super().__init__()
+        self.snapshot = snapshot
+        self.snapshots = 0
+
+    async def resource_snapshot(self):
+        self.snapshots += 1
+        return self.snapshot
+
+    async def container_exists(self, _name):
+        raise AssertionError("janitor must answer from the resource snapshot")
+
+    async def list_managed_containers(self):
+        raise AssertionError("janitor must answer from the resource snapshot")
+
+    async def managed_container_host_lease_ref(self, _name):
+        raise AssertionError("janitor must answer from the resource snapshot")
+
+
+@pytest.mark.asyncio
+async def test_janitor_answers_container_questions_from_one_snapshot() -> None:
+    lease = _lease()
+    repository = _Repository(lease)
+    runtime = _SnapshotRuntime(
+        OmnigentHostResourceSnapshot(
+            containers={
+                lease.container_name: OmnigentHostContainerState(
+                    running=True,
+                    kind="omnigent-oauth-host",
+                    host_lease_ref=lease.lease_id,
+                ),
+                "orphan-host": OmnigentHostContainerState(
+                    running=False,
+                    kind="omnigent-oauth-host",
+                    host_lease_ref=None,
+                ),
+            },
+            volumes=frozenset(),
+        )
+    )
+
+    result = await OmnigentOAuthHostJanitor(
+        repository=repository, runtime=runtime, client=_Client(),
+    ).run()
+
+    assert runtime.snapshots == 1
+    assert runtime.removed == ["orphan-host"]
+    assert result["actions"] == [
+        {
+            "containerName": "orphan-host",
+            "action": "orphan_container_removed",
+            "providerLeaseReleased": False,
+        }
+    ]
+
+
 @pytest.mark.asyncio
 async def test_janitor_reloads_container_lease_before_orphan_removal() -> None:
     initial_lease = _lease()
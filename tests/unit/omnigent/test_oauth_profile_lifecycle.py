@@ -52,6 +52,7 @@ from moonmind.omnigent.oauth_host_runtime import OmnigentOAuthHostRuntime
 from moonmind.omnigent.oauth_hosts import (
     HOST_CLEANUP_CLAIMED_ERROR_CODE,
     HOST_PROFILE_BUSY_ERROR_CODE,
+    HostPreflightFailure,
     OmnigentOAuthHostError,
     OmnigentOAuthHostRepository,
     validate_preflight_result,
@@ -109,6 +110,7 @@ from moonmind.security.egress import (
 from moonmind.security.egress_conformance_evidence import (
     parse_and_verify_conformance_evidence,
 )
+from moonmind.workflows.adapters.omnigent_client import OmnigentClientError
 from moonmind.workflows.temporal.runtime.workspace_locators import (
     SandboxWorkspaceRecord,
     SandboxWorkspaceRecordStore,
@@ -1028,6 +1030,50 @@ async def test_runtime_preflight_uses_stock_runner_environment_constructor() ->
     )
 
 
+@pytest.mark.asyncio
+async def test_runtime_resource_snapshot_lists_hosts_in_two_daemon_calls() -> None:
+    runtime = OmnigentOAuthHostRuntime(client=SimpleNamespace())
+    calls: list[tuple[str, ...]] = []
+
+    async def run(*args, **_kwargs):
+        calls.append(args)
+        if args[:2] == ("docker", "ps"):
+            return 0, (
+                "mm-omnigent-host-a\trunning\tomnigent-oauth-host\tlease-a\n"
+                "mm-omnigent-host-b\texited\tomnigent-oauth-host\t\n"
+            ), ""
+        return 0, "mm-omnigent-host-a-state\nmm-omnigent-host-b-cache\n", ""
+
+    runtime._run = run  # type: ignore[method-assign]
+
+    snapshot = await runtime.resource_snapshot()
+
+    assert [call[:3] for call in calls] == [
+        ("docker", "ps", "-a"),
+        ("docker", "volume", "ls"),
+    ]
+    assert snapshot is not None
+    assert snapshot.container_running("mm-omnigent-host-a")
+    assert not snapshot.container_running("mm-omnigent-host-b")
+    assert snapshot.container_present("mm-omnigent-host-b")
+    assert not snapshot.container_present("mm-omnigent-host-c")
+    assert snapshot.volume_present("mm-omnigent-host-b-cache")
+    assert snapshot.managed_containers() == [
+        "mm-omnigent-host-a",
+        "mm-omnigent-host-b",
+    ]
+    assert snapshot.host_lease_ref("mm-omnigent-host-a") == "lease-a"
+    assert snapshot.host_lease_ref("mm-omnigent-host-b") is None
+
+
+@pytest.mark.asyncio
+async def test_runtime_resource_snapshot_is_unavailable_when_listing_fails() -> None:
+    runtime = OmnigentOAuthHostRuntime(client=SimpleNamespace())
+    runtime._run = AsyncMock(return_value=(1, "", "daemon unavailable"))
+
+    assert await runtime.resource_snapshot() is None
+
+
 def test_deterministic_owner_reuses_activity_retry_identity() -> None:
     kwargs = {
         "profile_id": "codex",
@@ -2235,8 +2281,88 @@ async def test_exact_host_resolution_waits_for_registration_publication(
 
     assert host["host_id"] == "host-stock-1"
     assert client.list_hosts.await_count == 3
+    assert [call.args for call in sleep.await_args_list] == [(0.05,), (0.1,)]
+
+
+@pytest.mark.asyncio
+async def test_exact_host_resolution_looks_up_known_host_id_until_registered(
+    monkeypatch,
+) -> None:
+    client = SimpleNamespace()
+    client.list_hosts = AsyncMock(side_effect=AssertionError("catalog listed"))
+    client.get_host = AsyncMock(
+        side_effect=[
+            OmnigentClientError("not found", status_code=404),
+            {"id": "host-static-1", "status": "offline"},
+            {"id": "host-static-1", "status": "online"},
+        ]
+    )
+    runtime = OmnigentOAuthHostRuntime(client=client)
+    binding = _binding().model_copy(update={"static_host_id": "host-static-1"})
+    sleep = AsyncMock()
+    monkeypatch.setattr("moonmind.omnigent.oauth_host_runtime.asyncio.sleep", sleep)
+
+    host = await runtime._resolve_exact_host(binding=binding, host_lease=_host_lease())
+
+    assert host == {"id": "host-static-1", "status": "online"}
+    client.get_host.assert_awaited_with("host-static-1")
     assert sleep.await_count == 2
-    sleep.assert_awaited_with(2)
+
+
+@pytest.mark.asyncio
+async def test_exact_host_lookup_unwraps_host_envelope_and_falls_back_without_id(
+    monkeypatch,
+) -> None:
+    client = SimpleNamespace()
+    client.list_hosts = AsyncMock(
+        return_value=[{"hostId": "host-static-1", "status": "online"}]
+    )
+    client.get_host = AsyncMock(
+        side_effect=[
+            {"status": "online"},
+            {"host": {"id": "host-static-1", "status": "online"}},
+        ]
+    )
+    runtime = OmnigentOAuthHostRuntime(client=client)
+    binding = _binding().model_copy(update={"static_host_id": "host-static-1"})
+    monkeypatch.setattr(
+        "moonmind.omnigent.oauth_host_runtime.asyncio.sleep", AsyncMock()
+    )
+
+    # A response without a host id is checked against the catalog instead.
+    listed = await runtime._resolve_exact_host(
+        binding=binding, host_lease=_host_lease()
+    )
+    enveloped = await runtime._resolve_exact_host(
+        binding=binding, host_lease=_host_lease()
+    )
+
+    assert listed == {"hostId": "host-static-1", "status": "online"}
+    assert enveloped == {"id": "host-static-1", "status": "online"}
+    assert client.list_hosts.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_exact_host_resolution_registration_wait_stays_bounded(
+    monkeypatch,
+) -> None:
+    client = SimpleNamespace()
+    client.list_hosts = AsyncMock(return_value=[])
+    runtime = OmnigentOAuthHostRuntime(client=client)
+    binding = _binding().model_copy(
+        update={"static_host_id": None, "host_launch_profile_ref": "codex-oauth-v1"}
+    )
+    sleep = AsyncMock()
+    monkeypatch.setattr("moonmind.omnigent.oauth_host_runtime.asyncio.sleep", sleep)
+
+    with pytest.raises(OmnigentOAuthHostError) as exc_info:
+        await runtime._resolve_exact_host(binding=binding, host_lease=_host_lease())
+
+    assert exc_info.value.code == HostPreflightFailure.HOST_NOT_REGISTERED.value
+    delays = [call.args[0] for call in sleep.await_args_list]
+    assert delays[0] == 0.05
+    assert max(delays) == 2.0
+    assert sum(delays) == pytest.approx(180.0)
 
 
 @pytest.mark.asyncio
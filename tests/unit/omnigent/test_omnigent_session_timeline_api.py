@@ -23,6 +23,7 @@ from api_service.db.base import get_async_session
 from moonmind.omnigent.control_plane.records import (
     DecisionRecord,
     ObservationRecord,
+    SessionEvidenceRecord,
     SessionRecord,
     TurnAttemptRecord,
 )
@@ -127,6 +128,48 @@ class _FakeRepos:
         self.commands = _FakeCommands(active_command)
         self.decisions = _FakeDecisions(latest_decision, reason_counts)
         self.cleanup = _FakeCleanup(cleanup)
+        self.evidence_loads = 0
+
+    async def session_evidence_version(self, session_id):
+        session = await self.sessions.get(session_id)
+        if session is None:
+            return None
+        return (
+            session.session_id,
+            session.revision,
+            session.updated_at,
+            self.observations._event,
+            self.observations._snapshot,
+            self.commands._active,
+            self.decisions._latest,
+            self.cleanup._cleanup,
+        )
+
+    async def session_evidence(self, session_id, *, observation_type_groups):
+        self.evidence_loads += 1
+        session = await self.sessions.get(session_id)
+        if session is None:
+            return None
+        observations = {}
+        for name, types in observation_type_groups.items():
+            observation = await self.observations.latest_for_session(
+                session_id, observation_types=types
+            )
+            if observation is not None and observation.observation_type in types:
+                observations[name] = observation
+        return SessionEvidenceRecord(
+            session=session,
+            active_turn=(
+                await self.turn_attempts.get(session.active_turn_attempt_id)
+                if session.active_turn_attempt_id is not None
+                else None
+            ),
+            turn_attempt_count=await self.turn_attempts.count_for_session(session_id),
+            latest_observations=observations,
+            active_command=await self.commands.active_for_session(session_id),
+            latest_decision=await self.decisions.latest_for_session(session_id),
+            cleanup=await self.cleanup.get(session_id),
+        )
 
 
 def _build_app(session_record, user):
@@ -174,6 +217,69 @@ async def test_timeline_endpoint_returns_projection(monkeypatch, session_record)
     assert body["explanation"]["status"] == "closed"
 
 
+@pytest.mark.asyncio
+async def test_timeline_endpoint_answers_unchanged_revision_with_304(
+    monkeypatch, session_record
+):
+    repos = _FakeRepos(session_record)
+    monkeypatch.setattr(
+        timeline_service.ControlPlaneRepositories, "bind", classmethod(lambda cls, db: repos)
+    )
+    app = _build_app(session_record, _FakeUser())
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/omnigent/sessions/sess-1/timeline")
+        etag = first.headers["etag"]
+        unchanged = await client.get(
+            "/api/omnigent/sessions/sess-1/timeline",
+            headers={"If-None-Match": etag},
+        )
+        repos.sessions._session = SessionRecord(
+            **{**session_record.__dict__, "revision": session_record.revision + 1}
+        )
+        advanced = await client.get(
+            "/api/omnigent/sessions/sess-1/timeline",
+            headers={"If-None-Match": etag},
+        )
+
+    assert first.status_code == 200
+    assert unchanged.status_code == 304
+    assert advanced.status_code == 200
+    assert advanced.headers["etag"] != etag
+    assert advanced.json()["state"]["revision"] == 5
+    assert repos.evidence_loads == 2
+
+
+@pytest.mark.asyncio
+async def test_timeline_etag_changes_when_evidence_is_appended_without_a_session_write(
+    monkeypatch, session_record
+):
+    repos = _FakeRepos(session_record)
+    monkeypatch.setattr(
+        timeline_service.ControlPlaneRepositories, "bind", classmethod(lambda cls, db: repos)
+    )
+    app = _build_app(session_record, _FakeUser())
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/omnigent/sessions/sess-1/timeline")
+        etag = first.headers["etag"]
+        repos.observations._event = ObservationRecord(
+            observation_id="event-1",
+            session_id="sess-1",
+            observation_type="provider_event",
+            source="provider_event_stream",
+            observed_at=_LONG_AGO,
+            deduplication_key="event-1",
+        )
+        appended = await client.get(
+            "/api/omnigent/sessions/sess-1/timeline",
+            headers={"If-None-Match": etag},
+        )
+
+    assert appended.status_code == 200
+    assert appended.headers["etag"] != etag
+
+
 @pytest.mark.asyncio
 async def test_timeline_endpoint_404_for_unknown_session(monkeypatch, session_record):
     monkeypatch.setattr(
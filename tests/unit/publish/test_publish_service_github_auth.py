@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import subprocess
 import sys
 from pathlib import Path
 from types import SimpleNamespace
@@ -9,7 +11,7 @@ from uuid import uuid4
 import pytest
 
 from moonmind.config.settings import settings
-from moonmind.publish.service import PublishService
+from moonmind.publish.service import PublishService, _PushPatchScanner
 
 pytestmark = pytest.mark.asyncio
 
@@ -100,18 +102,28 @@ async def test_publish_branch_blocks_high_security_scan_before_push(
             proc.communicate = AsyncMock(return_value=(b"", b""))
             proc.returncode = 0
         elif scan_call_count == 2:
-            proc.communicate = AsyncMock(
-                return_value=(b"commit local-sha\nsubject MM-813\n", b"")
-            )
-            proc.returncode = 0
-        elif scan_call_count == 3:
-            proc.communicate = AsyncMock(return_value=(b"app/config.py\n", b""))
-            proc.returncode = 0
-        elif scan_call_count == 4:
-            proc.communicate = AsyncMock(
-                return_value=(b"+api_key=do-not-print-this-value\n", b"")
-            )
-            proc.returncode = 0
+            # One ``git log -p`` stream covers metadata and every file diff.
+            assert "log" in command and "-p" in command
+            boundary = next(
+                arg for arg in command if arg.startswith("--format=")
+            ).removeprefix("--format=").split("%n", 1)[0]
+            stream = (
+                f"{boundary}\ncommit local-sha\nsubject MM-813\n"
+                f"{boundary}-patch\n\n"
+                "diff --git a/app/config.py b/app/config.py\n"
+                "--- a/app/config.py\n"
+                "+++ b/app/config.py\n"
+                "@@ -1 +1 @@\n"
+                "-api_key=previously-published\n"
+                "+api_key=do-not-print-this-value\n"
+            ).encode()
+            proc.stdout = asyncio.StreamReader()
+            proc.stdout.feed_data(stream)
+            proc.stdout.feed_eof()
+            proc.stderr = asyncio.StreamReader()
+            proc.stderr.feed_eof()
+            proc.returncode = None
+            proc.kill = lambda: setattr(proc, "returncode", -9)
         else:
             raise AssertionError(f"Unexpected scan subprocess: {args!r}")
         return proc
@@ -132,9 +144,129 @@ async def test_publish_branch_blocks_high_security_scan_before_push(
     message = str(exc_info.value)
     assert "git.push.diff:app/config.py" in message
     assert "do-not-print-this-value" not in message
+    assert scan_call_count == 2
     assert not any(call["command"][:2] == ["git", "push"] for call in calls)
 
 
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), *args],
+        check=True,
+        capture_output=True,
+        env={
+            "GIT_AUTHOR_NAME": "MoonMind",
+            "GIT_AUTHOR_EMAIL": "moonmind@example.com",
+            "GIT_COMMITTER_NAME": "MoonMind",
+            "GIT_COMMITTER_EMAIL": "moonmind@example.com",
+            "HOME": str(repo),
+            "PATH": "/usr/bin:/bin",
+        },
+    )
+
+
+async def test_push_scan_streams_added_lines_of_every_commit(
+    monkeypatch, tmp_path: Path
+):
+    monkeypatch.setattr(settings.security, "high_security_mode", True)
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    (repo / "settings.py").write_text("api_key=already-on-remote\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "checkout", "-q", "-b", "feature")
+    for index in range(40):
+        (repo / f"module_{index}.py").write_text(f"value = {index}\n")
+    # Removed and context lines were already published and are not findings.
+    (repo / "settings.py").write_text("debug = True\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "many files")
+
+    service = PublishService()
+    spawned: list[tuple[str, ...]] = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def _counting_exec(*args, **kwargs):
+        spawned.append(args)
+        return await real_exec(*args, **kwargs)
+
+    env = {"PATH": "/usr/bin:/bin", "HOME": str(tmp_path)}
+    with patch("asyncio.create_subprocess_exec", side_effect=_counting_exec):
+        await service._scan_git_push_before_publish(
+            repo_dir=repo, branch_name="feature", base_ref="main", env=env
+        )
+    assert len(spawned) == 1
+
+    # A secret added and then removed inside the range is still pushed.
+    (repo / "module_3.py").write_text("password = 'hunter2-live'\n")
+    _git(repo, "commit", "-q", "-am", "add secret")
+    (repo / "module_3.py").write_text("value = 3\n")
+    _git(repo, "commit", "-q", "-am", "drop secret")
+    with pytest.raises(RuntimeError) as exc_info:
+        await service._scan_git_push_before_publish(
+            repo_dir=repo, branch_name="feature", base_ref="main", env=env
+        )
+    assert "credential at git.push.diff:module_3.py" in str(exc_info.value)
+    assert "hunter2-live" not in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "added",
+    [
+        ("+api_key:", "+  sk-live-abc123"),
+        ("+Authorization: Bearer", "+  tok.en-123"),
+    ],
+)
+async def test_push_scan_matches_secret_values_split_across_added_lines(added):
+    scanner = _PushPatchScanner(boundary="---b---", commit_range="main..feature")
+    stream = [
+        "---b----patch",
+        "diff --git a/app.yaml b/app.yaml",
+        "+++ b/app.yaml",
+        "@@ -0,0 +1,2 @@",
+        *added,
+    ]
+
+    findings = [scanner.feed(line) for line in stream]
+
+    assert findings[-1] is not None
+    assert findings[-1].location == "git.push.diff:app.yaml"
+    assert all(finding is None for finding in findings[:-1])
+
+
+async def test_push_scan_covers_content_added_by_a_merge_resolution(
+    monkeypatch, tmp_path: Path
+):
+    monkeypatch.setattr(settings.security, "high_security_mode", True)
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    (repo / "app.py").write_text("value = 0\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "checkout", "-q", "-b", "feature")
+    (repo / "app.py").write_text("value = 1\n")
+    _git(repo, "commit", "-q", "-am", "feature change")
+    _git(repo, "checkout", "-q", "-b", "side", "main")
+    (repo / "side.py").write_text("value = 2\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "side change")
+    _git(repo, "checkout", "-q", "feature")
+    _git(repo, "merge", "-q", "--no-ff", "--no-commit", "side")
+    # The secret exists only in the merge commit's resolution.
+    (repo / "app.py").write_text("password = 'merge-only-secret'\n")
+    _git(repo, "add", "app.py")
+    _git(repo, "commit", "-q", "--no-edit")
+
+    env = {"PATH": "/usr/bin:/bin", "HOME": str(tmp_path)}
+    with pytest.raises(RuntimeError) as exc_info:
+        await PublishService()._scan_git_push_before_publish(
+            repo_dir=repo, branch_name="feature", base_ref="main", env=env
+        )
+    assert "credential at git.push.diff:app.py" in str(exc_info.value)
+    assert "merge-only-secret" not in str(exc_info.value)
+
+
 async def test_publish_pr_uses_rest_service_without_ambient_gh(monkeypatch, tmp_path: Path):
     monkeypatch.setenv("GITHUB_TOKEN", "publish-token")
     monkeypatch.setenv("GH_TOKEN", "ambient-gh-token")
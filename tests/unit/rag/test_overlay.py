@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from moonmind.rag.overlay import OverlayChunk, chunk_file
+from qdrant_client import QdrantClient
+
+from moonmind.rag.overlay import OverlayChunk, chunk_file, upsert_overlay_files
+from moonmind.rag.qdrant_client import RagQdrantClient
+from moonmind.rag.settings import RagRuntimeSettings
 
 def test_overlay_chunk_hash_is_deterministic() -> None:
     chunk = OverlayChunk(
@@ -58,3 +62,109 @@ def test_chunk_file_single_chunk_for_small_file(tmp_path: Path) -> None:
     assert chunks[0].text == "tiny"
     assert chunks[0].offset_start == 0
     assert chunks[0].offset_end == 4
+
+
+def test_chunk_file_ends_chunks_on_line_breaks(tmp_path: Path) -> None:
+    file = tmp_path / "lines.py"
+    file.write_text("one\ntwo\nthree\n", encoding="utf-8")
+
+    chunks = list(chunk_file(file, chunk_chars=10, overlap=0))
+
+    assert [chunk.text for chunk in chunks] == ["one\ntwo\n", "three\n"]
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    def embed(self, text: str) -> list[float]:
+        self.texts.append(text)
+        return [float(len(text)), 1.0]
+
+
+def _overlay_fixture(tmp_path: Path):
+    settings = RagRuntimeSettings.from_env(
+        {
+            "RAG_OVERLAY_CHARS_PER_CHUNK": "32",
+            "RAG_OVERLAY_CHUNK_OVERLAP": "0",
+            "VECTOR_STORE_COLLECTION_NAME": "repo",
+        }
+    )
+    qdrant = RagQdrantClient(
+        host="localhost",
+        port=6333,
+        url=None,
+        api_key=None,
+        collection="repo",
+        overlay_mode="collection",
+        overlay_ttl_hours=24,
+        overlay_chunk_chars=32,
+        overlay_chunk_overlap=0,
+        embedding_dimensions=2,
+    )
+    qdrant._client = QdrantClient(":memory:")
+    # Local mode reports missing collections differently from the server.
+    qdrant._create_collection(
+        collection_name=settings.overlay_collection_name("run-1"), vector_size=2
+    )
+    return settings, qdrant, _CountingEmbedder()
+
+
+def _overlay_points(qdrant: RagQdrantClient, settings: RagRuntimeSettings) -> list[dict]:
+    points, _ = qdrant.client.scroll(
+        collection_name=settings.overlay_collection_name("run-1"),
+        limit=100,
+        with_payload=True,
+    )
+    return sorted((dict(point.payload) for point in points), key=lambda p: p["offset_start"])
+
+
+def test_upsert_overlay_files_only_embeds_changed_chunks(tmp_path: Path) -> None:
+    settings, qdrant, embedder = _overlay_fixture(tmp_path)
+    file = tmp_path / "module.py"
+    lines = [f"line number {index:02d}\n" for index in range(4)]
+    file.write_text("".join(lines), encoding="utf-8")
+
+    first = upsert_overlay_files(
+        files=[file], run_id="run-1", settings=settings, embedder=embedder, qdrant=qdrant
+    )
+    again = upsert_overlay_files(
+        files=[file], run_id="run-1", settings=settings, embedder=embedder, qdrant=qdrant
+    )
+
+    assert first == again == 2
+    assert len(embedder.texts) == 2
+
+    lines[0] = "edited\n"
+    file.write_text("".join(lines), encoding="utf-8")
+    upsert_overlay_files(
+        files=[file], run_id="run-1", settings=settings, embedder=embedder, qdrant=qdrant
+    )
+
+    assert embedder.texts[2:] == ["edited\nline number 01\n"]
+    points = _overlay_points(qdrant, settings)
+    assert [point["text"] for point in points] == [
+        "edited\nline number 01\n",
+        "line number 02\nline number 03\n",
+    ]
+    assert points[1]["offset_start"] == 22
+
+
+def test_upsert_overlay_files_rebuilds_index_after_external_writes(tmp_path: Path) -> None:
+    settings, qdrant, embedder = _overlay_fixture(tmp_path)
+    file = tmp_path / "notes.md"
+    file.write_text("short note\n", encoding="utf-8")
+    upsert_overlay_files(
+        files=[file], run_id="run-1", settings=settings, embedder=embedder, qdrant=qdrant
+    )
+
+    qdrant.delete_overlay_collection(settings.overlay_collection_name("run-1"))
+    qdrant._create_collection(
+        collection_name=settings.overlay_collection_name("run-1"), vector_size=2
+    )
+    upsert_overlay_files(
+        files=[file], run_id="run-1", settings=settings, embedder=embedder, qdrant=qdrant
+    )
+
+    assert embedder.texts == ["short note\n", "short note\n"]
+    assert len(_overlay_points(qdrant, settings)) == 1
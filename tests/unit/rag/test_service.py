@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 from moonmind.memory.services import apply_memory_policy, evaluate_memory_proposals
@@ -282,6 +284,85 @@ def test_retrieve_direct_flow_prepends_approved_long_term_memories() -> None:
     assert pack.usage["latency_ms"] == 7.0
 
 
+class _BlockingLongTermMemory(_StubLongTermMemory):
+    def __init__(self, release: threading.Event, *, wait_seconds: float) -> None:
+        super().__init__()
+        self.release = release
+        self.wait_seconds = wait_seconds
+
+    def search(self, **kwargs):
+        self.release.wait(timeout=self.wait_seconds)
+        return super().search(**kwargs)
+
+
+def _mem0_service(memory) -> tuple[ContextRetrievalService, _StubQdrant]:
+    qdrant = _StubQdrant()
+    service = ContextRetrievalService(
+        settings=_settings(
+            memory_long_term="mem0",
+            mem0_api_key="mem0-secret",
+            memory_context_budget_tokens=400,
+        ),
+        env={"GOOGLE_API_KEY": "test"},
+        embedding_client=_StubEmbedder(),
+        qdrant_client=qdrant,
+        long_term_memory_service=memory,
+    )
+    return service, qdrant
+
+
+def test_retrieve_runs_memory_lookup_concurrently_with_search() -> None:
+    search_done = threading.Event()
+    memory = _BlockingLongTermMemory(search_done, wait_seconds=5.0)
+    service, qdrant = _mem0_service(memory)
+    original_search = qdrant.search
+
+    def search(**kwargs):
+        # Memory is already in flight and waiting on the search to finish.
+        assert memory.search_calls == [] and not search_done.is_set()
+        result = original_search(**kwargs)
+        search_done.set()
+        return result
+
+    qdrant.search = search
+
+    pack = service.retrieve(
+        query="How should memory work?",
+        filters={"repo": "moonmind"},
+        top_k=3,
+        overlay_policy="skip",
+        budgets={},
+        transport="direct",
+    )
+
+    assert [item.source for item in pack.items] == ["mem0:memory-1", "src/file.py"]
+    assert set(pack.usage["stages"]) == {"embedding", "search", "planning", "memory"}
+    assert all(stage["status"] == "ok" for stage in pack.usage["stages"].values())
+
+
+def test_retrieve_drops_memory_stage_that_misses_its_deadline() -> None:
+    release = threading.Event()
+    memory = _BlockingLongTermMemory(release, wait_seconds=5.0)
+    service, _qdrant = _mem0_service(memory)
+
+    try:
+        pack = service.retrieve(
+            query="How should memory work?",
+            filters={"repo": "moonmind"},
+            top_k=3,
+            overlay_policy="skip",
+            budgets={},
+            transport="direct",
+            memory_timeout_ms=50,
+        )
+    finally:
+        release.set()
+
+    assert [item.source for item in pack.items] == ["src/file.py"]
+    assert pack.usage["stages"]["memory"]["status"] == "timeout"
+    assert pack.usage["stages"]["search"]["status"] == "ok"
+
+
 def test_retrieve_direct_flow_fail_opens_when_mem0_unavailable() -> None:
     embedder = _StubEmbedder()
     qdrant = _StubQdrant()
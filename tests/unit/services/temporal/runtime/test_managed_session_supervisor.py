@@ -995,3 +995,36 @@ async def test_publish_reset_artifacts_tolerates_event_publication_failure(
 
     assert published.latest_control_event_ref == "sess-1/session.control_event.epoch-2.json"
     assert published.latest_reset_boundary_ref == "sess-1/session.reset_boundary.epoch-2.json"
+
+
+@pytest.mark.asyncio
+async def test_session_supervisor_wakes_on_spool_changes_without_polling(
+    tmp_path: Path,
+) -> None:
+    store = ManagedSessionStore(tmp_path / "store")
+    artifact_storage = _LocalArtifactStorage(tmp_path / "published")
+    supervisor = ManagedSessionSupervisor(
+        store=store,
+        log_streamer=RuntimeLogStreamer(artifact_storage),
+        artifact_storage=artifact_storage,
+        poll_interval_seconds=60.0,
+    )
+    record = _record(tmp_path)
+    store.save(record)
+    spool = Path(record.artifact_spool_path)
+
+    await supervisor.start(record)
+    await asyncio.sleep(0.2)
+    (spool / "stdout.log").write_text("woken by the spool watcher\n", encoding="utf-8")
+
+    expected = len("woken by the spool watcher\n")
+    for _ in range(200):
+        watched = store.load("sess-1")
+        if watched is not None and watched.stdout_log_offset == expected:
+            break
+        await asyncio.sleep(0.01)
+
+    assert watched is not None
+    assert watched.stdout_log_offset == expected
+
+    await supervisor.finalize("sess-1", status="terminated")
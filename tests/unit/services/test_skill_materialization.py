@@ -1,5 +1,7 @@
 import json
 import io
+import os
+import stat
 import hashlib
 import tarfile
 from datetime import datetime, UTC
@@ -15,6 +17,7 @@ from moonmind.schemas.agent_skill_models import (
     ResolvedSkillSet,
     RuntimeMaterializationMode,
 )
+from moonmind.services.skill_content_cache import SkillContentCache
 from moonmind.services.skill_materialization import AgentSkillMaterializer
 
 @pytest.mark.asyncio
@@ -637,6 +640,178 @@ async def test_materializer_prompt_bundle_mode(tmp_path: Path):
     assert not active_dir.exists()
     assert result.prompt_index_ref == "index_snap_prompt"
 
+@pytest.mark.asyncio
+async def test_materializer_reuses_content_cache_across_runs(tmp_path: Path):
+    bundle = _skill_bundle_payload(
+        {"SKILL.md": b"# Bundle Skill\n", "bin/run.py": b"print('run')\n"}
+    )
+    markdown = b"---\nname: notes\n---\n"
+    artifact_service = _StaticArtifactService(
+        {"artifact-bundle": bundle, "artifact-notes": markdown}
+    )
+    cache = SkillContentCache(tmp_path / "cache", max_bytes=1024 * 1024)
+    skillset = ResolvedSkillSet(
+        snapshot_id="cached_snap",
+        resolved_at=datetime.now(tz=UTC),
+        skills=[
+            ResolvedSkillEntry(
+                skill_name="bundle_skill",
+                format=AgentSkillFormat.BUNDLE,
+                content_ref="artifact-bundle",
+                content_digest=_digest(bundle),
+                provenance=AgentSkillProvenance(
+                    source_kind=AgentSkillSourceKind.BUILT_IN
+                ),
+            ),
+            ResolvedSkillEntry(
+                skill_name="notes",
+                content_ref="artifact-notes",
+                content_digest=_digest(markdown),
+                provenance=AgentSkillProvenance(
+                    source_kind=AgentSkillSourceKind.DEPLOYMENT
+                ),
+            ),
+        ],
+    )
+
+    results = []
+    for run in ("run-a", "run-b"):
+        workspace = tmp_path / run
+        workspace.mkdir()
+        results.append(
+            await AgentSkillMaterializer(
+                str(workspace),
+                artifact_service=artifact_service,
+                content_cache=cache,
+            ).materialize(
+                resolved_skillset=skillset,
+                runtime_id="test_runtime",
+                mode=RuntimeMaterializationMode.WORKSPACE_MOUNTED,
+            )
+        )
+
+    assert sorted(artifact_service.reads) == ["artifact-bundle", "artifact-notes"]
+    assert results[0].metadata["skillContentCache"] == {"hits": 0, "misses": 2}
+    assert results[1].metadata["skillContentCache"] == {"hits": 2, "misses": 0}
+    first = tmp_path / "run-a" / ".agents" / "skills" / "bundle_skill" / "bin" / "run.py"
+    second = tmp_path / "run-b" / ".agents" / "skills" / "bundle_skill" / "bin" / "run.py"
+    assert second.read_text(encoding="utf-8") == "print('run')\n"
+    assert first.stat().st_ino != second.stat().st_ino
+    assert (
+        tmp_path / "run-b" / ".agents" / "skills" / "notes" / "SKILL.md"
+    ).read_bytes() == markdown
+
+
+@pytest.mark.asyncio
+async def test_materializer_does_not_cache_rejected_payloads(tmp_path: Path):
+    payload = _skill_bundle_payload({"../evil": b"nope"})
+    cache = SkillContentCache(tmp_path / "cache", max_bytes=1024 * 1024)
+    materializer = AgentSkillMaterializer(
+        str(tmp_path / "run"),
+        artifact_service=_StaticArtifactService({"artifact-bundle": payload}),
+        content_cache=cache,
+    )
+    skillset = ResolvedSkillSet(
+        snapshot_id="bad_snap",
+        resolved_at=datetime.now(tz=UTC),
+        skills=[
+            ResolvedSkillEntry(
+                skill_name="bad",
+                format=AgentSkillFormat.BUNDLE,
+                content_ref="artifact-bundle",
+                content_digest=_digest(payload),
+                provenance=AgentSkillProvenance(
+                    source_kind=AgentSkillSourceKind.DEPLOYMENT
+                ),
+            )
+        ],
+    )
+
+    with pytest.raises(RuntimeError, match="unsafe path"):
+        await materializer.materialize(
+            resolved_skillset=skillset,
+            runtime_id="test_runtime",
+            mode=RuntimeMaterializationMode.WORKSPACE_MOUNTED,
+        )
+
+    assert cache.lookup(SkillContentCache.entry_key(_digest(payload), "bundle")) is None
+    assert not any((tmp_path / "cache" / "tmp").iterdir())
+
+
+def test_content_cache_evicts_least_recently_used_entries(tmp_path: Path):
+    cache = SkillContentCache(tmp_path / "cache", max_bytes=10, min_idle_seconds=0)
+    for used_at, key in enumerate(("old", "warm", "new"), start=1):
+        cache.store(key, lambda target: (target / "SKILL.md").write_bytes(b"x" * 6))
+        os.utime(tmp_path / "cache" / "objects" / key, (used_at, used_at))
+    projected = tmp_path / "run" / "skill"
+    cache.project(cache.lookup("old"), projected)
+
+    evicted = cache.evict(keep=frozenset({"new"}))
+
+    assert evicted == ["warm", "old"]
+    assert cache.lookup("new") is not None
+    assert cache.lookup("old") is None
+    assert (projected / "SKILL.md").read_bytes() == b"x" * 6
+
+
+def test_content_cache_projections_do_not_share_cached_inodes(tmp_path: Path):
+    cache = SkillContentCache(tmp_path / "cache", max_bytes=1024)
+    tree = cache.store("skill", lambda target: (target / "SKILL.md").write_bytes(b"ok"))
+    projected = tmp_path / "run" / "skill"
+    cache.project(tree, projected)
+
+    (projected / "SKILL.md").write_bytes(b"damaged")
+
+    assert cache.lookup("skill") == tree
+    assert (tree / "SKILL.md").read_bytes() == b"ok"
+
+
+def test_content_cache_projections_restore_extracted_modes(tmp_path: Path):
+    def populate(target: Path) -> None:
+        (target / "SKILL.md").write_bytes(b"ok")
+        (target / "SKILL.md").chmod(0o644)
+        (target / "run.sh").write_bytes(b"#!/bin/sh\n")
+        (target / "run.sh").chmod(0o755)
+
+    cache = SkillContentCache(tmp_path / "cache", max_bytes=1024)
+    tree = cache.store("skill", populate)
+    projected = tmp_path / "run" / "skill"
+    cache.project(tree, projected)
+
+    # The cache copy is sealed read-only; the workspace copy is not.
+    assert stat.S_IMODE((tree / "run.sh").stat().st_mode) == 0o555
+    assert stat.S_IMODE((projected / "SKILL.md").stat().st_mode) == 0o644
+    assert stat.S_IMODE((projected / "run.sh").stat().st_mode) == 0o755
+
+
+def test_content_cache_discards_entries_modified_in_place(tmp_path: Path):
+    cache = SkillContentCache(tmp_path / "cache", max_bytes=1024)
+    tree = cache.store("skill", lambda target: (target / "SKILL.md").write_bytes(b"ok"))
+
+    (tree / "SKILL.md").chmod(0o644)
+    (tree / "SKILL.md").write_bytes(b"damaged")
+
+    assert cache.lookup("skill") is None
+    assert not (tmp_path / "cache" / "objects" / "skill").exists()
+
+
+def test_shared_content_cache_requires_absolute_root(monkeypatch, tmp_path: Path):
+    from moonmind.config.settings import settings
+    from moonmind.services.skill_content_cache import shared_skill_content_cache
+
+    monkeypatch.setattr(settings.workflow, "skills_content_cache_max_bytes", 1024)
+    monkeypatch.setattr(settings.workflow, "skills_content_cache_root", "")
+    assert shared_skill_content_cache() is None
+    monkeypatch.setattr(
+        settings.workflow, "skills_content_cache_root", "var/skill_content_cache"
+    )
+    assert shared_skill_content_cache() is None
+    monkeypatch.setattr(
+        settings.workflow, "skills_content_cache_root", str(tmp_path / "cache")
+    )
+    assert shared_skill_content_cache().root == (tmp_path / "cache").resolve()
+
+
 def _skill(name: str, content_ref: str) -> ResolvedSkillEntry:
     return ResolvedSkillEntry(
         skill_name=name,
@@ -659,6 +834,7 @@ def _skill_bundle_payload(files: dict[str, bytes]) -> bytes:
 class _StaticArtifactService:
     def __init__(self, payloads: dict[str, bytes]) -> None:
         self._payloads = payloads
+        self.reads: list[str] = []
 
     async def read(
         self,
@@ -668,4 +844,5 @@ class _StaticArtifactService:
         allow_restricted_raw: bool,
     ) -> tuple[object, bytes]:
         del principal, allow_restricted_raw
+        self.reads.append(artifact_id)
         return object(), self._payloads[artifact_id]
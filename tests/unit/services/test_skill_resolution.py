@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -16,6 +17,7 @@ from moonmind.services.skill_resolution import (
     LocalSkillLoader,
     RepoSkillLoader,
     DeploymentSkillLoader,
+    _SkillScanIndex,
     _terminal_contract_from_side_effect,
     extract_required_capabilities_from_skill_markdown,
     extract_side_effect_metadata_from_skill_markdown,
@@ -428,6 +430,90 @@ async def test_repo_skill_loader_scans_fs(tmp_path):
     assert "skill2" in names
     assert "not_a_skill" not in names
 
+async def test_skill_scan_index_reparses_only_changed_frontmatter(
+    tmp_path, monkeypatch
+):
+    from moonmind.services import skill_resolution
+
+    parsed: list[str] = []
+    parse = skill_resolution._parse_skill_frontmatter
+
+    def _counting_parse(skill_file):
+        parsed.append(skill_file.parent.name)
+        return parse(skill_file)
+
+    monkeypatch.setattr(skill_resolution, "_parse_skill_frontmatter", _counting_parse)
+    monkeypatch.setattr(skill_resolution, "_skill_scan_index", _SkillScanIndex())
+    skills_dir = tmp_path / "skills"
+    for name in ("alpha", "beta", "gamma"):
+        (skills_dir / name).mkdir(parents=True)
+        (skills_dir / name / "SKILL.md").write_text(
+            f"---\nname: {name}\n---\n", encoding="utf-8"
+        )
+
+    first = skill_resolution._scan_for_skills(skills_dir, AgentSkillSourceKind.REPO)
+    second = skill_resolution._scan_for_skills(skills_dir, AgentSkillSourceKind.REPO)
+    (skills_dir / "beta" / "SKILL.md").write_text(
+        "---\nname: beta\ndescription: changed\n---\n", encoding="utf-8"
+    )
+    skill_resolution._scan_for_skills(skills_dir, AgentSkillSourceKind.REPO)
+
+    assert [entry.skill_name for entry in first] == ["alpha", "beta", "gamma"]
+    assert first == second
+    assert sorted(parsed) == ["alpha", "beta", "beta", "gamma"]
+    assert skill_resolution._load_skill_frontmatter(skills_dir / "beta") == {
+        "name": "beta",
+        "description": "changed",
+    }
+
+
+async def test_skill_scan_index_serves_watched_directory_until_it_changes(
+    tmp_path, monkeypatch
+):
+    from moonmind.services import skill_resolution
+
+    sweeps: list[Path] = []
+    sweep = skill_resolution._sweep_skills_dir
+
+    def _counting_sweep(skills_dir, source_kind, *, skip_names=None):
+        sweeps.append(skills_dir)
+        return sweep(skills_dir, source_kind, skip_names=skip_names)
+
+    monkeypatch.setattr(skill_resolution, "_sweep_skills_dir", _counting_sweep)
+    skills_dir = tmp_path / "skills"
+    (skills_dir / "alpha").mkdir(parents=True)
+    (skills_dir / "alpha" / "SKILL.md").write_text("# Alpha\n", encoding="utf-8")
+    index = _SkillScanIndex()
+    try:
+        index.scan(skills_dir, AgentSkillSourceKind.BUILT_IN, watch=True)
+        watcher = index._watches[skills_dir]
+        for _ in range(100):
+            if watcher.live:
+                break
+            await asyncio.sleep(0.05)
+        else:
+            pytest.skip("filesystem watcher did not start")
+        sweeps.clear()
+
+        index.scan(skills_dir, AgentSkillSourceKind.BUILT_IN, watch=True)
+        cached = index.scan(skills_dir, AgentSkillSourceKind.BUILT_IN, watch=True)
+        generation = watcher.generation
+        (skills_dir / "beta").mkdir()
+        (skills_dir / "beta" / "SKILL.md").write_text("# Beta\n", encoding="utf-8")
+        for _ in range(100):
+            if watcher.generation != generation:
+                break
+            await asyncio.sleep(0.05)
+        refreshed = index.scan(skills_dir, AgentSkillSourceKind.BUILT_IN, watch=True)
+    finally:
+        index.close()
+
+    assert not watcher._thread.is_alive()
+    assert len(sweeps) == 2
+    assert [entry.skill_name for entry in cached] == ["alpha"]
+    assert [entry.skill_name for entry in refreshed] == ["alpha", "beta"]
+
+
 async def test_repo_loader_rejects_active_projection_as_repo_source(tmp_path):
     active_root = tmp_path / "runtime" / "skills_active" / "snap"
     active_skill = active_root / "active"
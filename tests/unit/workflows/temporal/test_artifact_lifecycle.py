@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -126,3 +127,37 @@ async def test_lifecycle_sweep_skips_pinned_artifacts(tmp_path: Path) -> None:
 
             refreshed = await service._repository.get_artifact(artifact.artifact_id)
             assert refreshed.status is TemporalArtifactStatus.COMPLETE
+
+async def test_lifecycle_sweep_deletes_stale_payload_claim_checks(
+    tmp_path: Path,
+) -> None:
+    store = LocalTemporalArtifactStore(tmp_path / "artifacts")
+    stale_key = store.build_content_addressed_storage_key(
+        namespace="default", scope="temporal-payloads", sha256="a" * 64
+    )
+    fresh_key = store.build_content_addressed_storage_key(
+        namespace="default", scope="temporal-payloads", sha256="b" * 64
+    )
+    other_key = store.build_content_addressed_storage_key(
+        namespace="default", scope="skills", sha256="c" * 64
+    )
+    for key in (stale_key, fresh_key, other_key):
+        store.write_bytes(key, b"blob", content_type=None)
+    old = (datetime.now(UTC) - timedelta(days=2)).timestamp()
+    for key in (stale_key, other_key):
+        os.utime(store.resolve_storage_key(key), (old, old))
+
+    async with temporal_db(tmp_path) as session_maker:
+        async with session_maker() as session:
+            service = TemporalArtifactService(
+                TemporalArtifactRepository(session),
+                store=store,
+                default_namespace="default",
+                payload_claim_check_retention_seconds=86400,
+            )
+            summary = await service.sweep_lifecycle(principal="service:test")
+
+    assert summary.payload_claim_check_deleted_count == 1
+    assert not store.resolve_storage_key(stale_key).exists()
+    assert store.resolve_storage_key(fresh_key).exists()
+    assert store.resolve_storage_key(other_key).exists()
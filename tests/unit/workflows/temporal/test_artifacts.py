@@ -233,6 +233,123 @@ async def test_s3_store_uses_thread_local_clients(
     assert other_thread_client is not main_thread_client
     assert len(created_clients) == 2
 
+async def test_local_store_reads_ranges_and_tails(tmp_path: Path) -> None:
+    """Local store should seek to byte windows instead of reading whole files."""
+
+    store = LocalTemporalArtifactStore(tmp_path)
+    store.write_bytes("ns/obj.txt", b"0123456789", content_type="text/plain")
+
+    assert store.read_range("ns/obj.txt", offset=3, length=4) == b"3456"
+    assert store.read_range("ns/obj.txt", offset=8, length=10) == b"89"
+    assert store.read_range("ns/obj.txt", offset=20, length=4) == b""
+    assert store.read_tail("ns/obj.txt", length=3) == (b"789", 10)
+    assert store.read_tail("ns/obj.txt", length=50) == (b"0123456789", 10)
+    assert store.read_tail("ns/obj.txt", length=0) == (b"", 10)
+
+async def test_base_store_range_and_tail_fall_back_to_chunks() -> None:
+    """Stores without native ranged reads should window the chunk stream."""
+
+    class _ChunkedStore(TemporalArtifactStore):
+        def read_chunks(self, storage_key: str):
+            _ = storage_key
+            yield from (b"abc", b"def", b"ghi")
+
+    store = _ChunkedStore()
+
+    assert store.read_range("key", offset=2, length=5) == b"cdefg"
+    assert store.read_range("key", offset=7, length=5) == b"hi"
+    assert store.read_tail("key", length=4) == (b"fghi", 9)
+
+async def test_s3_store_issues_ranged_and_suffix_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """S3 store should push byte windows down as HTTP Range requests."""
+
+    requests: list[dict[str, object]] = []
+
+    class _Body:
+        def __init__(self, data: bytes) -> None:
+            self._data = data
+
+        def read(self) -> bytes:
+            return self._data
+
+        def close(self) -> None:
+            return None
+
+    class _RangeS3Client:
+        def head_bucket(self, *, Bucket: str) -> None:
+            _ = Bucket
+
+        def get_object(self, **kwargs: object) -> dict[str, object]:
+            requests.append(kwargs)
+            if kwargs["Range"] == "bytes=100-103":
+                raise ClientError(
+                    {"Error": {"Code": "InvalidRange", "Message": "bad range"}},
+                    "GetObject",
+                )
+            if kwargs["Range"] == "bytes=-3":
+                return {"Body": _Body(b"789"), "ContentRange": "bytes 7-9/10"}
+            return {"Body": _Body(b"3456"), "ContentRange": "bytes 3-6/10"}
+
+    monkeypatch.setattr(
+        "moonmind.workflows.temporal.artifacts.boto3.client",
+        lambda *_args, **_kwargs: _RangeS3Client(),
+    )
+    store = S3TemporalArtifactStore(
+        endpoint_url="http://example.test:9000",
+        bucket="bucket-1",
+        access_key_id="access",
+        secret_access_key="secret",
+        region_name="us-east-1",
+        use_ssl=False,
+    )
+
+    assert store.read_range("ns/obj", offset=3, length=4) == b"3456"
+    assert store.read_range("ns/obj", offset=100, length=4) == b""
+    assert store.read_tail("ns/obj", length=3) == (b"789", 10)
+    assert [request["Range"] for request in requests] == [
+        "bytes=3-6",
+        "bytes=100-103",
+        "bytes=-3",
+    ]
+
+async def test_service_read_range_and_tail_report_total_size(tmp_path: Path) -> None:
+    """Service ranged reads should return the window plus the object size."""
+
+    async with temporal_db(tmp_path) as session_maker:
+        async with session_maker() as session:
+            service = TemporalArtifactService(
+                TemporalArtifactRepository(session),
+                store=LocalTemporalArtifactStore(tmp_path / "artifacts"),
+            )
+            artifact, _upload = await service.create(
+                principal="user-1",
+                content_type="text/plain",
+            )
+            await service.write_complete(
+                artifact_id=artifact.artifact_id,
+                principal="user-1",
+                payload=b"0123456789",
+                content_type="text/plain",
+            )
+
+            _artifact, window = await service.read_range(
+                artifact_id=artifact.artifact_id,
+                principal="user-1",
+                offset=4,
+                length=3,
+            )
+            assert (window.data, window.offset, window.total_size) == (b"456", 4, 10)
+            assert window.end == 7
+
+            _artifact, tail = await service.read_tail(
+                artifact_id=artifact.artifact_id,
+                principal="user-1",
+                length=4,
+            )
+            assert (tail.data, tail.offset, tail.total_size) == (b"6789", 6, 10)
+
 async def test_create_write_read_and_list_for_execution(tmp_path: Path) -> None:
     """Service should create, upload, read, and list artifacts by execution linkage."""
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import pytest
+from temporalio.api.common.v1 import Payload
+from temporalio.contrib.pydantic import pydantic_data_converter
+
+from moonmind.config.settings import TemporalSettings
+from moonmind.workflows.temporal.artifacts import LocalTemporalArtifactStore
+from moonmind.workflows.temporal.data_converter import (
+    CLAIM_CHECK_ENCODING,
+    MOONMIND_TEMPORAL_DATA_CONVERTER,
+    ZLIB_ENCODING,
+    MoonMindPayloadCodec,
+    PayloadCodecError,
+)
+
+pytestmark = [pytest.mark.asyncio]
+
+
+def _codec(tmp_path, **kwargs) -> MoonMindPayloadCodec:
+    options = {
+        "compression_threshold_bytes": 1024,
+        "claim_check_threshold_bytes": 0,
+        "store_factory": lambda: LocalTemporalArtifactStore(tmp_path),
+    }
+    options.update(kwargs)
+    return MoonMindPayloadCodec(**options)
+
+
+def _ledger_payload(rows: int) -> dict[str, object]:
+    return {
+        "steps": [
+            {"id": f"step-{index}", "title": "Run tests", "status": "completed"}
+            for index in range(rows)
+        ]
+    }
+
+
+async def test_shared_converter_installs_moonmind_codec() -> None:
+    assert isinstance(
+        MOONMIND_TEMPORAL_DATA_CONVERTER.payload_codec,
+        MoonMindPayloadCodec,
+    )
+    assert (
+        MOONMIND_TEMPORAL_DATA_CONVERTER.payload_converter_class
+        is pydantic_data_converter.payload_converter_class
+    )
+
+
+async def test_payload_encoding_is_opt_in(monkeypatch) -> None:
+    monkeypatch.delenv("TEMPORAL_PAYLOAD_CODEC_ENCODE_ENABLED", raising=False)
+
+    assert TemporalSettings().payload_codec_encode_enabled is False
+
+
+async def test_small_payloads_pass_through_unchanged(tmp_path) -> None:
+    codec = _codec(tmp_path)
+    payload = Payload(metadata={"encoding": b"json/plain"}, data=b'{"ok":true}')
+
+    assert await codec.encode([payload]) == [payload]
+    assert await codec.decode([payload]) == [payload]
+
+
+async def test_large_payloads_compress_and_round_trip(tmp_path) -> None:
+    converter = dataclasses.replace(
+        pydantic_data_converter,
+        payload_codec=_codec(tmp_path),
+    )
+    value = _ledger_payload(500)
+
+    plain = await pydantic_data_converter.encode([value])
+    encoded = await converter.encode([value])
+
+    assert encoded[0].metadata["encoding"] == ZLIB_ENCODING
+    assert encoded[0].ByteSize() * 5 < plain[0].ByteSize()
+    assert await converter.decode(encoded, [dict]) == [value]
+
+
+async def test_oversized_payloads_are_claim_checked(tmp_path) -> None:
+    codec = _codec(tmp_path, compression_threshold_bytes=0, claim_check_threshold_bytes=64)
+    payload = Payload(metadata={"encoding": b"json/plain"}, data=b"x" * 4096)
+
+    [encoded] = await codec.encode([payload])
+    [again] = await codec.encode([payload])
+    reference = json.loads(encoded.data)
+
+    assert encoded.metadata["encoding"] == CLAIM_CHECK_ENCODING
+    assert again == encoded
+    assert reference["storageKey"].startswith("default/blobs/temporal-payloads/")
+    assert len(list(tmp_path.rglob(reference["sha256"]))) == 1
+    assert await codec.decode([encoded]) == [payload]
+
+
+async def test_compressed_payload_can_also_be_claim_checked(tmp_path) -> None:
+    codec = _codec(tmp_path, claim_check_threshold_bytes=256)
+    payload = Payload(
+        metadata={"encoding": b"json/plain"},
+        data=json.dumps(_ledger_payload(2000)).encode(),
+    )
+
+    [encoded] = await codec.encode([payload])
+
+    assert encoded.metadata["encoding"] == CLAIM_CHECK_ENCODING
+    assert await codec.decode([encoded]) == [payload]
+
+
+async def test_decode_stays_enabled_when_encoding_is_disabled(tmp_path) -> None:
+    writer = _codec(tmp_path)
+    reader = _codec(tmp_path, encode_enabled=False)
+    payload = Payload(metadata={"encoding": b"json/plain"}, data=b"y" * 8192)
+
+    [encoded] = await writer.encode([payload])
+
+    assert await reader.encode([payload]) == [payload]
+    assert await reader.decode([encoded]) == [payload]
+
+
+async def test_unknown_codec_version_is_rejected(tmp_path) -> None:
+    codec = _codec(tmp_path)
+    payload = Payload(
+        metadata={
+            "encoding": ZLIB_ENCODING,
+            "moonmind-codec-version": b"99",
+        },
+        data=b"",
+    )
+
+    with pytest.raises(PayloadCodecError, match="version"):
+        await codec.decode([payload])
+
+
+async def test_claim_check_digest_mismatch_is_rejected(tmp_path) -> None:
+    codec = _codec(tmp_path, compression_threshold_bytes=0, claim_check_threshold_bytes=64)
+    [encoded] = await codec.encode(
+        [Payload(metadata={"encoding": b"json/plain"}, data=b"z" * 1024)]
+    )
+    storage_key = json.loads(encoded.data)["storageKey"]
+    (tmp_path / storage_key).write_bytes(b"tampered")
+
+    with pytest.raises(PayloadCodecError, match="digest mismatch"):
+        await codec.decode([encoded])
@@ -2127,6 +2127,133 @@ async def test_remediation_evidence_tools_read_only_context_declared_evidence(
                 stream="stdout",
             )
 
+@pytest.mark.asyncio
+async def test_remediation_evidence_tools_read_artifact_windows_without_full_reads(
+    tmp_path, mock_client_adapter
+):
+    async with temporal_db(tmp_path) as session:
+        owner_id = uuid4()
+        mock_client_adapter.start_workflow.side_effect = [
+            SimpleNamespace(run_id="target-run"),
+            SimpleNamespace(run_id="remediation-run"),
+        ]
+        execution_service = TemporalExecutionService(
+            session, client_adapter=mock_client_adapter
+        )
+        artifact_service = TemporalArtifactService(
+            TemporalArtifactRepository(session),
+            store=LocalTemporalArtifactStore(tmp_path / "artifacts"),
+        )
+        content = b"alpha\nbravo\ncharlie\ndelta\n"
+
+        target = await execution_service.create_execution(
+            workflow_type="MoonMind.UserWorkflow",
+            owner_id=owner_id,
+            title="Target",
+            input_artifact_ref=None,
+            plan_artifact_ref=None,
+            manifest_artifact_ref=None,
+            failure_policy=None,
+            initial_parameters=_valid_user_workflow_parameters(),
+            idempotency_key=None,
+        )
+        target_artifact, _upload = await artifact_service.create(
+            principal="service:test",
+            content_type="text/plain",
+            size_bytes=len(content),
+            link=ExecutionRef(
+                namespace="default",
+                workflow_id=target.workflow_id,
+                run_id=target.run_id,
+                link_type="target.evidence",
+                label="target.log",
+            ),
+        )
+        target_artifact = await artifact_service.write_complete(
+            artifact_id=target_artifact.artifact_id,
+            principal="service:test",
+            payload=content,
+            content_type="text/plain",
+        )
+        target_source = await session.get(
+            TemporalExecutionCanonicalRecord, target.workflow_id
+        )
+        assert target_source is not None
+        target_source.artifact_refs = [target_artifact.artifact_id]
+        await session.commit()
+
+        remediation = await execution_service.create_execution(
+            workflow_type="MoonMind.UserWorkflow",
+            owner_id=owner_id,
+            title="Remediate target",
+            input_artifact_ref=None,
+            plan_artifact_ref=None,
+            manifest_artifact_ref=None,
+            failure_policy=None,
+            initial_parameters={
+                "workflow": {
+                    "remediation": {"target": {"workflowId": target.workflow_id}},
+                }
+            },
+            idempotency_key=None,
+        )
+        await RemediationContextBuilder(
+            session=session,
+            artifact_service=artifact_service,
+        ).build_context(remediation_workflow_id=remediation.workflow_id)
+
+        tools = RemediationEvidenceToolService(
+            session=session,
+            artifact_service=artifact_service,
+        )
+        original_read = artifact_service.read
+
+        async def read_spy(*, artifact_id, principal):
+            assert artifact_id != target_artifact.artifact_id
+            return await original_read(artifact_id=artifact_id, principal=principal)
+
+        artifact_service.read = read_spy
+
+        first = await tools.read_target_artifact_bounded(
+            remediation_workflow_id=remediation.workflow_id,
+            artifact_ref=target_artifact.artifact_id,
+            include_content=True,
+            max_content_bytes=10,
+        )
+        assert (first.content, first.offset, first.next_offset) == ("alpha", 0, 6)
+        assert first.size_bytes == len(content)
+        assert first.content_truncated is True
+
+        second = await tools.read_target_artifact_bounded(
+            remediation_workflow_id=remediation.workflow_id,
+            artifact_ref=target_artifact.artifact_id,
+            include_content=True,
+            max_content_bytes=10,
+            offset=first.next_offset,
+        )
+        assert (second.content, second.offset, second.next_offset) == (
+            "bravo",
+            6,
+            12,
+        )
+
+        tail = await tools.read_target_artifact_bounded(
+            remediation_workflow_id=remediation.workflow_id,
+            artifact_ref=target_artifact.artifact_id,
+            include_content=True,
+            max_content_bytes=10,
+            tail=True,
+        )
+        assert (tail.content, tail.offset, tail.next_offset) == ("delta", 20, None)
+        assert tail.content_truncated is True
+
+        metadata_only = await tools.read_target_artifact_bounded(
+            remediation_workflow_id=remediation.workflow_id,
+            artifact_ref=target_artifact.artifact_id,
+        )
+        assert metadata_only.content is None
+        assert metadata_only.size_bytes == len(content)
+
 @pytest.mark.asyncio
 async def test_remediation_evidence_tools_gate_live_follow_by_context_policy(
     tmp_path, mock_client_adapter
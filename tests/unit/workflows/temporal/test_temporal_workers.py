@@ -14,7 +14,7 @@ from sqlalchemy.orm import sessionmaker
 from temporalio import workflow
 
 from api_service.db.models import Base
-from moonmind.config.settings import settings
+from moonmind.config.settings import TemporalSettings, settings
 from moonmind.workflows.skills.skill_dispatcher import SkillActivityDispatcher
 from moonmind.workflows.temporal import (
     AGENT_RUNTIME_FLEET,
@@ -48,6 +48,7 @@ from moonmind.workflows.agent_skills.agent_skills_activities import AgentSkillsA
 from moonmind.workflows.temporal.workers import (
     build_all_worker_topologies,
     build_worker_activity_bindings,
+    build_worker_slot_options,
     build_worker_spec,
     build_worker_topology,
     describe_configured_worker,
@@ -339,6 +340,66 @@ def test_describe_configured_worker_uses_temporal_worker_fleet_override():
         "docker_workload",
     )
 
+def test_host_bound_fleets_use_resource_based_slot_tuner():
+    temporal_settings = settings.temporal.model_copy(
+        update={
+            "worker_fleet": SANDBOX_FLEET,
+            "sandbox_worker_concurrency": 3,
+            "worker_resource_tuning_enabled": True,
+            "worker_target_memory_usage": 0.7,
+            "worker_target_cpu_usage": 0.85,
+            "worker_resource_tuning_min_slots": 2,
+            "worker_resource_tuning_max_slots_multiplier": 4,
+        }
+    )
+    topology = describe_configured_worker(temporal_settings=temporal_settings)
+
+    options = build_worker_slot_options(topology, temporal_settings=temporal_settings)
+
+    assert set(options) == {"tuner"}
+    supplier = options["tuner"].activity_slot_supplier
+    assert supplier.tuner_config.target_memory_usage == 0.7
+    assert supplier.tuner_config.target_cpu_usage == 0.85
+    assert supplier.slot_config.minimum_slots == 2
+    assert supplier.slot_config.maximum_slots == 12
+
+
+def test_resource_tuner_defaults_cap_slots_at_configured_concurrency(monkeypatch):
+    monkeypatch.delenv(
+        "TEMPORAL_WORKER_RESOURCE_TUNING_MAX_SLOTS_MULTIPLIER", raising=False
+    )
+    temporal_settings = TemporalSettings().model_copy(
+        update={"worker_fleet": SANDBOX_FLEET, "sandbox_worker_concurrency": 3}
+    )
+    topology = describe_configured_worker(temporal_settings=temporal_settings)
+
+    options = build_worker_slot_options(topology, temporal_settings=temporal_settings)
+
+    assert options["tuner"].activity_slot_supplier.slot_config.maximum_slots == 3
+
+
+def test_rate_limited_and_untuned_fleets_keep_fixed_slots():
+    llm_settings = settings.temporal.model_copy(
+        update={"worker_fleet": LLM_FLEET, "llm_worker_concurrency": 4}
+    )
+    llm_topology = describe_configured_worker(temporal_settings=llm_settings)
+    disabled_settings = settings.temporal.model_copy(
+        update={
+            "worker_fleet": WORKFLOW_FLEET,
+            "workflow_worker_concurrency": 6,
+            "worker_resource_tuning_enabled": False,
+        }
+    )
+    workflow_topology = describe_configured_worker(temporal_settings=disabled_settings)
+
+    assert build_worker_slot_options(
+        llm_topology, temporal_settings=llm_settings
+    ) == {"max_concurrent_activities": 4}
+    assert build_worker_slot_options(
+        workflow_topology, temporal_settings=disabled_settings
+    ) == {"max_concurrent_workflow_tasks": 6}
+
+
 def test_agent_runtime_topology_exposes_docker_workload_capability():
     topology = describe_configured_worker(
         temporal_settings=settings.temporal.model_copy(
@@ -1985,6 +1985,50 @@ def test_run_memo_updates_remain_compact(monkeypatch: pytest.MonkeyPatch) -> Non
     assert "progress" not in latest_memo
     assert "checks" not in latest_memo
 
+def test_progress_memo_is_versioned_and_only_published_on_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    memo_updates = _configure_workflow_runtime(monkeypatch)
+    workflow = MoonMindRunWorkflow()
+    now = datetime(2026, 4, 7, 12, 0, tzinfo=UTC)
+    workflow._initialize_step_ledger(
+        ordered_nodes=_ordered_nodes(),
+        dependency_map=_dependency_map(),
+        updated_at=now,
+    )
+
+    assert memo_updates == []
+
+    monkeypatch.setattr(
+        run_module.workflow,
+        "patched",
+        lambda patch_id: patch_id
+        in {
+            run_module.RUN_CANONICAL_STEP_STATUS_VOCAB_PATCH,
+            run_module.RUN_PROGRESS_MEMO_PATCH,
+        },
+    )
+    workflow._mark_step_running("prepare", updated_at=now, summary="Preparing")
+    workflow._sync_progress_snapshot(updated_at=datetime(2026, 4, 7, 12, 5, tzinfo=UTC))
+
+    progress_memos = [memo["progress"] for memo in memo_updates if "progress" in memo]
+    assert len(progress_memos) == 1
+    assert progress_memos[0]["version"] == 1
+    assert progress_memos[0]["executing"] == 1
+    assert progress_memos[0]["currentStepTitle"] == "Prepare workspace"
+    assert set(memo_updates[-1]) == {"progress"}
+
+    workflow._mark_step_waiting(
+        "prepare",
+        status="awaiting_external",
+        updated_at=now,
+        waiting_reason="external_review",
+        summary="Waiting on review",
+    )
+    progress_memos = [memo["progress"] for memo in memo_updates if "progress" in memo]
+    assert [memo["version"] for memo in progress_memos] == [1, 2]
+    assert progress_memos[-1]["awaitingExternal"] == 1
+
 def test_update_search_attributes_status_memo_is_patch_gated(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -10,7 +10,8 @@ import uuid
 
 import httpx
 from temporalio.client import Client
-from temporalio.contrib.pydantic import pydantic_data_converter
+
+from moonmind.workflows.temporal.data_converter import build_moonmind_data_converter
 
 
 async def _run(args: argparse.Namespace) -> int:
@@ -43,7 +44,7 @@ async def _run(args: argparse.Namespace) -> int:
     client = await Client.connect(
         args.address,
         namespace=args.namespace,
-        data_converter=pydantic_data_converter,
+        data_converter=build_moonmind_data_converter(),
     )
     workflow_id = f"canary:pr-resolver:{uuid.uuid4()}"
     result = await client.execute_workflow(